@@ -34,6 +34,22 @@ def event_loop() -> asyncio.AbstractEventLoop:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def isolated_response_cache() -> Any:
+    """
+    Give every test its own in-memory search response cache.
+
+    Integration clients share one process-wide cache, so without this a
+    response mocked in one test could be served to another.
+    """
+    from src.integrations.response_cache import SearchResponseCache, configure_response_cache
+
+    cache = SearchResponseCache()
+    configure_response_cache(cache)
+    yield cache
+    cache.close()
+
+
 @pytest.fixture
 async def async_session() -> AsyncGenerator[Any, None]:
     """
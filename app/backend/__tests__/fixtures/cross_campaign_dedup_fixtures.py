@@ -0,0 +1,82 @@
+"""Test fixtures for cross-campaign dedup fuzzy matching."""
+
+import random
+
+from src.agents.cross_campaign_dedup.fuzzy_index import _blocking_keys, _normalize
+
+
+def _typo(rng: random.Random, value: str) -> str:
+    """Apply one random substitution, insertion, deletion or transposition."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    i = rng.randrange(len(value))
+    edit = rng.randrange(4)
+    if edit == 0:
+        return value[:i] + rng.choice(letters) + value[i + 1 :]
+    if edit == 1:
+        return value[:i] + rng.choice(letters) + value[i:]
+    if edit == 2 and len(value) > 1:
+        return value[:i] + value[i + 1 :]
+    if i + 1 < len(value):
+        return value[:i] + value[i + 1] + value[i] + value[i + 2 :]
+    return value
+
+
+def typo_dataset(seed: int, size: int) -> tuple[list[dict], list[dict]]:
+    """History plus leads that are single-typo copies of historical rows."""
+    rng = random.Random(seed)
+    firsts = ["Katherine", "Catherine", "John", "Michael", "Sarah", "Philip", "Yvonne", "Eric"]
+    lasts = ["Smith", "Nguyen", "Oconnor", "Ellis", "Underwood", "Zhang", "Brown", "Avery"]
+    companies = ["Acme Corp", "Acne Corp", "Globex", "Initech", "Umbrella Ltd", "Hooli", "Stark"]
+
+    historical = [
+        {
+            "first_name": rng.choice(firsts),
+            "last_name": rng.choice(lasts),
+            "company_name": rng.choice(companies),
+            "campaign_id": f"c{i}",
+        }
+        for i in range(size)
+    ]
+    leads = []
+    for hist in rng.sample(historical, size // 2):
+        lead = dict(hist)
+        field = rng.choice(["first_name", "last_name", "company_name"])
+        lead[field] = _typo(rng, lead[field])
+        leads.append(lead)
+    return historical, leads
+
+
+def shares_blocking_key(a: dict, b: dict) -> bool:
+    """True when the fuzzy index would compare the two contacts."""
+
+    def keys(row: dict) -> set[str]:
+        return set(
+            _blocking_keys(
+                _normalize(row.get("first_name")),
+                _normalize(row.get("last_name")),
+                _normalize(row.get("company_name")),
+            )
+        )
+
+    return bool(keys(a) & keys(b))
+
+
+def growing_dataset(seed: int, size: int) -> list[dict]:
+    """Contacts whose surnames and companies grow with the dataset (~10 per company)."""
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    firsts = ["James", "Mary", "John", "Linda", "David", "Susan", "Thomas", "Sarah"]
+
+    def word(length: int) -> str:
+        return "".join(rng.choice(letters) for _ in range(length)).title()
+
+    companies = [f"{word(8)} Corp" for _ in range(max(size // 10, 1))]
+    return [
+        {
+            "first_name": rng.choice(firsts),
+            "last_name": word(7),
+            "company_name": rng.choice(companies),
+            "campaign_id": f"c{i}",
+        }
+        for i in range(size)
+    ]
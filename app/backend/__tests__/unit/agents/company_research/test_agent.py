@@ -5,12 +5,17 @@ Tests the main agent class with mocked dependencies.
 Coverage target: >85%
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any
 from unittest.mock import AsyncMock, patch
 from uuid import UUID, uuid4
 
 import pytest
 
 from src.agents.company_research.agent import CompanyResearchAgent
+from src.agents.company_research.planner import CACHE_TOOL_NAME, CachedResearch, facet_entry
 from src.agents.company_research.schemas import (
     CompanyResearchInput,
     CompanyResearchOutput,
@@ -19,6 +24,10 @@ from src.agents.company_research.schemas import (
     ExtractedFact,
     ResearchResult,
 )
+from src.agents.company_research.tools import (
+    aggregate_company_research_tool,
+    extract_and_score_facts_tool,
+)
 
 
 class TestCostTracker:
@@ -478,3 +487,139 @@ class TestCompanyResearchSchemas:
         assert output.success is True
         assert output.research_cost == 0.0
         assert output.personalization_hooks == {}
+
+
+class TestResearchCache:
+    """Tests for company-level dedup and the cross-campaign research cache."""
+
+    @pytest.fixture
+    def company(self) -> CompanyToResearch:
+        """Create sample company fixture."""
+        return CompanyToResearch(
+            lead_id=uuid4(),
+            company_name="Acme Corp",
+            company_domain="acme.com",
+        )
+
+    @staticmethod
+    def _search_result(title: str) -> dict[str, Any]:
+        return {
+            "data": {
+                "results": [{"title": title, "snippet": title, "url": f"https://{title}"}],
+                "result_count": 1,
+                "cost": 0.001,
+                "tool_used": "serper_search",
+            },
+        }
+
+    @staticmethod
+    def _cached(hours_ago: dict[str, float]) -> CachedResearch:
+        searched_at = datetime.now(UTC)
+        return CachedResearch(
+            research_id=uuid4(),
+            campaign_id=uuid4(),
+            company_domain="acme.com",
+            content={
+                "aggregated": {
+                    "headline": "Acme raises Series B",
+                    "facts": [{"fact_text": "Acme raises Series B", "category": "funding"}],
+                    "source_urls": ["https://funding"],
+                    "has_funding": True,
+                    "total_cost": 0.004,
+                    "tools_used": ["serper_search"],
+                },
+                "facets": {
+                    facet: facet_entry(
+                        TestResearchCache._search_result(facet)["data"],
+                        searched_at - timedelta(hours=hours),
+                    )
+                    for facet, hours in hours_ago.items()
+                },
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_searches_only_stale_facets(self, company: CompanyToResearch) -> None:
+        """Fresh facets are reused at no cost; stale ones are searched again."""
+        agent = CompanyResearchAgent()
+        agent._research_cache = {
+            "acme.com": self._cached({"news": 100, "funding": 1, "hiring": 1, "tech": 1})
+        }
+
+        with (
+            patch(
+                "src.agents.company_research.agent.search_company_news_tool",
+                new_callable=AsyncMock,
+                return_value=self._search_result("news"),
+            ) as mock_news,
+            patch(
+                "src.agents.company_research.agent.search_company_funding_tool",
+                new_callable=AsyncMock,
+            ) as mock_funding,
+            # The @tool decorator wraps the functions in SdkMcpTool; run the real handlers
+            patch(
+                "src.agents.company_research.agent.extract_and_score_facts_tool",
+                extract_and_score_facts_tool.handler,
+            ),
+            patch(
+                "src.agents.company_research.agent.aggregate_company_research_tool",
+                aggregate_company_research_tool.handler,
+            ),
+        ):
+            result = await agent._research_single_company(company)
+
+        mock_news.assert_awaited_once()
+        mock_funding.assert_not_called()
+        assert agent.searches_run == 1
+        assert agent.searches_reused == 3
+        assert agent.cost_tracker.total_cost == pytest.approx(0.001)
+
+        assert result.success is True
+        assert result.research_id is None
+        assert result.research_cost == pytest.approx(0.001)
+        assert CACHE_TOOL_NAME in result.tools_used
+        assert set(result.content["facets"]) == {"news", "funding", "hiring", "tech"}
+        assert {f.category for f in result.facts} >= {"news", "funding"}
+
+    @pytest.mark.asyncio
+    async def test_fully_cached_company_skips_searches(self, company: CompanyToResearch) -> None:
+        """A company with every facet fresh reuses the cached row as is."""
+        agent = CompanyResearchAgent()
+        cached = self._cached({"news": 1, "funding": 1, "hiring": 1, "tech": 1})
+        agent._research_cache = {"acme.com": cached}
+
+        with patch(
+            "src.agents.company_research.agent.search_company_news_tool",
+            new_callable=AsyncMock,
+        ) as mock_news:
+            result = await agent._research_single_company(company)
+
+        mock_news.assert_not_called()
+        assert agent.companies_from_cache == 1
+        assert agent.searches_run == 0
+        assert result.research_id == cached.research_id
+        assert result.research_cost == 0.0
+        assert result.headline == "Acme raises Series B"
+        assert result.facts[0].category == "funding"
+        assert agent.cost_tracker.total_cost == 0.0
+
+    @pytest.mark.asyncio
+    async def test_groups_leads_by_company_domain(self) -> None:
+        """The company query groups by domain only, not per lead."""
+        from sqlalchemy.dialects import postgresql
+
+        agent = CompanyResearchAgent()
+        session = AsyncMock()
+        session.execute.return_value.all = lambda: []
+
+        @asynccontextmanager
+        async def mock_get_session() -> AsyncIterator[AsyncMock]:
+            yield session
+
+        with patch("src.database.connection.get_session", mock_get_session):
+            await agent._get_unique_companies(uuid4(), max_companies=10)
+
+        stmt = session.execute.await_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))  # type: ignore[no-untyped-call]
+        assert "GROUP BY lower(leads.company_domain)" in sql
+        assert "leads.id," not in sql.split("GROUP BY")[1]
@@ -0,0 +1,91 @@
+"""Unit tests for the company research planner."""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from src.agents.company_research.planner import (
+    CACHE_TOOL_NAME,
+    CachedResearch,
+    CompanyResearchPlanner,
+    facet_entry,
+)
+from src.agents.company_research.schemas import CompanyToResearch
+
+NOW = datetime(2026, 3, 1, 12, tzinfo=UTC)
+
+
+def _company() -> CompanyToResearch:
+    return CompanyToResearch(lead_id=uuid4(), company_name="Acme", company_domain="acme.com")
+
+
+def _cached(facets: dict[str, Any]) -> CachedResearch:
+    return CachedResearch(
+        research_id=uuid4(),
+        campaign_id=uuid4(),
+        company_domain="acme.com",
+        content={"aggregated": {}, "facets": facets},
+    )
+
+
+def _entry(hours_ago: float) -> dict[str, Any]:
+    data = {"results": [{"title": "t", "url": "u"}], "cost": 0.001, "tool_used": "serper_search"}
+    return facet_entry(data, NOW - timedelta(hours=hours_ago))
+
+
+class TestCompanyResearchPlanner:
+    """Tests for per-facet freshness planning."""
+
+    def test_without_cache_searches_every_facet(self) -> None:
+        plan = CompanyResearchPlanner().plan(_company(), None, now=NOW)
+
+        assert plan.stale_facets == ["news", "funding", "hiring", "tech"]
+        assert not plan.fully_cached
+
+    def test_reuses_only_fresh_facets(self) -> None:
+        cached = _cached({"news": _entry(100), "funding": _entry(100), "hiring": _entry(1)})
+
+        plan = CompanyResearchPlanner().plan(_company(), cached, now=NOW)
+
+        # News expires after 72h, funding after 720h; tech was never searched
+        assert plan.stale_facets == ["news", "tech"]
+        assert set(plan.reused_facets) == {"funding", "hiring"}
+
+        result = plan.cached_result("funding")
+        assert result["data"]["cost"] == 0.0
+        assert result["data"]["tool_used"] == CACHE_TOOL_NAME
+        assert result["data"]["results"] == [{"title": "t", "url": "u"}]
+        assert plan.reused_facets["funding"]["data"]["cost"] == 0.001
+
+    def test_fully_cached_when_all_facets_fresh(self) -> None:
+        cached = _cached({facet: _entry(1) for facet in ("news", "funding", "hiring", "tech")})
+
+        plan = CompanyResearchPlanner().plan(_company(), cached, now=NOW)
+
+        assert plan.fully_cached
+        assert plan.stale_facets == []
+
+    def test_rows_without_facets_are_stale(self) -> None:
+        cached = CachedResearch(
+            research_id=uuid4(),
+            campaign_id=uuid4(),
+            company_domain="acme.com",
+            content={"aggregated": {"headline": "old"}},
+        )
+        broken = _cached({"news": {"searched_at": "not a date", "data": {}}})
+
+        planner = CompanyResearchPlanner()
+
+        assert len(planner.plan(_company(), cached, now=NOW).stale_facets) == 4
+        assert "news" in planner.plan(_company(), broken, now=NOW).stale_facets
+
+    def test_ttl_overrides(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("COMPANY_RESEARCH_HIRING_TTL_HOURS", "0.5")
+        cached = _cached({"news": _entry(1), "hiring": _entry(1)})
+
+        plan = CompanyResearchPlanner({"news": 0}).plan(_company(), cached, now=NOW)
+
+        assert "news" in plan.stale_facets
+        assert "hiring" in plan.stale_facets
@@ -0,0 +1,254 @@
+"""Unit tests for the persistent cross-campaign exclusion index."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.agents.cross_campaign_dedup import (
+    CrossCampaignDedupAgent,
+    ExclusionIndexStore,
+)
+from src.agents.cross_campaign_dedup.exclusion_index import HIGH_WATER_MARK_OVERLAP
+
+NOW = datetime.now(UTC)
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class FakeSource:
+    """In-memory ContactChangeSource recording the marks it was asked for."""
+
+    def __init__(self, contacts: list[dict[str, Any]], suppression: list[tuple[str, datetime]]):
+        self.contacts = contacts
+        self.suppression = suppression
+        self.calls: list[tuple[datetime | None, datetime | None]] = []
+
+    async def stream_contact_changes(
+        self,
+        last_contacted_since: datetime | None = None,
+        updated_since: datetime | None = None,
+        chunk_size: int = 5000,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        self.calls.append((last_contacted_since, updated_since))
+        if last_contacted_since is None and updated_since is None:
+            rows = [
+                c
+                for c in self.contacts
+                if c["last_contacted_at"] is not None
+                or c["email_status"] in ("bounced", "unsubscribed", "complained")
+            ]
+        else:
+            rows = [
+                c
+                for c in self.contacts
+                if (
+                    last_contacted_since
+                    and c["last_contacted_at"]
+                    and c["last_contacted_at"] > last_contacted_since
+                )
+                or (updated_since and c["updated_at"] > updated_since)
+            ]
+        for start in range(0, len(rows), chunk_size):
+            yield rows[start : start + chunk_size]
+
+    async def get_suppression_entries(
+        self, since: datetime | None = None
+    ) -> list[tuple[str, datetime]]:
+        return [e for e in self.suppression if since is None or e[1] > since]
+
+
+def _contact(
+    contact_id: str,
+    campaign_id: str = "c1",
+    email_status: str | None = None,
+    contacted_days_ago: int | None = 10,
+    **fields: Any,
+) -> dict[str, Any]:
+    return {
+        "id": contact_id,
+        "campaign_id": campaign_id,
+        "linkedin_url": f"https://linkedin.com/in/{contact_id}",
+        "email": f"{contact_id}@example.com",
+        "first_name": "John",
+        "last_name": "Doe",
+        "company_name": "Acme Corp",
+        "email_status": email_status,
+        "last_contacted_at": (
+            NOW - timedelta(days=contacted_days_ago) if contacted_days_ago is not None else None
+        ),
+        "updated_at": NOW - timedelta(days=1),
+        **fields,
+    }
+
+
+def _all_rows(store: ExclusionIndexStore, campaign_id: str, lookback_days: int = 90) -> list[dict]:
+    chunks = store.iter_historical_contacts(campaign_id, lookback_days)
+    return [row for chunk in chunks for row in chunk]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestExclusionIndexStore:
+    """Tests for ExclusionIndexStore."""
+
+    def test_apply_and_query(self) -> None:
+        with ExclusionIndexStore(":memory:") as store:
+            store.apply_contact_changes([_contact("a"), _contact("b", campaign_id="c2")])
+
+            rows = _all_rows(store, "c2")
+            assert [row["email"] for row in rows] == ["a@example.com"]
+            assert rows[0]["last_contacted_at"].tzinfo is not None
+
+    def test_lookback_and_status_filter(self) -> None:
+        with ExclusionIndexStore(":memory:") as store:
+            store.apply_contact_changes(
+                [
+                    _contact("old", contacted_days_ago=200),
+                    _contact("old-bounced", email_status="bounced", contacted_days_ago=200),
+                    _contact("recent", contacted_days_ago=5),
+                ]
+            )
+            assert {row["email"] for row in _all_rows(store, "other", 90)} == {
+                "old-bounced@example.com",
+                "recent@example.com",
+            }
+
+    def test_disqualified_contact_is_deleted(self) -> None:
+        with ExclusionIndexStore(":memory:") as store:
+            store.apply_contact_changes(
+                [_contact("a", email_status="bounced", contacted_days_ago=None)]
+            )
+            assert len(store) == 1
+
+            upserted, deleted = store.apply_contact_changes(
+                [_contact("a", email_status="valid", contacted_days_ago=None)]
+            )
+            assert (upserted, deleted) == (0, 1)
+            assert len(store) == 0
+
+    def test_upsert_is_idempotent(self) -> None:
+        with ExclusionIndexStore(":memory:") as store:
+            store.apply_contact_changes([_contact("a")])
+            store.apply_contact_changes([_contact("a", email_status="bounced")])
+
+            assert len(store) == 1
+            assert _all_rows(store, "other")[0]["email_status"] == "bounced"
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_uses_persisted_marks(self, tmp_path: Path) -> None:
+        path = tmp_path / "exclusions.db"
+        contacts = [_contact("a"), _contact("b", contacted_days_ago=None)]
+        source = FakeSource(contacts, [("blocked@example.com", NOW - timedelta(days=2))])
+
+        with ExclusionIndexStore(path) as store:
+            cold = await store.sync(source)
+        assert cold.cold_build is True
+        assert cold.contacts_upserted == 1
+        assert source.calls[-1] == (None, None)
+
+        # New outreach and a status change after the first run
+        contacts.append(_contact("c", contacted_days_ago=0, updated_at=NOW))
+        contacts[1].update(email_status="unsubscribed", updated_at=NOW)
+
+        with ExclusionIndexStore(path) as store:
+            assert store.is_empty is False
+            warm = await store.sync(source)
+
+            assert warm.cold_build is False
+            # "a" is re-read inside the overlap window; re-applying it is harmless
+            assert warm.contacts_upserted == 3
+            assert len(store) == 3
+            assert store.get_suppression_list() == ["blocked@example.com"]
+
+        last_contacted_since, updated_since = source.calls[-1]
+        expected_since = contacts[0]["last_contacted_at"] - HIGH_WATER_MARK_OVERLAP
+        assert last_contacted_since is not None and updated_since is not None
+        assert abs(last_contacted_since - expected_since) < timedelta(milliseconds=1)
+
+    @pytest.mark.asyncio
+    async def test_full_reconcile_drops_deleted_rows(self, tmp_path: Path) -> None:
+        path = tmp_path / "exclusions.db"
+        contacts = [_contact("a"), _contact("b")]
+        suppression = [
+            ("blocked@example.com", NOW - timedelta(days=2)),
+            ("removed@example.com", NOW - timedelta(days=2)),
+        ]
+        source = FakeSource(contacts, suppression)
+
+        with ExclusionIndexStore(path) as store:
+            await store.sync(source)
+        assert len(source.calls) == 1
+
+        # Lead "b" and one suppression entry are deleted from the database
+        del contacts[1]
+        del suppression[1]
+
+        with ExclusionIndexStore(path) as store:
+            warm = await store.sync(source)
+            assert warm.full_reconcile is False
+            assert len(store) == 2
+
+            full = await store.sync(source, full_reconcile_interval=timedelta(0))
+            assert full.full_reconcile is True
+            assert source.calls[-1] == (None, None)
+            assert full.contacts_deleted == 1
+            assert full.suppression_removed == 1
+            assert [row["email"] for row in _all_rows(store, "other")] == ["a@example.com"]
+            assert store.get_suppression_list() == ["blocked@example.com"]
+            assert store.reconcile_due() is False
+
+
+class TestRunStreamingWithStore:
+    """Matching from the local index must equal matching from the database."""
+
+    @pytest.mark.asyncio
+    async def test_matches_in_memory_run(self) -> None:
+        contacts = [
+            _contact("a", campaign_id="c2"),
+            _contact("b", campaign_id="c3", email_status="bounced"),
+            _contact("c", campaign_id="c4", first_name="Jane", last_name="Smith"),
+            _contact("d", campaign_id="current"),
+        ]
+        leads = [
+            {"id": "l1", "email": "a@example.com"},
+            {"id": "l2", "linkedin_url": "https://linkedin.com/in/b"},
+            {"id": "l3", "first_name": "Jane", "last_name": "Smith", "company_name": "Acme Corp"},
+            {"id": "l4", "email": "d@example.com"},
+        ]
+        historical = [
+            {k: v for k, v in c.items() if k not in ("id", "updated_at")}
+            for c in contacts
+            if c["campaign_id"] != "current"
+        ]
+        agent = CrossCampaignDedupAgent()
+
+        with ExclusionIndexStore(":memory:") as store:
+            await store.sync(FakeSource(contacts, []))
+            actual = await agent.run_streaming(
+                campaign_id="current",
+                leads=leads,
+                historical_chunks=store.stream_historical_contacts("current", 90, chunk_size=2),
+                suppression_list=store.get_suppression_list(),
+            )
+        expected = await agent.run(
+            campaign_id="current",
+            leads=leads,
+            historical_data=historical,
+            suppression_list=[],
+        )
+
+        expected_dict = expected.to_dict()
+        actual_dict = actual.to_dict()
+        expected_dict.pop("execution_time_ms")
+        actual_dict.pop("execution_time_ms")
+        assert actual_dict == expected_dict
+        assert actual.passed_lead_ids == ["l4"]
@@ -0,0 +1,257 @@
+"""Unit tests for the cross-campaign historical fuzzy index."""
+
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from __tests__.fixtures.cross_campaign_dedup_fixtures import (
+    growing_dataset,
+    shares_blocking_key,
+    typo_dataset,
+)
+from src.agents.cross_campaign_dedup import (
+    HistoricalFuzzyIndex,
+    name_company_match,
+)
+from src.agents.cross_campaign_dedup.fuzzy_index import (
+    _bigrams,
+    _blocking_keys,
+    _company_core,
+    _ratio_upper_bound,
+)
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _full_scan(
+    lead: dict, historical_data: list[dict], threshold: float
+) -> tuple[dict, float] | None:
+    """Reference implementation: the original per-lead full scan."""
+    for hist in historical_data:
+        is_match, score = name_company_match(
+            lead["first_name"],
+            lead["last_name"],
+            lead["company_name"],
+            hist.get("first_name"),
+            hist.get("last_name"),
+            hist.get("company_name"),
+            threshold,
+        )
+        if is_match:
+            return hist, score
+    return None
+
+
+@pytest.fixture
+def historical_data() -> list[dict]:
+    """Historical contacts with near-duplicates spread across campaigns."""
+    return [
+        {
+            "first_name": "John",
+            "last_name": "Doe",
+            "company_name": "Acme Corp",
+            "campaign_id": "c1",
+        },
+        {
+            "first_name": "Jane",
+            "last_name": "Smith",
+            "company_name": "Tech Inc",
+            "campaign_id": "c2",
+        },
+        {"first_name": "Jon", "last_name": "Doe", "company_name": "Acme Corp", "campaign_id": "c3"},
+        {
+            "first_name": "Bob",
+            "last_name": "Wilson",
+            "company_name": "Widgets LLC",
+            "campaign_id": "c4",
+        },
+        {
+            "first_name": "Alice",
+            "last_name": "Johnson",
+            "company_name": "The Globex",
+            "campaign_id": "c5",
+        },
+        {"first_name": None, "last_name": None, "company_name": "Unknown", "campaign_id": "c6"},
+    ]
+
+
+# =============================================================================
+# Blocking Keys
+# =============================================================================
+
+
+class TestBlockingKeys:
+    """Tests for blocking key generation."""
+
+    def test_company_core_skips_leading_article(self) -> None:
+        assert _company_core("the acme corp") == "acme corp"
+        assert _company_core("the") == "the"
+
+    def test_one_key_per_field_pair(self) -> None:
+        keys = _blocking_keys("john", "doe", "acme corp")
+        assert [key.split(":")[0] for key in keys] == ["fl", "fc", "lc"]
+
+    def test_missing_field_drops_its_pairs(self) -> None:
+        assert _blocking_keys("", "doe", "the acme corp") == _blocking_keys("", "doe", "acme corp")
+        assert len(_blocking_keys("", "doe", "acme corp")) == 1
+        assert _blocking_keys("", "", "acme corp") == []
+
+
+# =============================================================================
+# Upper Bound Prefilter
+# =============================================================================
+
+
+class TestRatioUpperBound:
+    """The bigram prefilter must never undercut the exact ratio."""
+
+    def test_bound_is_never_below_exact_ratio(self) -> None:
+        rng = random.Random(42)
+        alphabet = "abcdeilmnorst "
+        for _ in range(5000):
+            a = " ".join("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 14))).split())
+            b = " ".join("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 14))).split())
+            exact = SequenceMatcher(None, a, b).ratio() if a and b else 0.0
+            assert _ratio_upper_bound(a, b, _bigrams(a)) >= exact - 1e-9
+
+    def test_empty_strings_bound_zero(self) -> None:
+        assert _ratio_upper_bound("", "acme", _bigrams("")) == 0.0
+
+
+# =============================================================================
+# Index Lookups
+# =============================================================================
+
+
+class TestHistoricalFuzzyIndex:
+    """Tests for HistoricalFuzzyIndex.find_match."""
+
+    def test_len(self, historical_data: list[dict]) -> None:
+        assert len(HistoricalFuzzyIndex(historical_data)) == 6
+
+    def test_returns_first_match_in_historical_order(self, historical_data: list[dict]) -> None:
+        index = HistoricalFuzzyIndex(historical_data)
+        match = index.find_match("John", "Doe", "Acme Corp", 0.85)
+
+        assert match is not None
+        hist, score = match
+        assert hist["campaign_id"] == "c1"
+        assert score == pytest.approx(1.0)
+
+    def test_no_match_returns_none(self, historical_data: list[dict]) -> None:
+        index = HistoricalFuzzyIndex(historical_data)
+        assert index.find_match("Zed", "Quinn", "Initech", 0.85) is None
+
+    def test_matches_across_leading_article(self, historical_data: list[dict]) -> None:
+        index = HistoricalFuzzyIndex(historical_data)
+        match = index.find_match("Alice", "Johnson", "Globex", 0.75)
+        assert match is not None
+        assert match[0]["campaign_id"] == "c5"
+
+    def test_repeated_lookup_uses_cache(self, historical_data: list[dict]) -> None:
+        index = HistoricalFuzzyIndex(historical_data)
+        first = index.find_match("Jon", "Doe", "Acme Corp", 0.85)
+        second = index.find_match("jon", " doe ", "ACME corp", 0.85)
+
+        assert first == second
+        assert index.stats.cache_hits == 1
+
+    def test_incremental_add_invalidates_cache(self) -> None:
+        index = HistoricalFuzzyIndex()
+        assert index.find_match("John", "Doe", "Acme Corp", 0.85) is None
+
+        index.add({"first_name": "John", "last_name": "Doe", "company_name": "Acme Corp"})
+        assert index.find_match("John", "Doe", "Acme Corp", 0.85) is not None
+
+    def test_matches_typo_in_first_letters(self) -> None:
+        index = HistoricalFuzzyIndex(
+            [{"first_name": "Catherine", "last_name": "Smith", "company_name": "Acne Corp"}]
+        )
+        match = index.find_match("Katherine", "Smith", "Acme Corp", 0.85)
+
+        assert match is not None
+        assert match[1] == pytest.approx(0.916, abs=1e-3)
+
+    def test_misses_changed_first_letters_in_two_fields(self) -> None:
+        """Documented blocking loss: no field pair sounds alike."""
+        history = [{"first_name": "Catherine", "last_name": "Smith", "company_name": "Ecme Corp"}]
+        index = HistoricalFuzzyIndex(history)
+
+        is_match, _ = name_company_match(
+            "Katherine", "Smith", "Acme Corp", "Catherine", "Smith", "Ecme Corp", 0.85
+        )
+        assert is_match
+        assert index.find_match("Katherine", "Smith", "Acme Corp", 0.85) is None
+
+    def test_candidates_per_lookup_stay_flat_as_history_grows(self) -> None:
+        def candidates_per_lookup(size: int) -> float:
+            historical = growing_dataset(seed=3, size=size)
+            index = HistoricalFuzzyIndex(historical)
+            queries = historical[:: size // 200][:200]
+            for hist in queries:
+                index.find_match(
+                    hist["first_name"], f"{hist['last_name']}x", hist["company_name"], 0.85
+                )
+            return index.stats.candidates / len(queries)
+
+        small, large = candidates_per_lookup(1000), candidates_per_lookup(8000)
+
+        # 8x the history, well under 2x the rows visited per lookup
+        assert large < 2 * small
+
+    def test_bound_prunes_before_scoring(self, historical_data: list[dict]) -> None:
+        index = HistoricalFuzzyIndex(historical_data)
+        index.find_match("Jonathan", "Dorian", "Acme Corporation", 0.95)
+
+        assert index.stats.pruned_by_bound > 0
+        assert index.stats.scored < index.stats.candidates
+
+    @pytest.mark.parametrize("threshold", [0.75, 0.85, 0.9])
+    def test_matches_full_scan(self, threshold: float) -> None:
+        rng = random.Random(7)
+        firsts = ["John", "Jon", "Jonathan", "Jane", "Mary", "Maria", "Robert", "Alice"]
+        lasts = ["Doe", "Smith", "Smyth", "Johnson", "Jonson", "Brown", "Braun"]
+        companies = ["Acme Corp", "Acme Corporation", "The Acme Corp", "Tech Inc", "Globex"]
+
+        def make() -> dict:
+            return {
+                "first_name": rng.choice(firsts),
+                "last_name": rng.choice(lasts),
+                "company_name": rng.choice(companies),
+            }
+
+        historical = [{**make(), "campaign_id": f"c{i}"} for i in range(300)]
+        leads = [make() for _ in range(100)]
+        index = HistoricalFuzzyIndex(historical)
+
+        for lead in leads:
+            expected = _full_scan(lead, historical, threshold)
+            actual = index.find_match(
+                lead["first_name"], lead["last_name"], lead["company_name"], threshold
+            )
+            assert actual == expected
+
+    @pytest.mark.parametrize("threshold", [0.75, 0.85, 0.9])
+    def test_matches_blocked_full_scan_with_random_typos(self, threshold: float) -> None:
+        historical, leads = typo_dataset(seed=11, size=400)
+        sources = {hist["campaign_id"]: hist for hist in historical}
+        index = HistoricalFuzzyIndex(historical)
+
+        matched = 0
+        for lead in leads:
+            blocked = [hist for hist in historical if shares_blocking_key(lead, hist)]
+            expected = _full_scan(lead, blocked, threshold)
+            actual = index.find_match(
+                lead["first_name"], lead["last_name"], lead["company_name"], threshold
+            )
+            assert actual == expected
+            # A single typo never hides the row the lead was copied from
+            if _full_scan(lead, [sources[lead["campaign_id"]]], threshold):
+                assert actual is not None
+            matched += expected is not None
+
+        assert matched > 0
+        assert index.stats.candidates < index.stats.lookups * len(historical)
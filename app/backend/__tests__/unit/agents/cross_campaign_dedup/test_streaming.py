@@ -0,0 +1,200 @@
+"""Unit tests for streaming cross-campaign dedup."""
+
+import random
+from collections.abc import AsyncIterator
+
+import pytest
+
+from __tests__.fixtures.cross_campaign_dedup_fixtures import (
+    growing_dataset,
+    shares_blocking_key,
+    typo_dataset,
+)
+from src.agents.cross_campaign_dedup import (
+    CrossCampaignDedupAgent,
+    StreamingExclusionMatcher,
+    name_company_match,
+)
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+async def _chunks(rows: list[dict], size: int) -> AsyncIterator[list[dict]]:
+    """Yield rows in fixed-size chunks like LeadRepository.stream_historical_contacts."""
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def _synthetic_campaign(seed: int) -> tuple[list[dict], list[dict], list[str]]:
+    """Build leads, history and suppression list with overlapping identities."""
+    rng = random.Random(seed)
+    firsts = ["John", "Jon", "Jane", "Mary", "Maria", "Robert", "Alice"]
+    lasts = ["Doe", "Smith", "Smyth", "Johnson", "Brown"]
+    companies = ["Acme Corp", "Acme Corporation", "Tech Inc", "Globex"]
+    statuses = [None, None, "bounced", "unsubscribed", "complained"]
+
+    def person(i: int) -> dict:
+        first = rng.choice(firsts)
+        last = rng.choice(lasts)
+        return {
+            "first_name": first,
+            "last_name": last,
+            "company_name": rng.choice(companies),
+            "email": f"{first}.{last}{i % 40}@example.com".lower(),
+            "linkedin_url": f"https://linkedin.com/in/{first}{last}{i % 60}".lower(),
+        }
+
+    historical = [
+        {**person(i), "campaign_id": f"c{i % 7}", "email_status": rng.choice(statuses)}
+        for i in range(400)
+    ]
+    leads = [{**person(i * 3), "id": f"lead-{i}"} for i in range(150)]
+    for lead in leads[::3]:
+        # Some leads have no history at all
+        lead["first_name"] = f"Unique{lead['id']}"
+        lead["company_name"] = f"Solo {lead['id']} Ltd"
+        lead["email"] = None
+        lead["linkedin_url"] = None
+    suppression = [lead["email"] for lead in leads[:8] if lead["email"]]
+    return leads, historical, suppression
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestStreamingExclusionMatcher:
+    """Tests for StreamingExclusionMatcher."""
+
+    def test_suppression_skips_history(self) -> None:
+        leads = [{"id": "l1", "email": "x@y.com", "first_name": "A", "company_name": "B"}]
+        matcher = StreamingExclusionMatcher(leads, ["X@Y.com"])
+        matcher.feed([{"email": "x@y.com", "campaign_id": "c1"}])
+
+        result = matcher.finalize()
+        assert result["suppression_list_excluded"] == 1
+        assert result["previously_contacted"] == 0
+
+    def test_exact_match_overrides_earlier_fuzzy_match(self) -> None:
+        leads = [
+            {
+                "id": "l1",
+                "first_name": "John",
+                "last_name": "Doe",
+                "company_name": "Acme Corp",
+                "email": "john@acme.com",
+            }
+        ]
+        matcher = StreamingExclusionMatcher(leads, [])
+        matcher.feed([{"first_name": "John", "last_name": "Doe", "company_name": "Acme Corp"}])
+        matcher.feed([{"email": "JOHN@acme.com", "email_status": "bounced", "campaign_id": "c2"}])
+
+        result = matcher.finalize()
+        assert result["bounced_excluded"] == 1
+        assert result["fuzzy_match_excluded"] == 0
+        assert result["exclusions"][0]["excluded_due_to_campaign"] == "c2"
+
+    def test_records_first_match_row(self) -> None:
+        leads = [{"id": "l1", "linkedin_url": "https://linkedin.com/in/a/"}]
+        matcher = StreamingExclusionMatcher(leads, [])
+        matcher.feed([{"linkedin_url": "x"}, {"linkedin_url": "https://linkedin.com/in/a"}])
+
+        assert matcher.stats.first_match_at_row == 2
+        assert matcher.stats.chunks == 1
+
+    @pytest.mark.parametrize("threshold", [0.75, 0.85, 0.9])
+    def test_fuzzy_matches_blocked_full_scan_with_random_typos(self, threshold: float) -> None:
+        historical, leads = typo_dataset(seed=5, size=300)
+        leads = [{**lead, "id": f"lead-{i}"} for i, lead in enumerate(leads)]
+        matcher = StreamingExclusionMatcher(leads, [], threshold)
+        matcher.feed(historical)
+
+        expected = {}
+        for lead in leads:
+            for hist in historical:
+                if not shares_blocking_key(lead, hist):
+                    continue
+                is_match, score = name_company_match(
+                    lead["first_name"],
+                    lead["last_name"],
+                    lead["company_name"],
+                    hist["first_name"],
+                    hist["last_name"],
+                    hist["company_name"],
+                    threshold,
+                )
+                if is_match:
+                    expected[lead["id"]] = (hist["campaign_id"], score)
+                    break
+
+        actual = {
+            exclusion["lead_id"]: (
+                exclusion["excluded_due_to_campaign"],
+                exclusion["match_confidence"],
+            )
+            for exclusion in matcher.finalize()["exclusions"]
+        }
+        assert expected
+        assert actual == expected
+
+    def test_leads_visited_per_row_stay_flat_as_campaign_grows(self) -> None:
+        def visited_per_row(size: int) -> float:
+            leads = [
+                {**lead, "id": f"lead-{i}"}
+                for i, lead in enumerate(growing_dataset(seed=9, size=size))
+            ]
+            history = [
+                {**lead, "last_name": f"{lead['last_name']}x"} for lead in leads[:: size // 200]
+            ]
+            matcher = StreamingExclusionMatcher(leads, [])
+            matcher.feed(history)
+            return matcher._fuzzy_index.stats.candidates / len(history)
+
+        small, large = visited_per_row(1000), visited_per_row(8000)
+
+        # 8x the leads, well under 2x the leads visited per history row
+        assert large < 2 * small
+
+
+class TestRunStreaming:
+    """run_streaming must produce the same result as run()."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("chunk_size", [1, 37, 1000])
+    async def test_matches_in_memory_run(self, chunk_size: int) -> None:
+        leads, historical, suppression = _synthetic_campaign(seed=11)
+        agent = CrossCampaignDedupAgent()
+
+        expected = await agent.run(
+            campaign_id="test-campaign",
+            leads=leads,
+            historical_data=historical,
+            suppression_list=suppression,
+        )
+        actual = await agent.run_streaming(
+            campaign_id="test-campaign",
+            leads=leads,
+            historical_chunks=_chunks(historical, chunk_size),
+            suppression_list=suppression,
+        )
+
+        expected_dict = expected.to_dict()
+        actual_dict = actual.to_dict()
+        expected_dict.pop("execution_time_ms")
+        actual_dict.pop("execution_time_ms")
+        assert actual_dict == expected_dict
+
+    @pytest.mark.asyncio
+    async def test_empty_leads(self) -> None:
+        agent = CrossCampaignDedupAgent()
+        result = await agent.run_streaming(
+            campaign_id="test-campaign",
+            leads=[],
+            historical_chunks=_chunks([], 10),
+            suppression_list=[],
+        )
+        assert result.success is True
+        assert "No leads to process" in result.warnings
@@ -7,9 +7,14 @@ Tests the main agent class including:
 - Handoff generation
 """
 
+import pickle
+from typing import Any
+from unittest.mock import patch
+
 import pytest
 
 from src.agents.data_validation.agent import DataValidationAgent, validate_leads
+from src.agents.data_validation.parallel import ParallelValidator
 from src.agents.data_validation.schemas import (
     BatchValidationResult,
     DataValidationResult,
@@ -271,6 +276,86 @@ class TestDataValidationAgentAsync:
         assert result.needs_enrichment == 1  # Only lead-1
 
 
+def _pool_leads(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"lead-{i}",
+            "linkedin_url": f"https://linkedin.com/in/person{i}" if i % 5 else None,
+            "first_name": "jane",
+            "last_name": "o'brien",
+            "company_name": f"Company {i % 3} Inc.",
+            "job_title": "VP of Sales",
+            "email": f"p{i}@acme.com" if i % 2 else None,
+        }
+        for i in range(count)
+    ]
+
+
+class TestDataValidationAgentProcessPool:
+    """Tests for validation on worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_pool_matches_thread_path(self) -> None:
+        leads = _pool_leads(23)
+
+        pooled = await DataValidationAgent(batch_size=5, validation_workers=2).run("c-1", leads)
+        threaded = await DataValidationAgent(batch_size=5, validation_workers=0).run("c-1", leads)
+
+        assert pooled.total_batches == 5
+        assert [b.batch_number for b in pooled.batch_results] == [1, 2, 3, 4, 5]
+        assert [r.to_dict() for b in pooled.batch_results for r in b.results] == [
+            r.to_dict() for b in threaded.batch_results for r in b.results
+        ]
+        assert pooled.total_valid == threaded.total_valid == 18
+        assert pooled.needs_enrichment == threaded.needs_enrichment
+        assert pooled.error_breakdown == threaded.error_breakdown
+        assert pooled.leads_per_second > 0
+        assert pooled.to_dict()["leads_per_second"] > 0
+
+    @pytest.mark.asyncio
+    async def test_threads_by_default(self) -> None:
+        agent = DataValidationAgent(batch_size=5)
+
+        with patch("src.agents.data_validation.agent.ParallelValidator") as validator_cls:
+            result = await agent.run("c-1", _pool_leads(23))
+
+        validator_cls.assert_not_called()
+        assert result.total_batches == 5
+        assert result.total_valid == 18
+
+    @pytest.mark.asyncio
+    async def test_single_batch_skips_pool(self) -> None:
+        agent = DataValidationAgent(batch_size=100)
+
+        with patch("src.agents.data_validation.agent.ParallelValidator") as validator_cls:
+            result = await agent.run("c-1", _pool_leads(10))
+
+        validator_cls.assert_not_called()
+        assert result.total_processed == 10
+
+    @pytest.mark.asyncio
+    async def test_validator_bounds_pending_batches(self) -> None:
+        leads = _pool_leads(15)
+
+        async with ParallelValidator(max_workers=1, max_pending=1) as validator:
+            batches = await validator.validate(leads, batch_size=4)
+
+        assert [b.batch_size for b in batches] == [4, 4, 4, 3]
+        assert [r.lead_id for b in batches for r in b.results] == [lead["id"] for lead in leads]
+
+    def test_lead_result_round_trips_through_pickle(self) -> None:
+        result = LeadValidationResult(
+            lead_id="lead-1",
+            is_valid=False,
+            status="invalid",
+            errors=["linkedin_url is required"],
+            normalized_data={"first_name": "Jane"},
+            needs_email_enrichment=True,
+        )
+
+        assert pickle.loads(pickle.dumps(result)) == result
+
+
 class TestConvenienceFunction:
     """Tests for validate_leads() convenience function."""
 
@@ -145,6 +145,13 @@ class TestDetectSeniority:
         assert detect_seniority("Software Engineer") is None
         assert detect_seniority(None) is None
 
+    def test_most_senior_level_wins_regardless_of_position(self) -> None:
+        """Test that priority, not position in the title, decides the level."""
+        assert detect_seniority("Senior Director of Sales") == "director"
+        assert detect_seniority("Team Lead, Office of the CEO") == "c_suite"
+        assert detect_seniority("Director") == "director"
+        assert detect_seniority("Sr. Dir, Engineering") == "director"
+
 
 class TestCompanyNameNormalization:
     """Tests for normalize_company_name()."""
@@ -0,0 +1 @@
+"""Tests for Duplicate Detection Agent."""
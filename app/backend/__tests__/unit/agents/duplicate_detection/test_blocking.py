@@ -0,0 +1,142 @@
+"""Unit tests for multi-pass fuzzy duplicate blocking."""
+
+import random
+
+import pytest
+
+from src.agents.duplicate_detection import (
+    LeadRecord,
+    calculate_composite_score,
+    find_candidate_matches,
+    find_fuzzy_duplicates,
+)
+from src.agents.duplicate_detection.blocking import (
+    first_company_key,
+    legacy_key,
+    score_fields,
+)
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _lead(lead_id: str, first: str, last: str, company: str) -> LeadRecord:
+    return LeadRecord(id=lead_id, first_name=first, last_name=last, company_name=company)
+
+
+def _all_pairs(leads: list[LeadRecord], threshold: float) -> set[tuple[str, str]]:
+    """Reference: score every pair."""
+    pairs = set()
+    for i, a in enumerate(leads):
+        for b in leads[i + 1 :]:
+            score, _ = calculate_composite_score(a, b)
+            if score >= threshold:
+                pairs.add((a.id, b.id))
+    return pairs
+
+
+def _synthetic_leads(count: int, seed: int) -> list[LeadRecord]:
+    rng = random.Random(seed)
+    firsts = ["John", "Jon", "Jane", "Mary", "Maria", "Robert", "Alice", "Bob"]
+    lasts = ["Doe", "Smith", "Smyth", "Johnson", "Jonson", "Brown"]
+    companies = ["Acme Corp", "The Acme Corp", "Tech Inc", "Globex", "Initech LLC"]
+    return [
+        _lead(f"lead-{i:04d}", rng.choice(firsts), rng.choice(lasts), rng.choice(companies))
+        for i in range(count)
+    ]
+
+
+# =============================================================================
+# Keys and Scoring
+# =============================================================================
+
+
+class TestBlockingKeys:
+    """Tests for blocking key functions."""
+
+    def test_legacy_key_splits_leading_article(self) -> None:
+        a = _lead("1", "John", "Doe", "The Acme")
+        b = _lead("2", "John", "Doe", "Acme")
+        assert legacy_key(a) != legacy_key(b)
+
+    def test_company_key_ignores_leading_article(self) -> None:
+        a = _lead("1", "John", "Doe", "The Acme")
+        b = _lead("2", "John", "Doe", "Acme")
+        assert first_company_key(a) == first_company_key(b)
+
+    def test_missing_fields_have_no_key(self) -> None:
+        assert first_company_key(_lead("1", "", "Doe", "Acme")) is None
+        assert legacy_key(_lead("1", "John", "Doe", "")) is None
+
+
+class TestScoreFields:
+    """score_fields must agree with calculate_composite_score."""
+
+    def test_matches_composite_score(self) -> None:
+        a = _lead("1", " John ", "Doe", "ACME Corp")
+        b = _lead("2", "jon", "doe", "Acme Corporation")
+        expected, breakdown = calculate_composite_score(a, b)
+
+        composite, fn_sim, ln_sim, co_sim = score_fields(
+            ("john", "doe", "acme corp"), ("jon", "doe", "acme corporation")
+        )
+        assert composite == pytest.approx(expected)
+        assert fn_sim == pytest.approx(breakdown["first_name_similarity"])
+        assert co_sim == pytest.approx(breakdown["company_similarity"])
+        assert ln_sim == pytest.approx(breakdown["last_name_similarity"])
+
+
+# =============================================================================
+# Engine
+# =============================================================================
+
+
+class TestFindFuzzyDuplicates:
+    """Tests for multi-pass find_fuzzy_duplicates."""
+
+    def test_finds_duplicate_across_leading_article(self) -> None:
+        leads = [
+            _lead("1", "John", "Doe", "The Acme Corp"),
+            _lead("2", "John", "Doe", "Acme Corp"),
+        ]
+        # The single legacy key never compares these two
+        assert find_fuzzy_duplicates(leads, blocking_keys=(legacy_key,), window_size=0) == []
+
+        groups = find_fuzzy_duplicates(leads, threshold=0.8)
+        assert len(groups) == 1
+        assert sorted(groups[0].lead_ids) == ["1", "2"]
+
+    def test_skips_already_matched(self) -> None:
+        leads = [_lead("1", "John", "Doe", "Acme"), _lead("2", "John", "Doe", "Acme")]
+        assert find_fuzzy_duplicates(leads, already_matched_ids={"1"}) == []
+
+    def test_superset_of_legacy_pairs(self) -> None:
+        leads = _synthetic_leads(200, seed=3)
+        legacy, _ = find_candidate_matches(leads, 0.85, blocking_keys=(legacy_key,), window_size=0)
+        multi, stats = find_candidate_matches(leads, 0.85)
+
+        assert {p[:2] for p in legacy} <= {p[:2] for p in multi}
+        assert stats.window_pairs > 0
+        assert stats.matches == len(multi)
+
+    def test_recall_against_all_pairs(self) -> None:
+        leads = _synthetic_leads(150, seed=5)
+        expected = _all_pairs(leads, 0.9)
+
+        pairs, _ = find_candidate_matches(leads, 0.9)
+        found = {(leads[a].id, leads[b].id) for a, b, *_ in pairs}
+
+        assert found <= expected
+        assert len(found) >= 0.95 * len(expected)
+
+    def test_large_blocks_scored_in_pool(self) -> None:
+        leads = _synthetic_leads(120, seed=9)
+        inline, inline_stats = find_candidate_matches(leads, 0.85, max_workers=0)
+        pooled, pooled_stats = find_candidate_matches(
+            leads, 0.85, parallel_block_size=10, max_workers=2
+        )
+
+        assert pooled_stats.large_blocks > 0
+        assert inline_stats.large_blocks == 0
+        assert sorted(p[:3] for p in pooled) == pytest.approx(sorted(p[:3] for p in inline))
@@ -12,6 +12,7 @@ from src.agents.email_generation.frameworks import (
     QUESTION_TEMPLATE,
     SOFT_CTAS,
     build_generation_prompt,
+    build_generation_prompt_parts,
     get_framework_template,
     select_framework_for_tier,
 )
@@ -337,3 +338,35 @@ class TestBuildGenerationPrompt:
         assert "Pain-Agitate-Solution" in pas_prompt
         assert "Before-After-Bridge" in bab_prompt
         assert "Pain-Agitate-Solution" not in bab_prompt
+
+    def test_prompt_parts_share_prefix_across_leads(
+        self,
+        lead_context: dict,
+        persona_context: dict,
+        niche_context: dict,
+    ) -> None:
+        """Test only the suffix changes between leads of the same tier."""
+        other_lead = {**lead_context, "first_name": "Jane", "company_name": "Globex"}
+        first = build_generation_prompt_parts(
+            framework=EmailFramework.PAS,
+            lead_context=lead_context,
+            persona_context=persona_context,
+            niche_context=niche_context,
+        )
+        second = build_generation_prompt_parts(
+            framework=EmailFramework.PAS,
+            lead_context=other_lead,
+            persona_context=persona_context,
+            niche_context=niche_context,
+            company_research={"summary": "Globex builds rockets"},
+        )
+
+        assert first.prefix == second.prefix
+        assert "John" not in first.prefix
+        assert "Globex" in second.suffix
+        assert first.text == build_generation_prompt(
+            framework=EmailFramework.PAS,
+            lead_context=lead_context,
+            persona_context=persona_context,
+            niche_context=niche_context,
+        )
@@ -0,0 +1,173 @@
+"""Unit tests for the content-addressed generated email cache."""
+
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agents.email_generation.generation_cache import (
+    EmailGenerationCache,
+    configure_generation_cache,
+    generation_cache_key,
+)
+from src.agents.email_generation.tools import generate_email_impl
+
+REPLY = json.dumps(
+    {
+        "subject_line": "Pipeline at Acme",
+        "opening_line": "Saw Acme just opened a Denver office.",
+        "body": "Teams like yours use us to book more meetings.",
+        "cta": "Worth a quick chat next week?",
+        "full_email": "Saw Acme just opened a Denver office. Worth a quick chat next week?",
+    }
+)
+
+ARGS = {
+    "lead_id": "lead-1",
+    "campaign_id": "campaign-123",
+    "first_name": "Jane",
+    "last_name": "Doe",
+    "title": "VP Sales",
+    "company_name": "Acme",
+    "lead_tier": "B",
+}
+
+
+@pytest.fixture
+def cache() -> Iterator[EmailGenerationCache]:
+    cache = EmailGenerationCache()
+    configure_generation_cache(cache)
+    yield cache
+    configure_generation_cache(None)
+    cache.close()
+
+
+# =============================================================================
+# EmailGenerationCache
+# =============================================================================
+
+
+class TestEmailGenerationCache:
+    """Tests for keys, hits, expiry and eviction."""
+
+    def test_key_covers_prompt_and_parameters(self) -> None:
+        key = generation_cache_key("prefix", "suffix", "model", 1000, 0.7)
+
+        assert key == generation_cache_key("prefix", "suffix", "model", 1000, 0.7)
+        assert key != generation_cache_key("prefix", "suffix 2", "model", 1000, 0.7)
+        assert key != generation_cache_key("prefix", "suffix", "model", 1000, 0.2)
+        assert key != generation_cache_key("prefix", "suffix", "other", 1000, 0.7)
+
+    def test_hit_and_miss_counts(self, cache: EmailGenerationCache) -> None:
+        assert cache.get("k") is None
+        cache.put("k", REPLY, "model")
+
+        assert cache.get("k") == REPLY
+        assert cache.stats.to_dict()["hit_rate"] == 0.5
+
+    def test_expired_entries_are_not_served(self) -> None:
+        with EmailGenerationCache(ttl_seconds=60) as cache:
+            cache.put("k", REPLY, "model")
+            with patch("time.time", return_value=time.time() + 120):
+                assert cache.get("k") is None
+                assert cache.evict() == 1
+
+    def test_least_recently_used_evicted_over_limit(self) -> None:
+        with EmailGenerationCache(max_entries=2) as cache:
+            for key in ("a", "b", "c"):
+                cache.put(key, REPLY, "model")
+                time.sleep(0.001)
+            cache.get("a")
+
+            assert cache.evict() == 1
+            assert cache.get("b") is None
+            assert cache.get("a") == REPLY
+            assert len(cache) == 2
+
+    def test_persists_across_runs(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache" / "email_generation.db"
+        with EmailGenerationCache(path) as cache:
+            cache.put("k", REPLY, "model")
+
+        with EmailGenerationCache(path) as reopened:
+            assert reopened.get("k") == REPLY
+
+
+# =============================================================================
+# generate_email_impl
+# =============================================================================
+
+
+class TestGenerateEmailUsesCache:
+    """Unchanged inputs skip the API call and are scored again."""
+
+    @pytest.mark.asyncio
+    async def test_rerun_skips_api_call(
+        self, cache: EmailGenerationCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+
+        with (
+            patch(
+                "src.agents.email_generation.tools._get_anthropic_client",
+                return_value=MagicMock(),
+            ),
+            patch(
+                "src.agents.email_generation.tools._call_anthropic_with_retry",
+                new_callable=AsyncMock,
+                return_value=REPLY,
+            ) as mock_call,
+        ):
+            first = json.loads((await generate_email_impl(ARGS))["content"][0]["text"])
+            second = json.loads((await generate_email_impl(ARGS))["content"][0]["text"])
+            changed = json.loads(
+                (await generate_email_impl({**ARGS, "title": "CRO"}))["content"][0]["text"]
+            )
+
+        assert mock_call.call_count == 2
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert changed["cached"] is False
+        assert second["email"]["subject_line"] == "Pipeline at Acme"
+        assert second["quality_score"] == first["quality_score"]
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "reply",
+        [
+            "Sorry, I can't write that email.",
+            '{"subject_line": "Hi", "body": "truncated',
+            json.dumps({"subject_line": "Hi", "body": "We sell software.", "full_email": "Hi"}),
+        ],
+        ids=["no_json", "invalid_json", "below_threshold"],
+    )
+    async def test_rejected_reply_is_not_cached(
+        self, cache: EmailGenerationCache, monkeypatch: pytest.MonkeyPatch, reply: str
+    ) -> None:
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+
+        with (
+            patch(
+                "src.agents.email_generation.tools._get_anthropic_client",
+                return_value=MagicMock(),
+            ),
+            patch(
+                "src.agents.email_generation.tools._call_anthropic_with_retry",
+                new_callable=AsyncMock,
+                side_effect=[reply, REPLY],
+            ) as mock_call,
+        ):
+            first = json.loads((await generate_email_impl(ARGS))["content"][0]["text"])
+            # Regeneration after a rejected reply asks the model again
+            second = json.loads((await generate_email_impl(ARGS))["content"][0]["text"])
+
+        assert mock_call.call_count == 2
+        assert first["cached"] is False
+        assert second["cached"] is False
+        assert second["email"]["subject_line"] == "Pipeline at Acme"
+        assert len(cache) == 1
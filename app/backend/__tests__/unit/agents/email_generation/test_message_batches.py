@@ -0,0 +1,335 @@
+"""Unit tests for Message Batches email generation against a local stub endpoint."""
+
+import json
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import anthropic
+import httpx
+import pytest
+
+from src.agents.email_generation.agent import DirectEmailGenerator
+from src.agents.email_generation.generation_cache import (
+    EmailGenerationCache,
+    configure_generation_cache,
+)
+from src.agents.email_generation.message_batches import (
+    MessageBatchCheckpointStore,
+    MessageBatchConfig,
+    MessageBatchRunner,
+)
+from src.agents.email_generation.tools import (
+    GenerationRequest,
+    get_generation_usage,
+    prepare_generation_request,
+)
+
+CAMPAIGN_ID = "campaign-123"
+BASE_URL = "http://batches.stub"
+
+EMAIL_REPLY = json.dumps(
+    {
+        "subject_line": "Pipeline at Acme",
+        "opening_line": "Saw Acme just opened a Denver office.",
+        "body": "Teams like yours use us to book more meetings.",
+        "cta": "Worth a quick chat next week?",
+        "full_email": "Saw Acme just opened a Denver office. Worth a quick chat next week?",
+    }
+)
+
+
+class _BatchStub:
+    """In-process Message Batches endpoint (create, retrieve, results)."""
+
+    def __init__(
+        self,
+        polls_until_ended: int = 1,
+        errored: set[str] | None = None,
+        reply: str = EMAIL_REPLY,
+    ) -> None:
+        self.polls_until_ended = polls_until_ended
+        self.errored = errored or set()
+        self.reply = reply
+        self.batches: dict[str, list[dict[str, Any]]] = {}
+        self.polls: dict[str, int] = {}
+        self.creates = 0
+
+    def _batch(self, batch_id: str) -> dict[str, Any]:
+        ended = self.polls[batch_id] > self.polls_until_ended
+        count = len(self.batches[batch_id])
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else count,
+                "succeeded": count if ended else 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": "2026-01-01T00:00:00Z",
+            "expires_at": "2026-01-02T00:00:00Z",
+            "ended_at": "2026-01-01T01:00:00Z" if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{BASE_URL}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def _result(self, request: dict[str, Any]) -> dict[str, Any]:
+        custom_id = request["custom_id"]
+        if custom_id in self.errored:
+            return {
+                "custom_id": custom_id,
+                "result": {
+                    "type": "errored",
+                    "error": {
+                        "type": "error",
+                        "error": {"type": "overloaded_error", "message": "Overloaded"},
+                    },
+                },
+            }
+        return {
+            "custom_id": custom_id,
+            "result": {
+                "type": "succeeded",
+                "message": {
+                    "id": f"msg-{custom_id}",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": request["params"]["model"],
+                    "content": [{"type": "text", "text": f"Here you go:\n{self.reply}"}],
+                    "stop_reason": "end_turn",
+                    "stop_sequence": None,
+                    "usage": {
+                        "input_tokens": 10,
+                        "cache_read_input_tokens": 30,
+                        "output_tokens": 20,
+                    },
+                },
+            },
+        }
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST" and path == "/v1/messages/batches":
+            self.creates += 1
+            batch_id = f"msgbatch_{self.creates}"
+            self.batches[batch_id] = json.loads(request.content)["requests"]
+            self.polls[batch_id] = 0
+            return httpx.Response(200, json=self._batch(batch_id))
+
+        batch_id = path.split("/")[4]
+        if path.endswith("/results"):
+            lines = [json.dumps(self._result(r)) for r in self.batches[batch_id]]
+            return httpx.Response(200, content="\n".join(lines).encode())
+        self.polls[batch_id] += 1
+        return httpx.Response(200, json=self._batch(batch_id))
+
+    def client(self) -> anthropic.AsyncAnthropic:
+        return anthropic.AsyncAnthropic(
+            api_key="test",
+            base_url=BASE_URL,
+            max_retries=0,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self.handle)),
+        )
+
+
+def _requests(count: int) -> list[GenerationRequest]:
+    return [
+        prepare_generation_request(
+            {
+                "lead_id": f"lead-{i}",
+                "campaign_id": CAMPAIGN_ID,
+                "first_name": "Jane",
+                "last_name": "Doe",
+                "title": "VP Sales",
+                "company_name": "Acme",
+                "lead_tier": "B",
+                "persona_challenges": "pipeline",
+            }
+        )
+        for i in range(count)
+    ]
+
+
+# =============================================================================
+# MessageBatchRunner
+# =============================================================================
+
+
+class TestMessageBatchRunner:
+    """Tests for submitting, polling and scoring Message Batches."""
+
+    @pytest.mark.asyncio
+    async def test_splits_polls_and_scores_results(self) -> None:
+        stub = _BatchStub(polls_until_ended=2, errored={"req-1"})
+        config = MessageBatchConfig(max_requests_per_batch=2, poll_interval=0)
+        runner = MessageBatchRunner(config, client=stub.client())
+        baseline = replace(get_generation_usage())
+
+        results = await runner.run(CAMPAIGN_ID, _requests(5))
+
+        assert stub.creates == 3
+        assert [len(requests) for requests in stub.batches.values()] == [2, 2, 1]
+        # req-1 errored in both full batches
+        assert [r["lead_id"] for r in results] == ["lead-0", "lead-2", "lead-4"]
+        assert results[0]["email"]["subject_line"] == "Pipeline at Acme"
+        assert results[0]["quality_score"] > 0
+        assert results[0]["framework"] == _requests(1)[0].framework.value
+        assert runner.stats.succeeded == 3
+        assert runner.stats.failed == 2
+
+        params = stub.batches["msgbatch_1"][0]["params"]
+        (system,) = params["system"]
+        assert params["model"] == config.model
+        assert system["text"] == _requests(1)[0].prompt_prefix
+        assert system["cache_control"] == {"type": "ephemeral"}
+        assert params["messages"] == [{"role": "user", "content": _requests(1)[0].prompt_suffix}]
+
+        usage = get_generation_usage().since(baseline)
+        assert usage.requests == 3
+        assert usage.cache_read_input_tokens == 90
+        assert usage.cache_hit_rate == 0.75
+
+    @pytest.mark.asyncio
+    async def test_resumes_pending_batches_from_checkpoint(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "batches" / "email_batches.db")
+        stub = _BatchStub(polls_until_ended=1)
+        requests = _requests(3)
+
+        # Gives up before the batch ends; it stays pending in the checkpoint
+        first = MessageBatchRunner(
+            MessageBatchConfig(poll_interval=0, max_wait=0, checkpoint_path=path),
+            client=stub.client(),
+        )
+        assert await first.run(CAMPAIGN_ID, requests) == []
+        assert first.stats.unfinished_batches == 1
+
+        second = MessageBatchRunner(
+            MessageBatchConfig(poll_interval=0, checkpoint_path=path), client=stub.client()
+        )
+        results = await second.run(CAMPAIGN_ID, requests)
+
+        assert stub.creates == 1
+        assert second.stats.batches_resumed == 1
+        assert len(results) == 3
+
+        # A run with nothing left pending clears the campaign's checkpoints
+        with MessageBatchCheckpointStore(path) as store:
+            assert store.pending_batches(CAMPAIGN_ID) == {}
+            assert store.results(CAMPAIGN_ID) == {}
+
+    @pytest.mark.asyncio
+    async def test_ignores_checkpoints_for_a_changed_prompt(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "email_batches.db")
+        stub = _BatchStub(polls_until_ended=1)
+        requests = _requests(2)
+
+        first = MessageBatchRunner(
+            MessageBatchConfig(poll_interval=0, max_wait=0, checkpoint_path=path),
+            client=stub.client(),
+        )
+        await first.run(CAMPAIGN_ID, requests[:1])
+        with MessageBatchCheckpointStore(path) as store:
+            store.save_result(CAMPAIGN_ID, "lead-1", "old-prompt", {"lead_id": "lead-1"})
+
+        changed = [
+            replace(request, prompt_suffix=f"{request.prompt_suffix}!") for request in requests
+        ]
+        second = MessageBatchRunner(
+            MessageBatchConfig(poll_interval=0, checkpoint_path=path), client=stub.client()
+        )
+        results = await second.run(CAMPAIGN_ID, changed)
+
+        assert stub.creates == 2
+        assert second.stats.from_checkpoint == 0
+        assert second.stats.batches_resumed == 1
+        assert second.stats.requests_submitted == 2
+        assert [r["lead_id"] for r in results] == ["lead-0", "lead-1"]
+        assert [r["content"] for r in stub.batches["msgbatch_2"][0]["params"]["messages"]] == [
+            changed[0].prompt_suffix
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cached_replies_are_not_submitted(self) -> None:
+        stub = _BatchStub()
+        config = MessageBatchConfig(poll_interval=0)
+        cache = EmailGenerationCache()
+        configure_generation_cache(cache)
+        try:
+            first = await MessageBatchRunner(config, client=stub.client()).run(
+                CAMPAIGN_ID, _requests(2)
+            )
+            runner = MessageBatchRunner(config, client=stub.client())
+            second = await runner.run(CAMPAIGN_ID, _requests(2))
+        finally:
+            configure_generation_cache(None)
+            cache.close()
+
+        assert stub.creates == 1
+        assert runner.stats.from_cache == 2
+        assert [r["cached"] for r in first] == [False, False]
+        assert [r["cached"] for r in second] == [True, True]
+        assert second[0]["quality_score"] == first[0]["quality_score"]
+
+    @pytest.mark.asyncio
+    async def test_unparsed_replies_are_not_cached(self) -> None:
+        stub = _BatchStub(reply='{"subject_line": "Pipeline at Acme", "body": "cut off')
+        config = MessageBatchConfig(poll_interval=0)
+        cache = EmailGenerationCache()
+        configure_generation_cache(cache)
+        try:
+            await MessageBatchRunner(config, client=stub.client()).run(CAMPAIGN_ID, _requests(2))
+            runner = MessageBatchRunner(config, client=stub.client())
+            await runner.run(CAMPAIGN_ID, _requests(2))
+        finally:
+            configure_generation_cache(None)
+            cache.close()
+
+        assert stub.creates == 2
+        assert runner.stats.from_cache == 0
+
+
+# =============================================================================
+# DirectEmailGenerator batch mode
+# =============================================================================
+
+
+class TestDirectEmailGeneratorMessageBatches:
+    """DirectEmailGenerator hands prompts to the runner when batch_config is set."""
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_uses_message_batches(self) -> None:
+        generator = DirectEmailGenerator(batch_config=MessageBatchConfig())
+        leads = [
+            {"id": "lead-1", "first_name": "Jane", "company_name": "Acme", "lead_tier": "A"},
+            {"first_name": "No", "last_name": "Id"},
+        ]
+
+        with (
+            patch(
+                "src.agents.email_generation.agent.MessageBatchRunner.run",
+                new_callable=AsyncMock,
+                return_value=[{"lead_id": "lead-1"}],
+            ) as mock_run,
+            patch(
+                "src.agents.email_generation.agent.generate_email_impl", new_callable=AsyncMock
+            ) as mock_generate,
+        ):
+            results = await generator.generate_batch(
+                leads=leads,
+                persona_context={"challenges": ["pipeline"]},
+                niche_context={},
+                campaign_id=CAMPAIGN_ID,
+            )
+
+        assert results == [{"lead_id": "lead-1"}]
+        mock_generate.assert_not_called()
+        campaign_id, requests = mock_run.call_args.args
+        assert campaign_id == CAMPAIGN_ID
+        assert [r.lead_id for r in requests] == ["lead-1"]
+        assert requests[0].tier == "A"
+        assert generator.last_batch_stats is not None
@@ -0,0 +1,130 @@
+"""Unit tests for the token-aware Anthropic rate limiter."""
+
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agents.email_generation.rate_limiter import TokenAwareRateLimiter, TokenRateLimits
+from src.agents.email_generation.tools import _call_anthropic_with_retry
+
+
+def _usage(input_tokens: int, output_tokens: int, cache_read: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cache_creation_input_tokens=0,
+        cache_read_input_tokens=cache_read,
+    )
+
+
+def _limiter(**limits: float) -> TokenAwareRateLimiter:
+    return TokenAwareRateLimiter(TokenRateLimits(**limits), max_tokens=100)
+
+
+# =============================================================================
+# Budgets
+# =============================================================================
+
+
+class TestTokenAwareRateLimiter:
+    """Tests for token budgets, reconciliation and header adaptation."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_input_token_budget(self) -> None:
+        # 60,000 input tokens/min refills 1,000 per second
+        limiter = _limiter(input_tokens_per_minute=60_000, output_tokens_per_minute=60_000)
+        await limiter.acquire(60_000)
+
+        start = time.monotonic()
+        await limiter.acquire(100)
+
+        assert time.monotonic() - start >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_reconcile_returns_unused_estimate(self) -> None:
+        limiter = _limiter(input_tokens_per_minute=10_000)
+        reservation = await limiter.acquire(4_000)
+
+        limiter.reconcile(reservation, _usage(1_000, 40, cache_read=5_000))
+
+        utilization = limiter.utilization()
+        assert utilization["input"]["available"] == pytest.approx(9_000, abs=5)
+        assert utilization["in_flight"] == 0
+        # Output estimate follows observed replies instead of max_tokens
+        assert limiter.estimate_output_tokens() == pytest.approx(48)
+
+    def test_headers_set_limits_and_remaining(self) -> None:
+        limiter = _limiter()
+
+        limiter.update_from_headers(
+            {
+                "anthropic-ratelimit-requests-limit": "1000",
+                "anthropic-ratelimit-input-tokens-limit": "450000",
+                "anthropic-ratelimit-input-tokens-remaining": "1200",
+                "anthropic-ratelimit-output-tokens-limit": "bad",
+            }
+        )
+
+        utilization = limiter.utilization()
+        assert utilization["requests"]["limit"] == 1000
+        assert utilization["input"]["limit"] == 450_000
+        assert utilization["input"]["available"] == pytest.approx(1_200, abs=10)
+        assert utilization["output"]["limit"] == 8_000
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_pauses_callers(self) -> None:
+        limiter = _limiter(requests_per_minute=60_000)
+        limiter.on_rate_limited(retry_after=0.1)
+
+        start = time.monotonic()
+        await limiter.acquire(10)
+
+        assert time.monotonic() - start >= 0.09
+        assert limiter.utilization()["rate_limited"] == 1
+
+    def test_concurrency_follows_budget_and_latency(self) -> None:
+        small = _limiter(requests_per_minute=50, output_tokens_per_minute=8_000)
+        large = _limiter(requests_per_minute=4_000, output_tokens_per_minute=400_000)
+
+        assert small.recommended_concurrency() < large.recommended_concurrency()
+        assert large.recommended_concurrency() == large.max_concurrency
+
+
+# =============================================================================
+# _call_anthropic_with_retry
+# =============================================================================
+
+
+class TestCallUsesLimiter:
+    """Generation calls reserve budget and reconcile against usage and headers."""
+
+    @pytest.mark.asyncio
+    async def test_call_reconciles_usage_and_headers(self) -> None:
+        limiter = _limiter(input_tokens_per_minute=10_000)
+        message = SimpleNamespace(
+            content=[SimpleNamespace(text="{}")], usage=_usage(input_tokens=50, output_tokens=20)
+        )
+        raw = MagicMock()
+        raw.headers = {"anthropic-ratelimit-output-tokens-limit": "16000"}
+        raw.parse.return_value = message
+        client: Any = MagicMock()
+        client.messages.with_raw_response.create = AsyncMock(return_value=raw)
+
+        with patch(
+            "src.agents.email_generation.tools._get_anthropic_rate_limiter", return_value=limiter
+        ):
+            text = await _call_anthropic_with_retry(client, "suffix", prompt_prefix="prefix")
+
+        assert text == "{}"
+        kwargs = client.messages.with_raw_response.create.call_args.kwargs
+        assert kwargs["system"] == [
+            {"type": "text", "text": "prefix", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert kwargs["messages"] == [{"role": "user", "content": "suffix"}]
+        utilization = limiter.utilization()
+        assert utilization["output"]["limit"] == 16_000
+        assert utilization["input"]["available"] == pytest.approx(9_950, abs=5)
+        assert utilization["in_flight"] == 0
@@ -0,0 +1,261 @@
+"""
+Unit tests for streamed Instantly uploads.
+
+Tests the keyset-paginated batch loader, the adaptive in-flight window
+and DirectEmailUploader.upload_stream against a fake Instantly client.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agents.email_sending.agent import DirectEmailUploader, EmailSendingConfig
+from src.agents.email_sending.tools import reset_cost_tracker, stream_upload_batches
+from src.agents.email_sending.upload_window import AdaptiveUploadWindow
+from src.integrations.base import RateLimitError
+from src.integrations.instantly import InstantlyError
+
+
+def _row(index: int, tier: str, score: int) -> Any:
+    return SimpleNamespace(
+        id=f"lead-{index}",
+        email=f"lead{index}@example.com",
+        first_name="Jane",
+        last_name="Doe",
+        company_name="Acme",
+        lead_tier=tier,
+        generated_email_id=None,
+        lead_score=score,
+        subject_line="Subject",
+        full_email="Body",
+        quality_score=80,
+        tier_rank={"A": 0, "B": 1}.get(tier, 2),
+        score_key=score,
+    )
+
+
+def _rate_limited(retry_after: int | None = 0) -> InstantlyError:
+    try:
+        raise RateLimitError(status_code=429, retry_after=retry_after)
+    except RateLimitError as cause:
+        error = InstantlyError("Rate limit exceeded", status_code=429)
+        error.__cause__ = cause
+        return error
+
+
+class _FakeInstantly:
+    """bulk_add_leads that rate limits any call above a concurrency limit."""
+
+    def __init__(self, concurrency_limit: int, latency: float = 0.01) -> None:
+        self.concurrency_limit = concurrency_limit
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+        self.rate_limited = 0
+
+    async def bulk_add_leads(self, leads: list[dict[str, Any]], campaign_id: str) -> Any:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.in_flight > self.concurrency_limit:
+                self.rate_limited += 1
+                raise _rate_limited()
+            return SimpleNamespace(
+                created_count=len(leads),
+                updated_count=0,
+                failed_count=0,
+                created_leads=[],
+                failed_leads=[],
+            )
+        finally:
+            self.in_flight -= 1
+
+
+async def _batches(count: int, size: int = 2) -> AsyncIterator[list[dict[str, Any]]]:
+    for b in range(count):
+        yield [{"id": f"lead-{b}-{i}", "email": f"{b}-{i}@example.com"} for i in range(size)]
+
+
+# =============================================================================
+# stream_upload_batches
+# =============================================================================
+
+
+class TestStreamUploadBatches:
+    """Tests for the keyset-paginated loader."""
+
+    @pytest.mark.asyncio
+    async def test_pages_by_keyset_and_rebatches(self) -> None:
+        pages = [
+            [_row(0, "A", 90), _row(1, "A", 70), _row(2, "B", 95)],
+            [_row(3, "C", 99)],
+        ]
+        calls: list[dict[str, Any]] = []
+
+        async def execute(query: Any, params: dict[str, Any]) -> Any:
+            calls.append(params)
+            result = MagicMock()
+            result.fetchall.return_value = pages[len(calls) - 1]
+            return result
+
+        session = AsyncMock()
+        session.execute = execute
+        cm = AsyncMock()
+        cm.__aenter__.return_value = session
+
+        with patch("src.database.connection.get_session", return_value=cm):
+            batches = [
+                batch
+                async for batch in stream_upload_batches("campaign-1", batch_size=2, page_size=3)
+            ]
+
+        assert [[lead["id"] for lead in batch] for batch in batches] == [
+            ["lead-0", "lead-1"],
+            ["lead-2", "lead-3"],
+        ]
+        assert batches[0][0]["email_data"]["full_email"] == "Body"
+        assert "after_id" not in calls[0]
+        # Second page starts after the last (tier, score, id) of the first
+        assert calls[1]["after_rank"] == 1
+        assert calls[1]["after_score"] == -95
+        assert calls[1]["after_id"] == "lead-2"
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_leads(self) -> None:
+        result = MagicMock()
+        result.fetchall.return_value = [_row(i, "A", 50) for i in range(2)]
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=result)
+        cm = AsyncMock()
+        cm.__aenter__.return_value = session
+
+        with patch("src.database.connection.get_session", return_value=cm):
+            batches = [
+                batch
+                async for batch in stream_upload_batches(
+                    "campaign-1", batch_size=10, max_leads=2, page_size=5
+                )
+            ]
+
+        assert session.execute.call_count == 1
+        assert session.execute.call_args.args[1]["limit"] == 2
+        assert len(batches) == 1
+
+
+# =============================================================================
+# AdaptiveUploadWindow
+# =============================================================================
+
+
+class TestAdaptiveUploadWindow:
+    """Tests for window growth, shrinking and 429 pauses."""
+
+    @pytest.mark.asyncio
+    async def test_grows_after_a_window_of_successes(self) -> None:
+        window = AdaptiveUploadWindow(initial=2, maximum=3)
+
+        for _ in range(6):
+            await window.acquire()
+            await window.release()
+
+        assert window.size == 3
+        assert window.peak_size == 3
+
+    @pytest.mark.asyncio
+    async def test_halves_once_per_pause_and_waits(self) -> None:
+        window = AdaptiveUploadWindow(initial=8)
+        for _ in range(3):
+            await window.acquire()
+
+        await window.release(rate_limited=True, retry_after=0.1)
+        await window.release(rate_limited=True, retry_after=0.1)
+
+        assert window.size == 4
+        assert window.rate_limited == 2
+
+        start = time.monotonic()
+        await window.acquire()
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_blocks_when_full(self) -> None:
+        window = AdaptiveUploadWindow(initial=1)
+        await window.acquire()
+        waiter = asyncio.create_task(window.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        await window.release()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert window.in_flight == 1
+
+
+# =============================================================================
+# DirectEmailUploader.upload_stream
+# =============================================================================
+
+
+class TestUploadStream:
+    """Tests for continuous uploads through the adaptive window."""
+
+    @pytest.fixture(autouse=True)
+    def _no_database(self) -> Any:
+        with (
+            patch("src.agents.email_sending.tools._log_batch_to_database", new_callable=AsyncMock),
+            patch(
+                "src.agents.email_sending.tools._update_leads_status", new_callable=AsyncMock
+            ) as mock_status,
+        ):
+            yield mock_status
+        reset_cost_tracker()
+
+    @pytest.mark.asyncio
+    async def test_adapts_to_429s_and_uploads_everything(self, _no_database: Any) -> None:
+        fake = _FakeInstantly(concurrency_limit=3)
+        config = EmailSendingConfig(
+            max_parallel_batches=8, max_in_flight_batches=8, rate_limit_backoff_seconds=0
+        )
+        uploader = DirectEmailUploader(config=config)
+
+        with patch(
+            "src.agents.email_sending.tools._get_instantly_client", return_value=fake
+        ) as mock_client:
+            results = await uploader.upload_stream("instantly-1", "campaign-1", _batches(20))
+
+        mock_client.assert_called_once_with(max_retries=0)
+        assert [r["batch_number"] for r in results] == list(range(1, 21))
+        assert all(r["success"] for r in results)
+        assert _no_database.call_count == 20
+
+        stats = uploader.last_upload_stats
+        assert stats is not None
+        assert stats.leads_uploaded == 40
+        assert stats.batches_failed == 0
+        assert stats.rate_limited == fake.rate_limited > 0
+        assert stats.retries == fake.rate_limited
+        assert stats.final_window < 8
+        assert stats.to_dict()["leads_per_second"] > 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_rate_limit_retries(self) -> None:
+        client = MagicMock()
+        client.bulk_add_leads = AsyncMock(side_effect=_rate_limited())
+        config = EmailSendingConfig(max_rate_limit_retries=2, rate_limit_backoff_seconds=0)
+        uploader = DirectEmailUploader(config=config)
+
+        with patch("src.agents.email_sending.tools._get_instantly_client", return_value=client):
+            results = await uploader.upload_stream("instantly-1", "campaign-1", _batches(1))
+
+        assert client.bulk_add_leads.call_count == 3
+        assert results[0]["error"]
+        assert results[0]["leads_failed"] == 2
+        assert uploader.last_upload_stats is not None
+        assert uploader.last_upload_stats.batches_failed == 1
@@ -0,0 +1,195 @@
+"""Unit tests for bulk email verification."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.agents.email_verification import (
+    BulkEmailVerifier,
+    EmailVerificationAgent,
+    EmailVerificationProvider,
+    EmailVerificationResult,
+    EmailVerificationStatus,
+)
+from src.integrations.mailverify import MailVerifyBulkResult, MailVerifyResult, MailVerifyStatus
+from src.integrations.reoon import (
+    ReoonBulkTaskResult,
+    ReoonBulkTaskStatus,
+    ReoonBulkVerificationStatus,
+    ReoonError,
+)
+
+
+def _emails(count: int) -> list[str]:
+    return [f"Person{i}@Acme.com " for i in range(count)]
+
+
+def _task(task_id: str = "1", status: str = "success") -> ReoonBulkTaskResult:
+    return ReoonBulkTaskResult(
+        task_id=task_id,
+        status=status,
+        count_submitted=0,
+        count_duplicates_removed=0,
+        count_rejected_emails=0,
+        count_processing=0,
+    )
+
+
+def _task_status(
+    status: ReoonBulkTaskStatus, results: dict[str, dict[str, Any]] | None = None
+) -> ReoonBulkVerificationStatus:
+    return ReoonBulkVerificationStatus(
+        task_id="1",
+        name="",
+        status=status,
+        count_total=0,
+        count_checked=0,
+        progress_percentage=0.0,
+        results=results or {},
+    )
+
+
+def _mailverify_result(email: str, status: MailVerifyStatus) -> MailVerifyResult:
+    return MailVerifyResult(
+        email=email,
+        status=status,
+        is_valid=True,
+        is_deliverable=True,
+        is_catch_all=False,
+        is_disposable=False,
+        is_spam_trap=False,
+        domain="acme.com",
+        mx_records=[],
+        raw_response={},
+    )
+
+
+def _mailverify_job(results: list[MailVerifyResult], processed: int) -> MailVerifyBulkResult:
+    return MailVerifyBulkResult(
+        job_id="job-1",
+        status="completed" if processed >= len(results) else "processing",
+        total_emails=len(results),
+        processed=processed,
+        valid_count=0,
+        invalid_count=0,
+        risky_count=0,
+        results=results,
+        raw_response={},
+    )
+
+
+async def _single(email: str) -> EmailVerificationResult:
+    return EmailVerificationResult(
+        email=email,
+        status=EmailVerificationStatus.VALID,
+        provider=EmailVerificationProvider.REOON,
+        confidence=0.95,
+        cost=0.003,
+    )
+
+
+def _verifier(
+    reoon: Any = None, mailverify: Any = None, single: Any = _single
+) -> BulkEmailVerifier:
+    return BulkEmailVerifier(
+        verify_single=single,
+        map_reoon_status=EmailVerificationAgent._map_reoon_status,
+        map_mailverify_status=EmailVerificationAgent._map_mailverify_status,
+        reoon_client=reoon,
+        mailverify_client=mailverify,
+        poll_interval=0,
+    )
+
+
+class TestBulkEmailVerifier:
+    """Tests for bulk jobs, catch-all handling and the single-call fallback."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_jobs_replace_per_address_calls(self) -> None:
+        emails = [f"person{i}@acme.com" for i in range(1000)]
+        reoon_results: dict[str, dict[str, Any]] = {email: {"status": "safe"} for email in emails}
+        reoon_results["person0@acme.com"] = {"status": "invalid"}
+        reoon_results["person1@acme.com"] = {"status": "catch_all", "is_catch_all": True}
+        reoon_results["person2@acme.com"] = {"status": "valid", "is_catch_all": True}
+        reoon = MagicMock()
+        reoon.create_bulk_verification_task = AsyncMock(return_value=_task())
+        reoon.get_bulk_verification_status = AsyncMock(
+            side_effect=[
+                _task_status(ReoonBulkTaskStatus.RUNNING),
+                _task_status(ReoonBulkTaskStatus.COMPLETED, reoon_results),
+            ]
+        )
+        mailverify_results = [
+            _mailverify_result("person1@acme.com", MailVerifyStatus.VALID),
+            _mailverify_result("person2@acme.com", MailVerifyStatus.CATCH_ALL),
+        ]
+        mailverify = MagicMock()
+        mailverify.verify_bulk = AsyncMock(return_value=_mailverify_job(mailverify_results, 0))
+        mailverify.get_bulk_status = AsyncMock(return_value=_mailverify_job(mailverify_results, 2))
+        single = AsyncMock(side_effect=_single)
+
+        batch = await _verifier(reoon, mailverify, single).verify(_emails(1000))
+
+        assert len(batch.results) == 1000
+        assert batch.http_calls == 5
+        assert batch.bulk_jobs == 2
+        single.assert_not_called()
+        reoon.create_bulk_verification_task.assert_awaited_once_with(emails)
+        mailverify.verify_bulk.assert_awaited_once_with(["person1@acme.com", "person2@acme.com"])
+
+        assert batch.get("PERSON0@acme.com").status == EmailVerificationStatus.INVALID  # type: ignore[union-attr]
+        resolved = batch.results["person1@acme.com"]
+        assert resolved.status == EmailVerificationStatus.VALID
+        assert resolved.provider == EmailVerificationProvider.REOON
+        assert not resolved.is_catchall
+        catchall = batch.results["person2@acme.com"]
+        assert catchall.status == EmailVerificationStatus.CATCHALL
+        assert catchall.provider == EmailVerificationProvider.MAILVERIFY
+        assert catchall.cost == 0.008
+        assert batch.results["person3@acme.com"].status == EmailVerificationStatus.VALID
+
+    @pytest.mark.asyncio
+    async def test_small_batches_use_single_calls(self) -> None:
+        reoon = MagicMock()
+        reoon.create_bulk_verification_task = AsyncMock()
+        single = AsyncMock(side_effect=_single)
+
+        batch = await _verifier(reoon, single=single).verify(_emails(5) + _emails(5))
+
+        reoon.create_bulk_verification_task.assert_not_called()
+        assert single.await_count == 5
+        assert batch.single_calls == 5
+        assert batch.to_dict()["statuses"] == {"valid": 5}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_task_fails_or_misses_addresses(self) -> None:
+        reoon = MagicMock()
+        reoon.create_bulk_verification_task = AsyncMock(return_value=_task())
+        reoon.get_bulk_verification_status = AsyncMock(
+            return_value=_task_status(
+                ReoonBulkTaskStatus.COMPLETED, {"person0@acme.com": {"status": "safe"}}
+            )
+        )
+        single = AsyncMock(side_effect=_single)
+
+        batch = await _verifier(reoon, single=single).verify(_emails(12))
+
+        assert len(batch.results) == 12
+        assert batch.single_calls == 11
+
+        reoon.create_bulk_verification_task = AsyncMock(side_effect=ReoonError("down"))
+        single.reset_mock()
+        batch = await _verifier(reoon, single=single).verify(_emails(12))
+
+        assert batch.single_calls == 12
+        assert batch.bulk_jobs == 0
+
+    @pytest.mark.asyncio
+    async def test_single_failures_are_listed(self) -> None:
+        single = AsyncMock(side_effect=ConnectionError("timeout"))
+
+        batch = await _verifier(single=single).verify(["a@acme.com", "b@acme.com"])
+
+        assert batch.results == {}
+        assert sorted(batch.failed) == ["a@acme.com", "b@acme.com"]
@@ -0,0 +1,235 @@
+"""Unit tests for the per-domain email pattern cache."""
+
+from pathlib import Path
+
+import pytest
+
+from src.agents.email_verification import (
+    EmailFinderProvider,
+    EmailPatternCache,
+    EmailVerificationProvider,
+    EmailVerificationResult,
+    EmailVerificationStatus,
+    ProviderRegistry,
+    WaterfallScheduler,
+    infer_email_pattern,
+    render_email_pattern,
+)
+
+TOMBA = EmailFinderProvider.TOMBA
+
+
+def _verification(
+    email: str,
+    status: EmailVerificationStatus = EmailVerificationStatus.VALID,
+    is_catchall: bool = False,
+) -> EmailVerificationResult:
+    return EmailVerificationResult(
+        email=email,
+        status=status,
+        provider=EmailVerificationProvider.REOON,
+        confidence=0.95,
+        cost=0.003,
+        is_catchall=is_catchall,
+    )
+
+
+def _teach(cache: EmailPatternCache, domain: str, names: list[tuple[str, str]]) -> None:
+    for first, last in names:
+        cache.observe(first, last, domain, _verification(f"{first}.{last}@{domain}".lower()))
+
+
+# =============================================================================
+# Pattern helpers
+# =============================================================================
+
+
+class TestPatternHelpers:
+    """Tests for infer_email_pattern and render_email_pattern."""
+
+    @pytest.mark.parametrize(
+        ("email", "expected"),
+        [
+            ("jane.doe@acme.com", "{first}.{last}"),
+            ("jdoe@acme.com", "{f}{last}"),
+            ("jane@acme.com", "{first}"),
+            ("doe.jane@acme.com", "{last}.{first}"),
+            ("sales@acme.com", None),
+        ],
+    )
+    def test_infer(self, email: str, expected: str | None) -> None:
+        assert infer_email_pattern(email, "Jane", "Doe") == expected
+
+    def test_render_normalizes_names(self) -> None:
+        email = render_email_pattern("{first}.{last}", "José", "Smith-Jones", "WWW.Acme.com")
+
+        assert email == "jose.smithjones@acme.com"
+
+    def test_render_needs_name_parts(self) -> None:
+        assert render_email_pattern("{f}{last}", "Jane", "", "acme.com") is None
+        assert render_email_pattern("{first}", "Jane", "", "acme.com") == "jane@acme.com"
+
+
+# =============================================================================
+# EmailPatternCache
+# =============================================================================
+
+
+class TestEmailPatternCache:
+    """Tests for learning and trusting domain patterns."""
+
+    def test_needs_min_samples(self) -> None:
+        cache = EmailPatternCache()
+        _teach(cache, "acme.com", [("Jane", "Doe")])
+
+        assert cache.guess("John", "Roe", "acme.com") is None
+
+        _teach(cache, "acme.com", [("Ann", "Lee")])
+        guess = cache.guess("John", "Roe", "acme.com")
+
+        assert guess is not None
+        assert guess.email == "john.roe@acme.com"
+        assert guess.pattern == "{first}.{last}"
+
+    def test_mixed_domain_has_no_dominant_pattern(self) -> None:
+        cache = EmailPatternCache()
+        _teach(cache, "acme.com", [("Jane", "Doe"), ("Ann", "Lee")])
+        for first, last in [("Bob", "Ray"), ("Tim", "Fox")]:
+            cache.observe(first, last, "acme.com", _verification(f"{first[0]}{last}@acme.com"))
+
+        assert cache.dominant_pattern("acme.com") is None
+
+    def test_rejected_guesses_lower_trust(self) -> None:
+        cache = EmailPatternCache()
+        _teach(cache, "acme.com", [("Jane", "Doe"), ("Ann", "Lee")])
+
+        guess = cache.guess("John", "Roe", "acme.com")
+        assert guess is not None
+        invalid = _verification(guess.email, EmailVerificationStatus.INVALID)
+
+        assert cache.record_guess(guess, invalid, finder_cost=0.002) is False
+        assert cache.domain_patterns("acme.com") == {"{first}.{last}": (2, 1)}
+        assert cache.dominant_pattern("acme.com") is None
+
+    def test_catchall_domain_is_never_guessed(self) -> None:
+        cache = EmailPatternCache()
+        _teach(cache, "acme.com", [("Jane", "Doe"), ("Ann", "Lee")])
+
+        cache.observe("Bob", "Ray", "acme.com", _verification("bob.ray@acme.com", is_catchall=True))
+
+        assert cache.is_catchall("acme.com") is True
+        assert cache.guess("John", "Roe", "acme.com") is None
+
+    def test_ignores_addresses_on_other_domains(self) -> None:
+        cache = EmailPatternCache()
+
+        learned = cache.observe("Jane", "Doe", "acme.com", _verification("jane.doe@gmail.com"))
+
+        assert learned is None
+        assert cache.domain_patterns("acme.com") == {}
+
+    def test_stats_track_hit_rate_and_cost_saved(self) -> None:
+        cache = EmailPatternCache()
+        _teach(cache, "acme.com", [("Jane", "Doe"), ("Ann", "Lee")])
+
+        hit = cache.guess("John", "Roe", "acme.com")
+        miss = cache.guess("Kim", "Poe", "acme.com")
+        cache.guess("Joe", "Bloggs", "other.com")
+        assert hit is not None and miss is not None
+        cache.record_guess(hit, _verification(hit.email), finder_cost=0.002)
+        cache.record_guess(
+            miss, _verification(miss.email, EmailVerificationStatus.INVALID), finder_cost=0.002
+        )
+
+        stats = cache.stats.to_dict()
+        assert stats["lookups"] == 3
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == round(1 / 3, 4)
+        assert stats["cost_saved"] == pytest.approx(0.002 - 0.003)
+
+    def test_persists_across_runs(self, tmp_path: Path) -> None:
+        path = tmp_path / "patterns" / "email_patterns.db"
+        with EmailPatternCache(path) as cache:
+            _teach(cache, "acme.com", [("Jane", "Doe"), ("Ann", "Lee")])
+
+        with EmailPatternCache(path) as reopened:
+            assert reopened.dominant_pattern("acme.com") == "{first}.{last}"
+
+
+# =============================================================================
+# WaterfallScheduler integration
+# =============================================================================
+
+
+class TestSchedulerWithPatternCache:
+    """Pattern guesses run before finder lookups in the waterfall."""
+
+    @pytest.mark.asyncio
+    async def test_learned_domain_skips_finder_lookups(self) -> None:
+        finder_calls: list[str] = []
+
+        async def find(provider: EmailFinderProvider, first: str, last: str, domain: str) -> str:
+            finder_calls.append(first)
+            return f"{first}.{last}@{domain}".lower()
+
+        async def verify(email: str) -> EmailVerificationResult:
+            return _verification(email)
+
+        cache = EmailPatternCache()
+        scheduler = WaterfallScheduler(
+            find,
+            verify,
+            providers=[ProviderRegistry.PROVIDERS[TOMBA]],
+            max_concurrent_leads=1,
+            pattern_cache=cache,
+        )
+        leads = [
+            {
+                "id": f"lead-{i}",
+                "first_name": f"P{i}",
+                "last_name": "Doe",
+                "company_domain": "a.com",
+            }
+            for i in range(10)
+        ]
+
+        batch = await scheduler.run(leads)
+
+        assert finder_calls == ["P0", "P1"]
+        assert batch.pattern_hits == 8
+        assert batch.emails_found == 10
+        assert batch.results[5].provider_used == EmailFinderProvider.PATTERN
+        assert batch.results[5].email == "p5.doe@a.com"
+        assert batch.results[5].total_cost == pytest.approx(0.003)
+        assert batch.to_dict()["pattern_hits"] == 8
+        assert cache.stats.finder_cost_saved == pytest.approx(8 * 0.002)
+
+    @pytest.mark.asyncio
+    async def test_rejected_guess_falls_back_to_finders(self) -> None:
+        async def find(provider: EmailFinderProvider, first: str, last: str, domain: str) -> str:
+            return f"{first[0]}{last}@{domain}".lower()
+
+        async def verify(email: str) -> EmailVerificationResult:
+            status = (
+                EmailVerificationStatus.INVALID
+                if "." in email.split("@")[0]
+                else EmailVerificationStatus.VALID
+            )
+            return _verification(email, status)
+
+        cache = EmailPatternCache()
+        _teach(cache, "a.com", [("Jane", "Doe"), ("Ann", "Lee")])
+        scheduler = WaterfallScheduler(
+            find, verify, providers=[ProviderRegistry.PROVIDERS[TOMBA]], pattern_cache=cache
+        )
+
+        batch = await scheduler.run(
+            [{"id": "x", "first_name": "John", "last_name": "Roe", "company_domain": "a.com"}]
+        )
+
+        result = batch.results[0]
+        assert result.email == "jroe@a.com"
+        assert result.provider_used == TOMBA
+        assert result.total_cost == pytest.approx(0.003 + 0.002 + 0.003)
+        assert cache.stats.misses == 1
@@ -0,0 +1,110 @@
+"""Unit tests for persistent daily finder quotas."""
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.agents.email_verification import (
+    EmailFinderProvider,
+    EmailVerificationAgent,
+    ProviderQuotaStore,
+    ProviderRegistry,
+    WaterfallScheduler,
+)
+
+TOMBA = EmailFinderProvider.TOMBA
+
+
+def _leads(count: int) -> list[dict[str, str]]:
+    return [
+        {"id": f"lead-{i}", "first_name": f"P{i}", "last_name": "Doe", "company_domain": "a.com"}
+        for i in range(count)
+    ]
+
+
+class _Finder:
+    """Finder stub that records calls and never finds an email."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def find(
+        self, provider: EmailFinderProvider, first: str, last: str, domain: str
+    ) -> str | None:
+        self.calls += 1
+        return None
+
+
+# =============================================================================
+# ProviderQuotaStore
+# =============================================================================
+
+
+class TestProviderQuotaStore:
+    """Tests for ProviderQuotaStore."""
+
+    def test_records_usage_per_provider_and_day(self) -> None:
+        yesterday = datetime.now(UTC).date() - timedelta(days=1)
+        with ProviderQuotaStore() as store:
+            store.record_use("tomba")
+            store.record_use("tomba", count=2)
+            store.record_use("muraena")
+            store.record_use("tomba", day=yesterday)
+
+            assert store.usage() == {"tomba": 3, "muraena": 1}
+            assert store.usage(yesterday) == {"tomba": 1}
+
+    def test_usage_survives_reopen_and_old_days_are_dropped(self, tmp_path: Path) -> None:
+        path = tmp_path / "quota" / "email_quota.db"
+        old = datetime.now(UTC).date() - timedelta(days=40)
+        with ProviderQuotaStore(path) as store:
+            store.record_use("tomba", count=4)
+            store.record_use("tomba", day=old)
+
+        with ProviderQuotaStore(path) as store:
+            assert store.usage() == {"tomba": 4}
+            assert store.usage(old) == {}
+
+
+# =============================================================================
+# Scheduler integration
+# =============================================================================
+
+
+class TestSchedulerQuotaStore:
+    """Schedulers load and write back persisted usage."""
+
+    @pytest.mark.asyncio
+    async def test_quota_holds_across_schedulers(self, tmp_path: Path) -> None:
+        path = tmp_path / "email_quota.db"
+        limited = [replace(ProviderRegistry.PROVIDERS[TOMBA], daily_limit=5)]
+        finder = _Finder()
+
+        with ProviderQuotaStore(path) as store:
+            first = WaterfallScheduler(finder.find, providers=limited, quota_store=store)
+            await first.run(_leads(3))
+            assert store.usage() == {"tomba": 3}
+
+        # A restart opens the same file
+        with ProviderQuotaStore(path) as store:
+            second = WaterfallScheduler(finder.find, providers=limited, quota_store=store)
+            assert second.remaining_quota() == {"tomba": 2}
+            batch = await second.run(_leads(4))
+
+            assert finder.calls == 5
+            assert batch.provider_metrics["tomba"].skipped_quota == 2
+            assert store.usage() == {"tomba": 5}
+
+    @pytest.mark.asyncio
+    async def test_agent_schedulers_share_the_store(self) -> None:
+        with patch.dict("os.environ", {}, clear=True):
+            agent = EmailVerificationAgent()
+
+        agent.quota_store.record_use("tomba", count=7)
+        scheduler = agent.create_scheduler(verify=False)
+
+        daily_limit = ProviderRegistry.PROVIDERS[TOMBA].daily_limit
+        assert scheduler.remaining_quota()["tomba"] == daily_limit - 7
@@ -0,0 +1,259 @@
+"""Unit tests for the concurrent email waterfall scheduler."""
+
+import asyncio
+from dataclasses import replace
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.agents.email_verification import (
+    DailyQuota,
+    EmailFinderProvider,
+    EmailVerificationAgent,
+    EmailVerificationProvider,
+    EmailVerificationResult,
+    EmailVerificationStatus,
+    ProviderError,
+    ProviderRegistry,
+    WaterfallScheduler,
+)
+from src.utils.rate_limiter import CircuitBreaker
+
+TOMBA = EmailFinderProvider.TOMBA
+MURAENA = EmailFinderProvider.MURAENA
+VOILA = EmailFinderProvider.VOILA_NORBERT
+
+
+class StubProviders:
+    """Local stand-in for finder APIs with latency, hit lists and failures."""
+
+    def __init__(
+        self,
+        hits: dict[EmailFinderProvider, set[str]] | None = None,
+        failing: set[EmailFinderProvider] | None = None,
+        latency: float = 0.01,
+    ) -> None:
+        self.hits = hits or {}
+        self.failing = failing or set()
+        self.latency = latency
+        self.calls: list[tuple[EmailFinderProvider, str]] = []
+        self.in_flight: dict[EmailFinderProvider, int] = {}
+        self.peak: dict[EmailFinderProvider, int] = {}
+
+    async def find(
+        self, provider: EmailFinderProvider, first: str, last: str, domain: str
+    ) -> str | None:
+        self.calls.append((provider, first))
+        self.in_flight[provider] = self.in_flight.get(provider, 0) + 1
+        self.peak[provider] = max(self.peak.get(provider, 0), self.in_flight[provider])
+        try:
+            await asyncio.sleep(self.latency)
+            if provider in self.failing:
+                raise ProviderError(f"{provider.value} unavailable")
+            if first in self.hits.get(provider, set()):
+                return f"{first}.{last}@{domain}".lower()
+            return None
+        finally:
+            self.in_flight[provider] -= 1
+
+    async def verify(self, email: str) -> EmailVerificationResult:
+        return EmailVerificationResult(
+            email=email,
+            status=EmailVerificationStatus.VALID,
+            provider=EmailVerificationProvider.REOON,
+            confidence=0.95,
+            cost=0.003,
+        )
+
+
+def _leads(count: int) -> list[dict[str, str]]:
+    return [
+        {"id": f"lead-{i}", "first_name": f"P{i}", "last_name": "Doe", "company_domain": "a.com"}
+        for i in range(count)
+    ]
+
+
+def _providers(*names: EmailFinderProvider, **overrides: int) -> list:
+    return [replace(ProviderRegistry.PROVIDERS[name], **overrides) for name in names]
+
+
+# =============================================================================
+# DailyQuota
+# =============================================================================
+
+
+class TestDailyQuota:
+    """Tests for DailyQuota."""
+
+    def test_consumes_until_limit(self) -> None:
+        quota = DailyQuota(limit=2)
+
+        assert quota.try_consume() is True
+        assert quota.try_consume() is True
+        assert quota.try_consume() is False
+        assert quota.remaining == 0
+
+    def test_resets_on_new_day(self) -> None:
+        quota = DailyQuota(limit=1, used=1, day=date.today() - timedelta(days=2))
+
+        assert quota.remaining == 1
+        assert quota.try_consume() is True
+
+
+# =============================================================================
+# WaterfallScheduler
+# =============================================================================
+
+
+class TestWaterfallScheduler:
+    """Tests for WaterfallScheduler against stub providers."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order_with_verification(self) -> None:
+        leads = _leads(20)
+        stub = StubProviders(hits={TOMBA: {f"P{i}" for i in range(0, 20, 2)}, MURAENA: {"P1"}})
+        scheduler = WaterfallScheduler(stub.find, stub.verify, providers=_providers(TOMBA, MURAENA))
+
+        batch = await scheduler.run(leads)
+
+        assert [r.lead_id for r in batch.results] == [lead["id"] for lead in leads]
+        assert batch.emails_found == 11
+        assert batch.results[0].provider_used == TOMBA
+        assert batch.results[1].provider_used == MURAENA
+        assert batch.results[1].verification_status == EmailVerificationStatus.VALID
+        assert batch.results[3].email is None
+        assert len(batch.results[3].attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_bounds_in_flight_per_provider(self) -> None:
+        stub = StubProviders(latency=0.02)
+        scheduler = WaterfallScheduler(
+            stub.find,
+            providers=_providers(TOMBA, max_in_flight=3),
+            max_concurrent_leads=50,
+        )
+
+        batch = await scheduler.run(_leads(30))
+
+        assert stub.peak[TOMBA] == 3
+        assert batch.provider_metrics["tomba"].peak_in_flight == 3
+        assert batch.provider_metrics["tomba"].lookups == 30
+
+    @pytest.mark.asyncio
+    async def test_runs_leads_concurrently(self) -> None:
+        stub = StubProviders(latency=0.05)
+        scheduler = WaterfallScheduler(
+            stub.find, providers=_providers(TOMBA, max_in_flight=50), max_concurrent_leads=50
+        )
+
+        batch = await scheduler.run(_leads(50))
+
+        # Serial would take 50 x 50ms
+        assert batch.duration_ms < 1000
+
+    @pytest.mark.asyncio
+    async def test_routes_around_exhausted_quota(self) -> None:
+        stub = StubProviders(hits={TOMBA: {f"P{i}" for i in range(10)}, MURAENA: {"P8", "P9"}})
+        scheduler = WaterfallScheduler(
+            stub.find, providers=_providers(TOMBA, MURAENA, daily_limit=8), max_concurrent_leads=1
+        )
+
+        batch = await scheduler.run(_leads(10), max_providers=1)
+
+        assert [r.provider_used for r in batch.results[8:]] == [MURAENA, MURAENA]
+        assert batch.provider_metrics["tomba"].lookups == 8
+        assert batch.provider_metrics["tomba"].skipped_quota == 2
+        assert scheduler.remaining_quota()["tomba"] == 0
+
+    @pytest.mark.asyncio
+    async def test_quota_persists_across_batches(self) -> None:
+        stub = StubProviders()
+        scheduler = WaterfallScheduler(stub.find, providers=_providers(TOMBA, daily_limit=5))
+        scheduler.set_quota_used({"tomba": 3})
+
+        await scheduler.run(_leads(4))
+
+        assert len(stub.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_is_skipped(self) -> None:
+        stub = StubProviders(failing={TOMBA}, hits={MURAENA: {f"P{i}" for i in range(6)}})
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60.0, service_name="Tomba")
+        scheduler = WaterfallScheduler(
+            stub.find,
+            providers=_providers(TOMBA, MURAENA),
+            max_concurrent_leads=1,
+            circuit_breakers={"tomba": breaker},
+        )
+
+        batch = await scheduler.run(_leads(6))
+
+        tomba = batch.provider_metrics["tomba"]
+        assert tomba.errors == 2
+        assert tomba.skipped_breaker == 4
+        assert breaker.state == "open"
+        assert batch.emails_found == 6
+
+    @pytest.mark.asyncio
+    async def test_skipped_providers_do_not_use_attempts(self) -> None:
+        stub = StubProviders(hits={VOILA: {"P0"}})
+        scheduler = WaterfallScheduler(
+            stub.find, providers=_providers(TOMBA, MURAENA, VOILA, daily_limit=1)
+        )
+        scheduler.set_quota_used({"tomba": 1})
+
+        batch = await scheduler.run(_leads(1), max_providers=2)
+
+        assert [p for p, _ in stub.calls] == [MURAENA, VOILA]
+        assert batch.results[0].provider_used == VOILA
+
+    @pytest.mark.asyncio
+    async def test_reports_cost_and_hit_rate(self) -> None:
+        stub = StubProviders(hits={TOMBA: {"P0", "P1"}})
+        scheduler = WaterfallScheduler(stub.find, stub.verify, providers=_providers(TOMBA))
+
+        report = (await scheduler.run(_leads(4))).to_dict()
+
+        tomba = report["providers"]["tomba"]
+        assert tomba["lookups"] == 4
+        assert tomba["hit_rate"] == 0.5
+        assert tomba["cost"] == pytest.approx(4 * 0.002)
+        assert report["total_cost"] == pytest.approx(4 * 0.002 + 2 * 0.003)
+        assert report["emails_found"] == 2
+
+    @pytest.mark.asyncio
+    async def test_incomplete_lead_makes_no_calls(self) -> None:
+        stub = StubProviders()
+        scheduler = WaterfallScheduler(stub.find, providers=_providers(TOMBA))
+
+        batch = await scheduler.run([{"id": "x", "first_name": "A", "last_name": "B"}])
+
+        assert stub.calls == []
+        assert batch.results[0].attempts == []
+
+
+class TestFindEmailsBatch:
+    """Tests for EmailVerificationAgent.find_emails_batch."""
+
+    @pytest.mark.asyncio
+    async def test_uses_only_configured_providers(self) -> None:
+        with patch.dict(
+            "os.environ",
+            {
+                "MURAENA_API_KEY": "test",  # pragma: allowlist secret
+            },
+            clear=True,
+        ):
+            agent = EmailVerificationAgent()
+
+        stub = StubProviders(hits={MURAENA: {"P0"}})
+        agent.scheduler._find_email = stub.find
+
+        batch = await agent.find_emails_batch(_leads(1))
+
+        assert agent.configured_finder_providers() == [MURAENA]
+        assert [p for p, _ in stub.calls] == [MURAENA]
+        assert batch.results[0].email == "p0.doe@a.com"
+        # No verifier configured: the email is kept with an unknown status at no cost
+        assert batch.results[0].verification_status == EmailVerificationStatus.UNKNOWN
@@ -9,6 +9,7 @@ Tests the LeadResearchAgent class:
 """
 
 from decimal import Decimal
+from typing import Any
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
@@ -24,6 +25,7 @@ from src.agents.lead_research.schemas import (
     LeadResearchInput,
     LeadTier,
     ResearchDepth,
+    ResearchResult,
 )
 
 
@@ -132,9 +134,7 @@ class TestResearchSingleLead:
         """Test Tier A leads get deep research."""
         # Mock all the search methods
         with (
-            patch.object(
-                agent, "_search_linkedin_posts", new_callable=AsyncMock
-            ) as mock_linkedin,
+            patch.object(agent, "_search_linkedin_posts", new_callable=AsyncMock) as mock_linkedin,
             patch.object(agent, "_search_profile", new_callable=AsyncMock) as mock_profile,
             patch.object(agent, "_search_articles", new_callable=AsyncMock) as mock_articles,
             patch.object(agent, "_search_podcasts", new_callable=AsyncMock) as mock_podcasts,
@@ -178,9 +178,7 @@ class TestResearchSingleLead:
     ) -> None:
         """Test cost tracking per lead."""
         with (
-            patch.object(
-                agent, "_search_linkedin_posts", new_callable=AsyncMock
-            ) as mock_linkedin,
+            patch.object(agent, "_search_linkedin_posts", new_callable=AsyncMock) as mock_linkedin,
             patch.object(agent, "_search_profile", new_callable=AsyncMock) as mock_profile,
             patch.object(agent, "_search_articles", new_callable=AsyncMock) as mock_articles,
             patch.object(agent, "_search_podcasts", new_callable=AsyncMock) as mock_podcasts,
@@ -205,9 +203,7 @@ class TestResearchSingleLead:
         }
 
         with (
-            patch.object(
-                agent, "_search_linkedin_posts", new_callable=AsyncMock
-            ) as mock_linkedin,
+            patch.object(agent, "_search_linkedin_posts", new_callable=AsyncMock) as mock_linkedin,
             patch.object(agent, "_search_profile", new_callable=AsyncMock) as mock_profile,
             patch.object(agent, "_search_articles", new_callable=AsyncMock) as mock_articles,
             patch.object(agent, "_search_podcasts", new_callable=AsyncMock) as mock_podcasts,
@@ -249,38 +245,35 @@ class TestResearchCampaign:
         assert result.research_cost == Decimal("0.0")
 
     @pytest.mark.asyncio
-    async def test_processes_leads_by_tier(self, agent: LeadResearchAgent) -> None:
-        """Test leads are processed by tier."""
+    async def test_researches_all_tiers_and_streams_results(self, agent: LeadResearchAgent) -> None:
+        """Test every tier is researched in one run and each result is streamed."""
         input_data = LeadResearchInput(campaign_id=uuid4())
+        leads = [
+            LeadData(id=uuid4(), first_name=tier.value, last_name="Lead", lead_tier=tier)
+            for tier in (LeadTier.C, LeadTier.B, LeadTier.A, LeadTier.D)
+        ]
+        persisted: list[ResearchResult] = []
 
-        tier_a_lead = LeadData(
-            id=uuid4(),
-            first_name="A",
-            last_name="Lead",
-            lead_tier=LeadTier.A,
-        )
-        tier_b_lead = LeadData(
-            id=uuid4(),
-            first_name="B",
-            last_name="Lead",
-            lead_tier=LeadTier.B,
-        )
+        async def persist(result: ResearchResult) -> None:
+            persisted.append(result)
+
+        async def research(lead: LeadData, company_research: Any = None) -> ResearchResult:
+            return ResearchResult(lead_id=lead.id, research_depth=ResearchDepth.BASIC)
 
         with (
-            patch.object(
-                agent, "_get_leads_for_research", new_callable=AsyncMock
-            ) as mock_get,
-            patch.object(
-                agent, "_process_tier_parallel", new_callable=AsyncMock
-            ) as mock_process,
+            patch.object(agent, "_get_leads_for_research", new_callable=AsyncMock) as mock_get,
+            patch.object(agent, "research_single_lead", side_effect=research) as mock_research,
         ):
-            mock_get.return_value = [tier_a_lead, tier_b_lead]
-            mock_process.return_value = []
+            mock_get.return_value = leads
 
-            await agent.research_campaign(input_data)
+            result = await agent.research_campaign(input_data, on_result=persist)
 
-        # Should be called for each tier with leads
-        assert mock_process.call_count >= 2
+        assert mock_research.call_count == 4
+        # Tier A is scheduled first
+        assert mock_research.call_args_list[0].args[0].lead_tier == LeadTier.A
+        assert {r.lead_id for r in persisted} == {lead.id for lead in leads}
+        assert result.total_researched == 4
+        assert result.tier_breakdown == {"tier_a": 1, "tier_b": 1, "tier_c": 1, "tier_d": 1}
 
 
 class TestCostTracking:
@@ -303,6 +296,80 @@ class TestCostTracking:
 
         assert agent._check_lead_budget(LeadTier.A) is False
 
+    def test_check_lead_budget_uses_tier_maximum(self, agent: LeadResearchAgent) -> None:
+        """Test the Tier A per-lead maximum is held against the campaign budget."""
+        agent._total_cost = COST_CONTROLS["max_per_campaign"] - Decimal("0.10")  # type: ignore[operator]
+
+        assert agent._check_lead_budget(LeadTier.A) is False
+        assert agent._check_lead_budget(LeadTier.C) is True
+
+    @pytest.mark.asyncio
+    async def test_in_flight_leads_reserve_budget(self, agent: LeadResearchAgent) -> None:
+        """Test leads still being researched count against the budget."""
+        agent._total_cost = COST_CONTROLS["max_per_campaign"] - Decimal("0.20")  # type: ignore[operator]
+        lead = LeadData(id=uuid4(), first_name="A", last_name="Lead", lead_tier=LeadTier.A)
+        checks: list[bool] = []
+
+        async def search(_: LeadData) -> dict[str, Any]:
+            # A second Tier A lead would not fit while this one is in flight
+            checks.append(agent._check_lead_budget(LeadTier.A))
+            return {"posts": [], "profile": {}, "articles": [], "podcasts": [], "cost": 0}
+
+        with (
+            patch.object(agent, "_search_linkedin_posts", side_effect=search),
+            patch.object(agent, "_search_profile", side_effect=search),
+            patch.object(agent, "_search_articles", side_effect=search),
+            patch.object(agent, "_search_podcasts", side_effect=search),
+        ):
+            await agent.research_single_lead(lead)
+
+        assert checks and not any(checks)
+        assert agent._reserved_cost == Decimal("0.0")
+        assert agent._check_lead_budget(LeadTier.A) is True
+
+    def test_queued_higher_tiers_hold_back_budget(self, agent: LeadResearchAgent) -> None:
+        """Test lower tiers cannot spend budget owed to queued higher-tier leads."""
+        agent._total_cost = COST_CONTROLS["max_per_campaign"] - Decimal("0.155")  # type: ignore[operator]
+        agent._queued_by_tier[LeadTier.A] = 1
+
+        assert agent._check_lead_budget(LeadTier.A) is True
+        assert agent._check_lead_budget(LeadTier.C) is False
+
+        agent._queued_by_tier[LeadTier.A] = 0
+        assert agent._check_lead_budget(LeadTier.C) is True
+
+    @pytest.mark.asyncio
+    async def test_lower_tiers_do_not_starve_tier_a(self) -> None:
+        """Test queued Tier A leads still fit after lower tiers start."""
+        # One Tier A lead at a time while Tier C runs ten at once
+        agent = LeadResearchAgent(tier_concurrency={LeadTier.A: 1, LeadTier.C: 10})
+        leads = [
+            LeadData(id=uuid4(), first_name="A", last_name="Lead", lead_tier=LeadTier.A)
+            for _ in range(2)
+        ] + [
+            LeadData(id=uuid4(), first_name="C", last_name="Lead", lead_tier=LeadTier.C)
+            for _ in range(10)
+        ]
+
+        async def research(
+            lead: LeadData, tier_config: Any, company_research: Any = None
+        ) -> ResearchResult:
+            tier = lead.lead_tier or LeadTier.C
+            agent._update_cost(tier, agent._max_cost_per_lead(tier), str(lead.id))
+            return ResearchResult(lead_id=lead.id, research_depth=tier_config.depth)
+
+        with (
+            patch.dict(COST_CONTROLS, {"max_per_campaign": Decimal("0.35")}),
+            patch.object(agent, "_get_leads_for_research", new_callable=AsyncMock) as mock_get,
+            patch.object(agent, "_research_lead", side_effect=research),
+        ):
+            mock_get.return_value = leads
+
+            result = await agent.research_campaign(LeadResearchInput(campaign_id=uuid4()))
+
+        assert result.cost_by_tier["tier_a"] == Decimal("0.30")
+        assert result.research_cost <= Decimal("0.35")
+
     def test_update_cost_updates_all_trackers(self, agent: LeadResearchAgent) -> None:
         """Test cost update updates all tracking fields."""
         lead_id = str(uuid4())
@@ -0,0 +1,130 @@
+"""Unit tests for the tier-aware research scheduler."""
+
+import asyncio
+from collections import Counter
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.agents.lead_research.scheduler import PrioritySemaphore, ResearchScheduler
+from src.agents.lead_research.schemas import LeadData, LeadTier, ResearchDepth, ResearchResult
+
+
+def _leads(tier: LeadTier, count: int) -> list[LeadData]:
+    return [
+        LeadData(id=uuid4(), first_name=f"{tier.value}{i}", lead_tier=tier) for i in range(count)
+    ]
+
+
+def _result(lead: LeadData) -> ResearchResult:
+    return ResearchResult(
+        lead_id=lead.id,
+        research_depth=ResearchDepth.BASIC,
+        research_cost=Decimal("0.0"),
+    )
+
+
+class TestPrioritySemaphore:
+    """Tests for priority admission to shared backend slots."""
+
+    @pytest.mark.asyncio
+    async def test_admits_waiters_by_priority(self) -> None:
+        semaphore = PrioritySemaphore(1)
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        async def call(name: str, priority: int) -> None:
+            async with semaphore.slot(priority):
+                order.append(name)
+                await gate.wait()
+
+        holder = asyncio.create_task(call("holder", 2))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(call("tier_c", 2)),
+            asyncio.create_task(call("tier_b", 1)),
+            asyncio.create_task(call("tier_a", 0)),
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(holder, *waiters)
+
+        assert order == ["holder", "tier_a", "tier_b", "tier_c"]
+        assert semaphore.peak_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        semaphore = PrioritySemaphore(1)
+        gate = asyncio.Event()
+
+        async def hold() -> None:
+            async with semaphore.slot(0):
+                await gate.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        gate.set()
+        await holder
+
+        async with semaphore.slot(0):
+            assert semaphore.in_flight == 1
+
+
+class TestResearchScheduler:
+    """Tests for running all tiers from one queue."""
+
+    @pytest.mark.asyncio
+    async def test_runs_tiers_concurrently_within_ceilings(self) -> None:
+        in_flight: Counter[LeadTier] = Counter()
+        peak: Counter[LeadTier] = Counter()
+        started: list[LeadTier] = []
+
+        async def research(lead: LeadData) -> ResearchResult:
+            tier = lead.lead_tier or LeadTier.C
+            started.append(tier)
+            in_flight[tier] += 1
+            peak[tier] = max(peak[tier], in_flight[tier])
+            await asyncio.sleep(0.01)
+            in_flight[tier] -= 1
+            return _result(lead)
+
+        persisted: list[ResearchResult] = []
+
+        async def on_result(lead: LeadData, result: ResearchResult) -> None:
+            persisted.append(result)
+
+        scheduler = ResearchScheduler(research, {LeadTier.A: 2, LeadTier.B: 3, LeadTier.C: 4})
+        leads = _leads(LeadTier.C, 8) + _leads(LeadTier.B, 6) + _leads(LeadTier.A, 4)
+        report = await scheduler.run(leads, on_result=on_result)
+
+        # Tier A is started first even though it was listed last
+        assert started[:2] == [LeadTier.A, LeadTier.A]
+        # Every tier is in flight from the first wave
+        assert set(started[:9]) == {LeadTier.A, LeadTier.B, LeadTier.C}
+        assert peak == {LeadTier.A: 2, LeadTier.B: 3, LeadTier.C: 4}
+
+        assert len(persisted) == 18
+        assert report.completed == {LeadTier.A: 4, LeadTier.B: 6, LeadTier.C: 8}
+        assert set(report.tier_finished_ms) == {LeadTier.A, LeadTier.B, LeadTier.C}
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted_and_persistence_errors_logged(self) -> None:
+        leads = _leads(LeadTier.A, 2) + _leads(LeadTier.D, 2)
+
+        async def research(lead: LeadData) -> ResearchResult:
+            if lead.first_name == "A0":
+                raise ConnectionError("search down")
+            return _result(lead)
+
+        async def on_result(lead: LeadData, result: ResearchResult) -> None:
+            raise RuntimeError("database unavailable")
+
+        report = await ResearchScheduler(research).run(leads, on_result=on_result)
+
+        assert report.failed == {LeadTier.A: 1}
+        assert report.completed == {LeadTier.A: 1, LeadTier.D: 2}
+        assert report.to_dict()["completed"] == {"A": 1, "D": 2}
@@ -14,6 +14,7 @@ from src.agents.lead_scoring.agent import (
     LeadScoringResult,
     score_leads,
 )
+from src.agents.lead_scoring.parallel import ParallelScorer
 
 
 class TestLeadScoringAgentError:
@@ -137,6 +138,7 @@ class TestLeadScoringAgentInitialization:
         assert agent.model == DEFAULT_MODEL
         assert agent.batch_size == 2000
         assert agent.job_title_threshold == 0.80
+        assert agent.scoring_workers == 0
 
     def test_custom_values(self) -> None:
         agent = LeadScoringAgent(
@@ -469,6 +471,101 @@ class TestLeadScoringAgentRunDirect:
         assert "0-9" in result.score_distribution or "80-89" in result.score_distribution
 
 
+class TestLeadScoringAgentParallelScoring:
+    """Tests for process-pool scoring in _run_direct()."""
+
+    @pytest.fixture
+    def scoring_context(self) -> dict[str, Any]:
+        return {
+            "niche": {
+                "id": "niche-1",
+                "name": "SaaS Marketing",
+                "industries": ["SaaS"],
+                "company_sizes": ["201-500"],
+                "job_titles": ["VP Marketing"],
+            },
+            "personas": [
+                {
+                    "id": "persona-1",
+                    "name": "Marketing Leader",
+                    "job_titles": ["VP Marketing", "Head of Growth"],
+                    "seniority_levels": ["vp", "director"],
+                    "company_sizes": ["201-500"],
+                },
+            ],
+            "industry_fit_scores": [
+                {"industry": "SaaS", "fit_score": 95},
+            ],
+            "target_countries": ["United States"],
+        }
+
+    @pytest.fixture
+    def leads(self) -> list[dict[str, Any]]:
+        titles = ["VP Marketing", "Head of Growth", "Engineer", "CMO", None, "Sales Director"]
+        return [
+            {
+                "id": f"lead-{i}",
+                "title": titles[i % len(titles)],
+                "company_size": "201-500" if i % 2 else "1-10",
+                "company_industry": "SaaS" if i % 3 else "Retail",
+                "country": "United States" if i % 4 else "Germany",
+                "email": f"lead{i}@test.com" if i % 5 else None,
+            }
+            for i in range(53)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_parallel_matches_serial(
+        self, scoring_context: dict[str, Any], leads: list[dict[str, Any]]
+    ) -> None:
+        serial = await LeadScoringAgent(batch_size=5).run(
+            campaign_id="campaign-1", leads=leads, scoring_context=scoring_context
+        )
+        parallel = await LeadScoringAgent(batch_size=5, scoring_workers=2).run(
+            campaign_id="campaign-1", leads=leads, scoring_context=scoring_context
+        )
+
+        assert parallel.success is True
+        assert parallel.lead_scores == serial.lead_scores
+        assert parallel.score_distribution == serial.score_distribution
+        assert parallel.avg_score == serial.avg_score
+
+    @pytest.mark.asyncio
+    async def test_parallel_preserves_input_order(
+        self, scoring_context: dict[str, Any], leads: list[dict[str, Any]]
+    ) -> None:
+        agent = LeadScoringAgent(batch_size=3, scoring_workers=2)
+
+        result = await agent.run(
+            campaign_id="campaign-1", leads=leads, scoring_context=scoring_context
+        )
+
+        assert [s["lead_id"] for s in result.lead_scores] == [lead["id"] for lead in leads]
+
+    @pytest.mark.asyncio
+    async def test_single_batch_skips_pool(
+        self, scoring_context: dict[str, Any], leads: list[dict[str, Any]]
+    ) -> None:
+        agent = LeadScoringAgent(batch_size=100, scoring_workers=2)
+
+        with patch("src.agents.lead_scoring.agent.ParallelScorer") as scorer_cls:
+            result = await agent.run(
+                campaign_id="campaign-1", leads=leads, scoring_context=scoring_context
+            )
+
+        scorer_cls.assert_not_called()
+        assert result.total_scored == len(leads)
+
+    @pytest.mark.asyncio
+    async def test_scorer_bounds_pending_batches(
+        self, scoring_context: dict[str, Any], leads: list[dict[str, Any]]
+    ) -> None:
+        async with ParallelScorer(scoring_context, max_workers=1, max_pending=1) as scorer:
+            scores = await scorer.score(leads, batch_size=7)
+
+        assert [s.lead_id for s in scores] == [lead["id"] for lead in leads]
+
+
 class TestLeadScoringAgentBuildTaskPrompt:
     """Tests for LeadScoringAgent._build_task_prompt() method."""
 
@@ -4,6 +4,7 @@ import pytest
 
 from src.agents.lead_scoring.job_title_matcher import (
     JobTitleMatcher,
+    MatchResult,
     calculate_similarity,
     expand_with_synonyms,
     extract_seniority_level,
@@ -216,3 +217,62 @@ class TestJobTitleMatcher:
     def test_match_seniority_no_lead_seniority(self, matcher: JobTitleMatcher) -> None:
         score, matched = matcher.match_seniority(None, ["director", "vp"])
         assert score == 5  # Partial points for unknown
+
+
+class TestCompiledTitleMatcher:
+    """CompiledTitleMatcher must return exactly what JobTitleMatcher.match returns."""
+
+    TARGETS = ["VP Marketing", "Marketing Director", "Head of Growth", "CMO", "Sales Lead"]
+    PERSONAS = [
+        {"name": "Marketing Leader", "job_titles": ["VP Marketing", "CMO", "Marketing Head"]},
+        {"name": "Growth Leader", "job_titles": ["Head of Growth", "VP Growth"]},
+        {"name": "Revenue", "job_titles": ["CRO", "VP Sales", "Sales Director"]},
+    ]
+    LEAD_TITLES = [
+        "VP Marketing",
+        "vp of marketing",
+        "Vice President, Marketing",
+        "Chief Marketing Officer",
+        "Director of Growth",
+        "Head of Sales",
+        "Sr. Sales Director - EMEA",
+        "Software Engineer",
+        "CMO",
+        "Marketing",
+        "---",
+        "Head of HR",
+        "Growth Marketing Manager",
+    ]
+
+    @pytest.mark.parametrize("prefilter", [True, False])
+    @pytest.mark.parametrize("with_personas", [True, False])
+    def test_matches_reference(self, prefilter: bool, with_personas: bool) -> None:
+        matcher = JobTitleMatcher(threshold=0.8)
+        personas = self.PERSONAS if with_personas else None
+        compiled = matcher.compile(self.TARGETS, personas, prefilter=prefilter)
+
+        for title in self.LEAD_TITLES:
+            assert compiled.match(title) == matcher.match(title, self.TARGETS, personas), title
+
+    def test_empty_title(self) -> None:
+        compiled = JobTitleMatcher().compile(self.TARGETS)
+        assert compiled.match("") == MatchResult()
+        assert compiled.match(None) == MatchResult()
+
+    def test_repeated_titles_hit_cache(self) -> None:
+        compiled = JobTitleMatcher().compile(self.TARGETS, self.PERSONAS)
+        first = compiled.match("VP of Marketing")
+        second = compiled.match("vp of MARKETING")
+
+        assert first == second
+        assert first is not second
+        assert compiled.cache_info().hits == 1
+
+    def test_custom_synonyms(self) -> None:
+        synonyms = {"Growth Lead": ["Head of Growth Hacking"]}
+        matcher = JobTitleMatcher(synonyms=synonyms)
+        compiled = matcher.compile(["Growth Lead"])
+
+        result = compiled.match("Head of Growth Hacking")
+        assert result == matcher.match("Head of Growth Hacking", ["Growth Lead"])
+        assert result.score == 1.0
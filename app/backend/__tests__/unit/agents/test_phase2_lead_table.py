@@ -0,0 +1,247 @@
+"""Unit tests for the in-memory Phase 2 lead table, checkpoints and orchestrator mode."""
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.agents.data_validation.agent import DataValidationAgent
+from src.agents.data_validation.schemas import LeadValidationResult
+from src.agents.lead_scoring.agent import LeadScoringAgent
+from src.agents.phase2_lead_table import (
+    LEAD_TABLE_COLUMNS,
+    LeadTable,
+    Phase2CheckpointStore,
+)
+from src.agents.phase2_orchestrator import Phase2Config, Phase2Orchestrator, Phase2Result
+
+CAMPAIGN_ID = str(uuid4())
+
+
+def _row(**values: Any) -> tuple[Any, ...]:
+    data: dict[str, Any] = {name: None for name in LEAD_TABLE_COLUMNS}
+    data.update(id=uuid4(), campaign_id=CAMPAIGN_ID, status="new", title="VP Sales")
+    data.update(values)
+    return tuple(data[name] for name in LEAD_TABLE_COLUMNS)
+
+
+def _table(count: int) -> LeadTable:
+    table = LeadTable(CAMPAIGN_ID)
+    table.append_rows(_row(first_name=f"Lead {i}") for i in range(count))
+    return table
+
+
+def _validation(lead_id: str, is_valid: bool) -> LeadValidationResult:
+    return LeadValidationResult(
+        lead_id=lead_id,
+        is_valid=is_valid,
+        status="valid" if is_valid else "invalid",
+        errors=[] if is_valid else ["missing_email"],
+    )
+
+
+# =============================================================================
+# LeadTable
+# =============================================================================
+
+
+class TestLeadTable:
+    """Tests for LeadTable reads and stage results."""
+
+    def test_records_match_lead_dict_shape(self) -> None:
+        table = _table(2)
+
+        records = table.records(status="new")
+
+        assert len(records) == 2
+        assert records[0]["first_name"] == "Lead 0"
+        assert records[0]["job_title"] == "VP Sales"
+        assert records[0]["validation_errors"] == []
+        assert records[0]["score_breakdown"] == {}
+        assert isinstance(records[0]["id"], str)
+
+    def test_stages_update_status_filters(self) -> None:
+        table = _table(4)
+        ids = table.columns["id"]
+
+        table.apply_validation(
+            [_validation(ids[0], False)] + [_validation(i, True) for i in ids[1:]]
+        )
+        table.mark_duplicates([(ids[2], ids[1])])
+        table.mark_cross_duplicates(
+            [{"lead_id": ids[3], "exclusion_reason": "bounced", "excluded_due_to_campaign": None}]
+        )
+
+        assert table.count(status="validated") == 1
+        assert table.count(exclude_status=["invalid", "duplicate"]) == 2
+        remaining = table.records(
+            exclude_status=["invalid", "duplicate", "cross_campaign_duplicate"]
+        )
+        assert [lead["id"] for lead in remaining] == [ids[1]]
+        assert table.records(status="duplicate")[0]["duplicate_of"] == ids[1]
+
+    def test_validation_applies_normalized_fields(self) -> None:
+        table = _table(1)
+        lead_id = table.columns["id"][0]
+        result = _validation(lead_id, True)
+        result.normalized_data = {"email": "jane@acme.com", "first_name": None}
+
+        table.apply_validation([result])
+
+        record = table.records(status="validated")[0]
+        assert record["email"] == "jane@acme.com"
+        assert record["first_name"] == "Lead 0"
+        assert table.state_rows()[0]["email"] == "jane@acme.com"
+
+    def test_state_rows_hold_only_changed_leads(self) -> None:
+        table = _table(3)
+        lead_id = table.columns["id"][1]
+
+        table.apply_scores(
+            [{"lead_id": lead_id, "score": 82, "tier": "A", "breakdown": {"title": 30}}]
+        )
+        table.apply_scores([{"lead_id": "unknown", "score": 1, "tier": "D"}])
+
+        rows = table.state_rows()
+        assert len(rows) == 1
+        assert rows[0]["id"] == lead_id
+        assert rows[0]["status"] == "scored"
+        assert rows[0]["lead_tier"] == "A"
+        assert rows[0]["score_breakdown"] == {"title": 30}
+
+
+# =============================================================================
+# Phase2CheckpointStore
+# =============================================================================
+
+
+class TestPhase2CheckpointStore:
+    """Tests for saving and restoring stage checkpoints."""
+
+    def test_newest_checkpoint_restores_state(self, tmp_path: Path) -> None:
+        path = tmp_path / "checkpoints" / "phase2.db"
+        table = _table(2)
+        ids = table.columns["id"]
+
+        with Phase2CheckpointStore(path) as store:
+            table.apply_validation([_validation(ids[0], True), _validation(ids[1], False)])
+            store.save(CAMPAIGN_ID, "data_validation", table)
+            table.mark_duplicates([(ids[0], ids[1])])
+            store.save(CAMPAIGN_ID, "duplicate_detection", table)
+
+        fresh = LeadTable(CAMPAIGN_ID)
+        fresh.append_rows(
+            _row(id=lead_id, first_name=name) for lead_id, name in zip(ids, ("a", "b"), strict=True)
+        )
+        with Phase2CheckpointStore(path) as store:
+            checkpoint = store.load(CAMPAIGN_ID)
+            assert checkpoint is not None
+            stage, states = checkpoint
+            fresh.restore_state(states)
+            store.clear(CAMPAIGN_ID)
+            assert store.load(CAMPAIGN_ID) is None
+
+        assert stage == "duplicate_detection"
+        assert fresh.count(status="duplicate") == 1
+        assert fresh.count(status="invalid") == 1
+
+
+# =============================================================================
+# Phase2Orchestrator in-memory mode
+# =============================================================================
+
+
+class _FakeLeadRepo:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self.rows = rows
+        self.loads = 0
+        self.written: list[dict[str, Any]] = []
+        self.commits = 0
+
+    async def stream_campaign_lead_rows(
+        self, campaign_id: str, chunk_size: int = 5000
+    ) -> AsyncIterator[list[tuple[Any, ...]]]:
+        self.loads += 1
+        yield self.rows
+
+    async def bulk_write_lead_state(
+        self, states: list[dict[str, Any]], chunk_size: int = 1000
+    ) -> int:
+        self.written = states
+        return len(states)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+class TestInMemoryOrchestrator:
+    """Phase2Orchestrator loads once and writes back once in in-memory mode."""
+
+    @pytest.mark.asyncio
+    async def test_loads_once_and_writes_final_state(self, tmp_path: Path) -> None:
+        config = Phase2Config(in_memory_pipeline=True, checkpoint_path=str(tmp_path / "phase2.db"))
+        orchestrator = Phase2Orchestrator(MagicMock(), config)
+        repo = _FakeLeadRepo([_row() for _ in range(3)])
+        orchestrator.lead_repo = repo  # type: ignore[assignment]
+        orchestrator._checkpoints = Phase2CheckpointStore(config.checkpoint_path or "")
+
+        new_leads = await orchestrator._stage_leads(CAMPAIGN_ID, status="new")
+        assert orchestrator._lead_table is not None
+        orchestrator._lead_table.apply_validation(
+            [_validation(lead["id"], True) for lead in new_leads]
+        )
+        orchestrator._checkpoint(CAMPAIGN_ID, "data_validation")
+        validated = await orchestrator._stage_leads(CAMPAIGN_ID, status="validated")
+
+        result = Phase2Result(campaign_id=CAMPAIGN_ID, niche_id="n")
+        await orchestrator._write_back_lead_table(CAMPAIGN_ID, result)
+
+        assert repo.loads == 1
+        assert len(validated) == 3
+        assert len(repo.written) == 3
+        assert {state["status"] for state in repo.written} == {"validated"}
+        assert repo.commits == 1
+        assert orchestrator._checkpoints.load(CAMPAIGN_ID) is None
+        orchestrator._checkpoints.close()
+
+    @pytest.mark.asyncio
+    async def test_passes_validation_workers_to_agent(self) -> None:
+        config = Phase2Config(in_memory_pipeline=True, validation_workers=4)
+        orchestrator = Phase2Orchestrator(MagicMock(), config)
+        orchestrator.lead_repo = _FakeLeadRepo([_row() for _ in range(3)])  # type: ignore[assignment]
+        built: list[DataValidationAgent] = []
+
+        def build(**kwargs: Any) -> DataValidationAgent:
+            built.append(DataValidationAgent(**kwargs))
+            return built[-1]
+
+        with patch("src.agents.phase2_orchestrator.DataValidationAgent", side_effect=build):
+            stats = await orchestrator._run_data_validation(CAMPAIGN_ID)
+
+        assert [agent.validation_workers for agent in built] == [4]
+        assert stats["total_valid"] + stats["total_invalid"] == 3
+
+    @pytest.mark.asyncio
+    async def test_passes_scoring_workers_to_agent(self) -> None:
+        config = Phase2Config(in_memory_pipeline=True, scoring_workers=4)
+        orchestrator = Phase2Orchestrator(MagicMock(), config)
+        orchestrator.lead_repo = _FakeLeadRepo([_row() for _ in range(3)])  # type: ignore[assignment]
+        orchestrator.niche_repo = MagicMock(
+            get_niche=AsyncMock(return_value=None),
+            get_industry_fit_scores=AsyncMock(return_value={}),
+        )
+        orchestrator.persona_repo = MagicMock(get_personas_by_niche=AsyncMock(return_value=[]))
+        built: list[LeadScoringAgent] = []
+
+        def build(**kwargs: Any) -> LeadScoringAgent:
+            built.append(LeadScoringAgent(**kwargs))
+            return built[-1]
+
+        with patch("src.agents.phase2_orchestrator.LeadScoringAgent", side_effect=build):
+            stats = await orchestrator._run_lead_scoring(CAMPAIGN_ID, "niche-1")
+
+        assert [agent.scoring_workers for agent in built] == [4]
+        assert stats["total_scored"] == 3
@@ -0,0 +1,316 @@
+"""Unit tests for the concurrent Phase 3 email-finding stage."""
+
+import asyncio
+import dataclasses
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.agents.circuit_breaker import CircuitBreakerRegistry
+from src.agents.email_verification import (
+    EmailFinderProvider,
+    EmailVerificationProvider,
+    EmailVerificationResult,
+    EmailVerificationStatus,
+    ProviderRegistry,
+    WaterfallScheduler,
+)
+from src.agents.exceptions import CircuitBreakerError
+from src.agents.phase3_email_stage import (
+    CHECKPOINT_AGENT_ID,
+    CHECKPOINT_STEP_ID,
+    Histogram,
+    Phase3EmailStage,
+)
+from src.agents.phase3_orchestrator import Phase3Config
+
+TOMBA = EmailFinderProvider.TOMBA
+VOILA = EmailFinderProvider.VOILA_NORBERT
+
+
+def _leads(start: int, count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"lead-{i:03d}",
+            "first_name": f"P{i}",
+            "last_name": "Doe",
+            "company_domain": "a.com",
+            "lead_tier": "A",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+class FakeAgent:
+    """EmailVerificationAgent stand-in: Tomba finds even leads, Norbert the rest."""
+
+    def __init__(
+        self,
+        failing: bool = False,
+        failing_leads: frozenset[int] = frozenset(),
+        daily_limits: dict[EmailFinderProvider, int] | None = None,
+    ) -> None:
+        self.failing = failing
+        self.failing_leads = failing_leads
+        self.daily_limits = daily_limits or {}
+        self.in_flight = 0
+        self.peak = 0
+
+    def configured_finder_providers(self) -> list[EmailFinderProvider]:
+        return [TOMBA, VOILA]
+
+    async def find(
+        self, provider: EmailFinderProvider, first: str, last: str, domain: str
+    ) -> str | None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            number = int(first[1:])
+            if self.failing or number in self.failing_leads:
+                raise ConnectionError("provider down")
+            if number % 3 == 2:
+                return None
+            if (provider == TOMBA) == (number % 2 == 0):
+                return f"{first}.{last}@{domain}".lower()
+            return None
+        finally:
+            self.in_flight -= 1
+
+    async def verify(self, email: str) -> EmailVerificationResult:
+        return EmailVerificationResult(
+            email=email,
+            status=EmailVerificationStatus.VALID,
+            provider=EmailVerificationProvider.REOON,
+            confidence=0.95,
+            cost=0.003,
+        )
+
+    def create_scheduler(self, **kwargs: Any) -> WaterfallScheduler:
+        providers = [
+            dataclasses.replace(
+                ProviderRegistry.PROVIDERS[provider],
+                daily_limit=self.daily_limits.get(
+                    provider, ProviderRegistry.PROVIDERS[provider].daily_limit
+                ),
+            )
+            for provider in self.configured_finder_providers()
+        ]
+        return WaterfallScheduler(
+            find_email=self.find,
+            verify_email=self.verify if kwargs["verify"] else None,
+            providers=providers,
+            max_concurrent_leads=kwargs["max_concurrent_leads"],
+            circuit_breakers=kwargs["circuit_breakers"],
+        )
+
+
+def _lead_repo(leads: list[dict[str, Any]], page_size: int) -> MagicMock:
+    repo = MagicMock()
+    repo.queried_after: list[str | None] = []
+
+    async def stream(
+        campaign_id: str, after_id: str | None = None, chunk_size: int = 500
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        repo.queried_after.append(after_id)
+        remaining = [lead for lead in leads if after_id is None or lead["id"] > after_id]
+        for i in range(0, len(remaining), page_size):
+            yield remaining[i : i + page_size]
+
+    repo.stream_leads_needing_email = stream
+    repo.bulk_update_email_results = AsyncMock(side_effect=lambda rows: len(rows))
+    repo.commit = AsyncMock()
+    return repo
+
+
+def _checkpoint_repo(output_data: dict[str, Any] | None = None) -> MagicMock:
+    repo = MagicMock()
+    checkpoint = MagicMock(output_data=output_data) if output_data else None
+    repo.get_checkpoint = AsyncMock(return_value=checkpoint)
+    repo.update_checkpoint = AsyncMock()
+    repo.commit = AsyncMock()
+    return repo
+
+
+def _stage(
+    lead_repo: MagicMock,
+    checkpoint_repo: MagicMock,
+    agent: FakeAgent | None = None,
+    **config: Any,
+) -> Phase3EmailStage:
+    config.setdefault("batch_size", 4)
+    return Phase3EmailStage(
+        lead_repo=lead_repo,
+        checkpoint_repo=checkpoint_repo,
+        config=Phase3Config(**config),
+        circuit_breakers=CircuitBreakerRegistry(),
+        agent=agent or FakeAgent(),  # type: ignore[arg-type]
+    )
+
+
+# =============================================================================
+# Histogram
+# =============================================================================
+
+
+class TestHistogram:
+    """Tests for the fixed-bucket histogram."""
+
+    def test_buckets_and_quantiles(self) -> None:
+        histogram = Histogram((100, 500, 1000))
+        for value in (50, 100, 300, 800, 5000):
+            histogram.observe(value)
+
+        data = histogram.to_dict()
+        assert data["buckets"] == {"<=100": 2, "<=500": 1, "<=1000": 1, ">1000": 1}
+        assert data["count"] == 5
+        assert data["p50"] == 500
+        assert data["p95"] is None
+        assert data["mean"] == 1250
+
+
+# =============================================================================
+# Phase3EmailStage
+# =============================================================================
+
+
+class TestPhase3EmailStage:
+    """Tests for streaming, bulk writes, checkpoints and breakers."""
+
+    @pytest.mark.asyncio
+    async def test_runs_chunks_and_writes_in_bulk(self) -> None:
+        lead_repo = _lead_repo(_leads(0, 10), page_size=4)
+        checkpoint_repo = _checkpoint_repo()
+        agent = FakeAgent()
+        stage = _stage(lead_repo, checkpoint_repo, agent)
+
+        report = await stage.run("campaign-1", workflow_id="wf-1")
+
+        progress = report.progress
+        assert progress.processed == 10
+        assert progress.not_found == 3
+        assert progress.found == progress.verified == 7
+        assert progress.cursor == "lead-009"
+        assert progress.chunks == 3
+        # Leads of a chunk run concurrently
+        assert agent.peak > 1
+
+        assert lead_repo.bulk_update_email_results.await_count == 3
+        rows = lead_repo.bulk_update_email_results.await_args_list[0].args[0]
+        assert rows[0] == {"lead_id": "lead-000", "email": "p0.doe@a.com", "email_status": "valid"}
+        assert rows[2] == {"lead_id": "lead-002", "email": None, "email_status": "not_found"}
+        assert lead_repo.commit.await_count == 3
+
+        final = checkpoint_repo.update_checkpoint.await_args_list[-1].kwargs
+        assert final["status"] == "completed"
+        assert final["agent_id"] == CHECKPOINT_AGENT_ID
+        assert final["step_id"] == CHECKPOINT_STEP_ID
+        assert final["output_data"]["processed"] == 10
+
+        tomba = report.provider_breakdown["tomba"]
+        assert tomba["latency_ms"]["count"] == 10
+        assert tomba["cost_per_lead_usd"]["count"] > 0
+        assert report.provider_breakdown["not_found"]["cost_per_lead_usd"]["count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_checkpoint_cursor(self) -> None:
+        lead_repo = _lead_repo(_leads(0, 10), page_size=4)
+        checkpoint_repo = _checkpoint_repo(
+            {"cursor": "lead-005", "processed": 6, "found": 4, "verified": 4, "not_found": 2}
+        )
+        stage = _stage(lead_repo, checkpoint_repo)
+
+        report = await stage.run("campaign-1", workflow_id="wf-1")
+
+        assert report.resumed
+        assert lead_repo.queried_after == ["lead-005"]
+        written = [
+            row["lead_id"]
+            for call in lead_repo.bulk_update_email_results.await_args_list
+            for row in call.args[0]
+        ]
+        assert written == ["lead-006", "lead-007", "lead-008", "lead-009"]
+        assert report.progress.processed == 10
+
+    @pytest.mark.asyncio
+    async def test_raises_when_every_finder_circuit_is_open(self) -> None:
+        lead_repo = _lead_repo(_leads(0, 12), page_size=4)
+        checkpoint_repo = _checkpoint_repo()
+        stage = _stage(
+            lead_repo, checkpoint_repo, FakeAgent(failing=True), circuit_breaker_threshold=2
+        )
+
+        with pytest.raises(CircuitBreakerError):
+            await stage.run("campaign-1", workflow_id="wf-1")
+
+        # The chunk that opened the circuits is still persisted, but its
+        # leads got no answer, so none is marked and the cursor stays put
+        assert lead_repo.bulk_update_email_results.await_count == 1
+        assert lead_repo.bulk_update_email_results.await_args.args[0] == []
+        saved = checkpoint_repo.update_checkpoint.await_args.kwargs
+        assert saved["status"] == "in_progress"
+        assert saved["output_data"]["cursor"] is None
+        assert saved["output_data"]["deferred"] == 4
+        assert set(stage.circuit_breakers.get_open_circuits()) == {
+            "email_finder_tomba",
+            "email_finder_norbert",
+        }
+
+    @pytest.mark.asyncio
+    async def test_zero_quota_leaves_leads_unmarked(self) -> None:
+        lead_repo = _lead_repo(_leads(0, 10), page_size=4)
+        checkpoint_repo = _checkpoint_repo()
+        agent = FakeAgent(daily_limits={TOMBA: 0, VOILA: 0})
+        stage = _stage(lead_repo, checkpoint_repo, agent)
+
+        report = await stage.run("campaign-1", workflow_id="wf-1")
+
+        progress = report.progress
+        assert progress.processed == progress.not_found == 0
+        assert progress.deferred == 10
+        assert progress.cursor is None
+        assert agent.peak == 0
+        written = [
+            row
+            for call in lead_repo.bulk_update_email_results.await_args_list
+            for row in call.args[0]
+        ]
+        assert written == []
+        final = checkpoint_repo.update_checkpoint.await_args_list[-1].kwargs
+        assert final["output_data"]["cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_not_found_needs_a_provider_answer(self) -> None:
+        lead_repo = _lead_repo(_leads(0, 10), page_size=4)
+        checkpoint_repo = _checkpoint_repo()
+        # Tomba has no quota and lead 5 errors on Norbert
+        agent = FakeAgent(failing_leads=frozenset({5}), daily_limits={TOMBA: 0})
+        stage = _stage(lead_repo, checkpoint_repo, agent)
+
+        report = await stage.run("campaign-1", workflow_id="wf-1")
+
+        statuses = {
+            row["lead_id"]: row["email_status"]
+            for call in lead_repo.bulk_update_email_results.await_args_list
+            for row in call.args[0]
+        }
+        assert "lead-005" not in statuses
+        # Norbert answered without an email for the others it could not find
+        assert statuses["lead-000"] == "not_found"
+        assert statuses["lead-001"] == "valid"
+        assert len(statuses) == 9
+        assert report.progress.deferred == 1
+        # The cursor stops before the deferred lead for the rest of the run
+        assert report.progress.cursor == "lead-004"
+
+    @pytest.mark.asyncio
+    async def test_stops_fetching_at_budget(self) -> None:
+        lead_repo = _lead_repo(_leads(0, 12), page_size=4)
+        stage = _stage(lead_repo, _checkpoint_repo(), email_budget_usd=0.0)
+
+        report = await stage.run("campaign-1")
+
+        assert report.progress.processed == 4
+        assert report.errors == ["Email budget $0.00 reached"]
@@ -0,0 +1,287 @@
+"""Unit tests for LeadRepository set-based bulk writers."""
+
+import re
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from src.database.repositories.lead_repository import BulkWriteStats, LeadRepository
+
+
+class _Result:
+    def __init__(self, rowcount: int) -> None:
+        self.rowcount = rowcount
+
+
+class RecordingSession:
+    """Stand-in AsyncSession that compiles each statement for asyncpg."""
+
+    def __init__(self) -> None:
+        self.statements: list[Any] = []
+        self.flushes = 0
+
+    async def execute(self, stmt: Any) -> _Result:
+        compiled = stmt.compile(dialect=asyncpg.dialect())
+        self.statements.append(compiled)
+        # Pretend every lead in the VALUES list exists; each row opens with its id
+        return _Result(len(re.findall(r"\(\$\d+::UUID", compiled.string)))
+
+    async def flush(self) -> None:
+        self.flushes += 1
+
+
+# =============================================================================
+# bulk_update_scores
+# =============================================================================
+
+
+class TestBulkUpdateScores:
+    """Tests for LeadRepository.bulk_update_scores."""
+
+    @pytest.mark.asyncio
+    async def test_one_statement_per_chunk(self) -> None:
+        session = RecordingSession()
+        repo = LeadRepository(session)  # type: ignore[arg-type]
+        scores = [
+            {"lead_id": str(uuid4()), "score": i, "tier": "B", "breakdown": {"x": i}}
+            for i in range(5)
+        ]
+
+        count = await repo.bulk_update_scores(scores, chunk_size=2)
+
+        assert count == 5
+        assert len(session.statements) == 3
+        assert session.flushes == 1
+        sql = str(session.statements[0])
+        assert "FROM (VALUES" in sql
+        assert "WHERE leads.id = v.id" in sql
+        assert "::JSONB" in sql
+
+    @pytest.mark.asyncio
+    async def test_records_write_stats(self) -> None:
+        repo = LeadRepository(RecordingSession())  # type: ignore[arg-type]
+
+        await repo.bulk_update_scores([{"lead_id": uuid4(), "score": 90, "tier": "A"}])
+
+        stats = repo.last_bulk_write
+        assert isinstance(stats, BulkWriteStats)
+        assert stats.operation == "bulk_update_scores"
+        assert stats.rows_written == 1
+        assert stats.statements == 1
+        assert stats.to_dict()["rows_per_second"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_empty_input_issues_no_statements(self) -> None:
+        session = RecordingSession()
+        repo = LeadRepository(session)  # type: ignore[arg-type]
+
+        assert await repo.bulk_update_scores([]) == 0
+        assert session.statements == []
+        assert session.flushes == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_lead_keeps_last_score(self) -> None:
+        session = RecordingSession()
+        repo = LeadRepository(session)  # type: ignore[arg-type]
+        lead_id = uuid4()
+
+        await repo.bulk_update_scores(
+            [
+                {"lead_id": lead_id, "score": 10, "tier": "D"},
+                {"lead_id": str(lead_id), "score": 85, "tier": "A"},
+            ]
+        )
+
+        params = session.statements[0].params
+        assert list(params.values()).count(lead_id) == 1
+        assert 85 in params.values()
+        assert 10 not in params.values()
+
+
+# =============================================================================
+# Validation writer
+# =============================================================================
+
+
+class TestBulkUpdateValidationResults:
+    """Tests for LeadRepository.bulk_update_validation_results."""
+
+    @pytest.mark.asyncio
+    async def test_mixed_results_share_one_statement(self) -> None:
+        session = RecordingSession()
+        repo = LeadRepository(session)  # type: ignore[arg-type]
+        results = [
+            {
+                "lead_id": str(uuid4()),
+                "is_valid": True,
+                "errors": [],
+                "normalized_data": {"email": "jane@acme.com", "title": "VP Sales"},
+            },
+            {
+                "lead_id": str(uuid4()),
+                "is_valid": False,
+                "errors": ["missing_email", "invalid_linkedin_url"],
+                "normalized_data": {"first_name": "X" * 150},
+            },
+        ]
+
+        count = await repo.bulk_update_validation_results(results)
+
+        assert count == 2
+        assert len(session.statements) == 1
+        assert session.flushes == 1
+        sql = str(session.statements[0])
+        assert "validation_errors=v.validation_errors" in sql
+        assert "email=coalesce(v.email, leads.email)" in sql
+        params = list(session.statements[0].params.values())
+        assert "validated" in params
+        assert "invalid" in params
+        assert ["missing_email", "invalid_linkedin_url"] in params
+        assert "jane@acme.com" in params
+        # Truncated to the column length
+        assert "X" * 100 in params
+
+    @pytest.mark.asyncio
+    async def test_chunks_large_batches(self) -> None:
+        session = RecordingSession()
+        repo = LeadRepository(session)  # type: ignore[arg-type]
+        results = [{"lead_id": str(uuid4()), "is_valid": True, "errors": []} for _ in range(5)]
+
+        count = await repo.bulk_update_validation_results(results, chunk_size=2)
+
+        assert count == 5
+        assert len(session.statements) == 3
+        assert repo.last_bulk_write is not None
+        assert repo.last_bulk_write.operation == "bulk_update_validation_results"
+
+
+# =============================================================================
+# Duplicate writers
+# =============================================================================
+
+
+class TestBulkMarkDuplicates:
+    """Tests for LeadRepository.bulk_mark_duplicates."""
+
+    @pytest.mark.asyncio
+    async def test_sets_duplicate_of_from_values(self) -> None:
+        session = RecordingSession()
+        repo = LeadRepository(session)  # type: ignore[arg-type]
+
+        count = await repo.bulk_mark_duplicates([(str(uuid4()), str(uuid4())) for _ in range(3)])
+
+        assert count == 3
+        sql = str(session.statements[0])
+        assert "duplicate_of=v.duplicate_of" in sql
+        assert "duplicate" in session.statements[0].params.values()
+
+
+class TestBulkMarkCrossDuplicates:
+    """Tests for LeadRepository.bulk_mark_cross_duplicates."""
+
+    @pytest.mark.asyncio
+    async def test_missing_campaign_keeps_existing_value(self) -> None:
+        session = RecordingSession()
+        repo = LeadRepository(session)  # type: ignore[arg-type]
+
+        await repo.bulk_mark_cross_duplicates(
+            [{"lead_id": str(uuid4()), "exclusion_reason": "previously_contacted"}]
+        )
+
+        sql = str(session.statements[0])
+        assert "coalesce(CAST(v.excluded_due_to_campaign AS UUID)" in sql
+        assert "leads.excluded_due_to_campaign" in sql
+        assert "previously_contacted" in session.statements[0].params.values()
+
+
+# =============================================================================
+# Streaming ingestion
+# =============================================================================
+
+
+async def _batches(*sizes: int) -> AsyncIterator[list[dict[str, Any]]]:
+    count = 0
+    for size in sizes:
+        yield [{"first_name": f"Lead {count + i}", "job_title": "VP"} for i in range(size)]
+        count += size
+
+
+class TestIngestLeads:
+    """Tests for LeadRepository.ingest_leads."""
+
+    @pytest.mark.asyncio
+    async def test_writes_fixed_size_insert_chunks(self) -> None:
+        session = RecordingSession()
+        repo = LeadRepository(session)  # type: ignore[arg-type]
+
+        count = await repo.ingest_leads(uuid4(), _batches(3, 2, 2), chunk_size=3)
+
+        assert count == 7
+        assert len(session.statements) == 3
+        sql = str(session.statements[0])
+        assert sql.startswith("INSERT INTO leads")
+        assert sql.count("::UUID") == 3
+        params = session.statements[-1].params
+        assert "Lead 6" in params.values()
+        assert "VP" in params.values()
+        assert repo.last_bulk_write is not None
+        assert repo.last_bulk_write.operation == "ingest_leads"
+        assert repo.last_bulk_write.rows_written == 7
+        assert repo.last_bulk_write.statements == 3
+
+    @pytest.mark.asyncio
+    async def test_empty_stream_issues_no_statements(self) -> None:
+        session = RecordingSession()
+        repo = LeadRepository(session)  # type: ignore[arg-type]
+
+        assert await repo.ingest_leads(str(uuid4()), _batches()) == 0
+        assert session.statements == []
+
+
+# =============================================================================
+# In-memory pipeline write-back
+# =============================================================================
+
+
+class TestBulkWriteLeadState:
+    """Tests for LeadRepository.bulk_write_lead_state."""
+
+    @pytest.mark.asyncio
+    async def test_writes_all_state_columns_in_one_statement(self) -> None:
+        session = RecordingSession()
+        repo = LeadRepository(session)  # type: ignore[arg-type]
+        states = [
+            {"id": str(uuid4()), "status": "scored", "lead_score": 80, "lead_tier": "A"},
+            {"id": str(uuid4()), "status": "duplicate", "duplicate_of": str(uuid4())},
+        ]
+
+        count = await repo.bulk_write_lead_state(states)
+
+        assert count == 2
+        assert len(session.statements) == 1
+        sql = str(session.statements[0])
+        assert "status=v.status" in sql
+        assert "lead_score=CAST(v.lead_score AS INTEGER)" in sql
+        assert "duplicate_of=CAST(v.duplicate_of AS UUID)" in sql
+        assert repo.last_bulk_write is not None
+        assert repo.last_bulk_write.operation == "bulk_write_lead_state"
+
+    @pytest.mark.asyncio
+    async def test_all_unscored_chunk_types_score_column(self) -> None:
+        session = RecordingSession()
+        repo = LeadRepository(session)  # type: ignore[arg-type]
+        states = [
+            {"id": str(uuid4()), "status": "invalid"},
+            {"id": str(uuid4()), "status": "cross_campaign_duplicate"},
+        ]
+
+        assert await repo.bulk_write_lead_state(states) == 2
+
+        sql = str(session.statements[0])
+        # Every lead_score in the VALUES list is a bare NULL (typed as text by
+        # Postgres), so the SET clause must cast it back to the column type
+        assert "lead_score=CAST(v.lead_score AS INTEGER)" in sql
+        assert "excluded_due_to_campaign=CAST(v.excluded_due_to_campaign AS UUID)" in sql
@@ -10,11 +10,14 @@ Tests cover:
 - Rate limiting
 """
 
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.integrations.apify import (
+    ApifyActorError,
     ApifyActorId,
     ApifyAuthenticationError,
     ApifyError,
@@ -301,6 +304,33 @@ class TestGetDatasetItems:
 
         assert len(items) == 1500
 
+    @pytest.mark.asyncio
+    async def test_stream_dataset_items_prefetches_next_page(
+        self,
+        client: ApifyLeadScraperClient,
+    ) -> None:
+        """The next page is requested before the current one is handed out."""
+        dataset = [{"id": i} for i in range(250)]
+        offsets: list[int] = []
+
+        async def list_items(limit: int, offset: int) -> MagicMock:
+            offsets.append(offset)
+            return MagicMock(items=dataset[offset : offset + limit])
+
+        mock_dataset_client = MagicMock()
+        mock_dataset_client.list_items = list_items
+
+        with patch.object(client.client, "dataset", return_value=mock_dataset_client):
+            stream = client.stream_dataset_items("dataset_xyz789", batch_size=100)
+            first = await anext(stream)
+            await asyncio.sleep(0)
+            assert offsets == [0, 100]
+
+            pages = [first] + [page async for page in stream]
+
+        assert [len(page) for page in pages] == [100, 100, 50]
+        assert offsets == [0, 100, 200]
+
 
 # =============================================================================
 # Lead Scraping Tests
@@ -630,3 +660,193 @@ class TestApifyScrapeResult:
         assert result.leads == []
         assert result.total_items == 0
         assert result.cost_usd == 0.0
+
+
+# =============================================================================
+# Streaming Tests
+# =============================================================================
+
+
+def _started_run(actor_id: str, run_id: str) -> ApifyScrapeResult:
+    return ApifyScrapeResult(
+        run_id=run_id, actor_id=actor_id, status="RUNNING", dataset_id=f"ds_{run_id}"
+    )
+
+
+class TestStreamLeads:
+    """Tests for ApifyLeadScraperClient.stream_leads."""
+
+    @pytest.mark.asyncio
+    async def test_yields_leads_while_run_is_in_progress(
+        self,
+        client: ApifyLeadScraperClient,
+    ) -> None:
+        """Items written between polls are parsed and yielded before the run ends."""
+        client.poll_interval_secs = 0
+        dataset: list[dict[str, Any]] = []
+        statuses = iter(["RUNNING", "RUNNING", "SUCCEEDED"])
+
+        async def get_run() -> dict[str, Any]:
+            # The actor writes 3 more items before every poll
+            start = len(dataset)
+            dataset.extend(
+                {"firstName": f"P{i}", "lastName": "Doe"} for i in range(start, start + 3)
+            )
+            return {"status": next(statuses), "usage": {"TOTAL_USD": 0.25}}
+
+        async def list_items(limit: int, offset: int) -> MagicMock:
+            return MagicMock(items=dataset[offset : offset + limit])
+
+        run_client = MagicMock(get=get_run)
+        dataset_client = MagicMock(list_items=list_items)
+        started = _started_run(ApifyActorId.LEADS_FINDER_PRIMARY.value, "run_1")
+
+        with (
+            patch.object(client, "run_actor", AsyncMock(return_value=started)),
+            patch.object(client.client, "run", return_value=run_client),
+            patch.object(client.client, "dataset", return_value=dataset_client),
+        ):
+            stream = client.stream_leads(job_titles=["VP"], batch_size=2)
+            batches = [batch async for batch in stream]
+
+        assert [len(batch) for batch in batches] == [2, 1, 2, 1, 2, 1]
+        assert batches[0][0].first_name == "P0"
+        assert stream.total_leads == 9
+        assert stream.runs[0].status == "SUCCEEDED"
+        assert stream.runs[0].total_items == 9
+        assert stream.total_cost_usd == 0.25
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_actor_fails_before_any_leads(
+        self,
+        client: ApifyLeadScraperClient,
+    ) -> None:
+        """A failed run with no leads moves on to the next waterfall actor."""
+        client.poll_interval_secs = 0
+        runs = [
+            _started_run(ApifyActorId.LEADS_FINDER_PRIMARY.value, "run_1"),
+            _started_run(ApifyActorId.LEADS_SCRAPER_PPE.value, "run_2"),
+        ]
+        run_info = {"run_1": {"status": "FAILED"}, "run_2": {"status": "SUCCEEDED"}}
+
+        def run(run_id: str) -> MagicMock:
+            return MagicMock(get=AsyncMock(return_value=run_info[run_id]))
+
+        dataset_client = MagicMock(
+            list_items=AsyncMock(return_value=MagicMock(items=[{"firstName": "Ann"}]))
+        )
+
+        with (
+            patch.object(client, "run_actor", AsyncMock(side_effect=runs)),
+            patch.object(client.client, "run", side_effect=run),
+            patch.object(client.client, "dataset", return_value=dataset_client),
+        ):
+            stream = client.stream_leads(batch_size=10)
+            batches = [batch async for batch in stream]
+
+        assert len(batches) == 1
+        assert stream.runs[-1].actor_id == ApifyActorId.LEADS_SCRAPER_PPE.value
+        assert "status=FAILED" in stream.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_all_actors_failing_raises(
+        self,
+        client: ApifyLeadScraperClient,
+    ) -> None:
+        """The stream raises once every actor in the waterfall has failed."""
+        with patch.object(
+            client,
+            "run_actor",
+            AsyncMock(side_effect=ApifyActorError(actor_id="x", message="boom")),
+        ):
+            stream = client.stream_leads()
+            with pytest.raises(ApifyActorError, match="All lead scrapers failed"):
+                async for _ in stream:
+                    pass
+
+        assert len(stream.errors) == len(ApifyLeadScraperClient.LEAD_SCRAPER_WATERFALL)
+
+    @pytest.mark.asyncio
+    async def test_consumer_error_aborts_running_actor(
+        self,
+        client: ApifyLeadScraperClient,
+    ) -> None:
+        """A consumer that raises mid-stream leaves no actor run billing."""
+        client.poll_interval_secs = 0
+        run_client = MagicMock(
+            get=AsyncMock(return_value={"status": "RUNNING"}),
+            abort=AsyncMock(return_value={"status": "ABORTING"}),
+        )
+        dataset_client = MagicMock(
+            list_items=AsyncMock(return_value=MagicMock(items=[{"firstName": "Ann"}]))
+        )
+        started = _started_run(ApifyActorId.LEADS_FINDER_PRIMARY.value, "run_1")
+
+        with (
+            patch.object(client, "run_actor", AsyncMock(return_value=started)),
+            patch.object(client.client, "run", return_value=run_client),
+            patch.object(client.client, "dataset", return_value=dataset_client),
+            pytest.raises(RuntimeError, match="insert failed"),
+        ):
+            async with client.stream_leads(batch_size=10) as stream:
+                async for _ in stream:
+                    raise RuntimeError("insert failed")
+
+        run_client.abort.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_timeout_aborts_running_actor(
+        self,
+        client: ApifyLeadScraperClient,
+    ) -> None:
+        """Giving up on a run after timeout_secs aborts it before the next actor."""
+        client.poll_interval_secs = 0
+        client.timeout_secs = 0
+        run_client = MagicMock(
+            get=AsyncMock(return_value={"status": "RUNNING"}),
+            abort=AsyncMock(return_value={"status": "ABORTING"}),
+        )
+        dataset_client = MagicMock(list_items=AsyncMock(return_value=MagicMock(items=[])))
+
+        with (
+            patch.object(
+                client,
+                "run_actor",
+                AsyncMock(side_effect=[_started_run("actor", "run_1")]),
+            ),
+            patch.object(client.client, "run", return_value=run_client),
+            patch.object(client.client, "dataset", return_value=dataset_client),
+        ):
+            stream = client.stream_leads(actor_id="actor")
+            with pytest.raises(ApifyActorError, match="All lead scrapers failed"):
+                async for _ in stream:
+                    pass
+
+        assert "timed out" in stream.errors[0]
+        run_client.abort.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_finished_run_is_not_aborted(
+        self,
+        client: ApifyLeadScraperClient,
+    ) -> None:
+        """Closing the stream after a run succeeded makes no abort call."""
+        run_client = MagicMock(
+            get=AsyncMock(return_value={"status": "SUCCEEDED"}),
+            abort=AsyncMock(),
+        )
+        dataset_client = MagicMock(
+            list_items=AsyncMock(return_value=MagicMock(items=[{"firstName": "Ann"}]))
+        )
+        started = _started_run(ApifyActorId.LEADS_FINDER_PRIMARY.value, "run_1")
+
+        with (
+            patch.object(client, "run_actor", AsyncMock(return_value=started)),
+            patch.object(client.client, "run", return_value=run_client),
+            patch.object(client.client, "dataset", return_value=dataset_client),
+        ):
+            async with client.stream_leads(batch_size=10) as stream:
+                batches = [batch async for batch in stream]
+
+        assert len(batches) == 1
+        run_client.abort.assert_not_awaited()
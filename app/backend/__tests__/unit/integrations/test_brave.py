@@ -1,7 +1,9 @@
 """Unit tests for Brave Search API integration client."""
 
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from __tests__.fixtures.brave_fixtures import (
@@ -30,6 +32,7 @@ from src.integrations.brave import (
     BraveVideoResult,
     BraveWebResult,
 )
+from src.integrations.response_cache import get_response_cache, response_cache_stats
 
 
 class TestBraveClientInitialization:
@@ -500,50 +503,60 @@ class TestBraveClientSuggest:
             assert mock_get.call_args[0][0] == "/suggest/search"
 
 
+def _http_response(data: dict[str, Any]) -> httpx.Response:
+    return httpx.Response(200, json=data, request=httpx.Request("GET", BraveClient.BASE_URL))
+
+
 class TestBraveClientCaching:
-    """Tests for BraveClient caching functionality."""
+    """Tests for BraveClient use of the shared search response cache."""
 
     @pytest.mark.asyncio
     async def test_cache_stores_results(self) -> None:
-        """Client should cache search results."""
+        """Repeated searches should be answered from the shared cache."""
         client = BraveClient(api_key="test-key", enable_caching=True)  # pragma: allowlist secret
 
-        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = MOCK_WEB_SEARCH_SIMPLE
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _http_response(MOCK_WEB_SEARCH_SIMPLE)
 
             # First call should hit API
-            await client.search("test")
-            assert mock_get.call_count == 1
+            first = await client.search("test")
+            assert mock_request.call_count == 1
 
-            # Second call should use cache
-            await client.search("test")
-            assert mock_get.call_count == 1
+            # Second call, from another client instance, should use the cache
+            other = BraveClient(api_key="other-key")  # pragma: allowlist secret
+            second = await other.search("test")
+            assert mock_request.call_count == 1
+
+        assert second.results[0].url == first.results[0].url
+        assert response_cache_stats()["brave"]["memory_hits"] == 1
 
     @pytest.mark.asyncio
     async def test_cache_disabled_hits_api_each_time(self) -> None:
         """Client with caching disabled should hit API each time."""
         client = BraveClient(api_key="test-key", enable_caching=False)  # pragma: allowlist secret
 
-        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = MOCK_WEB_SEARCH_SIMPLE
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _http_response(MOCK_WEB_SEARCH_SIMPLE)
 
             await client.search("test")
             await client.search("test")
 
-            assert mock_get.call_count == 2
+            assert mock_request.call_count == 2
 
-    def test_clear_cache_returns_count(self) -> None:
-        """clear_cache() should return number of entries cleared."""
+    @pytest.mark.asyncio
+    async def test_clear_cache_returns_count(self) -> None:
+        """clear_cache() should drop only Brave entries and return their count."""
         client = BraveClient(api_key="test-key")  # pragma: allowlist secret
-        # Manually add cache entries
-        from datetime import datetime
+        get_response_cache().put("serper", "other", {"organic": []}, ttl=60)
 
-        client._cache["key1"] = (MOCK_WEB_SEARCH_SIMPLE, datetime.now())  # type: ignore
-        client._cache["key2"] = (MOCK_NEWS_SEARCH_RESPONSE, datetime.now())  # type: ignore
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _http_response(MOCK_WEB_SEARCH_SIMPLE)
+            await client.search("first")
+            await client.search("second")
 
         count = client.clear_cache()
         assert count == 2
-        assert len(client._cache) == 0
+        assert get_response_cache().get("serper", "other") == {"organic": []}
 
 
 class TestBraveClientHealthCheck:
@@ -619,18 +632,16 @@ class TestBraveClientContextManager:
     """Tests for BraveClient async context manager."""
 
     @pytest.mark.asyncio
-    async def test_context_manager_clears_cache_on_exit(self) -> None:
-        """Context manager should clear cache on exit."""
+    async def test_context_manager_keeps_shared_cache_on_exit(self) -> None:
+        """Cached responses should outlive the client that fetched them."""
         client = BraveClient(api_key="test-key")  # pragma: allowlist secret
-        from datetime import datetime
-
-        client._cache["key1"] = (MOCK_WEB_SEARCH_SIMPLE, datetime.now())  # type: ignore
 
-        with patch.object(client, "close", new_callable=AsyncMock):
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _http_response(MOCK_WEB_SEARCH_SIMPLE)
             async with client:
-                assert len(client._cache) == 1
+                await client.search("test")
 
-        assert len(client._cache) == 0
+        assert len(get_response_cache()) == 1
 
 
 class TestBraveDataclasses:
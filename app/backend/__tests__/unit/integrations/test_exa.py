@@ -1,7 +1,9 @@
 """Unit tests for Exa API integration client."""
 
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from __tests__.fixtures.exa_fixtures import (
@@ -24,6 +26,11 @@ from src.integrations.exa import (
     ExaError,
     ExaSearchType,
 )
+from src.integrations.response_cache import get_response_cache
+
+
+def _http_response(data: dict[str, Any]) -> httpx.Response:
+    return httpx.Response(200, json=data, request=httpx.Request("POST", ExaClient.BASE_URL))
 
 
 class TestExaClientInitialization:
@@ -427,31 +434,37 @@ class TestExaClientCaching:
     @pytest.mark.asyncio
     async def test_caches_search_results(self, client: ExaClient) -> None:
         """search() should cache results."""
-        with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = SAMPLE_SEARCH_RESPONSE
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _http_response(SAMPLE_SEARCH_RESPONSE)
 
             # First call - should hit API
             result1 = await client.search("cached query")
-            assert mock_post.call_count == 1
+            assert mock_request.call_count == 1
 
             # Second call with same query - should use cache
             result2 = await client.search("cached query")
-            assert mock_post.call_count == 1  # Still 1, cache hit
+            assert mock_request.call_count == 1  # Still 1, cache hit
 
             # Results should be the same
             assert result1.query == result2.query
-            assert len(result1.results) == len(result2.results)
+            assert result2 == result1
 
-    def test_clear_cache(self) -> None:
+            # Reformatted query - same cache entry
+            result3 = await client.search("  cached   query ")
+            assert mock_request.call_count == 1
+            assert result3.results == result1.results
+
+    @pytest.mark.asyncio
+    async def test_clear_cache(self, client: ExaClient) -> None:
         """clear_cache() should remove all cached entries."""
-        client = ExaClient(api_key="test-key")  # pragma: allowlist secret
-        # Simulate some cached entries
-        client._cache["key1"] = ("result1", None)  # type: ignore[assignment]
-        client._cache["key2"] = ("result2", None)  # type: ignore[assignment]
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _http_response(SAMPLE_SEARCH_RESPONSE)
+            await client.search("query one")
+            await client.search("query two")
 
         count = client.clear_cache()
         assert count == 2
-        assert len(client._cache) == 0
+        assert len(get_response_cache()) == 0
 
 
 class TestExaClientErrorHandling:
@@ -0,0 +1,179 @@
+"""Unit tests for the shared search response cache."""
+
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.integrations.response_cache import (
+    SearchResponseCache,
+    get_response_cache,
+    response_cache_key,
+    response_cache_stats,
+)
+from src.integrations.serper import SerperClient
+
+
+def _key(**body: Any) -> str | None:
+    return response_cache_key("serper", "POST", "/search", {"json": body})
+
+
+def _http_response(data: dict[str, Any]) -> httpx.Response:
+    return httpx.Response(200, json=data, request=httpx.Request("POST", SerperClient.BASE_URL))
+
+
+# =============================================================================
+# Keys
+# =============================================================================
+
+
+class TestResponseCacheKey:
+    """Tests for request canonicalization."""
+
+    def test_equivalent_requests_share_a_key(self) -> None:
+        key = _key(q="acme  funding", num=10, gl="us")
+
+        assert key == _key(gl="us", num=10, q=" acme funding ")
+        assert key == _key(q="acme funding", num=10, gl="us", tbs=None, api_key="secret")
+        assert key != _key(q="acme hiring", num=10, gl="us")
+        assert key != response_cache_key("tavily", "POST", "/search", {"json": {"q": "x"}})
+
+    def test_only_top_level_query_and_credential_fields_are_normalized(self) -> None:
+        def perplexity(content: str, **extra: Any) -> str | None:
+            body = {"messages": [{"role": "user", "content": content}], **extra}
+            return response_cache_key("perplexity", "POST", "/chat/completions", {"json": body})
+
+        # Prompt whitespace can change the answer, so it is keyed as sent
+        assert perplexity("Summarize:\n\n- Acme") != perplexity("Summarize: - Acme")
+        assert perplexity("x", api_key="a") == perplexity("x", api_key="b")
+
+        # Nested key/token fields and top-level pagination tokens are request data
+        assert _key(q="acme", filter={"key": "a"}) != _key(q="acme", filter={"key": "b"})
+        assert _key(q="acme", token="page-2") != _key(q="acme", token="page-3")
+        assert _key(q="acme", meta={"api_key": "a"}) != _key(q="acme", meta={"api_key": "b"})
+
+    def test_headers_are_ignored_and_raw_bodies_are_uncacheable(self) -> None:
+        params = {"params": {"q": "acme"}}
+
+        assert response_cache_key("brave", "GET", "/web/search", params) == response_cache_key(
+            "brave", "GET", "/web/search", {**params, "headers": {"X": "1"}, "timeout": 5}
+        )
+        assert response_cache_key("brave", "POST", "/upload", {"content": b"raw"}) is None
+
+
+# =============================================================================
+# SearchResponseCache
+# =============================================================================
+
+
+class TestSearchResponseCache:
+    """Tests for tiers, expiry, eviction and stats."""
+
+    def test_hit_returns_a_copy(self) -> None:
+        cache = SearchResponseCache()
+        cache.put("serper", "k", {"organic": [{"title": "Acme"}]}, ttl=60)
+
+        first = cache.get("serper", "k")
+        assert first == {"organic": [{"title": "Acme"}]}
+        first["organic"].clear()  # type: ignore[index]
+
+        assert cache.get("serper", "k") == {"organic": [{"title": "Acme"}]}
+        assert cache.get("serper", "missing") is None
+        assert cache.stats()["serper"] == {
+            "lookups": 3,
+            "hits": 2,
+            "memory_hits": 2,
+            "disk_hits": 0,
+            "misses": 1,
+            "stores": 1,
+            "evictions": 0,
+            "hit_rate": 0.6667,
+        }
+
+    def test_expired_entries_miss(self) -> None:
+        cache = SearchResponseCache()
+        cache.put("exa", "k", {"results": []}, ttl=10)
+
+        with patch("src.integrations.response_cache.time.time", return_value=time.time() + 11):
+            assert cache.get("exa", "k") is None
+
+    def test_memory_tier_is_lru_bounded(self) -> None:
+        cache = SearchResponseCache(memory_entries=2)
+        cache.put("serper", "a", {"n": 1}, ttl=60)
+        cache.put("tavily", "b", {"n": 2}, ttl=60)
+        cache.get("serper", "a")
+        cache.put("serper", "c", {"n": 3}, ttl=60)
+
+        assert cache.get("tavily", "b") is None
+        assert cache.get("serper", "a") == {"n": 1}
+        assert cache.stats()["tavily"]["evictions"] == 1
+
+    def test_disk_tier_survives_restart(self, tmp_path: Path) -> None:
+        path = tmp_path / "search_cache.db"
+        with SearchResponseCache(path) as cache:
+            cache.put("firecrawl", "k", {"markdown": "# Acme"}, ttl=60)
+
+        with SearchResponseCache(path) as cache:
+            assert cache.get("firecrawl", "k") == {"markdown": "# Acme"}
+            assert cache.get("firecrawl", "k") == {"markdown": "# Acme"}
+            stats = cache.stats()["firecrawl"]
+            assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+
+    def test_disk_tier_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        with SearchResponseCache(tmp_path / "c.db", memory_entries=0, max_entries=50) as cache:
+            for i in range(100):
+                cache.put("serper", f"k{i}", {"n": i}, ttl=60)
+
+            assert len(cache) == 50
+            assert cache.get("serper", "k0") is None
+            assert cache.get("serper", "k99") == {"n": 99}
+            assert cache.stats()["serper"]["evictions"] == 50
+
+    def test_clear_by_integration(self, tmp_path: Path) -> None:
+        with SearchResponseCache(tmp_path / "c.db") as cache:
+            cache.put("brave", "a", {}, ttl=60)
+            cache.put("brave", "b", {}, ttl=60)
+            cache.put("serper", "c", {}, ttl=60)
+
+            assert cache.clear("brave") == 2
+            assert cache.get("serper", "c") == {}
+            assert cache.clear() == 1
+
+
+# =============================================================================
+# BaseIntegrationClient
+# =============================================================================
+
+
+class TestClientResponseCaching:
+    """Tests for cached endpoints on integration clients."""
+
+    @pytest.mark.asyncio
+    async def test_cached_endpoint_is_served_from_cache(self) -> None:
+        client = SerperClient(api_key="test-key")  # pragma: allowlist secret
+
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _http_response({"organic": []})
+
+            other = SerperClient(api_key="other-key")  # pragma: allowlist secret
+            await client.search("acme funding")
+            await other.search(" acme  funding")
+
+        assert mock_request.call_count == 1
+        assert response_cache_stats()["serper"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_uncached_endpoints_always_hit_api(self) -> None:
+        client = SerperClient(api_key="test-key", max_retries=0)  # pragma: allowlist secret
+        client.response_cache_ttls = {}
+
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _http_response({"organic": []})
+            await client.search("acme")
+            await client.search("acme")
+
+        assert mock_request.call_count == 2
+        assert len(get_response_cache()) == 0
@@ -0,0 +1,127 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.integrations import single_flight
+from src.integrations.base import BaseIntegrationClient, IntegrationError
+from src.integrations.single_flight import SingleFlight, single_flight_key, single_flight_stats
+
+
+class SearchClient(BaseIntegrationClient):
+    """Client with one declared search endpoint."""
+
+    RESPONSE_CACHE_TTLS = {"/search": 60.0}
+
+    def __init__(self, api_key: str = "test-api-key") -> None:  # pragma: allowlist secret
+        super().__init__(name="search", base_url="https://api.test.com", api_key=api_key)
+
+
+@pytest.fixture(autouse=True)
+def flights() -> Iterator[SingleFlight]:
+    flights = SingleFlight()
+    with patch.object(single_flight, "_single_flight", flights):
+        yield flights
+
+
+def _slow_transport(calls: list[httpx.Request], status_code: int = 200) -> Any:
+    async def request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+        calls.append(httpx.Request(method, url, json=kwargs.get("json")))
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            status_code, json={"results": [{"n": 1}]}, request=httpx.Request(method, url)
+        )
+
+    return request
+
+
+class TestSingleFlightKey:
+    """Tests for coalescing keys."""
+
+    def test_key_is_scoped_to_headers(self) -> None:
+        kwargs = {"json": {"q": "acme"}}
+        key = single_flight_key("serper", "POST", "/search", {"X-API-KEY": "a"}, kwargs)
+
+        assert key == single_flight_key(
+            "serper", "POST", "/search", {"X-API-KEY": "a"}, {"json": {"q": " acme"}}
+        )
+        assert key != single_flight_key("serper", "POST", "/search", {"X-API-KEY": "b"}, kwargs)
+        assert single_flight_key("serper", "POST", "/x", {}, {"files": {}}) is None
+
+
+class TestRequestCoalescing:
+    """Tests for coalescing in BaseIntegrationClient._request_with_retry."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_call(self) -> None:
+        calls: list[httpx.Request] = []
+        client = SearchClient()
+        client.response_cache_ttls = {}  # exercise coalescing, not the cache
+
+        with patch.object(client.client, "request", side_effect=_slow_transport(calls)):
+            results = await asyncio.gather(
+                *(client.post("/search", json={"q": "acme"}) for _ in range(5)),
+                client.post("/search", json={"q": "globex"}),
+            )
+
+        assert len(calls) == 2
+        assert results[0] == results[4] == {"results": [{"n": 1}]}
+        results[1]["results"].clear()
+        assert results[0] == {"results": [{"n": 1}]}
+        assert single_flight_stats() == {"search": {"calls": 2, "coalesced": 4}}
+
+    @pytest.mark.asyncio
+    async def test_non_search_posts_and_other_accounts_are_not_coalesced(self) -> None:
+        calls: list[httpx.Request] = []
+        client = SearchClient()
+        other = SearchClient(api_key="other-key")  # pragma: allowlist secret
+
+        with (
+            patch.object(client.client, "request", side_effect=_slow_transport(calls)),
+            patch.object(other.client, "request", side_effect=_slow_transport(calls)),
+        ):
+            await asyncio.gather(
+                client.post("/campaigns", json={"name": "Q3"}),
+                client.post("/campaigns", json={"name": "Q3"}),
+                client.get("/status"),
+                other.get("/status"),
+            )
+
+        assert len(calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller_and_release_the_key(
+        self, flights: SingleFlight
+    ) -> None:
+        calls: list[httpx.Request] = []
+        client = SearchClient()
+        client.max_retries = 0
+
+        with patch.object(client.client, "request", side_effect=_slow_transport(calls, 400)):
+            results = await asyncio.gather(
+                client.get("/status"), client.get("/status"), return_exceptions=True
+            )
+
+        assert len(calls) == 1
+        assert all(isinstance(result, IntegrationError) for result in results)
+        assert flights.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_the_shared_call(self) -> None:
+        calls: list[httpx.Request] = []
+        client = SearchClient()
+
+        with patch.object(client.client, "request", side_effect=_slow_transport(calls)):
+            first = asyncio.create_task(client.get("/status"))
+            second = asyncio.create_task(client.get("/status"))
+            await asyncio.sleep(0)
+            first.cancel()
+
+            assert await second == {"results": [{"n": 1}]}
+
+        assert len(calls) == 1
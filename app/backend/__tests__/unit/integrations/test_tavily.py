@@ -1,11 +1,14 @@
 """Unit tests for Tavily integration client."""
 
-from datetime import datetime, timedelta
+import time
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from src.integrations.base import IntegrationError
+from src.integrations.response_cache import get_response_cache
 from src.integrations.tavily import (
     TavilyAnswer,
     TavilyClient,
@@ -19,6 +22,10 @@ from src.integrations.tavily import (
 )
 
 
+def _http_response(data: dict[str, Any]) -> httpx.Response:
+    return httpx.Response(200, json=data, request=httpx.Request("POST", TavilyClient.BASE_URL))
+
+
 class TestTavilyClientInitialization:
     """Tests for TavilyClient initialization."""
 
@@ -263,8 +270,8 @@ class TestTavilyClientCaching:
     @pytest.mark.asyncio
     async def test_caches_search_results(self, client: TavilyClient, mock_response: dict) -> None:
         """search() should cache results."""
-        with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _http_response(mock_response)
 
             # First call should hit API
             result1 = await client.search("test query")
@@ -282,8 +289,8 @@ class TestTavilyClientCaching:
         self, client: TavilyClient, mock_response: dict
     ) -> None:
         """search() should cache different queries separately."""
-        with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _http_response(mock_response)
 
             await client.search("query 1")
             await client.search("query 2")
@@ -291,13 +298,12 @@ class TestTavilyClientCaching:
             assert mock_post.call_count == 2  # Two different queries
 
     @pytest.mark.asyncio
-    async def test_cache_respects_ttl(self, client: TavilyClient, mock_response: dict) -> None:
+    async def test_cache_respects_ttl(self, mock_response: dict) -> None:
         """search() should expire cache after TTL."""
-        # Set short TTL for testing
-        client.cache_ttl = 1  # 1 second
+        client = TavilyClient(api_key="tvly-test", cache_ttl=1)  # pragma: allowlist secret
 
-        with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _http_response(mock_response)
 
             # First call
             await client.search("test")
@@ -307,13 +313,9 @@ class TestTavilyClientCaching:
             await client.search("test")
             assert mock_post.call_count == 1
 
-            # Manually expire cache entry
-            cache_key = list(client._cache.keys())[0]
-            result, _ = client._cache[cache_key]
-            client._cache[cache_key] = (result, datetime.now() - timedelta(seconds=2))
-
             # Third call after expiry - should hit API
-            await client.search("test")
+            with patch("src.integrations.response_cache.time.time", return_value=time.time() + 2):
+                await client.search("test")
             assert mock_post.call_count == 2
 
     @pytest.mark.asyncio
@@ -324,23 +326,27 @@ class TestTavilyClientCaching:
             enable_caching=False,
         )
 
-        with patch.object(client, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _http_response(mock_response)
 
             await client.search("test")
             await client.search("test")
 
             assert mock_post.call_count == 2  # Both calls hit API
 
-    def test_clear_cache_returns_count(self, client: TavilyClient) -> None:
+    @pytest.mark.asyncio
+    async def test_clear_cache_returns_count(
+        self, client: TavilyClient, mock_response: dict
+    ) -> None:
         """clear_cache() should return number of cleared entries."""
-        # Manually add some cache entries
-        client._cache["key1"] = (TavilySearchResponse(query="test1"), datetime.now())
-        client._cache["key2"] = (TavilySearchResponse(query="test2"), datetime.now())
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _http_response(mock_response)
+            await client.search("test1")
+            await client.search("test2")
 
         count = client.clear_cache()
         assert count == 2
-        assert len(client._cache) == 0
+        assert len(get_response_cache()) == 0
 
 
 class TestTavilyClientExtract:
@@ -549,18 +555,16 @@ class TestTavilyClientContextManager:
     """Tests for TavilyClient context manager."""
 
     @pytest.mark.asyncio
-    async def test_context_manager_clears_cache_on_exit(self) -> None:
-        """Context manager should clear cache on exit."""
+    async def test_context_manager_keeps_shared_cache_on_exit(self) -> None:
+        """Cached responses should outlive the client that fetched them."""
         client = TavilyClient(api_key="tvly-test")  # pragma: allowlist secret
 
-        # Add cache entry
-        client._cache["test"] = (TavilySearchResponse(query="test"), datetime.now())
-
-        async with client:
-            assert len(client._cache) == 1
+        with patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _http_response({"results": []})
+            async with client:
+                await client.search("test")
 
-        # Cache should be cleared after exit
-        assert len(client._cache) == 0
+        assert len(get_response_cache()) == 1
 
 
 class TestTavilyDataClasses:
@@ -0,0 +1,269 @@
+"""Unit tests for the shared HTTP transport pool."""
+
+import asyncio
+import http.server
+import socketserver
+import threading
+from collections.abc import AsyncIterator, Iterator
+
+import httpx
+import pytest
+
+from src.integrations import transport_pool
+from src.integrations.base import BaseIntegrationClient
+from src.integrations.transport_pool import (
+    HostPoolConfig,
+    SharedTransport,
+    TransportPoolConfig,
+    TransportRegistry,
+    get_transport_registry,
+)
+
+
+class _Client(BaseIntegrationClient):
+    def __init__(self, base_url: str) -> None:
+        super().__init__(name="pool_test", base_url=base_url, api_key="test", max_retries=0)
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Minimal keep-alive HTTP/1.1 server that answers every request with {}."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.decode().split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            await asyncio.sleep(0.01)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: 2\r\n\r\n{}"
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest.fixture
+async def server_url() -> AsyncIterator[str]:
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    server.close()
+
+
+class _DisconnectTracker(http.server.BaseHTTPRequestHandler):
+    """Keep-alive handler that records when a client connection is closed."""
+
+    protocol_version = "HTTP/1.1"
+    disconnected = threading.Event()
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def finish(self) -> None:
+        super().finish()
+        self.disconnected.set()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def threaded_server_url() -> Iterator[str]:
+    """Server on its own thread, so it outlives the event loops under test."""
+    _DisconnectTracker.disconnected = threading.Event()
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _DisconnectTracker)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+# =============================================================================
+# Config
+# =============================================================================
+
+
+class TestTransportPoolConfig:
+    """Tests for TransportPoolConfig."""
+
+    def test_from_env_parses_host_limits(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("HTTP_POOL_MAX_KEEPALIVE", "8")
+        monkeypatch.setenv("HTTP_POOL_HOST_LIMITS", "api.tomba.io=10:5, API.Reoon.com=30,bad=x")
+
+        config = TransportPoolConfig.from_env()
+
+        assert config.default.max_keepalive_connections == 8
+        assert config.for_host("api.tomba.io").max_connections == 10
+        assert config.for_host("api.tomba.io").max_keepalive_connections == 5
+        assert config.for_host("api.reoon.com").max_keepalive_connections == 8
+        assert config.for_host("bad") == config.default
+
+    def test_keepalive_capped_by_connections(self) -> None:
+        limits = HostPoolConfig(max_connections=4, max_keepalive_connections=20).to_limits()
+
+        assert limits.max_keepalive_connections == 4
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+
+class TestTransportRegistry:
+    """Tests for TransportRegistry against a local server."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_connections(self, server_url: str) -> None:
+        registry = TransportRegistry(TransportPoolConfig())
+        clients = [
+            httpx.AsyncClient(base_url=server_url, transport=registry.transport) for _ in range(3)
+        ]
+
+        for _ in range(4):
+            for client in clients:
+                await client.get("/ping")
+        for client in clients:
+            await client.aclose()
+
+        stats = registry.stats()["127.0.0.1"]
+        assert stats["requests"] == 12
+        assert stats["connections_opened"] == 1
+        assert stats["reuse_rate"] == round(11 / 12, 4)
+        # Closing the clients left the pooled connection open
+        assert stats["open_connections"] == 1
+        assert stats["idle_connections"] == 1
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_per_host_connection_limit(self, server_url: str) -> None:
+        config = TransportPoolConfig(hosts={"127.0.0.1": HostPoolConfig(max_connections=2)})
+        registry = TransportRegistry(config)
+
+        async with httpx.AsyncClient(base_url=server_url, transport=registry.transport) as client:
+            await asyncio.gather(*(client.get("/ping") for _ in range(10)))
+
+        stats = registry.stats()["127.0.0.1"]
+        assert stats["connections_opened"] == 2
+        assert stats["peak_in_flight"] == 10
+        assert stats["max_connections"] == 2
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http2_without_h2_falls_back(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(transport_pool, "_http2_available", lambda: False)
+        registry = TransportRegistry(TransportPoolConfig(default=HostPoolConfig(http2=True)))
+
+        pool = registry._pool_for("example.com")
+
+        assert pool.config.http2 is False
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_shared_transport_close_is_noop(self, server_url: str) -> None:
+        registry = TransportRegistry(TransportPoolConfig())
+        transport = SharedTransport(registry)
+
+        await transport.aclose()
+        async with httpx.AsyncClient(base_url=server_url, transport=transport) as client:
+            response = await client.get("/ping")
+
+        assert response.status_code == 200
+        await registry.aclose()
+
+    def test_loop_change_releases_closed_loop_connections(self, threaded_server_url: str) -> None:
+        registry = TransportRegistry(TransportPoolConfig())
+
+        async def ping() -> None:
+            client = httpx.AsyncClient(base_url=threaded_server_url, transport=registry.transport)
+            await client.get("/ping")
+
+        def run_on_new_loop() -> None:
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(ping())
+            finally:
+                loop.close()
+
+        run_on_new_loop()
+        assert not _DisconnectTracker.disconnected.is_set()
+
+        run_on_new_loop()
+
+        assert _DisconnectTracker.disconnected.wait(timeout=5)
+        assert registry.stats()["127.0.0.1"]["connections_opened"] == 1
+
+    @pytest.mark.asyncio
+    async def test_loop_change_closes_transports_on_open_loop(
+        self, threaded_server_url: str
+    ) -> None:
+        registry = TransportRegistry(TransportPoolConfig())
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+
+        async def ping() -> None:
+            client = httpx.AsyncClient(base_url=threaded_server_url, transport=registry.transport)
+            await client.get("/ping")
+
+        try:
+            asyncio.run_coroutine_threadsafe(ping(), other_loop).result(timeout=5)
+            registry._pool_for("127.0.0.1")
+
+            assert await asyncio.to_thread(_DisconnectTracker.disconnected.wait, 5)
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(timeout=5)
+            other_loop.close()
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_pools_use_environment_proxies(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("https_proxy", "http://proxy.internal:3128")
+        monkeypatch.setenv("no_proxy", "direct.example")
+        registry = TransportRegistry(TransportPoolConfig())
+
+        assert registry._pool_for("api.example.com", "https").proxy == "http://proxy.internal:3128"
+        assert registry._pool_for("direct.example", "https").proxy is None
+        assert TransportRegistry(trust_env=False)._pool_for("api.example.com").proxy is None
+        await registry.aclose()
+
+
+# =============================================================================
+# BaseIntegrationClient
+# =============================================================================
+
+
+class TestBaseClientUsesSharedPool:
+    """BaseIntegrationClient subclasses share the process-wide pool."""
+
+    def test_clients_use_process_transport(self) -> None:
+        first = _Client("https://api.one.example")
+        second = _Client("https://api.two.example")
+
+        assert first.client._transport is get_transport_registry().transport
+        assert second.client._transport is first.client._transport
+
+    @pytest.mark.asyncio
+    async def test_closed_client_keeps_shared_connections(self, server_url: str) -> None:
+        registry = get_transport_registry()
+        before = registry.stats().get("127.0.0.1", {}).get("connections_opened", 0)
+
+        first = _Client(server_url)
+        await first.get("/ping")
+        await first.close()
+        second = _Client(server_url)
+        await second.get("/ping")
+        await second.close()
+
+        assert registry.stats()["127.0.0.1"]["connections_opened"] == before + 1
+        await registry.aclose()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark set-based lead bulk writes against per-lead UPDATEs.
+
+Inserts synthetic leads into an existing campaign, persists scores once with
+one UPDATE per lead (the previous write path) and once with
+LeadRepository.bulk_update_scores, then rolls everything back.
+
+Requires DATABASE_URL to point at a Postgres database with the schema applied.
+
+Usage:
+    python3 scripts/benchmark_bulk_writes.py <campaign_id> [leads] [chunk_size]
+
+Example:
+    python3 scripts/benchmark_bulk_writes.py 6f1c...e2 20000 1000
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+from uuid import UUID
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__) + "/..")
+
+from sqlalchemy import select, update
+
+from src.database.connection import get_session_factory
+from src.database.models import LeadModel
+from src.database.repositories.lead_repository import LeadRepository
+
+
+async def main() -> None:
+    """Run both write paths inside one rolled-back transaction."""
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    campaign_id = sys.argv[1]
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    chunk_size = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    rng = random.Random(42)
+
+    session = get_session_factory()()
+    try:
+        repo = LeadRepository(session)
+        await repo.bulk_create_leads(
+            campaign_id,
+            [
+                {"first_name": f"Bench{i}", "last_name": "Lead", "company_name": "Bench Co"}
+                for i in range(count)
+            ],
+        )
+        result = await session.execute(
+            select(LeadModel.id).where(
+                LeadModel.campaign_id == UUID(campaign_id),
+                LeadModel.first_name.like("Bench%"),
+            )
+        )
+        lead_ids = [row[0] for row in result.all()]
+
+        scores = [
+            {
+                "lead_id": lead_id,
+                "score": rng.randint(0, 100),
+                "tier": rng.choice("ABCD"),
+                "breakdown": {"job_title": rng.randint(0, 30), "seniority": rng.randint(0, 20)},
+                "persona_tags": ["Marketing Leader"],
+            }
+            for lead_id in lead_ids
+        ]
+
+        start = time.perf_counter()
+        for s in scores:
+            await session.execute(
+                update(LeadModel)
+                .where(LeadModel.id == s["lead_id"])
+                .values(
+                    lead_score=s["score"],
+                    lead_tier=s["tier"],
+                    score_breakdown=s["breakdown"],
+                    persona_tags=s["persona_tags"],
+                    status="scored",
+                )
+            )
+        await session.flush()
+        per_row = time.perf_counter() - start
+        print(f"Per-lead UPDATE:   {per_row:>8.2f}s  ({len(scores) / per_row:>9.0f} rows/s)")
+
+        await repo.bulk_update_scores(scores, chunk_size=chunk_size)
+        stats = repo.last_bulk_write
+        assert stats is not None
+        print(
+            f"Set-based UPDATE:  {stats.duration_ms / 1000:>8.2f}s  "
+            f"({stats.rows_per_second:>9.0f} rows/s, {stats.statements} statements)"
+        )
+    finally:
+        await session.rollback()
+        await session.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
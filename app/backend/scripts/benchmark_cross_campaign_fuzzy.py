@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark cross-campaign fuzzy matching as history and campaigns grow.
+
+Builds synthetic contact history (common first names, a long tail of last
+names, one company per ~10 contacts) and campaigns whose leads are partly
+single-typo copies of historical contacts. Reports, per index size:
+- HistoricalFuzzyIndex: ms and rows visited per lead lookup
+- StreamingExclusionMatcher: ms and leads visited per streamed history row
+
+Usage:
+    python3 scripts/benchmark_cross_campaign_fuzzy.py [sizes] [queries]
+
+Example:
+    python3 scripts/benchmark_cross_campaign_fuzzy.py 20000,80000,320000 500
+"""
+
+import os
+import random
+import string
+import sys
+import time
+from typing import Any
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__) + "/..")
+
+from src.agents.cross_campaign_dedup.fuzzy_index import HistoricalFuzzyIndex
+from src.agents.cross_campaign_dedup.streaming import StreamingExclusionMatcher
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+    "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Daniel", "Nancy", "Matthew", "Lisa",
+]  # fmt: skip
+SUFFIXES = ("", " Inc", " Corp", " Labs", " Group", " LLC")
+THRESHOLD = 0.85
+
+
+def word(rng: random.Random, low: int, high: int) -> str:
+    """Random pronounceable-ish word."""
+    vowels, consonants = "aeiou", "bcdfghjklmnprstvwz"
+    letters = [
+        rng.choice(consonants if i % 2 == 0 else vowels) for i in range(rng.randint(low, high))
+    ]
+    return "".join(letters).title()
+
+
+def typo(rng: random.Random, value: str) -> str:
+    """Swap, drop or replace one character."""
+    if len(value) < 4:
+        return value
+    i = rng.randint(0, len(value) - 2)
+    kind = rng.choice(("swap", "drop", "replace"))
+    if kind == "swap":
+        return value[:i] + value[i + 1] + value[i] + value[i + 2 :]
+    if kind == "drop":
+        return value[:i] + value[i + 1 :]
+    return value[:i] + rng.choice(string.ascii_lowercase) + value[i + 1 :]
+
+
+def history(count: int, seed: int) -> list[dict[str, Any]]:
+    """Synthetic historical contacts."""
+    rng = random.Random(seed)
+    companies = [word(rng, 4, 9) + rng.choice(SUFFIXES) for _ in range(max(count // 10, 1))]
+    return [
+        {
+            "first_name": rng.choice(FIRST_NAMES),
+            "last_name": word(rng, 4, 8),
+            "company_name": rng.choice(companies),
+            "campaign_id": f"c{i % 50}",
+        }
+        for i in range(count)
+    ]
+
+
+def campaign(rows: list[dict[str, Any]], count: int, seed: int) -> list[dict[str, Any]]:
+    """Leads: a third are typo copies of history rows, the rest are new people."""
+    rng = random.Random(seed)
+    leads = []
+    for i in range(count):
+        if i % 3 == 0:
+            lead = dict(rng.choice(rows))
+            field = rng.choice(["first_name", "last_name", "company_name"])
+            lead[field] = typo(rng, lead[field])
+        else:
+            lead = history(1, seed * 100_000 + i)[0]
+        leads.append({**lead, "id": f"lead-{i}"})
+    return leads
+
+
+def bench_index(size: int, queries: int) -> None:
+    rows = history(size, seed=1)
+    leads = campaign(rows, queries, seed=2)
+    index = HistoricalFuzzyIndex(rows)
+
+    start = time.perf_counter()
+    matched = sum(
+        index.find_match(lead["first_name"], lead["last_name"], lead["company_name"], THRESHOLD)
+        is not None
+        for lead in leads
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"index     history={size:>8}  {elapsed * 1000 / queries:>7.2f} ms/lookup  "
+        f"{index.stats.candidates / queries:>8.1f} visited/lookup  "
+        f"{index.stats.scored / queries:>6.1f} scored/lookup  matched={matched}"
+    )
+
+
+def bench_streaming(size: int, queries: int) -> None:
+    rows = history(queries, seed=3)
+    leads = campaign(history(size, seed=4), size, seed=5)
+    matcher = StreamingExclusionMatcher(leads, [], THRESHOLD)
+
+    start = time.perf_counter()
+    matcher.feed(rows)
+    elapsed = time.perf_counter() - start
+    stats = matcher._fuzzy_index.stats
+    print(
+        f"streaming leads={size:>10}  {elapsed * 1000 / queries:>7.2f} ms/row     "
+        f"{stats.candidates / queries:>8.1f} visited/row     "
+        f"{stats.scored / queries:>6.1f} scored/row"
+    )
+
+
+def main() -> None:
+    sizes = [int(s) for s in (sys.argv[1] if len(sys.argv) > 1 else "20000,80000").split(",")]
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    for size in sizes:
+        bench_index(size, queries)
+    for size in sizes:
+        bench_streaming(size, queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark the concurrent email waterfall against one-lead-at-a-time lookups.
+
+Drives WaterfallScheduler with local stub providers that sleep for a
+provider-like latency and hit at a fixed rate, so no API keys are needed.
+Prints wall time and the per-provider report.
+
+Usage:
+    python3 scripts/benchmark_email_waterfall.py [leads] [latency_ms]
+
+Example:
+    python3 scripts/benchmark_email_waterfall.py 2000 150
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__) + "/..")
+
+from src.agents.email_verification import (
+    EmailFinderProvider,
+    EmailVerificationProvider,
+    EmailVerificationResult,
+    EmailVerificationStatus,
+    WaterfallScheduler,
+)
+
+HIT_RATES = {
+    EmailFinderProvider.TOMBA: 0.55,
+    EmailFinderProvider.MURAENA: 0.45,
+    EmailFinderProvider.VOILA_NORBERT: 0.50,
+}
+
+
+def make_stubs(latency: float) -> tuple:
+    """Stub finder and verifier with deterministic hits per (provider, lead)."""
+
+    async def find(provider: EmailFinderProvider, first: str, last: str, domain: str) -> str | None:
+        await asyncio.sleep(latency)
+        rng = random.Random(f"{provider.value}:{first}")
+        if rng.random() < HIT_RATES.get(provider, 0.4):
+            return f"{first}.{last}@{domain}".lower()
+        return None
+
+    async def verify(email: str) -> EmailVerificationResult:
+        await asyncio.sleep(latency / 2)
+        return EmailVerificationResult(
+            email=email,
+            status=EmailVerificationStatus.VALID,
+            provider=EmailVerificationProvider.REOON,
+            confidence=0.95,
+            cost=0.003,
+        )
+
+    return find, verify
+
+
+async def main() -> None:
+    """Run sequential and concurrent configurations."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency = (int(sys.argv[2]) if len(sys.argv) > 2 else 150) / 1000
+    leads = [
+        {"id": f"lead-{i}", "first_name": f"P{i}", "last_name": "Doe", "company_domain": "x.com"}
+        for i in range(count)
+    ]
+    find, verify = make_stubs(latency)
+
+    # One lead at a time, as EmailVerificationAgent.find_email is called today
+    sample = leads[: min(count, 100)]
+    start = time.perf_counter()
+    await WaterfallScheduler(find, verify, max_concurrent_leads=1).run(sample)
+    per_lead = (time.perf_counter() - start) / len(sample)
+    print(f"Sequential:  ~{per_lead * count:>7.1f}s for {count} leads (extrapolated)")
+
+    scheduler = WaterfallScheduler(find, verify, max_concurrent_leads=200)
+    batch = await scheduler.run(leads)
+    print(f"Concurrent:   {batch.duration_ms / 1000:>7.1f}s for {count} leads")
+    print(json.dumps(batch.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark the persistent cross-campaign exclusion index.
+
+Compares a cold build (first sync streams every qualifying contact) with a
+warm run (open the existing file and apply a small delta), using synthetic
+contact history instead of Postgres.
+
+Usage:
+    python3 scripts/benchmark_exclusion_index.py [contacts] [delta]
+
+Example:
+    python3 scripts/benchmark_exclusion_index.py 500000 2000
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__) + "/..")
+
+from src.agents.cross_campaign_dedup.exclusion_index import ExclusionIndexStore
+
+
+class SyntheticSource:
+    """In-memory stand-in for LeadRepository's change-stream methods."""
+
+    def __init__(self, contacts: list[dict[str, Any]], suppression: list[tuple[str, datetime]]):
+        self.contacts = contacts
+        self.suppression = suppression
+
+    async def stream_contact_changes(
+        self,
+        last_contacted_since: datetime | None = None,
+        updated_since: datetime | None = None,
+        chunk_size: int = 5000,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        if last_contacted_since is None and updated_since is None:
+            rows = self.contacts
+        else:
+            rows = [
+                c
+                for c in self.contacts
+                if (last_contacted_since and c["last_contacted_at"] > last_contacted_since)
+                or (updated_since and c["updated_at"] > updated_since)
+            ]
+        for start in range(0, len(rows), chunk_size):
+            yield rows[start : start + chunk_size]
+
+    async def get_suppression_entries(
+        self, since: datetime | None = None
+    ) -> list[tuple[str, datetime]]:
+        return [e for e in self.suppression if since is None or e[1] > since]
+
+
+def make_contact(i: int, rng: random.Random, when: datetime) -> dict[str, Any]:
+    """Build one synthetic contact-history row."""
+    return {
+        "id": f"lead-{i}",
+        "campaign_id": f"campaign-{i % 50}",
+        "linkedin_url": f"https://linkedin.com/in/person{i}",
+        "email": f"person{i}@company{i % 5000}.com",
+        "first_name": rng.choice(["John", "Jane", "Maria", "Robert", "Alice"]),
+        "last_name": rng.choice(["Doe", "Smith", "Johnson", "Brown"]),
+        "company_name": f"Company {i % 5000}",
+        "email_status": rng.choice([None, None, None, "bounced", "unsubscribed"]),
+        "last_contacted_at": when - timedelta(minutes=rng.randint(60, 60 * 24 * 90)),
+        "updated_at": when - timedelta(minutes=rng.randint(60, 60 * 24 * 90)),
+    }
+
+
+async def main() -> None:
+    """Run cold and incremental syncs and print timings."""
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    delta = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    rng = random.Random(42)
+    now = datetime.now(UTC)
+
+    contacts = [make_contact(i, rng, now) for i in range(total)]
+    suppression = [
+        (f"blocked{i}@example.com", now - timedelta(days=1)) for i in range(total // 100)
+    ]
+    source = SyntheticSource(contacts, suppression)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "exclusions.db")
+
+        with ExclusionIndexStore(path) as store:
+            cold = await store.sync(source)
+        print(f"Cold build:        {cold.duration_ms:>8} ms  ({cold.contacts_upserted} contacts)")
+
+        # New outreach and status changes since the last run
+        later = now + timedelta(hours=1)
+        for i in range(delta):
+            contacts.append(make_contact(total + i, rng, later) | {"last_contacted_at": later})
+        for contact in rng.sample(contacts[:total], delta):
+            contact["email_status"] = "bounced"
+            contact["updated_at"] = later
+
+        start = time.perf_counter()
+        with ExclusionIndexStore(path) as store:
+            open_ms = (time.perf_counter() - start) * 1000
+            warm = await store.sync(source)
+            rows = sum(len(c) for c in store.iter_historical_contacts("campaign-0", 90))
+        print(f"Open existing:     {open_ms:>8.1f} ms")
+        print(f"Incremental sync:  {warm.duration_ms:>8} ms  ({warm.contacts_upserted} changed)")
+        print(f"Historical rows for one campaign: {rows}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
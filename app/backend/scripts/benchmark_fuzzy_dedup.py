@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Benchmark multi-pass fuzzy duplicate detection.
+
+Builds a synthetic campaign with known duplicates (typos, "The Acme" vs
+"Acme", suffix changes) and compares recall and runtime of the original
+single-key blocking with the multi-pass engine.
+
+Usage:
+    python3 scripts/benchmark_fuzzy_dedup.py [leads] [max_workers]
+
+Example:
+    python3 scripts/benchmark_fuzzy_dedup.py 200000 8
+"""
+
+import os
+import random
+import string
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__) + "/..")
+
+from src.agents.duplicate_detection.blocking import (
+    find_candidate_matches,
+    legacy_key,
+    score_fields,
+)
+from src.agents.duplicate_detection.schemas import LeadRecord
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+    "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Daniel", "Nancy", "Matthew", "Lisa",
+]  # fmt: skip
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson", "White",
+]  # fmt: skip
+THRESHOLD = 0.85
+
+
+def typo(rng: random.Random, value: str) -> str:
+    """Swap, drop or replace one character after the first."""
+    if len(value) < 4:
+        return value
+    i = rng.randint(1, len(value) - 2)
+    kind = rng.choice(("swap", "drop", "replace"))
+    if kind == "swap":
+        return value[:i] + value[i + 1] + value[i] + value[i + 2 :]
+    if kind == "drop":
+        return value[:i] + value[i + 1 :]
+    return value[:i] + rng.choice(string.ascii_lowercase) + value[i + 1 :]
+
+
+def variant(rng: random.Random, lead: LeadRecord, lead_id: str) -> LeadRecord:
+    """Near-duplicate of a lead as it shows up from a second source."""
+    first, last, company = lead.first_name or "", lead.last_name or "", lead.company_name or ""
+    change = rng.choice(("first", "last", "article", "suffix"))
+    if change == "first":
+        first = typo(rng, first)
+    elif change == "last":
+        last = typo(rng, last)
+    elif change == "article":
+        company = company[4:] if company.startswith("The ") else f"The {company}"
+    else:
+        company = f"{company} Inc"
+    return LeadRecord(id=lead_id, first_name=first, last_name=last, company_name=company)
+
+
+def build_campaign(count: int, seed: int) -> tuple[list[LeadRecord], set[tuple[str, str]]]:
+    """Synthetic leads plus the set of planted duplicate id pairs."""
+    rng = random.Random(seed)
+    companies = [
+        ("The " if rng.random() < 0.1 else "")
+        + "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10))).title()
+        + rng.choice(("", " Corp", " Labs", " Group"))
+        for _ in range(count // 20)
+    ]
+
+    leads: list[LeadRecord] = []
+    planted: set[tuple[str, str]] = set()
+    while len(leads) < count:
+        base = LeadRecord(
+            id=f"lead-{len(leads):07d}",
+            first_name=rng.choice(FIRST_NAMES),
+            last_name=rng.choice(LAST_NAMES),
+            company_name=rng.choice(companies),
+        )
+        leads.append(base)
+        if rng.random() < 0.05:
+            dup = variant(rng, base, f"lead-{len(leads):07d}")
+            leads.append(dup)
+            planted.add((base.id, dup.id))
+
+    rng.shuffle(leads)
+    return leads, planted
+
+
+def fields(lead: LeadRecord) -> tuple[str, str, str]:
+    """Normalized scoring fields."""
+    return (
+        (lead.first_name or "").lower().strip(),
+        (lead.last_name or "").lower().strip(),
+        (lead.company_name or "").lower().strip(),
+    )
+
+
+def run(label: str, leads: list[LeadRecord], planted: set[tuple[str, str]], **kwargs) -> None:
+    """Time one configuration and print recall on the findable planted duplicates."""
+    start = time.perf_counter()
+    pairs, stats = find_candidate_matches(leads, THRESHOLD, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    found = {tuple(sorted((leads[a].id, leads[b].id))) for a, b, *_ in pairs}
+    recalled = sum(1 for pair in planted if pair in found)
+    print(
+        f"{label:<12} {elapsed:>8.1f}s  scored={stats.pairs_scored:>10}  "
+        f"matches={len(found):>7}  recall={recalled / max(len(planted), 1):.1%}"
+    )
+
+
+def main() -> None:
+    """Run the legacy and multi-pass configurations."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    leads, planted = build_campaign(count, seed=42)
+    by_id = {lead.id: lead for lead in leads}
+
+    # Only planted pairs that score above the threshold can be found at all
+    findable = {
+        (a, b)
+        for a, b in planted
+        if score_fields(fields(by_id[a]), fields(by_id[b]))[0] >= THRESHOLD
+    }
+    print(f"{len(leads)} leads, {len(findable)} findable planted duplicate pairs")
+
+    run("single-key", leads, findable, blocking_keys=(legacy_key,), window_size=0, max_workers=0)
+    run("multi-pass", leads, findable, max_workers=max_workers)
+
+
+if __name__ == "__main__":
+    main()
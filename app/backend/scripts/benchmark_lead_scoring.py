@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark job title matching in lead scoring.
+
+Compares the per-call JobTitleMatcher.match path (synonym expansion and
+normalization for every lead) with the CompiledTitleMatcher built once per
+ScoringContext, checks that both return identical results, and times full
+ScoringModel scoring.
+
+Usage:
+    python3 scripts/benchmark_lead_scoring.py [leads]
+
+Example:
+    python3 scripts/benchmark_lead_scoring.py 100000
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__) + "/..")
+
+from src.agents.lead_scoring.job_title_matcher import JobTitleMatcher
+from src.agents.lead_scoring.schemas import (
+    LeadScoreRecord,
+    NicheContext,
+    PersonaContext,
+    ScoringContext,
+)
+from src.agents.lead_scoring.scoring_model import ScoringModel
+
+TITLE_POOL = [
+    "VP Marketing", "VP of Marketing", "Vice President, Marketing", "CMO",
+    "Chief Marketing Officer", "Head of Growth", "Growth Marketing Manager",
+    "Director of Demand Generation", "Marketing Director", "Sr. Marketing Manager",
+    "Head of Sales", "Sales Director - EMEA", "Account Executive", "Software Engineer",
+    "Founder & CEO", "COO", "Product Marketing Lead", "Marketing Coordinator",
+    "Content Strategist", "Director, Revenue Operations",
+]  # fmt: skip
+
+
+def build_context() -> ScoringContext:
+    """Scoring context resembling a marketing-leader campaign."""
+    return ScoringContext(
+        niche=NicheContext(
+            id="niche-1",
+            name="B2B SaaS",
+            job_titles=["VP Marketing", "Head of Growth", "CMO"],
+        ),
+        personas=[
+            PersonaContext(
+                id="p1",
+                name="Marketing Leader",
+                job_titles=["VP Marketing", "Marketing Director", "CMO", "Head of Marketing"],
+                seniority_levels=["vp", "director", "c_suite"],
+            ),
+            PersonaContext(
+                id="p2",
+                name="Growth Leader",
+                job_titles=["Head of Growth", "VP Growth", "Growth Director"],
+                seniority_levels=["vp", "director"],
+            ),
+        ],
+    )
+
+
+def build_leads(count: int) -> list[LeadScoreRecord]:
+    """Leads drawing titles from a realistic, heavily repeating pool."""
+    rng = random.Random(42)
+    leads = []
+    for i in range(count):
+        title = rng.choice(TITLE_POOL)
+        if rng.random() < 0.05:
+            # A long tail of one-off spellings
+            title = f"{title} {rng.randint(1, 5000)}"
+        leads.append(LeadScoreRecord(id=f"lead-{i}", title=title))
+    return leads
+
+
+def main() -> None:
+    """Run the comparison."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    context = build_context()
+    leads = build_leads(count)
+
+    matcher = JobTitleMatcher()
+    targets = context.get_all_target_job_titles()
+
+    start = time.perf_counter()
+    reference = []
+    for lead in leads:
+        personas = [{"name": p.name, "job_titles": p.job_titles} for p in context.personas]
+        reference.append(matcher.match(lead.title or "", targets, personas))
+    per_call = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = matcher.compile(
+        targets, [{"name": p.name, "job_titles": p.job_titles} for p in context.personas]
+    )
+    results = [compiled.match(lead.title) for lead in leads]
+    compiled_time = time.perf_counter() - start
+
+    assert results == reference, "compiled matcher diverged from JobTitleMatcher.match"
+    print(f"{count} leads, {len({lead.title for lead in leads})} distinct titles")
+    print(f"Per-call match:    {per_call:>7.2f}s")
+    print(f"Compiled match:    {compiled_time:>7.2f}s  ({per_call / compiled_time:.0f}x)")
+    print(f"Cache:             {compiled.cache_info()}")
+
+    start = time.perf_counter()
+    model = ScoringModel(context)
+    for lead in leads:
+        model.score_lead(lead)
+    print(f"Full ScoringModel: {time.perf_counter() - start:>7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
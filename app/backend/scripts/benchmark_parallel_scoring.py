@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark process-pool lead scoring.
+
+Scores the same synthetic campaign in-process and with increasing worker
+counts, checks that every run returns identical scores in the same order, and
+measures the worst event loop stall seen by a ticker task while scoring runs.
+
+Usage:
+    python3 scripts/benchmark_parallel_scoring.py [leads] [workers...]
+
+Example:
+    python3 scripts/benchmark_parallel_scoring.py 200000 1 2 4 8
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+from typing import Any
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__) + "/..")
+
+from src.agents.lead_scoring.agent import LeadScoringAgent
+
+TITLE_POOL = [
+    "VP Marketing", "VP of Marketing", "Vice President, Marketing", "CMO",
+    "Chief Marketing Officer", "Head of Growth", "Growth Marketing Manager",
+    "Director of Demand Generation", "Marketing Director", "Sr. Marketing Manager",
+    "Head of Sales", "Sales Director - EMEA", "Account Executive", "Software Engineer",
+    "Founder & CEO", "COO", "Product Marketing Lead", "Marketing Coordinator",
+]  # fmt: skip
+INDUSTRIES = ["SaaS", "Fintech", "Retail", "Healthcare", "Manufacturing"]
+SIZES = ["1-10", "11-50", "51-200", "201-500", "501-1000", "1001-5000"]
+COUNTRIES = ["United States", "Canada", "United Kingdom", "Germany", "India"]
+
+SCORING_CONTEXT: dict[str, Any] = {
+    "niche": {
+        "id": "niche-1",
+        "name": "B2B SaaS",
+        "industries": ["SaaS", "Fintech"],
+        "company_sizes": ["51-200", "201-500"],
+        "job_titles": ["VP Marketing", "Head of Growth", "CMO"],
+    },
+    "personas": [
+        {
+            "id": "p1",
+            "name": "Marketing Leader",
+            "job_titles": ["VP Marketing", "Marketing Director", "CMO", "Head of Marketing"],
+            "seniority_levels": ["vp", "director", "c_suite"],
+            "company_sizes": ["51-200", "201-500"],
+        },
+    ],
+    "industry_fit_scores": [
+        {"industry": "SaaS", "fit_score": 95},
+        {"industry": "Fintech", "fit_score": 80},
+    ],
+    "target_countries": ["United States", "Canada"],
+}
+
+
+def build_leads(count: int) -> list[dict[str, Any]]:
+    """Synthetic leads with a long tail of one-off titles."""
+    rng = random.Random(42)
+    leads = []
+    for i in range(count):
+        title = rng.choice(TITLE_POOL)
+        if rng.random() < 0.2:
+            title = f"{title} {rng.randint(1, 50_000)}"
+        leads.append(
+            {
+                "id": f"lead-{i}",
+                "title": title,
+                "company_size": rng.choice(SIZES),
+                "company_industry": rng.choice(INDUSTRIES),
+                "country": rng.choice(COUNTRIES),
+                "email": f"lead{i}@example.com" if rng.random() < 0.8 else None,
+            }
+        )
+    return leads
+
+
+async def timed_run(
+    agent: LeadScoringAgent, leads: list[dict[str, Any]]
+) -> tuple[float, float, list[dict[str, Any]]]:
+    """Score leads while a ticker measures the longest event loop stall."""
+    worst_stall = 0.0
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal worst_stall
+        while not done.is_set():
+            before = time.perf_counter()
+            await asyncio.sleep(0.01)
+            worst_stall = max(worst_stall, time.perf_counter() - before - 0.01)
+
+    task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    result = await agent.run("campaign-1", leads, scoring_context=SCORING_CONTEXT)
+    elapsed = time.perf_counter() - start
+    done.set()
+    await task
+    return elapsed, worst_stall, result.lead_scores
+
+
+async def main() -> None:
+    """Run serial and parallel configurations."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    worker_counts = [int(w) for w in sys.argv[2:]] or [1, 2, 4]
+    leads = build_leads(count)
+    print(f"{count} leads, {os.cpu_count()} CPUs")
+
+    serial_time, stall, reference = await timed_run(LeadScoringAgent(), leads)
+    print(f"in-process   {serial_time:>7.2f}s  worst loop stall {stall * 1000:>7.1f} ms")
+
+    for workers in worker_counts:
+        agent = LeadScoringAgent(scoring_workers=workers)
+        elapsed, stall, scores = await timed_run(agent, leads)
+        assert scores == reference, f"{workers} workers diverged from in-process scoring"
+        print(
+            f"{workers:>2} workers   {elapsed:>7.2f}s  worst loop stall {stall * 1000:>7.1f} ms"
+            f"  ({serial_time / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
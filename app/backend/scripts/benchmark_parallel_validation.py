@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark process-pool lead validation.
+
+Validates the same synthetic campaign on threads and with increasing worker
+counts, checks that every run returns identical results in the same order,
+and measures the worst event loop stall seen by a ticker task while
+validation runs.
+
+Usage:
+    python3 scripts/benchmark_parallel_validation.py [leads] [workers...]
+
+Example:
+    python3 scripts/benchmark_parallel_validation.py 100000 1 2 4 8
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+from typing import Any
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__) + "/..")
+
+from src.agents.data_validation.agent import DataValidationAgent
+
+FIRST_NAMES = ["jane", "JOHN", "María", "o'neil", "Li", "  anna  ", "Dr. Robert", "ÉMILE"]
+LAST_NAMES = ["o'brien", "SMITH", "García-López", "van der Berg", "Nguyen", "mcdonald"]
+TITLES = [
+    "VP of Sales", "vp marketing", "Chief Executive Officer", "Sr. Software Engineer",
+    "Head of Growth", "Director, Demand Gen", "Founder & CEO", "Marketing Coordinator",
+]  # fmt: skip
+SUFFIXES = ["Inc.", "LLC", "Ltd", "GmbH", "Corp", ""]
+
+
+def build_leads(count: int) -> list[dict[str, Any]]:
+    """Synthetic leads with messy names, titles and a long tail of companies."""
+    rng = random.Random(42)
+    leads = []
+    for i in range(count):
+        company = f"Company {rng.randint(1, count // 5 or 1)} {rng.choice(SUFFIXES)}".strip()
+        leads.append(
+            {
+                "id": f"lead-{i}",
+                "linkedin_url": f"https://linkedin.com/in/person{i}"
+                if rng.random() < 0.9
+                else None,
+                "first_name": rng.choice(FIRST_NAMES),
+                "last_name": rng.choice(LAST_NAMES),
+                "company_name": company,
+                "job_title": rng.choice(TITLES),
+                "email": f"p{i}@example.com" if rng.random() < 0.6 else None,
+            }
+        )
+    return leads
+
+
+async def timed_run(
+    agent: DataValidationAgent, leads: list[dict[str, Any]]
+) -> tuple[float, float, list[dict[str, Any]]]:
+    """Validate leads while a ticker measures the longest event loop stall."""
+    worst_stall = 0.0
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal worst_stall
+        while not done.is_set():
+            before = time.perf_counter()
+            await asyncio.sleep(0.01)
+            worst_stall = max(worst_stall, time.perf_counter() - before - 0.01)
+
+    task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    result = await agent.run("campaign-1", leads)
+    elapsed = time.perf_counter() - start
+    done.set()
+    await task
+    return elapsed, worst_stall, [r.to_dict() for b in result.batch_results for r in b.results]
+
+
+async def main() -> None:
+    """Run the thread path and parallel configurations."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    worker_counts = [int(w) for w in sys.argv[2:]] or [1, 2, 4]
+    leads = build_leads(count)
+    print(f"{count} leads, {os.cpu_count()} CPUs")
+
+    thread_time, stall, reference = await timed_run(DataValidationAgent(), leads)
+    print(f"threads      {thread_time:>7.2f}s  worst loop stall {stall * 1000:>7.1f} ms")
+
+    for workers in worker_counts:
+        agent = DataValidationAgent(validation_workers=workers)
+        elapsed, stall, results = await timed_run(agent, leads)
+        assert results == reference, f"{workers} workers diverged from thread validation"
+        print(
+            f"{workers:>2} workers   {elapsed:>7.2f}s  worst loop stall {stall * 1000:>7.1f} ms"
+            f"  ({thread_time / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -8,10 +8,12 @@ Exports:
     CompanyResearchAgent: Main agent class
     CompanyResearchInput: Input schema
     CompanyResearchOutput: Output schema
+    CompanyResearchPlanner: Per-facet research freshness planner
     COMPANY_RESEARCH_TOOLS: List of SDK MCP tools
 """
 
 from src.agents.company_research.agent import CompanyResearchAgent
+from src.agents.company_research.planner import CompanyResearchPlanner
 from src.agents.company_research.schemas import (
     CompanyResearchInput,
     CompanyResearchOutput,
@@ -25,6 +27,7 @@ __all__ = [
     "CompanyResearchAgent",
     "CompanyResearchInput",
     "CompanyResearchOutput",
+    "CompanyResearchPlanner",
     "CompanyToResearch",
     "ResearchResult",
     "ExtractedFact",
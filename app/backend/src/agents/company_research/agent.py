@@ -8,7 +8,8 @@ breaker protection and parallel batch processing.
 Follows Claude Agent SDK patterns per SDK_PATTERNS.md.
 
 Database Flow:
-- Reads from: leads table (unique companies by campaign_id where email_status='valid')
+- Reads from: leads table (unique company domains by campaign_id where email_status='valid'),
+  company_research_data (latest research per domain from any campaign, as a cache)
 - Writes to: company_research_data, extracted_facts tables
 - Updates: leads table with company_research_id reference
 
@@ -24,6 +25,13 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
+from src.agents.company_research.planner import (
+    CACHE_TOOL_NAME,
+    CachedResearch,
+    CompanyResearchPlanner,
+    ResearchPlan,
+    facet_entry,
+)
 from src.agents.company_research.prompts import COMPANY_RESEARCH_SYSTEM_PROMPT
 from src.agents.company_research.schemas import (
     CompanyResearchOutput,
@@ -52,8 +60,14 @@ class CompanyResearchAgent:
     Conducts deep research on target companies using Serper API web search,
     news, and public data. Gathers company context for email personalization.
 
+    Leads are collapsed to one row per company domain, and search results
+    still fresh from any earlier campaign are reused through
+    CompanyResearchPlanner, so search spend scales with unique companies
+    that need new research rather than with leads.
+
     Database Flow:
-    - Reads from: leads table (unique companies by campaign_id where email_status='valid')
+    - Reads from: leads table (unique company domains by campaign_id where email_status='valid'),
+      company_research_data (latest research per domain from any campaign, as a cache)
     - Writes to: company_research_data, extracted_facts tables
     - Updates: leads table with company_research_id reference
 
@@ -65,17 +79,21 @@ class CompanyResearchAgent:
         name: Agent identifier
         max_concurrent_companies: Parallel processing limit
         session_id: Unique session identifier
+        planner: Decides which search facets each company needs
     """
 
     def __init__(
         self,
         max_concurrent_companies: int = 20,
+        facet_ttl_hours: dict[str, float] | None = None,
     ) -> None:
         """
         Initialize the Company Research Agent.
 
         Args:
             max_concurrent_companies: Max companies to research in parallel.
+            facet_ttl_hours: How long news/funding/hiring/tech search results
+                stay reusable, in hours (defaults per CompanyResearchPlanner).
         """
         self.name = "company_research_agent"
         self.max_concurrent_companies = max_concurrent_companies
@@ -87,6 +105,14 @@ class CompanyResearchAgent:
         # Circuit breaker trip count
         self.circuit_breaker_trips = 0
 
+        # Research cache: latest research per domain, loaded per run
+        self.planner = CompanyResearchPlanner(facet_ttl_hours)
+        self._research_cache: dict[str, CachedResearch] = {}
+        self.searches_run = 0
+        self.searches_reused = 0
+        self.companies_from_cache = 0
+        self.leads_linked = 0
+
         logger.info(f"Initialized {self.name} (max_concurrent={max_concurrent_companies})")
 
     async def run(
@@ -117,6 +143,10 @@ class CompanyResearchAgent:
             max_per_campaign=max_total_cost,
             max_per_company=max_cost_per_company,
         )
+        self.searches_run = 0
+        self.searches_reused = 0
+        self.companies_from_cache = 0
+        self.leads_linked = 0
 
         logger.info(
             f"Starting company research for campaign {campaign_id} "
@@ -196,6 +226,10 @@ class CompanyResearchAgent:
                 avg_fact_score=round(avg_fact_score, 4),
                 avg_relevance_score=round(avg_relevance_score, 4),
                 circuit_breaker_trips=self.circuit_breaker_trips,
+                companies_from_cache=self.companies_from_cache,
+                searches_run=self.searches_run,
+                searches_reused=self.searches_reused,
+                leads_linked=self.leads_linked,
                 success=True,
                 duration_seconds=round(duration_seconds, 2),
             )
@@ -203,7 +237,8 @@ class CompanyResearchAgent:
             logger.info(
                 f"Company research complete: {companies_researched}/{total_companies} companies, "
                 f"{facts_extracted} facts, ${self.cost_tracker.total_cost:.2f} cost, "
-                f"{duration_seconds:.1f}s"
+                f"{self.searches_run} searches ({self.searches_reused} reused, "
+                f"{self.companies_from_cache} companies fully cached), {duration_seconds:.1f}s"
             )
 
             return output
@@ -226,6 +261,9 @@ class CompanyResearchAgent:
         """
         Get unique companies from leads table.
 
+        Leads are grouped by lowercase company_domain, so each company is
+        researched once however many of the campaign's leads work there.
+
         Args:
             campaign_id: Campaign UUID.
             max_companies: Maximum companies to return.
@@ -238,25 +276,27 @@ class CompanyResearchAgent:
             TimeoutError: If query exceeds timeout.
         """
         # Import inside method to avoid circular imports
-        from sqlalchemy import func, select
+        from sqlalchemy import String, cast, func, select
 
         from src.database.connection import get_session
         from src.database.models import LeadModel
 
         companies: list[CompanyToResearch] = []
+        domain = func.lower(LeadModel.company_domain)
 
         # Add timeout protection for database query
         async with asyncio.timeout(timeout_seconds):
             async with get_session() as session:
-                # Query for unique companies with valid emails
+                # Query for unique companies with valid emails; company fields
+                # can differ between leads at the same domain, so take one value
                 stmt = (
                     select(
-                        LeadModel.id,
-                        LeadModel.company_name,
-                        LeadModel.company_domain,
-                        LeadModel.company_linkedin_url,
-                        LeadModel.company_industry,
-                        LeadModel.company_size,
+                        domain.label("company_domain"),
+                        func.min(cast(LeadModel.id, String)).label("lead_id"),
+                        func.max(LeadModel.company_name).label("company_name"),
+                        func.max(LeadModel.company_linkedin_url).label("company_linkedin_url"),
+                        func.max(LeadModel.company_industry).label("company_industry"),
+                        func.max(LeadModel.company_size).label("company_size"),
                         func.count(LeadModel.id).label("lead_count"),
                         func.max(LeadModel.lead_score).label("max_lead_score"),
                     )
@@ -265,15 +305,8 @@ class CompanyResearchAgent:
                         LeadModel.email_status == "valid",
                         LeadModel.company_domain.isnot(None),
                     )
-                    .group_by(
-                        LeadModel.id,
-                        LeadModel.company_name,
-                        LeadModel.company_domain,
-                        LeadModel.company_linkedin_url,
-                        LeadModel.company_industry,
-                        LeadModel.company_size,
-                    )
-                    .order_by(func.max(LeadModel.lead_score).desc())
+                    .group_by(domain)
+                    .order_by(func.max(LeadModel.lead_score).desc().nulls_last())
                     .limit(max_companies)
                 )
 
@@ -284,7 +317,7 @@ class CompanyResearchAgent:
                     if row.company_domain and row.company_name:
                         companies.append(
                             CompanyToResearch(
-                                lead_id=row.id,
+                                lead_id=UUID(row.lead_id),
                                 company_name=row.company_name,
                                 company_domain=row.company_domain,
                                 company_linkedin_url=row.company_linkedin_url,
@@ -304,12 +337,19 @@ class CompanyResearchAgent:
         """
         Research companies in parallel with concurrency limit.
 
+        Loads the research cache for all companies first so each company
+        only searches the facets that are missing or stale.
+
         Args:
             companies: List of companies to research.
 
         Returns:
             List of research results.
         """
+        self._research_cache = await self.planner.load_cache(
+            sorted({c.company_domain for c in companies})
+        )
+
         semaphore = asyncio.Semaphore(self.max_concurrent_companies)
         results: list[ResearchResult] = []
 
@@ -355,7 +395,7 @@ class CompanyResearchAgent:
         company: CompanyToResearch,
     ) -> ResearchResult:
         """
-        Research a single company using all search tools.
+        Research a single company, searching only missing or stale facets.
 
         Args:
             company: Company to research.
@@ -364,21 +404,32 @@ class CompanyResearchAgent:
             ResearchResult with findings.
         """
         try:
-            # Run all search types in parallel
+            plan = self.planner.plan(company, self._research_cache.get(company.company_domain))
+            self.searches_reused += len(plan.reused_facets)
+
+            if plan.fully_cached:
+                self.companies_from_cache += 1
+                return self._cached_research_result(plan)
+
             search_args = {
                 "company_name": company.company_name,
                 "company_domain": company.company_domain,
                 "max_results": 5,
             }
+            search_tools = {
+                "news": search_company_news_tool,
+                "funding": search_company_funding_tool,
+                "hiring": search_company_hiring_tool,
+                "tech": search_company_tech_tool,
+            }
 
-            # Run all search tools in parallel
-            raw_results: tuple[Any, ...] = await asyncio.gather(
-                search_company_news_tool(search_args),
-                search_company_funding_tool(search_args),
-                search_company_hiring_tool(search_args),
-                search_company_tech_tool(search_args),
+            # Run the stale facet searches in parallel
+            raw_results: list[Any] = await asyncio.gather(
+                *(search_tools[facet](search_args) for facet in plan.stale_facets),
                 return_exceptions=True,
             )
+            self.searches_run += len(plan.stale_facets)
+            searched_at = datetime.now(UTC)
 
             # Handle any exceptions
             def safe_result(r: Any) -> dict[str, Any]:
@@ -386,10 +437,23 @@ class CompanyResearchAgent:
                     return {"is_error": True, "data": {}}
                 return dict(r)
 
-            news_result: dict[str, Any] = safe_result(raw_results[0])
-            funding_result: dict[str, Any] = safe_result(raw_results[1])
-            hiring_result: dict[str, Any] = safe_result(raw_results[2])
-            tech_result: dict[str, Any] = safe_result(raw_results[3])
+            facet_results: dict[str, dict[str, Any]] = {}
+            facet_entries: dict[str, dict[str, Any]] = {}
+            for facet, raw in zip(plan.stale_facets, raw_results, strict=True):
+                result = safe_result(raw)
+                facet_results[facet] = result
+                # Only searches that actually ran are cached; cost is zero when
+                # the API key is missing or the circuit breaker is open
+                if not result.get("is_error") and result.get("data", {}).get("cost"):
+                    facet_entries[facet] = facet_entry(result["data"], searched_at)
+            for facet, entry in plan.reused_facets.items():
+                facet_results[facet] = plan.cached_result(facet)
+                facet_entries[facet] = entry
+
+            news_result = facet_results["news"]
+            funding_result = facet_results["funding"]
+            hiring_result = facet_results["hiring"]
+            tech_result = facet_results["tech"]
 
             # Collect all search results for fact extraction
             all_results: list[dict[str, Any]] = []
@@ -402,8 +466,7 @@ class CompanyResearchAgent:
             ]:
                 if not result.get("is_error") and result.get("data", {}).get("results"):
                     for r in result["data"]["results"]:
-                        r["category"] = category
-                        all_results.append(r)
+                        all_results.append({**r, "category": category})
 
             # Track costs
             for result in [news_result, funding_result, hiring_result, tech_result]:
@@ -447,46 +510,8 @@ class CompanyResearchAgent:
                 )
 
             data = aggregate_result.get("data", {})
-
-            # Convert extracted facts to dataclass
-            fact_objects = []
-            for f in data.get("facts", []):
-                fact_objects.append(
-                    ExtractedFact(
-                        fact_text=f.get("fact_text", ""),
-                        category=f.get("category", "news"),
-                        source_type=f.get("source_type", "web_search"),
-                        source_url=f.get("source_url"),
-                        recency_days=f.get("recency_days"),
-                        recency_score=f.get("recency_score", 0),
-                        specificity_score=f.get("specificity_score", 0),
-                        business_relevance_score=f.get("business_relevance_score", 0),
-                        emotional_hook_score=f.get("emotional_hook_score", 0),
-                        total_score=f.get("total_score", 0),
-                    )
-                )
-
-            source_urls = data.get("source_urls", [])
-            return ResearchResult(
-                company_domain=company.company_domain,
-                company_name=company.company_name,
-                headline=data.get("headline"),
-                summary=data.get("summary"),
-                content={"aggregated": data},
-                primary_source_url=source_urls[0] if source_urls else None,
-                source_urls=source_urls,
-                relevance_score=data.get("relevance_score", 0),
-                key_insights=[],
-                personalization_hooks=list(data.get("personalization_hooks", {}).keys()),
-                primary_hook=data.get("primary_hook"),
-                has_recent_news=data.get("has_recent_news", False),
-                has_funding=data.get("has_funding", False),
-                has_hiring=data.get("has_hiring", False),
-                has_product_launch=data.get("has_product_launch", False),
-                facts=fact_objects,
-                research_cost=data.get("total_cost", 0),
-                tools_used=data.get("tools_used", []),
-                success=True,
+            return self._build_research_result(
+                company, data, {"aggregated": data, "facets": facet_entries}
             )
 
         except Exception as e:
@@ -498,13 +523,94 @@ class CompanyResearchAgent:
                 error_message=str(e),
             )
 
+    def _cached_research_result(self, plan: ResearchPlan) -> ResearchResult:
+        """
+        Rebuild a research result from a cached row whose facets are all fresh.
+
+        Args:
+            plan: Plan with the cached research.
+
+        Returns:
+            ResearchResult carrying the cached row's id and no new cost.
+        """
+        assert plan.cached is not None
+        content = plan.cached.content
+        result = self._build_research_result(plan.company, content.get("aggregated", {}), content)
+        result.research_id = plan.cached.research_id
+        result.research_cost = 0.0
+        result.tools_used = [CACHE_TOOL_NAME]
+        return result
+
+    def _build_research_result(
+        self,
+        company: CompanyToResearch,
+        data: dict[str, Any],
+        content: dict[str, Any],
+    ) -> ResearchResult:
+        """
+        Convert aggregated research data into a ResearchResult.
+
+        Args:
+            company: Researched company.
+            data: Output of aggregate_company_research_tool.
+            content: Content stored on the company_research_data row.
+
+        Returns:
+            Successful ResearchResult.
+        """
+        # Convert extracted facts to dataclass
+        fact_objects = []
+        for f in data.get("facts", []):
+            fact_objects.append(
+                ExtractedFact(
+                    fact_text=f.get("fact_text", ""),
+                    category=f.get("category", "news"),
+                    source_type=f.get("source_type", "web_search"),
+                    source_url=f.get("source_url"),
+                    recency_days=f.get("recency_days"),
+                    recency_score=f.get("recency_score", 0),
+                    specificity_score=f.get("specificity_score", 0),
+                    business_relevance_score=f.get("business_relevance_score", 0),
+                    emotional_hook_score=f.get("emotional_hook_score", 0),
+                    total_score=f.get("total_score", 0),
+                )
+            )
+
+        source_urls = data.get("source_urls", [])
+        return ResearchResult(
+            company_domain=company.company_domain,
+            company_name=company.company_name,
+            headline=data.get("headline"),
+            summary=data.get("summary"),
+            content=content,
+            primary_source_url=source_urls[0] if source_urls else None,
+            source_urls=source_urls,
+            relevance_score=data.get("relevance_score", 0),
+            key_insights=[],
+            personalization_hooks=list(data.get("personalization_hooks", {}).keys()),
+            primary_hook=data.get("primary_hook"),
+            has_recent_news=data.get("has_recent_news", False),
+            has_funding=data.get("has_funding", False),
+            has_hiring=data.get("has_hiring", False),
+            has_product_launch=data.get("has_product_launch", False),
+            facts=fact_objects,
+            research_cost=data.get("total_cost", 0),
+            tools_used=data.get("tools_used", []),
+            success=True,
+        )
+
     async def _save_research_results(
         self,
         campaign_id: UUID,
         results: list[ResearchResult],
     ) -> int:
         """
-        Save research results to database.
+        Save research results to database and link them to the campaign's leads.
+
+        Each company has one company_research_data row per campaign; a rerun
+        updates it in place. Research reused from another campaign is copied
+        into this campaign. Every campaign lead at the company's domain then
+        gets its company_research_id set in a single UPDATE.
 
         Args:
             campaign_id: Campaign UUID.
@@ -514,42 +620,74 @@ class CompanyResearchAgent:
             Number of results saved.
         """
         # Import inside method to avoid circular imports
+        from sqlalchemy import case, delete, func, select, update
+
         from src.database.connection import get_session
-        from src.database.models import CompanyResearchDataModel, ExtractedFactsModel
+        from src.database.models import CompanyResearchDataModel, ExtractedFactsModel, LeadModel
 
         saved_count = 0
+        successful = [r for r in results if r.success]
 
         async with get_session() as session:
-            for result in results:
-                if not result.success:
+            existing_rows = await session.execute(
+                select(CompanyResearchDataModel).where(
+                    CompanyResearchDataModel.campaign_id == campaign_id,
+                    CompanyResearchDataModel.company_domain.in_(
+                        [r.company_domain for r in successful]
+                    ),
+                )
+            )
+            existing: dict[str, Any] = {
+                str(row.company_domain): row for row in existing_rows.scalars()
+            }
+
+            for result in successful:
+                research = existing.get(result.company_domain)
+
+                # Cached research already stored for this campaign: only link
+                if research is not None and research.id == result.research_id:
+                    saved_count += 1
                     continue
 
                 try:
-                    # Create company research record
-                    research = CompanyResearchDataModel(
-                        campaign_id=campaign_id,
-                        company_domain=result.company_domain,
-                        company_name=result.company_name,
-                        research_type="company_overview",
-                        data_source="web_search",
-                        headline=result.headline,
-                        summary=result.summary,
-                        content=result.content,
-                        primary_source_url=result.primary_source_url,
-                        source_urls=result.source_urls,
-                        relevance_score=result.relevance_score,
-                        key_insights=result.key_insights,
-                        personalization_hooks=result.personalization_hooks,
-                        primary_hook=result.primary_hook,
-                        has_recent_news=result.has_recent_news,
-                        has_funding=result.has_funding,
-                        has_hiring=result.has_hiring,
-                        has_product_launch=result.has_product_launch,
-                        research_cost=result.research_cost,
-                        tools_used=result.tools_used,
-                        researched_at=datetime.now(UTC),
-                    )
-                    session.add(research)
+                    values = {
+                        "company_name": result.company_name,
+                        "research_type": "company_overview",
+                        "data_source": "web_search",
+                        "headline": result.headline,
+                        "summary": result.summary,
+                        "content": result.content,
+                        "primary_source_url": result.primary_source_url,
+                        "source_urls": result.source_urls,
+                        "relevance_score": result.relevance_score,
+                        "key_insights": result.key_insights,
+                        "personalization_hooks": result.personalization_hooks,
+                        "primary_hook": result.primary_hook,
+                        "has_recent_news": result.has_recent_news,
+                        "has_funding": result.has_funding,
+                        "has_hiring": result.has_hiring,
+                        "has_product_launch": result.has_product_launch,
+                        "research_cost": result.research_cost,
+                        "tools_used": result.tools_used,
+                        "researched_at": datetime.now(UTC),
+                    }
+
+                    if research is None:
+                        # Create company research record
+                        research = CompanyResearchDataModel(
+                            campaign_id=campaign_id,
+                            company_domain=result.company_domain,
+                            **values,
+                        )
+                        session.add(research)
+                    else:
+                        for column, value in values.items():
+                            setattr(research, column, value)
+                        await session.execute(
+                            delete(ExtractedFactsModel).where(
+                                ExtractedFactsModel.company_research_id == research.id
+                            )
+                        )
                     await session.flush()
 
                     # Create extracted facts records
@@ -570,15 +708,34 @@ class CompanyResearchAgent:
                         )
                         session.add(fact_record)
 
+                    result.research_id = research.id  # type: ignore[assignment]
                     saved_count += 1
 
                 except Exception as e:
                     logger.error(f"Error saving research for {result.company_domain}: {e}")
                     continue
 
+            # Link research to every campaign lead at each company
+            links = {r.company_domain: r.research_id for r in successful if r.research_id}
+            if links:
+                lead_domain = func.lower(LeadModel.company_domain)
+                link_result = await session.execute(
+                    update(LeadModel)
+                    .where(
+                        LeadModel.campaign_id == campaign_id,
+                        lead_domain.in_(list(links)),
+                    )
+                    .values(company_research_id=case(links, value=lead_domain))
+                    .execution_options(synchronize_session=False)
+                )
+                self.leads_linked = link_result.rowcount or 0
+
             await session.commit()
 
-        logger.info(f"Saved {saved_count} research results to database")
+        logger.info(
+            f"Saved {saved_count} research results to database, "
+            f"linked {self.leads_linked} leads"
+        )
         return saved_count
 
     @property
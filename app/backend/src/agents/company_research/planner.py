@@ -0,0 +1,217 @@
+"""
+Company research planner.
+
+Phase 4.1 research is company-level: every lead at a domain shares the same
+news, funding, hiring and tech searches. The planner decides, per company,
+which of those four facets actually need a Serper search.
+
+Each company_research_data row stores its raw facet search results under
+``content["facets"]`` together with the time the search ran. Before a run the
+planner loads the most recent row per domain across all campaigns; a facet
+younger than its TTL is reused, and only missing or stale facets are searched
+again. A company whose facets are all fresh costs no searches at all.
+
+Configuration (environment, hours; read when the planner is created):
+    COMPANY_RESEARCH_NEWS_TTL_HOURS=72
+    COMPANY_RESEARCH_FUNDING_TTL_HOURS=720
+    COMPANY_RESEARCH_HIRING_TTL_HOURS=168
+    COMPANY_RESEARCH_TECH_TTL_HOURS=720
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from src.agents.company_research.schemas import CompanyToResearch
+
+logger = logging.getLogger(__name__)
+
+# Search facets, in the order the search tools run
+RESEARCH_FACETS = ("news", "funding", "hiring", "tech")
+
+# News goes stale fastest; funding rounds and tech stacks change slowly
+DEFAULT_FACET_TTL_HOURS: dict[str, float] = {
+    "news": 72.0,
+    "funding": 720.0,
+    "hiring": 168.0,
+    "tech": 720.0,
+}
+
+# tool_used reported for facet results served from a previous run
+CACHE_TOOL_NAME = "research_cache"
+
+
+def facet_ttls_from_env() -> dict[str, timedelta]:
+    """Per-facet TTLs from COMPANY_RESEARCH_<FACET>_TTL_HOURS, with defaults."""
+    return {
+        facet: timedelta(
+            hours=float(os.getenv(f"COMPANY_RESEARCH_{facet.upper()}_TTL_HOURS", default))
+        )
+        for facet, default in DEFAULT_FACET_TTL_HOURS.items()
+    }
+
+
+def facet_entry(data: dict[str, Any], searched_at: datetime) -> dict[str, Any]:
+    """Build the content["facets"] entry stored for one search result."""
+    return {"searched_at": searched_at.isoformat(), "data": data}
+
+
+@dataclass
+class CachedResearch:
+    """The most recent company_research_data row for a domain."""
+
+    research_id: UUID
+    campaign_id: UUID
+    company_domain: str
+    content: dict[str, Any] = field(default_factory=dict)
+
+    def facet_entries(self) -> dict[str, dict[str, Any]]:
+        """Stored facet entries keyed by facet (rows without facets have none)."""
+        facets = self.content.get("facets") if isinstance(self.content, dict) else None
+        return facets if isinstance(facets, dict) else {}
+
+
+@dataclass
+class ResearchPlan:
+    """Which facets to search for one company and which to reuse."""
+
+    company: CompanyToResearch
+    stale_facets: list[str] = field(default_factory=list)
+    reused_facets: dict[str, dict[str, Any]] = field(default_factory=dict)
+    cached: CachedResearch | None = None
+
+    @property
+    def fully_cached(self) -> bool:
+        """True when every facet is fresh and no search is needed."""
+        return self.cached is not None and not self.stale_facets
+
+    def cached_result(self, facet: str) -> dict[str, Any]:
+        """
+        A reused facet shaped like a search tool result.
+
+        Cost is zeroed so aggregation and cost tracking only count searches
+        made in this run.
+        """
+        data = dict(self.reused_facets[facet].get("data") or {})
+        data["cost"] = 0.0
+        data["tool_used"] = CACHE_TOOL_NAME
+        return {"data": data}
+
+
+class CompanyResearchPlanner:
+    """
+    Plans company research against the cross-campaign freshness cache.
+
+    Attributes:
+        facet_ttls: Maximum age of a reusable search result, per facet.
+    """
+
+    def __init__(self, facet_ttl_hours: dict[str, float] | None = None) -> None:
+        """
+        Initialize the planner.
+
+        Args:
+            facet_ttl_hours: TTL overrides in hours, per facet. Facets not
+                listed use the environment or DEFAULT_FACET_TTL_HOURS.
+        """
+        self.facet_ttls = facet_ttls_from_env()
+        for facet, hours in (facet_ttl_hours or {}).items():
+            self.facet_ttls[facet] = timedelta(hours=hours)
+
+    async def load_cache(
+        self,
+        domains: list[str],
+        timeout_seconds: float = 30.0,
+    ) -> dict[str, CachedResearch]:
+        """
+        Load the most recent research row per domain, from any campaign.
+
+        Args:
+            domains: Company domains, lowercase as research rows store them.
+            timeout_seconds: Query timeout in seconds.
+
+        Returns:
+            CachedResearch keyed by domain.
+        """
+        # Import inside method to avoid circular imports
+        from sqlalchemy import select
+
+        from src.database.connection import get_session
+        from src.database.models import CompanyResearchDataModel
+
+        if not domains:
+            return {}
+
+        cache: dict[str, CachedResearch] = {}
+        domain = CompanyResearchDataModel.company_domain
+
+        async with asyncio.timeout(timeout_seconds):
+            async with get_session() as session:
+                # DISTINCT ON keeps the newest row per domain
+                stmt = (
+                    select(
+                        domain,
+                        CompanyResearchDataModel.id,
+                        CompanyResearchDataModel.campaign_id,
+                        CompanyResearchDataModel.content,
+                    )
+                    .where(domain.in_(domains))
+                    .order_by(domain, CompanyResearchDataModel.researched_at.desc().nulls_last())
+                    .distinct(domain)
+                )
+                result = await session.execute(stmt)
+
+                for row in result.all():
+                    cache[row.company_domain] = CachedResearch(
+                        research_id=row.id,
+                        campaign_id=row.campaign_id,
+                        company_domain=row.company_domain,
+                        content=row.content or {},
+                    )
+
+        logger.info(f"Research cache: {len(cache)}/{len(domains)} companies previously researched")
+        return cache
+
+    def plan(
+        self,
+        company: CompanyToResearch,
+        cached: CachedResearch | None,
+        now: datetime | None = None,
+    ) -> ResearchPlan:
+        """
+        Split a company's facets into fresh (reused) and stale (searched).
+
+        Args:
+            company: Company to research.
+            cached: Most recent research for the domain, if any.
+            now: Reference time (defaults to the current UTC time).
+
+        Returns:
+            ResearchPlan for the company.
+        """
+        now = now or datetime.now(UTC)
+        plan = ResearchPlan(company=company, cached=cached)
+        entries = cached.facet_entries() if cached else {}
+
+        for facet in RESEARCH_FACETS:
+            entry = entries.get(facet)
+            if entry and self._is_fresh(facet, entry, now):
+                plan.reused_facets[facet] = entry
+            else:
+                plan.stale_facets.append(facet)
+
+        return plan
+
+    def _is_fresh(self, facet: str, entry: dict[str, Any], now: datetime) -> bool:
+        """Whether a stored facet entry is younger than the facet TTL."""
+        try:
+            searched_at = datetime.fromisoformat(entry["searched_at"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        if searched_at.tzinfo is None:
+            searched_at = searched_at.replace(tzinfo=UTC)
+        return now - searched_at < self.facet_ttls.get(facet, timedelta(0))
@@ -127,6 +127,12 @@ class CompanyResearchOutput:
     # Reliability metrics
     circuit_breaker_trips: int = 0
 
+    # Research cache metrics
+    companies_from_cache: int = 0
+    searches_run: int = 0
+    searches_reused: int = 0
+    leads_linked: int = 0
+
     # Status
     success: bool = True
     error_message: str | None = None
@@ -18,6 +18,18 @@ from src.agents.cross_campaign_dedup.agent import (
     name_company_match,
     normalize_string,
 )
+from src.agents.cross_campaign_dedup.exclusion_index import (
+    ExclusionIndexStore,
+    ExclusionIndexSyncStats,
+)
+from src.agents.cross_campaign_dedup.fuzzy_index import (
+    FuzzyIndexStats,
+    HistoricalFuzzyIndex,
+)
+from src.agents.cross_campaign_dedup.streaming import (
+    StreamingExclusionMatcher,
+    StreamingStats,
+)
 
 __all__ = [
     # Agent
@@ -30,6 +42,15 @@ __all__ = [
     "CrossCampaignDedupError",
     "NoLeadsToProcessError",
     "HistoricalDataLoadError",
+    # Persistent exclusion index
+    "ExclusionIndexStore",
+    "ExclusionIndexSyncStats",
+    # Fuzzy index
+    "HistoricalFuzzyIndex",
+    "FuzzyIndexStats",
+    # Streaming
+    "StreamingExclusionMatcher",
+    "StreamingStats",
     # Utilities
     "normalize_string",
     "fuzzy_match_score",
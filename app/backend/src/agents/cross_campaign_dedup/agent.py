@@ -14,6 +14,7 @@ handles all database persistence.
 """
 
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from difflib import SequenceMatcher
@@ -21,6 +22,9 @@ from typing import Any
 
 from claude_agent_sdk import tool
 
+from src.agents.cross_campaign_dedup.fuzzy_index import HistoricalFuzzyIndex
+from src.agents.cross_campaign_dedup.streaming import StreamingExclusionMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -449,6 +453,7 @@ async def batch_check_exclusions_tool(args: dict[str, Any]) -> dict[str, Any]:
     suppression_set = {e.lower().strip() for e in suppression_list if e}
     linkedin_index: dict[str, dict[str, Any]] = {}
     email_index: dict[str, dict[str, Any]] = {}
+    fuzzy_index = HistoricalFuzzyIndex()
 
     for hist in historical_data:
         linkedin_url = (hist.get("linkedin_url") or "").lower().rstrip("/")
@@ -459,6 +464,8 @@ async def batch_check_exclusions_tool(args: dict[str, Any]) -> dict[str, Any]:
         if email:
             email_index[email] = hist
 
+        fuzzy_index.add(hist)
+
     exclusions: list[dict[str, Any]] = []
     passed_ids: list[str] = []
 
@@ -541,28 +548,19 @@ async def batch_check_exclusions_tool(args: dict[str, Any]) -> dict[str, Any]:
             company_name = lead.get("company_name", "")
 
             if (first_name or last_name) and company_name:
-                for hist in historical_data:
-                    is_match, score = name_company_match(
-                        first_name,
-                        last_name,
-                        company_name,
-                        hist.get("first_name"),
-                        hist.get("last_name"),
-                        hist.get("company_name"),
-                        fuzzy_threshold,
-                    )
-                    if is_match:
-                        matched_id = f"{hist.get('first_name', '')} {hist.get('last_name', '')} @ {hist.get('company_name', '')}"
-                        exclusion_info = {
-                            "lead_id": lead_id,
-                            "exclusion_reason": "fuzzy_match",
-                            "excluded_due_to_campaign": hist.get("campaign_id"),
-                            "matched_identifier": matched_id,
-                            "match_confidence": score,
-                        }
-                        excluded = True
-                        fuzzy_matches += 1
-                        break
+                match = fuzzy_index.find_match(first_name, last_name, company_name, fuzzy_threshold)
+                if match:
+                    hist, score = match
+                    matched_id = f"{hist.get('first_name', '')} {hist.get('last_name', '')} @ {hist.get('company_name', '')}"
+                    exclusion_info = {
+                        "lead_id": lead_id,
+                        "exclusion_reason": "fuzzy_match",
+                        "excluded_due_to_campaign": hist.get("campaign_id"),
+                        "matched_identifier": matched_id,
+                        "match_confidence": score,
+                    }
+                    excluded = True
+                    fuzzy_matches += 1
 
         if excluded and exclusion_info:
             exclusions.append(exclusion_info)
@@ -741,30 +739,7 @@ Return a summary with exclusion counts and the complete list of excluded leads."
                 fuzzy_threshold=effective_threshold,
             )
 
-            # Populate result
-            result.total_checked = dedup_result["total_checked"]
-            result.previously_contacted = dedup_result["previously_contacted"]
-            result.bounced_excluded = dedup_result["bounced_excluded"]
-            result.unsubscribed_excluded = dedup_result["unsubscribed_excluded"]
-            result.suppression_list_excluded = dedup_result["suppression_list_excluded"]
-            result.fuzzy_match_excluded = dedup_result["fuzzy_match_excluded"]
-            result.remaining_leads = dedup_result["remaining_leads"]
-
-            # Convert exclusions to ExclusionResult objects
-            for exc in dedup_result["exclusions"]:
-                result.exclusions.append(
-                    ExclusionResult(
-                        lead_id=exc["lead_id"],
-                        exclusion_reason=exc["exclusion_reason"],
-                        excluded_due_to_campaign=exc.get("excluded_due_to_campaign"),
-                        matched_identifier=exc.get("matched_identifier"),
-                        match_confidence=exc.get("match_confidence", 1.0),
-                    )
-                )
-
-            result.passed_lead_ids = dedup_result["passed_lead_ids"]
-            result.success = True
-            result.status = "completed"
+            self._populate_result(result, dedup_result)
 
             logger.info(
                 f"[{self.name}] Cross-campaign dedup completed: "
@@ -792,6 +767,121 @@ Return a summary with exclusion counts and the complete list of excluded leads."
         result.execution_time_ms = int((time.time() - start_time) * 1000)
         return result
 
+    async def run_streaming(
+        self,
+        campaign_id: str,
+        leads: list[dict[str, Any]],
+        historical_chunks: AsyncIterator[list[dict[str, Any]]],
+        suppression_list: list[str],
+        lookback_days: int | None = None,
+        fuzzy_threshold: float | None = None,
+    ) -> CrossCampaignDedupResult:
+        """
+        Execute cross-campaign deduplication against streamed history.
+
+        Same result as run(), but historical contacts arrive as an async stream
+        of chunks (e.g. LeadRepository.stream_historical_contacts) and are
+        matched as they arrive instead of being loaded into a list first.
+
+        Args:
+            campaign_id: Campaign UUID for logging.
+            leads: List of lead dictionaries to check.
+            historical_chunks: Async iterator of historical lead chunks.
+            suppression_list: List of suppressed email addresses.
+            lookback_days: Override default lookback period.
+            fuzzy_threshold: Override default fuzzy threshold.
+
+        Returns:
+            CrossCampaignDedupResult with exclusions and passed leads.
+        """
+        import time
+
+        start_time = time.time()
+        effective_lookback = lookback_days or self.lookback_days
+        effective_threshold = fuzzy_threshold or self.fuzzy_threshold
+
+        result = CrossCampaignDedupResult(
+            started_at=datetime.now(),
+            lookback_days=effective_lookback,
+            fuzzy_threshold=effective_threshold,
+        )
+
+        logger.info(
+            f"[{self.name}] Starting streaming cross-campaign dedup for campaign {campaign_id} "
+            f"({len(leads)} leads, {len(suppression_list)} suppressed)"
+        )
+
+        if not leads:
+            result.success = True
+            result.status = "completed"
+            result.completed_at = datetime.now()
+            result.execution_time_ms = int((time.time() - start_time) * 1000)
+            result.warnings.append("No leads to process")
+            return result
+
+        try:
+            matcher = StreamingExclusionMatcher(
+                leads=leads,
+                suppression_list=suppression_list,
+                fuzzy_threshold=effective_threshold,
+            )
+            await matcher.feed_stream(historical_chunks)
+            dedup_result = matcher.finalize()
+
+            self._populate_result(result, dedup_result)
+
+            logger.info(
+                f"[{self.name}] Streaming cross-campaign dedup completed: "
+                f"{result.total_checked} checked against {dedup_result['rows_streamed']} "
+                f"historical rows, {len(result.exclusions)} excluded, "
+                f"{result.remaining_leads} passed"
+            )
+
+        except Exception as e:
+            logger.error(f"[{self.name}] Streaming cross-campaign dedup failed: {e}")
+            result.success = False
+            result.status = "failed"
+            result.errors.append(
+                {
+                    "type": type(e).__name__,
+                    "message": str(e),
+                }
+            )
+
+        result.completed_at = datetime.now()
+        result.execution_time_ms = int((time.time() - start_time) * 1000)
+        return result
+
+    def _populate_result(
+        self,
+        result: CrossCampaignDedupResult,
+        dedup_result: dict[str, Any],
+    ) -> None:
+        """Copy counts and exclusions from a raw dedup result into the result object."""
+        result.total_checked = dedup_result["total_checked"]
+        result.previously_contacted = dedup_result["previously_contacted"]
+        result.bounced_excluded = dedup_result["bounced_excluded"]
+        result.unsubscribed_excluded = dedup_result["unsubscribed_excluded"]
+        result.suppression_list_excluded = dedup_result["suppression_list_excluded"]
+        result.fuzzy_match_excluded = dedup_result["fuzzy_match_excluded"]
+        result.remaining_leads = dedup_result["remaining_leads"]
+
+        # Convert exclusions to ExclusionResult objects
+        for exc in dedup_result["exclusions"]:
+            result.exclusions.append(
+                ExclusionResult(
+                    lead_id=exc["lead_id"],
+                    exclusion_reason=exc["exclusion_reason"],
+                    excluded_due_to_campaign=exc.get("excluded_due_to_campaign"),
+                    matched_identifier=exc.get("matched_identifier"),
+                    match_confidence=exc.get("match_confidence", 1.0),
+                )
+            )
+
+        result.passed_lead_ids = dedup_result["passed_lead_ids"]
+        result.success = True
+        result.status = "completed"
+
     async def _process_leads_directly(
         self,
         leads: list[dict[str, Any]],
@@ -803,12 +893,14 @@ Return a summary with exclusion counts and the complete list of excluded leads."
         Process leads directly without Claude orchestration.
 
         This is more efficient for pure data processing tasks.
-        Uses the same logic as batch_check_exclusions_tool.
+        Uses the same logic as batch_check_exclusions_tool. Fuzzy matching goes
+        through HistoricalFuzzyIndex instead of scanning every historical row.
         """
         # Build lookup indices for efficient matching
         suppression_set = {e.lower().strip() for e in suppression_list if e}
         linkedin_index: dict[str, dict[str, Any]] = {}
         email_index: dict[str, dict[str, Any]] = {}
+        fuzzy_index = HistoricalFuzzyIndex()
 
         for hist in historical_data:
             linkedin_url = (hist.get("linkedin_url") or "").lower().rstrip("/")
@@ -819,6 +911,8 @@ Return a summary with exclusion counts and the complete list of excluded leads."
             if email:
                 email_index[email] = hist
 
+            fuzzy_index.add(hist)
+
         exclusions: list[dict[str, Any]] = []
         passed_ids: list[str] = []
 
@@ -901,38 +995,33 @@ Return a summary with exclusion counts and the complete list of excluded leads."
                 company_name = lead.get("company_name", "")
 
                 if (first_name or last_name) and company_name:
-                    for hist in historical_data:
-                        is_match, score = name_company_match(
-                            first_name,
-                            last_name,
-                            company_name,
-                            hist.get("first_name"),
-                            hist.get("last_name"),
-                            hist.get("company_name"),
-                            fuzzy_threshold,
+                    match = fuzzy_index.find_match(
+                        first_name, last_name, company_name, fuzzy_threshold
+                    )
+                    if match:
+                        hist, score = match
+                        matched_id = (
+                            f"{hist.get('first_name', '')} "
+                            f"{hist.get('last_name', '')} @ "
+                            f"{hist.get('company_name', '')}"
                         )
-                        if is_match:
-                            matched_id = (
-                                f"{hist.get('first_name', '')} "
-                                f"{hist.get('last_name', '')} @ "
-                                f"{hist.get('company_name', '')}"
-                            )
-                            exclusion_info = {
-                                "lead_id": lead_id,
-                                "exclusion_reason": "fuzzy_match",
-                                "excluded_due_to_campaign": hist.get("campaign_id"),
-                                "matched_identifier": matched_id,
-                                "match_confidence": score,
-                            }
-                            excluded = True
-                            fuzzy_matches += 1
-                            break
+                        exclusion_info = {
+                            "lead_id": lead_id,
+                            "exclusion_reason": "fuzzy_match",
+                            "excluded_due_to_campaign": hist.get("campaign_id"),
+                            "matched_identifier": matched_id,
+                            "match_confidence": score,
+                        }
+                        excluded = True
+                        fuzzy_matches += 1
 
             if excluded and exclusion_info:
                 exclusions.append(exclusion_info)
             else:
                 passed_ids.append(lead_id)
 
+        logger.debug(f"[{self.name}] Fuzzy index stats: {fuzzy_index.stats.to_dict()}")
+
         return {
             "exclusions": exclusions,
             "passed_lead_ids": passed_ids,
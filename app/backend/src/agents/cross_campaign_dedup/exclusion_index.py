@@ -0,0 +1,454 @@
+"""
+Persistent, incrementally synced exclusion index for cross-campaign dedup.
+
+Keeps a local SQLite file (WAL + mmap) with every contact that can cause a
+cross-campaign exclusion and the global suppression list. Each run applies
+only the rows changed since the recorded high-water marks instead of
+rebuilding LinkedIn/email indexes and the suppression set from Postgres.
+
+High-water marks:
+- ``last_contacted_at``: newest contact time seen (new outreach)
+- ``updated_at``: newest lead update seen (email_status changes)
+- ``suppression_created_at``: newest suppression entry seen
+
+Marks are applied with a small overlap so rows committed slightly out of
+order are picked up on the next run; re-applying a row is idempotent.
+
+Deletes never show up behind a high-water mark (a removed suppression entry
+or a deleted lead simply stops being returned), so every
+``FULL_RECONCILE_INTERVAL`` a sync streams the full qualifying set instead
+and drops local contacts and suppressed emails the database no longer has.
+
+Usage:
+    with ExclusionIndexStore("/var/lib/smarter-team/exclusions.db") as store:
+        await store.sync(lead_repo)
+        result = await agent.run_streaming(
+            campaign_id=campaign_id,
+            leads=leads,
+            historical_chunks=store.stream_historical_contacts(campaign_id, 90),
+            suppression_list=store.get_suppression_list(),
+        )
+"""
+
+import logging
+import sqlite3
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+# Statuses that exclude a contact regardless of when it was contacted
+EXCLUDED_EMAIL_STATUSES = ("bounced", "unsubscribed", "complained")
+
+# Re-read rows this far behind the high-water marks to tolerate late commits
+HIGH_WATER_MARK_OVERLAP = timedelta(minutes=5)
+
+# Re-stream everything this often to drop rows deleted from the database
+FULL_RECONCILE_INTERVAL = timedelta(hours=24)
+
+# Memory-map up to 256MB of the index file
+MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    id TEXT PRIMARY KEY,
+    campaign_id TEXT,
+    linkedin_url TEXT,
+    email TEXT,
+    first_name TEXT,
+    last_name TEXT,
+    company_name TEXT,
+    email_status TEXT,
+    last_contacted_at REAL
+);
+CREATE INDEX IF NOT EXISTS ix_contacts_linkedin_url ON contacts (linkedin_url);
+CREATE INDEX IF NOT EXISTS ix_contacts_email ON contacts (email);
+CREATE TABLE IF NOT EXISTS suppression (email TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class ContactChangeSource(Protocol):
+    """Repository methods the store syncs from (implemented by LeadRepository)."""
+
+    def stream_contact_changes(
+        self,
+        last_contacted_since: datetime | None = None,
+        updated_since: datetime | None = None,
+        chunk_size: int = 5000,
+    ) -> AsyncIterator[list[dict[str, Any]]]: ...
+
+    async def get_suppression_entries(
+        self,
+        since: datetime | None = None,
+    ) -> list[tuple[str, datetime]]: ...
+
+
+@dataclass
+class ExclusionIndexSyncStats:
+    """Result of one sync run."""
+
+    cold_build: bool = False
+    full_reconcile: bool = False
+    contacts_upserted: int = 0
+    contacts_deleted: int = 0
+    suppression_added: int = 0
+    suppression_removed: int = 0
+    duration_ms: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            "cold_build": self.cold_build,
+            "full_reconcile": self.full_reconcile,
+            "contacts_upserted": self.contacts_upserted,
+            "contacts_deleted": self.contacts_deleted,
+            "suppression_added": self.suppression_added,
+            "suppression_removed": self.suppression_removed,
+            "duration_ms": self.duration_ms,
+        }
+
+
+def _to_epoch(value: datetime | None) -> float | None:
+    """Convert a datetime to a UTC epoch (naive values are assumed UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+def _from_epoch(value: float | None) -> datetime | None:
+    """Convert a UTC epoch back to an aware datetime."""
+    return datetime.fromtimestamp(value, tz=UTC) if value is not None else None
+
+
+def _qualifies(contact: dict[str, Any]) -> bool:
+    """Whether a contact can ever cause a cross-campaign exclusion."""
+    return (
+        contact.get("last_contacted_at") is not None
+        or contact.get("email_status") in EXCLUDED_EMAIL_STATUSES
+    )
+
+
+class ExclusionIndexStore:
+    """
+    Local SQLite exclusion index shared across campaign runs.
+
+    Opening an existing index only runs the idempotent schema statements,
+    so it takes milliseconds regardless of how many contacts it holds.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Open (or create) the index file.
+
+        Args:
+            path: SQLite file path. Use ":memory:" for a throwaway index.
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={MMAP_SIZE_BYTES}")
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute("CREATE TEMP TABLE seen_contacts (id TEXT PRIMARY KEY)")
+        self._conn.commit()
+
+    def __enter__(self) -> "ExclusionIndexStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        row = self._conn.execute("SELECT COUNT(*) FROM contacts").fetchone()
+        return int(row[0])
+
+    # =========================================================================
+    # High-water marks
+    # =========================================================================
+
+    def _get_mark(self, key: str) -> datetime | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return _from_epoch(float(row[0])) if row else None
+
+    def _set_mark(self, key: str, value: datetime | None) -> None:
+        epoch = _to_epoch(value)
+        if epoch is None:
+            return
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, repr(epoch)),
+        )
+
+    @property
+    def high_water_marks(self) -> dict[str, datetime | None]:
+        """Current high-water marks (None until the first sync)."""
+        return {
+            "last_contacted_at": self._get_mark("last_contacted_at"),
+            "updated_at": self._get_mark("updated_at"),
+            "suppression_created_at": self._get_mark("suppression_created_at"),
+        }
+
+    @property
+    def is_empty(self) -> bool:
+        """True until a first (cold) sync has completed."""
+        return self._get_mark("synced_at") is None
+
+    # =========================================================================
+    # Applying changes
+    # =========================================================================
+
+    def apply_contact_changes(self, contacts: Iterable[dict[str, Any]]) -> tuple[int, int]:
+        """
+        Upsert changed contacts and drop the ones that no longer qualify.
+
+        Args:
+            contacts: Dicts with id, the dedup columns and optionally updated_at.
+
+        Returns:
+            Tuple of (upserted, deleted).
+        """
+        upserts: list[tuple[Any, ...]] = []
+        deletes: list[tuple[str]] = []
+        max_contacted = self._get_mark("last_contacted_at")
+        max_updated = self._get_mark("updated_at")
+
+        for contact in contacts:
+            contact_id = str(contact["id"])
+            last_contacted = contact.get("last_contacted_at")
+            updated = contact.get("updated_at")
+
+            if last_contacted is not None:
+                max_contacted = max(filter(None, (max_contacted, last_contacted)))
+            if updated is not None:
+                max_updated = max(filter(None, (max_updated, updated)))
+
+            if not _qualifies(contact):
+                deletes.append((contact_id,))
+                continue
+
+            upserts.append(
+                (
+                    contact_id,
+                    contact.get("campaign_id"),
+                    contact.get("linkedin_url"),
+                    contact.get("email"),
+                    contact.get("first_name"),
+                    contact.get("last_name"),
+                    contact.get("company_name"),
+                    contact.get("email_status"),
+                    _to_epoch(last_contacted),
+                )
+            )
+
+        # INSERT OR REPLACE moves updated rows to the end, like a fresh insert
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO contacts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            upserts,
+        )
+        deleted = 0
+        if deletes:
+            before = self._conn.total_changes
+            self._conn.executemany("DELETE FROM contacts WHERE id = ?", deletes)
+            deleted = self._conn.total_changes - before
+
+        self._set_mark("last_contacted_at", max_contacted)
+        self._set_mark("updated_at", max_updated)
+        self._conn.commit()
+        return len(upserts), deleted
+
+    def apply_suppression_changes(self, entries: Iterable[tuple[str, datetime | None]]) -> int:
+        """
+        Add suppressed emails.
+
+        Args:
+            entries: (email, created_at) tuples.
+
+        Returns:
+            Number of entries applied.
+        """
+        rows: list[tuple[str]] = []
+        max_created = self._get_mark("suppression_created_at")
+        for email, created_at in entries:
+            if email:
+                rows.append((email,))
+            if created_at is not None:
+                max_created = max(filter(None, (max_created, created_at)))
+
+        self._conn.executemany("INSERT OR IGNORE INTO suppression (email) VALUES (?)", rows)
+        self._set_mark("suppression_created_at", max_created)
+        self._conn.commit()
+        return len(rows)
+
+    def _mark_seen(self, contacts: Iterable[dict[str, Any]]) -> None:
+        """Record contact ids returned by a full reconcile."""
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO temp.seen_contacts (id) VALUES (?)",
+            ((str(contact["id"]),) for contact in contacts),
+        )
+
+    def _remove_unseen_contacts(self) -> int:
+        """Delete contacts a full reconcile did not return; returns rows deleted."""
+        before = self._conn.total_changes
+        self._conn.execute(
+            "DELETE FROM contacts WHERE id NOT IN (SELECT id FROM temp.seen_contacts)"
+        )
+        deleted = self._conn.total_changes - before
+        self._conn.execute("DELETE FROM temp.seen_contacts")
+        self._conn.commit()
+        return deleted
+
+    def _remove_unseen_suppression(self, emails: set[str]) -> int:
+        """Delete suppressed emails not in emails; returns rows deleted."""
+        stale = [(email,) for email in self.get_suppression_list() if email not in emails]
+        self._conn.executemany("DELETE FROM suppression WHERE email = ?", stale)
+        self._conn.commit()
+        return len(stale)
+
+    def reconcile_due(self, interval: timedelta = FULL_RECONCILE_INTERVAL) -> bool:
+        """Whether the next sync should re-stream everything to catch deletes."""
+        reconciled_at = self._get_mark("reconciled_at")
+        return reconciled_at is None or datetime.now(UTC) - reconciled_at >= interval
+
+    async def sync(
+        self,
+        source: ContactChangeSource,
+        chunk_size: int = 5000,
+        full_reconcile_interval: timedelta = FULL_RECONCILE_INTERVAL,
+    ) -> ExclusionIndexSyncStats:
+        """
+        Bring the index up to date with the database.
+
+        The first sync streams every qualifying contact (cold build); later
+        syncs only stream rows contacted or updated since the high-water marks.
+        Once full_reconcile_interval has passed since the last full pass, the
+        sync streams everything again and removes contacts and suppressed
+        emails the database no longer returns.
+
+        Args:
+            source: LeadRepository (or anything implementing ContactChangeSource).
+            chunk_size: Rows per streamed chunk.
+            full_reconcile_interval: How often to re-stream everything.
+
+        Returns:
+            ExclusionIndexSyncStats for this run.
+        """
+        start_time = time.time()
+        stats = ExclusionIndexSyncStats(cold_build=self.is_empty)
+        stats.full_reconcile = not stats.cold_build and self.reconcile_due(full_reconcile_interval)
+        full = stats.cold_build or stats.full_reconcile
+        marks = self.high_water_marks
+
+        def behind(mark: datetime | None) -> datetime | None:
+            return mark - HIGH_WATER_MARK_OVERLAP if mark is not None else None
+
+        if stats.full_reconcile:
+            self._conn.execute("DELETE FROM temp.seen_contacts")
+
+        async for chunk in source.stream_contact_changes(
+            last_contacted_since=None if full else behind(marks["last_contacted_at"]),
+            updated_since=None if full else behind(marks["updated_at"]),
+            chunk_size=chunk_size,
+        ):
+            upserted, deleted = self.apply_contact_changes(chunk)
+            stats.contacts_upserted += upserted
+            stats.contacts_deleted += deleted
+            if stats.full_reconcile:
+                self._mark_seen(chunk)
+
+        entries = await source.get_suppression_entries(
+            since=None if full else behind(marks["suppression_created_at"])
+        )
+        stats.suppression_added = self.apply_suppression_changes(entries)
+
+        if stats.full_reconcile:
+            stats.contacts_deleted += self._remove_unseen_contacts()
+            stats.suppression_removed = self._remove_unseen_suppression(
+                {email for email, _created_at in entries if email}
+            )
+
+        now = datetime.now(UTC)
+        if full:
+            self._set_mark("reconciled_at", now)
+        self._set_mark("synced_at", now)
+        self._conn.commit()
+
+        stats.duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(f"Exclusion index synced ({self.path}): {stats.to_dict()}")
+        return stats
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def get_suppression_list(self) -> list[str]:
+        """Get all suppressed emails."""
+        return [row[0] for row in self._conn.execute("SELECT email FROM suppression")]
+
+    def iter_historical_contacts(
+        self,
+        campaign_id: str,
+        lookback_days: int = 90,
+        chunk_size: int = 5000,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield contacts from other campaigns, same filter and shape as
+        LeadRepository.stream_historical_contacts.
+
+        Args:
+            campaign_id: Current campaign UUID (to exclude)
+            lookback_days: Days to look back
+            chunk_size: Rows per chunk
+
+        Yields:
+            Lists of historical contact dicts
+        """
+        cutoff = _to_epoch(datetime.now(UTC) - timedelta(days=lookback_days))
+        cursor = self._conn.execute(
+            "SELECT linkedin_url, email, first_name, last_name, company_name, "
+            "campaign_id, email_status, last_contacted_at FROM contacts "
+            "WHERE campaign_id != ? AND (last_contacted_at > ? OR email_status IN (?, ?, ?)) "
+            "ORDER BY rowid",
+            (str(campaign_id), cutoff, *EXCLUDED_EMAIL_STATUSES),
+        )
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield [
+                {
+                    "linkedin_url": row[0],
+                    "email": row[1],
+                    "first_name": row[2],
+                    "last_name": row[3],
+                    "company_name": row[4],
+                    "campaign_id": row[5],
+                    "email_status": row[6],
+                    "last_contacted_at": _from_epoch(row[7]),
+                }
+                for row in rows
+            ]
+
+    async def stream_historical_contacts(
+        self,
+        campaign_id: str,
+        lookback_days: int = 90,
+        chunk_size: int = 5000,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Async wrapper around iter_historical_contacts for run_streaming()."""
+        for chunk in self.iter_historical_contacts(campaign_id, lookback_days, chunk_size):
+            yield chunk
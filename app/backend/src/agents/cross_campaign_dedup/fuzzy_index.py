@@ -0,0 +1,326 @@
+"""
+Blocked fuzzy index over historical contacts for cross-campaign dedup.
+
+Replaces the per-lead full scan of historical data with:
+1. Phonetic pair blocking: every row is filed under the soundex of each
+   pair of its fields (first + last name, first name + company, last name +
+   company, leading articles ignored). A lookup only visits rows sharing at
+   least one pair, so its cost follows block sizes rather than history size.
+2. A bigram prefilter that computes a guaranteed upper bound on the
+   SequenceMatcher ratio and skips candidates that cannot reach the threshold.
+3. Exact scoring with ``name_company_match`` on the remaining candidates.
+
+Blocking is not exact. An edit in any single field (including its first
+letter) leaves the other two fields' pair intact, but a contact whose
+soundex differs from the lead's in two or more fields (e.g. changed first
+letters in both the first name and the company) is never compared, even
+when it would reach the threshold. Candidates are scored in historical order and the first match wins, which
+mirrors the ``break`` in the original full scan.
+"""
+
+import logging
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import jellyfish
+
+logger = logging.getLogger(__name__)
+
+# Weights used by name_company_match (name slightly more important)
+NAME_WEIGHT = 0.6
+COMPANY_WEIGHT = 0.4
+
+# Leading tokens ignored in company keys ("The Acme" -> "acme")
+_COMPANY_STOPWORDS = frozenset({"the", "a", "an"})
+
+# Tolerance for float comparisons between the upper bound and the threshold
+_BOUND_EPSILON = 1e-9
+
+
+@dataclass
+class FuzzyIndexStats:
+    """Counters describing how much work the index avoided."""
+
+    lookups: int = 0
+    cache_hits: int = 0
+    candidates: int = 0
+    pruned_by_bound: int = 0
+    scored: int = 0
+    matches: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary for logging."""
+        return {
+            "lookups": self.lookups,
+            "cache_hits": self.cache_hits,
+            "candidates": self.candidates,
+            "pruned_by_bound": self.pruned_by_bound,
+            "scored": self.scored,
+            "matches": self.matches,
+        }
+
+
+def _normalize(s: str | None) -> str:
+    """Normalize string the same way as ``normalize_string`` in agent.py."""
+    if not s:
+        return ""
+    return " ".join(s.lower().strip().split())
+
+
+def _phonetic_key(value: str) -> str:
+    """Soundex of a normalized value, falling back to a 4-char prefix."""
+    if not value:
+        return ""
+    try:
+        key = jellyfish.soundex(value)
+    except Exception:
+        key = ""
+    return key or value[:4].upper()
+
+
+def _company_core(company: str) -> str:
+    """Normalized company without leading articles."""
+    tokens = company.split()
+    while len(tokens) > 1 and tokens[0] in _COMPANY_STOPWORDS:
+        tokens = tokens[1:]
+    return " ".join(tokens)
+
+
+def _blocking_keys(first: str, last: str, company: str) -> list[str]:
+    """
+    Blocking keys for a normalized (first, last, company) triple.
+
+    One key per pair of non-empty fields, so a row and a query meet when
+    any two of their fields sound alike.
+    """
+    first_key = _phonetic_key(first)
+    last_key = _phonetic_key(last)
+    company_key = _phonetic_key(_company_core(company))
+
+    keys: list[str] = []
+    if first_key and last_key:
+        keys.append(f"fl:{first_key}:{last_key}")
+    if first_key and company_key:
+        keys.append(f"fc:{first_key}:{company_key}")
+    if last_key and company_key:
+        keys.append(f"lc:{last_key}:{company_key}")
+    return keys
+
+
+def _bigrams(s: str) -> Counter[str]:
+    """Multiset of character bigrams."""
+    return Counter(s[i : i + 2] for i in range(len(s) - 1))
+
+
+def _ratio_upper_bound(a: str, b: str, a_bigrams: Counter[str]) -> float:
+    """
+    Upper bound on ``SequenceMatcher(None, a, b).ratio()``.
+
+    With M matched characters spread over k matching blocks, every block of
+    size s contributes s - 1 shared bigrams and consecutive blocks are
+    separated by at least one unmatched character, so
+    shared_bigrams >= 3M - len(a) - len(b) - 1. The length bound
+    2 * min(len) / total also holds. Both are cheap compared to the exact ratio.
+    """
+    if not a or not b:
+        return 0.0
+    total = len(a) + len(b)
+    length_bound = 2 * min(len(a), len(b)) / total
+
+    b_bigrams = _bigrams(b)
+    shared = sum(min(count, b_bigrams[g]) for g, count in a_bigrams.items() if g in b_bigrams)
+    bigram_bound = 2 * (shared + total + 1) / (3 * total)
+
+    return min(1.0, length_bound, bigram_bound)
+
+
+class HistoricalFuzzyIndex:
+    """
+    Reusable fuzzy index over historical contacts.
+
+    Rows can be added incrementally (e.g. while streaming history from the
+    database); lookups always see every row added so far.
+
+    Example:
+        >>> index = HistoricalFuzzyIndex(historical_data)
+        >>> match = index.find_match("Jon", "Doe", "Acme Corp", threshold=0.85)
+        >>> if match:
+        ...     hist, score = match
+    """
+
+    def __init__(self, historical_data: Iterable[dict[str, Any]] | None = None) -> None:
+        self._rows: list[dict[str, Any]] = []
+        # Rows with the same normalized (name, company) always score the same,
+        # so bounds are computed once per distinct key
+        self._key_ids: dict[tuple[str, str], int] = {}
+        self._keys: list[tuple[str, str]] = []
+        self._key_positions: list[list[int]] = []
+        self._blocks: dict[str, list[int]] = defaultdict(list)
+        # Keys without any blocking key (a single field) are always candidates
+        self._unblocked: list[int] = []
+        self._removed: set[int] = set()
+        self._cache: dict[tuple[str, str, str, float], tuple[int, float] | None] = {}
+        self.stats = FuzzyIndexStats()
+
+        if historical_data is not None:
+            self.extend(historical_data)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, hist: dict[str, Any]) -> None:
+        """Add a single historical contact to the index."""
+        first = _normalize(hist.get("first_name"))
+        last = _normalize(hist.get("last_name"))
+        company = _normalize(hist.get("company_name"))
+
+        name = _normalize(f"{first} {last}")
+
+        position = len(self._rows)
+        self._rows.append(hist)
+
+        key_id = self._key_ids.get((name, company))
+        if key_id is None:
+            key_id = self._key_ids[(name, company)] = len(self._keys)
+            self._keys.append((name, company))
+            self._key_positions.append([])
+            blocking_keys = _blocking_keys(first, last, company)
+            for blocking_key in blocking_keys:
+                self._blocks[blocking_key].append(key_id)
+            if not blocking_keys:
+                self._unblocked.append(key_id)
+        self._key_positions[key_id].append(position)
+
+        if self._cache:
+            self._cache.clear()
+
+    def extend(self, historical_data: Iterable[dict[str, Any]]) -> None:
+        """Add many historical contacts to the index."""
+        for hist in historical_data:
+            self.add(hist)
+
+    def discard(self, position: int) -> None:
+        """
+        Stop returning the row at ``position`` from lookups.
+
+        Used by the streaming matcher to retire leads once they are resolved.
+        """
+        self._removed.add(position)
+        if self._cache:
+            self._cache.clear()
+
+    def _candidates(
+        self, first: str, last: str, company: str, name: str, threshold: float
+    ) -> list[int]:
+        """Positions, in insertion order, sharing a block and passing the bound."""
+        key_ids: set[int] = set(self._unblocked)
+        for blocking_key in _blocking_keys(first, last, company):
+            block = self._blocks.get(blocking_key)
+            if block:
+                key_ids.update(block)
+
+        name_bigrams = _bigrams(name)
+        company_bigrams = _bigrams(company)
+        positions: list[int] = []
+        for key_id in key_ids:
+            live = [p for p in self._key_positions[key_id] if p not in self._removed]
+            if not live:
+                continue
+            self.stats.candidates += len(live)
+
+            row_name, row_company = self._keys[key_id]
+            upper_bound = NAME_WEIGHT * _ratio_upper_bound(
+                name, row_name, name_bigrams
+            ) + COMPANY_WEIGHT * _ratio_upper_bound(company, row_company, company_bigrams)
+            if upper_bound + _BOUND_EPSILON < threshold:
+                self.stats.pruned_by_bound += len(live)
+                continue
+            positions.extend(live)
+        return sorted(positions)
+
+    def iter_matches(
+        self,
+        first_name: str | None,
+        last_name: str | None,
+        company_name: str | None,
+        threshold: float = 0.85,
+        rows_are_leads: bool = False,
+    ) -> Iterator[tuple[int, dict[str, Any], float]]:
+        """
+        Yield every blocked row that fuzzy matches name + company, in order.
+
+        Args:
+            first_name: Query first name.
+            last_name: Query last name.
+            company_name: Query company name.
+            threshold: Minimum combined score (same as name_company_match).
+            rows_are_leads: If True the indexed rows are leads and the query is
+                a historical contact, so the row is passed to name_company_match
+                first. Keeps scores identical to the lead-first full scan.
+
+        Yields:
+            Tuples of (position, row, score).
+        """
+        # Imported here to avoid a circular import with agent.py
+        from src.agents.cross_campaign_dedup.agent import name_company_match
+
+        first = _normalize(first_name)
+        last = _normalize(last_name)
+        company = _normalize(company_name)
+        name = _normalize(f"{first} {last}")
+
+        for position in self._candidates(first, last, company, name, threshold):
+            row = self._rows[position]
+            query_fields = (first_name, last_name, company_name)
+            row_fields = (row.get("first_name"), row.get("last_name"), row.get("company_name"))
+            if rows_are_leads:
+                query_fields, row_fields = row_fields, query_fields
+
+            self.stats.scored += 1
+            is_match, score = name_company_match(*query_fields, *row_fields, threshold)
+            if is_match:
+                self.stats.matches += 1
+                yield position, row, score
+
+    def find_match(
+        self,
+        first_name: str | None,
+        last_name: str | None,
+        company_name: str | None,
+        threshold: float = 0.85,
+    ) -> tuple[dict[str, Any], float] | None:
+        """
+        Find the first historical contact that fuzzy matches name + company.
+
+        Args:
+            first_name: Lead first name.
+            last_name: Lead last name.
+            company_name: Lead company name.
+            threshold: Minimum combined score (same as name_company_match).
+
+        Returns:
+            Tuple of (historical_row, score) or None if nothing matches.
+        """
+        self.stats.lookups += 1
+        cache_key = (
+            _normalize(first_name),
+            _normalize(last_name),
+            _normalize(company_name),
+            threshold,
+        )
+        if cache_key in self._cache:
+            self.stats.cache_hits += 1
+            cached = self._cache[cache_key]
+            return (self._rows[cached[0]], cached[1]) if cached else None
+
+        result: tuple[int, float] | None = None
+        for position, _row, score in self.iter_matches(
+            first_name, last_name, company_name, threshold
+        ):
+            result = (position, score)
+            break
+
+        self._cache[cache_key] = result
+        return (self._rows[result[0]], result[1]) if result else None
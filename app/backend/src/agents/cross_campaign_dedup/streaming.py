@@ -0,0 +1,244 @@
+"""
+Streaming exclusion matcher for cross-campaign dedup.
+
+Indexes the campaign's leads instead of the historical contacts and probes
+each historical row as it arrives from the database. History is never held
+in memory, so peak memory depends on the campaign size rather than on how
+many contacts were made in the lookback window, and matching starts with
+the first chunk.
+
+Produces exactly the same output as
+``CrossCampaignDedupAgent._process_leads_directly`` for the same history order:
+- LinkedIn/email matches keep the last matching historical row (dict overwrite)
+- Fuzzy matches keep the first matching historical row (full-scan ``break``)
+- Priority: suppression list > LinkedIn URL > email > fuzzy
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from src.agents.cross_campaign_dedup.fuzzy_index import HistoricalFuzzyIndex
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StreamingStats:
+    """Progress counters for a streaming run."""
+
+    chunks: int = 0
+    rows_streamed: int = 0
+    first_match_at_row: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            "chunks": self.chunks,
+            "rows_streamed": self.rows_streamed,
+            "first_match_at_row": self.first_match_at_row,
+        }
+
+
+def _exclusion_reason(email_status: str | None) -> str:
+    """Map a historical email status to an exclusion reason."""
+    if email_status == "bounced":
+        return "bounced"
+    if email_status in ("unsubscribed", "complained"):
+        return "unsubscribed"
+    return "previously_contacted"
+
+
+class StreamingExclusionMatcher:
+    """
+    Match campaign leads against historical contacts streamed in chunks.
+
+    Example:
+        >>> matcher = StreamingExclusionMatcher(leads, suppression_list, 0.85)
+        >>> async for chunk in repo.stream_historical_contacts(campaign_id):
+        ...     matcher.feed(chunk)
+        >>> dedup_result = matcher.finalize()
+    """
+
+    def __init__(
+        self,
+        leads: list[dict[str, Any]],
+        suppression_list: Iterable[str],
+        fuzzy_threshold: float = 0.85,
+    ) -> None:
+        self.leads = leads
+        self.fuzzy_threshold = fuzzy_threshold
+        self.stats = StreamingStats()
+
+        suppression_set = {e.lower().strip() for e in suppression_list if e}
+        count = len(leads)
+        self._suppressed: list[bool] = [False] * count
+        self._linkedin_hits: list[tuple[str, dict[str, Any]] | None] = [None] * count
+        self._email_hits: list[tuple[str, dict[str, Any]] | None] = [None] * count
+        self._fuzzy_hits: list[tuple[dict[str, Any], float] | None] = [None] * count
+
+        self._linkedin_to_leads: dict[str, list[int]] = defaultdict(list)
+        self._email_to_leads: dict[str, list[int]] = defaultdict(list)
+
+        # Fuzzy index over leads that may still need a fuzzy match
+        self._fuzzy_index = HistoricalFuzzyIndex()
+        self._fuzzy_position: dict[int, int] = {}
+        self._fuzzy_lead: list[int] = []
+
+        for idx, lead in enumerate(leads):
+            email = (lead.get("email") or "").lower().strip()
+            if email and email in suppression_set:
+                # Suppression wins over everything, no need to look at history
+                self._suppressed[idx] = True
+                continue
+
+            linkedin_url = (lead.get("linkedin_url") or "").lower().rstrip("/")
+            if linkedin_url:
+                self._linkedin_to_leads[linkedin_url].append(idx)
+            if email:
+                self._email_to_leads[email].append(idx)
+
+            if (lead.get("first_name", "") or lead.get("last_name", "")) and lead.get(
+                "company_name", ""
+            ):
+                self._fuzzy_position[idx] = len(self._fuzzy_lead)
+                self._fuzzy_lead.append(idx)
+                self._fuzzy_index.add(lead)
+
+    def _retire_fuzzy(self, idx: int) -> None:
+        """Stop fuzzy matching a lead that already has a higher-priority result."""
+        position = self._fuzzy_position.pop(idx, None)
+        if position is not None:
+            self._fuzzy_index.discard(position)
+
+    def _record_match(self) -> None:
+        if self.stats.first_match_at_row is None:
+            self.stats.first_match_at_row = self.stats.rows_streamed
+
+    def feed(self, historical_chunk: Iterable[dict[str, Any]]) -> None:
+        """Probe a chunk of historical contacts against the campaign's leads."""
+        self.stats.chunks += 1
+        for hist in historical_chunk:
+            self.stats.rows_streamed += 1
+
+            linkedin_url = (hist.get("linkedin_url") or "").lower().rstrip("/")
+            if linkedin_url and linkedin_url in self._linkedin_to_leads:
+                for idx in self._linkedin_to_leads[linkedin_url]:
+                    self._linkedin_hits[idx] = (linkedin_url, hist)
+                    self._retire_fuzzy(idx)
+                self._record_match()
+
+            email = (hist.get("email") or "").lower().strip()
+            if email and email in self._email_to_leads:
+                for idx in self._email_to_leads[email]:
+                    self._email_hits[idx] = (email, hist)
+                    self._retire_fuzzy(idx)
+                self._record_match()
+
+            if not self._fuzzy_position:
+                continue
+
+            matches = list(
+                self._fuzzy_index.iter_matches(
+                    hist.get("first_name"),
+                    hist.get("last_name"),
+                    hist.get("company_name"),
+                    self.fuzzy_threshold,
+                    rows_are_leads=True,
+                )
+            )
+            for position, _lead, score in matches:
+                idx = self._fuzzy_lead[position]
+                self._fuzzy_hits[idx] = (hist, score)
+                self._retire_fuzzy(idx)
+                self._record_match()
+
+    async def feed_stream(self, historical_chunks: AsyncIterator[list[dict[str, Any]]]) -> None:
+        """Consume an async stream of historical chunks."""
+        async for chunk in historical_chunks:
+            self.feed(chunk)
+
+    def finalize(self) -> dict[str, Any]:
+        """
+        Build the dedup result in the same shape as ``_process_leads_directly``.
+
+        Returns:
+            Dictionary with exclusions, passed_lead_ids and per-reason counts.
+        """
+        exclusions: list[dict[str, Any]] = []
+        passed_ids: list[str] = []
+        counts = {
+            "previously_contacted": 0,
+            "bounced": 0,
+            "unsubscribed": 0,
+            "suppression_list": 0,
+            "fuzzy_match": 0,
+        }
+
+        for idx, lead in enumerate(self.leads):
+            lead_id = str(lead.get("id", ""))
+            exact_hit = self._linkedin_hits[idx] or self._email_hits[idx]
+            fuzzy_hit = self._fuzzy_hits[idx]
+
+            if self._suppressed[idx]:
+                exclusions.append(
+                    {
+                        "lead_id": lead_id,
+                        "exclusion_reason": "suppression_list",
+                        "matched_identifier": (lead.get("email") or "").lower().strip(),
+                        "match_confidence": 1.0,
+                    }
+                )
+                counts["suppression_list"] += 1
+            elif exact_hit:
+                identifier, hist = exact_hit
+                reason = _exclusion_reason(hist.get("email_status", ""))
+                exclusions.append(
+                    {
+                        "lead_id": lead_id,
+                        "exclusion_reason": reason,
+                        "excluded_due_to_campaign": hist.get("campaign_id"),
+                        "matched_identifier": identifier,
+                        "match_confidence": 1.0,
+                    }
+                )
+                counts[reason] += 1
+            elif fuzzy_hit:
+                hist, score = fuzzy_hit
+                matched_id = (
+                    f"{hist.get('first_name', '')} "
+                    f"{hist.get('last_name', '')} @ "
+                    f"{hist.get('company_name', '')}"
+                )
+                exclusions.append(
+                    {
+                        "lead_id": lead_id,
+                        "exclusion_reason": "fuzzy_match",
+                        "excluded_due_to_campaign": hist.get("campaign_id"),
+                        "matched_identifier": matched_id,
+                        "match_confidence": score,
+                    }
+                )
+                counts["fuzzy_match"] += 1
+            else:
+                passed_ids.append(lead_id)
+
+        logger.debug(
+            f"Streaming dedup stats: {self.stats.to_dict()}, "
+            f"fuzzy={self._fuzzy_index.stats.to_dict()}"
+        )
+
+        return {
+            "exclusions": exclusions,
+            "passed_lead_ids": passed_ids,
+            "total_checked": len(self.leads),
+            "previously_contacted": counts["previously_contacted"],
+            "bounced_excluded": counts["bounced"],
+            "unsubscribed_excluded": counts["unsubscribed"],
+            "suppression_list_excluded": counts["suppression_list"],
+            "fuzzy_match_excluded": counts["fuzzy_match"],
+            "remaining_leads": len(passed_ids),
+            "rows_streamed": self.stats.rows_streamed,
+        }
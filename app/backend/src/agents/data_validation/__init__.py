@@ -38,6 +38,7 @@ from src.agents.data_validation.normalizers import (
     normalize_name,
     parse_location,
 )
+from src.agents.data_validation.parallel import ParallelValidator, validate_batch
 from src.agents.data_validation.schemas import (
     BatchValidationResult,
     DataValidationResult,
@@ -71,6 +72,9 @@ __all__ = [
     # Security Hooks
     "validate_tool_inputs",
     "log_tool_execution",
+    # Process-pool validation
+    "ParallelValidator",
+    "validate_batch",
     # Schemas
     "DataValidationResult",
     "BatchValidationResult",
@@ -52,7 +52,7 @@ from claude_agent_sdk.types import (
     TextBlock,
 )
 
-from src.agents.data_validation.normalizers import normalize_lead
+from src.agents.data_validation.parallel import ParallelValidator, validate_batch
 from src.agents.data_validation.schemas import (
     BatchValidationResult,
     DataValidationResult,
@@ -60,7 +60,6 @@ from src.agents.data_validation.schemas import (
     ValidationHandoff,
 )
 from src.agents.data_validation.tools import DATA_VALIDATION_TOOLS
-from src.agents.data_validation.validators import validate_lead
 
 logger = logging.getLogger(__name__)
 
@@ -237,6 +236,7 @@ class DataValidationAgent:
         model: Claude model to use (for AI-assisted validation).
         batch_size: Number of leads per batch.
         max_parallel_batches: Maximum concurrent batches.
+        validation_workers: Worker processes for direct-mode validation (0 = threads).
     """
 
     def __init__(
@@ -245,6 +245,7 @@ class DataValidationAgent:
         batch_size: int = 1000,
         max_parallel_batches: int = 10,
         use_claude: bool = False,
+        validation_workers: int | None = 0,
     ) -> None:
         """
         Initialize Data Validation Agent.
@@ -254,16 +255,22 @@ class DataValidationAgent:
             batch_size: Number of leads per validation batch.
             max_parallel_batches: Maximum concurrent batch processing.
             use_claude: Whether to use Claude for orchestration (default: False for efficiency).
+            validation_workers: Worker processes for direct-mode validation.
+                0 validates on threads; None uses one per CPU (os.cpu_count,
+                which ignores container CPU quotas). The pool is only started
+                when there is more than one batch.
         """
         self.name = "data_validation"
         self.model = model
         self.batch_size = batch_size
         self.max_parallel_batches = max_parallel_batches
         self.use_claude = use_claude
+        self.validation_workers = validation_workers
 
         logger.info(
             f"[{self.name}] Agent initialized "
-            f"(model={model}, batch_size={batch_size}, parallel={max_parallel_batches})"
+            f"(model={model}, batch_size={batch_size}, parallel={max_parallel_batches}, "
+            f"validation_workers={validation_workers})"
         )
 
     @property
@@ -342,12 +349,15 @@ Use the validate_lead_batch tool to process leads and aggregate_validation_resul
                 result = await self._run_direct(campaign_id, leads, result)
 
             result.completed_at = datetime.now()
-            result.execution_time_ms = int((time.time() - start_time) * 1000)
+            elapsed = time.time() - start_time
+            result.execution_time_ms = int(elapsed * 1000)
+            result.leads_per_second = result.total_processed / elapsed if elapsed > 0 else 0.0
 
             logger.info(
                 f"[{self.name}] Validation complete for campaign {campaign_id}: "
                 f"{result.total_valid}/{result.total_processed} valid "
-                f"({result.validation_rate:.1%}), time={result.execution_time_ms}ms"
+                f"({result.validation_rate:.1%}), time={result.execution_time_ms}ms "
+                f"({result.leads_per_second:.0f} leads/sec)"
             )
 
             return result
@@ -371,7 +381,8 @@ Use the validate_lead_batch tool to process leads and aggregate_validation_resul
         Run validation directly without Claude orchestration.
 
         This is the efficient path for processing large lead volumes.
-        Uses parallel batch processing with asyncio.
+        Batches run on worker processes (see ParallelValidator), or on
+        threads when validation_workers is 0 or there is a single batch.
 
         Args:
             campaign_id: Campaign UUID.
@@ -385,18 +396,23 @@ Use the validate_lead_batch tool to process leads and aggregate_validation_resul
         batches = [leads[i : i + self.batch_size] for i in range(0, len(leads), self.batch_size)]
         result.total_batches = len(batches)
 
-        logger.info(
-            f"[{self.name}] Processing {len(leads)} leads in {len(batches)} batches "
-            f"(max {self.max_parallel_batches} parallel)"
-        )
+        batch_results: list[BatchValidationResult | BaseException]
+        if self.validation_workers != 0 and len(batches) > 1:
+            batch_results = list(await self._validate_in_pool(leads))
+        else:
+            logger.info(
+                f"[{self.name}] Processing {len(leads)} leads in {len(batches)} batches "
+                f"(max {self.max_parallel_batches} parallel)"
+            )
 
-        # Process batches in parallel with semaphore for concurrency control
-        semaphore = asyncio.Semaphore(self.max_parallel_batches)
-        tasks = [
-            self._validate_batch_async(batch, i + 1, semaphore) for i, batch in enumerate(batches)
-        ]
+            # Process batches in parallel with semaphore for concurrency control
+            semaphore = asyncio.Semaphore(self.max_parallel_batches)
+            tasks = [
+                self._validate_batch_async(batch, i + 1, semaphore)
+                for i, batch in enumerate(batches)
+            ]
 
-        batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Aggregate results
         error_breakdown: dict[str, int] = {}
@@ -433,6 +449,15 @@ Use the validate_lead_batch tool to process leads and aggregate_validation_resul
 
         return result
 
+    async def _validate_in_pool(self, leads: list[dict[str, Any]]) -> list[BatchValidationResult]:
+        """Validate all batches on worker processes; same results and order as threads."""
+        async with ParallelValidator(max_workers=self.validation_workers) as validator:
+            logger.info(
+                f"[{self.name}] Validating {len(leads)} leads on "
+                f"{validator.max_workers} worker processes"
+            )
+            return await validator.validate(leads, self.batch_size)
+
     async def _validate_batch_async(
         self,
         batch: list[dict[str, Any]],
@@ -462,6 +487,7 @@ Use the validate_lead_batch tool to process leads and aggregate_validation_resul
         Validate a batch of leads synchronously.
 
         This is called from a thread pool to avoid blocking the event loop.
+        Worker processes run the same validate_batch().
 
         Args:
             batch: List of leads in this batch.
@@ -470,43 +496,7 @@ Use the validate_lead_batch tool to process leads and aggregate_validation_resul
         Returns:
             BatchValidationResult with validation results.
         """
-        start_time = time.time()
-
-        result = BatchValidationResult(
-            batch_number=batch_number,
-            batch_size=len(batch),
-        )
-
-        for lead in batch:
-            lead_id = str(lead.get("id", "unknown"))
-
-            # Normalize
-            normalized = normalize_lead(lead)
-
-            # Validate
-            validation = validate_lead(normalized)
-
-            # Check if needs enrichment
-            needs_enrichment = not lead.get("email")
-
-            lead_result = LeadValidationResult(
-                lead_id=lead_id,
-                is_valid=validation["is_valid"],
-                status=validation["status"],
-                errors=validation["errors"],
-                warnings=validation["warnings"],
-                normalized_data=validation["normalized"],
-                needs_email_enrichment=needs_enrichment,
-            )
-
-            result.results.append(lead_result)
-
-            if validation["is_valid"]:
-                result.valid_count += 1
-            else:
-                result.invalid_count += 1
-
-        result.processing_time_ms = int((time.time() - start_time) * 1000)
+        result = validate_batch(batch, batch_number)
 
         logger.debug(
             f"[{self.name}] Batch {batch_number}: "
@@ -10,9 +10,14 @@ Normalization Philosophy:
 - Expand abbreviations (VP -> Vice President)
 - Remove legal suffixes from company names
 - Derive missing fields where possible
+
+Pattern tables are compiled once at import (so once per worker process
+when validation runs on a pool), and the single-field normalizers are
+memoized, since large campaigns repeat the same company names and titles.
 """
 
 import re
+from functools import lru_cache
 from typing import Any
 
 # =============================================================================
@@ -67,6 +72,19 @@ SENIORITY_PATTERNS: dict[str, list[str]] = {
     "entry": ["Junior", "Jr", "Analyst", "Coordinator"],
 }
 
+# All seniority patterns as one alternation, a named group per level in
+# priority order (longest phrase first within a level)
+SENIORITY_REGEX = re.compile(
+    "|".join(
+        rf"(?P<{seniority}>\b(?:"
+        + "|".join(re.escape(p.lower()) for p in sorted(patterns, key=len, reverse=True))
+        + r")\b)"
+        for seniority, patterns in SENIORITY_PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+_SENIORITY_RANK = {seniority: rank for rank, seniority in enumerate(SENIORITY_PATTERNS)}
+
 # Legal suffixes to remove from company names (from YAML spec)
 LEGAL_SUFFIXES: list[str] = [
     ", Inc.",
@@ -106,6 +124,10 @@ LEGAL_SUFFIXES: list[str] = [
 # Patterns for special character removal (keep letters, numbers, space, hyphen, apostrophe)
 SPECIAL_CHAR_PATTERN = re.compile(r"[^\w\s\-\'\.]", re.UNICODE)
 MULTIPLE_SPACES = re.compile(r"\s+")
+NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]")
+
+# Distinct values remembered per field normalizer (per process)
+FIELD_CACHE_SIZE = 65536
 
 
 # =============================================================================
@@ -113,6 +135,7 @@ MULTIPLE_SPACES = re.compile(r"\s+")
 # =============================================================================
 
 
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
 def normalize_name(name: str | None) -> str | None:
     """
     Normalize a name field (first_name, last_name).
@@ -228,6 +251,7 @@ def derive_full_name(first_name: str | None, last_name: str | None) -> str | Non
 # =============================================================================
 
 
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
 def normalize_job_title(job_title: str | None) -> str | None:
     """
     Normalize job title.
@@ -271,6 +295,7 @@ def normalize_job_title(job_title: str | None) -> str | None:
     return " ".join(normalized_words)
 
 
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
 def detect_seniority(job_title: str | None) -> str | None:
     """
     Detect seniority level from job title.
@@ -287,18 +312,19 @@ def detect_seniority(job_title: str | None) -> str | None:
     if not job_title:
         return None
 
-    job_title_lower = job_title.lower()
-
-    # Check patterns in priority order (most senior first)
-    for seniority, patterns in SENIORITY_PATTERNS.items():
-        for pattern in patterns:
-            # Use word boundary matching to avoid substring false positives
-            # e.g., "CTO" should not match "Director"
-            pattern_regex = re.compile(r"\b" + re.escape(pattern.lower()) + r"\b", re.IGNORECASE)
-            if pattern_regex.search(job_title_lower):
-                return seniority
+    # The most senior level matched anywhere in the title wins, whatever its
+    # position; word boundaries keep e.g. "CTO" from matching in "Director"
+    best: str | None = None
+    for match in SENIORITY_REGEX.finditer(job_title):
+        seniority = match.lastgroup
+        if seniority is None:
+            continue
+        if best is None or _SENIORITY_RANK[seniority] < _SENIORITY_RANK[best]:
+            best = seniority
+            if _SENIORITY_RANK[best] == 0:
+                break
 
-    return None
+    return best
 
 
 # =============================================================================
@@ -306,6 +332,7 @@ def detect_seniority(job_title: str | None) -> str | None:
 # =============================================================================
 
 
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
 def normalize_company_name(company_name: str | None) -> str | None:
     """
     Normalize company name.
@@ -347,6 +374,7 @@ def normalize_company_name(company_name: str | None) -> str | None:
     return company_name.strip() if company_name else None
 
 
+@lru_cache(maxsize=FIELD_CACHE_SIZE)
 def derive_domain_from_company_name(company_name: str | None) -> str | None:
     """
     Derive domain from company name (simple heuristic).
@@ -375,7 +403,7 @@ def derive_domain_from_company_name(company_name: str | None) -> str | None:
     domain_base = clean_name.lower().replace(" ", "").replace("-", "")
 
     # Remove non-alphanumeric
-    domain_base = re.sub(r"[^a-z0-9]", "", domain_base)
+    domain_base = NON_ALPHANUMERIC.sub("", domain_base)
 
     if domain_base:
         return f"{domain_base}.com"
@@ -0,0 +1,165 @@
+"""
+Process-pool lead validation.
+
+Normalization and validation are pure-Python CPU work, so batches handed to
+threads only take turns on the GIL. Large campaigns are instead split into
+batches and validated across worker processes. Each worker compiles the
+normalizer and validator pattern tables once, when it imports them, and
+keeps its own per-field caches for repeated company names and titles;
+afterwards only lead batches and their results cross the process boundary.
+
+Batches are submitted in order with a bounded number in flight and collected
+in submission order, so results are identical to, and in the same order as,
+serial validate_batch calls. The event loop only awaits executor futures and
+stays free to serve other work while workers validate.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from src.agents.data_validation.normalizers import normalize_lead
+from src.agents.data_validation.schemas import BatchValidationResult, LeadValidationResult
+from src.agents.data_validation.validators import validate_lead
+
+logger = logging.getLogger(__name__)
+
+
+def validate_batch(batch: list[dict[str, Any]], batch_number: int) -> BatchValidationResult:
+    """
+    Normalize and validate one batch of leads.
+
+    Args:
+        batch: Lead dictionaries in this batch.
+        batch_number: Batch number for tracking (1-indexed).
+
+    Returns:
+        BatchValidationResult with one LeadValidationResult per lead, in order.
+    """
+    start_time = time.time()
+
+    result = BatchValidationResult(
+        batch_number=batch_number,
+        batch_size=len(batch),
+    )
+
+    for lead in batch:
+        lead_id = str(lead.get("id", "unknown"))
+
+        # Normalize
+        normalized = normalize_lead(lead)
+
+        # Validate
+        validation = validate_lead(normalized)
+
+        lead_result = LeadValidationResult(
+            lead_id=lead_id,
+            is_valid=validation["is_valid"],
+            status=validation["status"],
+            errors=validation["errors"],
+            warnings=validation["warnings"],
+            normalized_data=validation["normalized"],
+            needs_email_enrichment=not lead.get("email"),
+        )
+
+        result.results.append(lead_result)
+
+        if validation["is_valid"]:
+            result.valid_count += 1
+        else:
+            result.invalid_count += 1
+
+    result.processing_time_ms = int((time.time() - start_time) * 1000)
+    return result
+
+
+class ParallelValidator:
+    """
+    Validates lead batches on a pool of worker processes.
+
+    Use as an async context manager so the pool is shut down, without
+    blocking the event loop, when validation finishes:
+
+        async with ParallelValidator(max_workers=8) as validator:
+            batches = await validator.validate(leads, batch_size=1000)
+
+    Attributes:
+        max_workers: Number of worker processes.
+        max_pending: Maximum batches submitted but not yet collected.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        """
+        Start the worker pool.
+
+        Args:
+            max_workers: Worker processes; defaults to one per CPU.
+            max_pending: Batches in flight; defaults to twice the worker count.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.max_workers
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def __enter__(self) -> "ParallelValidator":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool, dropping batches not yet started."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    async def __aenter__(self) -> "ParallelValidator":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Shut down the worker pool off the event loop, dropping batches not yet started."""
+        await asyncio.to_thread(self.close)
+
+    async def validate(
+        self, leads: list[dict[str, Any]], batch_size: int
+    ) -> list[BatchValidationResult]:
+        """
+        Validate leads across the pool.
+
+        Args:
+            leads: Lead dictionaries.
+            batch_size: Leads per batch sent to a worker.
+
+        Returns:
+            One BatchValidationResult per batch, numbered from 1 in input order.
+        """
+        loop = asyncio.get_running_loop()
+        pending: deque[asyncio.Future[BatchValidationResult]] = deque()
+        batches: list[BatchValidationResult] = []
+
+        try:
+            for batch_number, start in enumerate(range(0, len(leads), batch_size), start=1):
+                if len(pending) >= self.max_pending:
+                    batches.append(await pending.popleft())
+                batch = leads[start : start + batch_size]
+                pending.append(
+                    loop.run_in_executor(self._pool, validate_batch, batch, batch_number)
+                )
+
+            while pending:
+                batches.append(await pending.popleft())
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+        logger.debug(f"Validated {len(leads)} leads on {self.max_workers} worker processes")
+        return batches
@@ -36,6 +36,22 @@ class LeadValidationResult:
     normalized_data: dict[str, Any] = field(default_factory=dict)
     needs_email_enrichment: bool = False
 
+    def __reduce__(self) -> tuple[type["LeadValidationResult"], tuple[Any, ...]]:
+        # Rebuild from positional fields: much cheaper to unpickle than the
+        # default __dict__ state when batches return from worker processes
+        return (
+            LeadValidationResult,
+            (
+                self.lead_id,
+                self.is_valid,
+                self.status,
+                self.errors,
+                self.warnings,
+                self.normalized_data,
+                self.needs_email_enrichment,
+            ),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for database update."""
         return {
@@ -103,6 +119,7 @@ class DataValidationResult:
         needs_enrichment: Count of leads flagged for email enrichment.
         error_breakdown: Count of each error type.
         execution_time_ms: Total execution time.
+        leads_per_second: Validation throughput.
         batch_results: List of batch results.
         errors: List of agent-level errors.
     """
@@ -124,6 +141,7 @@ class DataValidationResult:
 
     # Timing
     execution_time_ms: int = 0
+    leads_per_second: float = 0.0
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
@@ -148,6 +166,7 @@ class DataValidationResult:
             "needs_enrichment": self.needs_enrichment,
             "error_breakdown": self.error_breakdown,
             "execution_time_ms": self.execution_time_ms,
+            "leads_per_second": round(self.leads_per_second, 1),
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "total_batches": self.total_batches,
@@ -47,6 +47,12 @@ VALID_COMPANY_SIZES = frozenset(
 # Characters to strip from names
 INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z\s\-'\.\,]")
 
+# Company LinkedIn URL: https://linkedin.com/company/{company-name}
+COMPANY_LINKEDIN_SLUG_PATTERN = re.compile(
+    r"linkedin\.com/company/([a-zA-Z0-9_-]+)",
+    re.IGNORECASE,
+)
+
 
 # =============================================================================
 # Validation Result Type
@@ -452,12 +458,7 @@ def derive_domain_from_linkedin_url(
     if not company_linkedin_url:
         return None
 
-    # Pattern: https://linkedin.com/company/{company-name}
-    pattern = re.compile(
-        r"linkedin\.com/company/([a-zA-Z0-9_-]+)",
-        re.IGNORECASE,
-    )
-    match = pattern.search(company_linkedin_url)
+    match = COMPANY_LINKEDIN_SLUG_PATTERN.search(company_linkedin_url)
 
     if match:
         company_slug = match.group(1).lower()
@@ -14,6 +14,11 @@ from src.agents.duplicate_detection.agent import (
     DuplicateDetectionResult,
     detect_duplicates,
 )
+from src.agents.duplicate_detection.blocking import (
+    DEFAULT_BLOCKING_KEYS,
+    BlockingStats,
+    find_candidate_matches,
+)
 from src.agents.duplicate_detection.matching import (
     DuplicateGroup,
     MatchResult,
@@ -40,6 +45,10 @@ __all__ = [
     "DuplicateDetectionAgentError",
     "DuplicateDetectionResult",
     "detect_duplicates",
+    # Blocking
+    "DEFAULT_BLOCKING_KEYS",
+    "BlockingStats",
+    "find_candidate_matches",
     # Matching
     "DuplicateGroup",
     "MatchResult",
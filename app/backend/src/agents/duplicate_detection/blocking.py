@@ -0,0 +1,372 @@
+"""
+Multi-pass blocking engine for fuzzy duplicate detection.
+
+A single blocking key (first-name soundex + raw company prefix) misses
+duplicates whose company prefix differs ("The Acme" vs "Acme") and still
+compares every pair inside large blocks. This engine:
+
+1. Runs several blocking keys (the original key plus article-insensitive
+   first-name/company and last-name/company keys).
+2. Adds sorted-neighbourhood passes: leads are sorted on company-first and
+   name-first keys and every lead is compared with the next
+   ``window_size - 1`` leads. This catches pairs whose company or name
+   spelling breaks every blocking key, without a quadratic name-only block.
+3. Merges candidate pairs from every pass so each pair is scored once.
+4. Scores blocks of ``parallel_block_size`` leads or more in a process pool.
+
+Scores are identical to ``calculate_composite_score`` so the threshold keeps
+its meaning; the extra passes only add candidate pairs.
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import jellyfish
+
+from src.agents.duplicate_detection.schemas import LeadRecord
+from src.utils.string_similarity import (
+    DEFAULT_COMPANY_WEIGHT,
+    DEFAULT_FIRST_NAME_WEIGHT,
+    DEFAULT_LAST_NAME_WEIGHT,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default sorted-neighbourhood window (each lead vs the next N-1 leads)
+DEFAULT_WINDOW_SIZE = 6
+
+# Blocks at least this large are scored in the process pool
+DEFAULT_PARALLEL_BLOCK_SIZE = 1000
+
+# Rows of a large block handed to one worker task
+_ROWS_PER_TASK = 256
+
+# Leading tokens ignored in company keys ("The Acme" -> "acme")
+_COMPANY_STOPWORDS = frozenset({"the", "a", "an"})
+
+# Normalized (first_name, last_name, company_name)
+Fields = tuple[str, str, str]
+
+# (index_a, index_b, composite, first_sim, last_sim, company_sim)
+ScoredPair = tuple[int, int, float, float, float, float]
+
+BlockingKey = Callable[[LeadRecord], str | None]
+
+# One key per blocking pass (None when the lead has no key for that pass)
+LeadKeys = tuple[str | None, ...]
+
+
+@dataclass
+class BlockingStats:
+    """Counters for one multi-pass run."""
+
+    leads: int = 0
+    blocks: int = 0
+    large_blocks: int = 0
+    block_pairs: int = 0
+    window_pairs: int = 0
+    pairs_scored: int = 0
+    matches: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary for logging."""
+        return {
+            "leads": self.leads,
+            "blocks": self.blocks,
+            "large_blocks": self.large_blocks,
+            "block_pairs": self.block_pairs,
+            "window_pairs": self.window_pairs,
+            "pairs_scored": self.pairs_scored,
+            "matches": self.matches,
+        }
+
+
+# =============================================================================
+# Keys
+# =============================================================================
+
+
+def _normalize(s: str | None) -> str:
+    """Lowercase and strip, matching jaro_winkler_similarity's normalization."""
+    return (s or "").lower().strip()
+
+
+def _soundex(name: str | None) -> str:
+    """Soundex of a name, falling back to a 4-char prefix."""
+    if not name:
+        return ""
+    try:
+        return str(jellyfish.soundex(name))
+    except Exception:
+        return name[:4].upper()
+
+
+def _company_core(company: str | None) -> str:
+    """Normalized company without leading articles or spaces."""
+    tokens = _normalize(company).split()
+    while len(tokens) > 1 and tokens[0] in _COMPANY_STOPWORDS:
+        tokens = tokens[1:]
+    return "".join(tokens)
+
+
+def legacy_key(lead: LeadRecord) -> str | None:
+    """Original key: first-name soundex + first 3 raw chars of company."""
+    if not lead.first_name:
+        return None
+    fn_soundex = _soundex(lead.first_name)
+    co_prefix = (lead.company_name or "")[:3].lower()
+    if not fn_soundex or not co_prefix:
+        return None
+    return f"lg:{fn_soundex}:{co_prefix}"
+
+
+def first_company_key(lead: LeadRecord) -> str | None:
+    """First-name soundex + article-insensitive company prefix."""
+    fn_soundex = _soundex(lead.first_name)
+    co_prefix = _company_core(lead.company_name)[:3]
+    return f"fc:{fn_soundex}:{co_prefix}" if fn_soundex and co_prefix else None
+
+
+def last_company_key(lead: LeadRecord) -> str | None:
+    """Last-name soundex + article-insensitive company prefix (first-name typos)."""
+    ln_soundex = _soundex(lead.last_name)
+    co_prefix = _company_core(lead.company_name)[:3]
+    return f"lc:{ln_soundex}:{co_prefix}" if ln_soundex and co_prefix else None
+
+
+DEFAULT_BLOCKING_KEYS: tuple[BlockingKey, ...] = (
+    legacy_key,
+    first_company_key,
+    last_company_key,
+)
+
+
+def _company_name_sort_key(fields: Fields) -> str:
+    first, last, company = fields
+    return f"{_company_core(company)}|{last}|{first}"
+
+
+def _name_company_sort_key(fields: Fields) -> str:
+    first, last, company = fields
+    return f"{last}|{first}|{_company_core(company)}"
+
+
+DEFAULT_SORT_KEYS: tuple[Callable[[Fields], str], ...] = (
+    _company_name_sort_key,
+    _name_company_sort_key,
+)
+
+
+# =============================================================================
+# Scoring
+# =============================================================================
+
+
+def _similarity(a: str, b: str) -> float:
+    """Jaro-Winkler on pre-normalized strings (0.0 when either is empty)."""
+    if not a or not b:
+        return 0.0
+    return float(jellyfish.jaro_winkler_similarity(a, b))
+
+
+def score_fields(a: Fields, b: Fields) -> tuple[float, float, float, float]:
+    """
+    Composite score on pre-normalized fields.
+
+    Returns the same values as ``calculate_composite_score``.
+
+    Returns:
+        Tuple of (composite, first_sim, last_sim, company_sim).
+    """
+    fn_sim = _similarity(a[0], b[0])
+    ln_sim = _similarity(a[1], b[1])
+    co_sim = _similarity(a[2], b[2])
+    composite = (
+        (fn_sim * DEFAULT_FIRST_NAME_WEIGHT)
+        + (ln_sim * DEFAULT_LAST_NAME_WEIGHT)
+        + (co_sim * DEFAULT_COMPANY_WEIGHT)
+    )
+    return composite, fn_sim, ln_sim, co_sim
+
+
+def _shares_earlier_key(keys_a: LeadKeys, keys_b: LeadKeys, pass_index: int) -> bool:
+    """Whether an earlier blocking pass already put both leads in one block."""
+    return any(keys_a[j] is not None and keys_a[j] == keys_b[j] for j in range(pass_index))
+
+
+def _score_block_rows(
+    block: Sequence[tuple[int, Fields, LeadKeys]],
+    row_start: int,
+    row_end: int,
+    pass_index: int,
+    threshold: float,
+) -> tuple[list[ScoredPair], int]:
+    """
+    Score rows [row_start, row_end) of a block against every later row.
+
+    Pairs already owned by an earlier pass are skipped. Top-level so it can
+    run in a worker process.
+
+    Returns:
+        Tuple of (matched pairs, pairs scored).
+    """
+    matches: list[ScoredPair] = []
+    scored = 0
+    for i in range(row_start, row_end):
+        idx_a, fields_a, keys_a = block[i]
+        for idx_b, fields_b, keys_b in block[i + 1 :]:
+            if pass_index and _shares_earlier_key(keys_a, keys_b, pass_index):
+                continue
+            scored += 1
+            composite, fn_sim, ln_sim, co_sim = score_fields(fields_a, fields_b)
+            if composite >= threshold:
+                matches.append((idx_a, idx_b, composite, fn_sim, ln_sim, co_sim))
+    return matches, scored
+
+
+# =============================================================================
+# Engine
+# =============================================================================
+
+
+def find_candidate_matches(
+    leads: Sequence[LeadRecord],
+    threshold: float,
+    blocking_keys: Iterable[BlockingKey] = DEFAULT_BLOCKING_KEYS,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+    parallel_block_size: int = DEFAULT_PARALLEL_BLOCK_SIZE,
+    max_workers: int | None = None,
+) -> tuple[list[ScoredPair], BlockingStats]:
+    """
+    Run every blocking and sorted-neighbourhood pass and score the candidates.
+
+    Each pair is scored only by the first pass that produces it (checked by
+    recomputing earlier keys / window positions), so merging passes needs no
+    seen-pair set and memory stays linear in the number of leads.
+
+    Args:
+        leads: Leads to compare (already filtered).
+        threshold: Minimum composite score for a match.
+        blocking_keys: Key functions; leads sharing a key are compared.
+        window_size: Sorted-neighbourhood window (0 or 1 disables the passes).
+        parallel_block_size: Blocks this large are scored in a process pool.
+        max_workers: Process pool size (None = CPU count, 0 = never use a pool).
+
+    Returns:
+        Tuple of (matched pairs, stats). Pairs hold indexes into ``leads``
+        with the smaller index first.
+    """
+    stats = BlockingStats(leads=len(leads))
+    key_fns = tuple(blocking_keys)
+    fields: list[Fields] = [
+        (_normalize(lead.first_name), _normalize(lead.last_name), _normalize(lead.company_name))
+        for lead in leads
+    ]
+    keys: list[LeadKeys] = [tuple(key_fn(lead) for key_fn in key_fns) for lead in leads]
+
+    # Blocking passes (members stay in index order)
+    small_blocks: list[tuple[int, list[int]]] = []
+    large_blocks: list[tuple[int, list[int]]] = []
+    for pass_index in range(len(key_fns)):
+        blocks: dict[str, list[int]] = defaultdict(list)
+        for idx, lead_keys in enumerate(keys):
+            key = lead_keys[pass_index]
+            if key:
+                blocks[key].append(idx)
+        for members in blocks.values():
+            if len(members) < 2:
+                continue
+            stats.blocks += 1
+            stats.block_pairs += len(members) * (len(members) - 1) // 2
+            if len(members) >= parallel_block_size:
+                large_blocks.append((pass_index, members))
+            else:
+                small_blocks.append((pass_index, members))
+    stats.large_blocks = len(large_blocks)
+
+    matches: list[ScoredPair] = []
+
+    if large_blocks:
+        large_matches, scored = _score_large_blocks(
+            large_blocks, fields, keys, threshold, max_workers
+        )
+        matches.extend(large_matches)
+        stats.pairs_scored += scored
+
+    for pass_index, members in small_blocks:
+        block = [(idx, fields[idx], keys[idx]) for idx in members]
+        block_matches, scored = _score_block_rows(block, 0, len(block), pass_index, threshold)
+        matches.extend(block_matches)
+        stats.pairs_scored += scored
+
+    # Sorted-neighbourhood passes
+    if window_size > 1:
+        earlier_positions: list[list[int]] = []
+        count = len(leads)
+        for sort_key in DEFAULT_SORT_KEYS:
+            sort_values = [sort_key(f) for f in fields]
+            order = sorted(range(count), key=sort_values.__getitem__)
+            positions = [0] * count
+            for pos, idx in enumerate(order):
+                positions[idx] = pos
+
+            for pos, a in enumerate(order):
+                for b in order[pos + 1 : pos + window_size]:
+                    stats.window_pairs += 1
+                    if _shares_earlier_key(keys[a], keys[b], len(key_fns)) or any(
+                        abs(earlier[a] - earlier[b]) < window_size for earlier in earlier_positions
+                    ):
+                        continue
+                    lo, hi = (a, b) if a < b else (b, a)
+                    stats.pairs_scored += 1
+                    composite, fn_sim, ln_sim, co_sim = score_fields(fields[lo], fields[hi])
+                    if composite >= threshold:
+                        matches.append((lo, hi, composite, fn_sim, ln_sim, co_sim))
+
+            earlier_positions.append(positions)
+
+    stats.matches = len(matches)
+    logger.debug(f"Multi-pass blocking stats: {stats.to_dict()}")
+    return matches, stats
+
+
+def _score_large_blocks(
+    large_blocks: list[tuple[int, list[int]]],
+    fields: list[Fields],
+    keys: list[LeadKeys],
+    threshold: float,
+    max_workers: int | None,
+) -> tuple[list[ScoredPair], int]:
+    """Score large blocks in row stripes, in a process pool when allowed."""
+    tasks: list[tuple[list[tuple[int, Fields, LeadKeys]], int, int, int]] = []
+    for pass_index, members in large_blocks:
+        block = [(idx, fields[idx], keys[idx]) for idx in members]
+        for row_start in range(0, len(block), _ROWS_PER_TASK):
+            row_end = min(row_start + _ROWS_PER_TASK, len(block))
+            tasks.append((block, row_start, row_end, pass_index))
+
+    results: list[tuple[list[ScoredPair], int]]
+    if max_workers == 0 or len(tasks) == 1:
+        results = [_score_block_rows(*task, threshold) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_score_block_rows, *task, threshold) for task in tasks]
+            results = [future.result() for future in futures]
+
+    pairs = [pair for task_pairs, _scored in results for pair in task_pairs]
+    return pairs, sum(scored for _pairs, scored in results)
+
+
+def pair_details(pair: ScoredPair) -> dict[str, Any]:
+    """Breakdown dict in the same shape as ``calculate_composite_score``."""
+    _a, _b, composite, fn_sim, ln_sim, co_sim = pair
+    return {
+        "first_name_similarity": fn_sim,
+        "last_name_similarity": ln_sim,
+        "company_similarity": co_sim,
+        "composite_score": composite,
+    }
@@ -7,11 +7,18 @@ Implements exact matching (LinkedIn URL, email) and fuzzy matching
 
 import logging
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
-import jellyfish
-
+from src.agents.duplicate_detection.blocking import (
+    DEFAULT_BLOCKING_KEYS,
+    DEFAULT_PARALLEL_BLOCK_SIZE,
+    DEFAULT_WINDOW_SIZE,
+    BlockingKey,
+    find_candidate_matches,
+    pair_details,
+)
 from src.agents.duplicate_detection.schemas import LeadRecord
 from src.utils.string_similarity import (
     DEFAULT_COMPANY_WEIGHT,
@@ -185,46 +192,30 @@ def find_email_duplicates(leads: list[LeadRecord]) -> list[DuplicateGroup]:
     return groups
 
 
-def _create_blocking_key(lead: LeadRecord) -> str | None:
-    """
-    Create blocking key for fuzzy matching.
-
-    Uses first_name soundex + first 3 chars of company name.
-    This reduces comparison space for fuzzy matching.
-    """
-    if not lead.first_name:
-        return None
-
-    # Get soundex of first name
-    try:
-        fn_soundex = jellyfish.soundex(lead.first_name)
-    except Exception:
-        fn_soundex = lead.first_name[:4].upper() if lead.first_name else ""
-
-    # Get first 3 chars of company name
-    co_prefix = (lead.company_name or "")[:3].lower()
-
-    if not fn_soundex or not co_prefix:
-        return None
-
-    return f"{fn_soundex}:{co_prefix}"
-
-
 def find_fuzzy_duplicates(
     leads: list[LeadRecord],
     already_matched_ids: set[str] | None = None,
     threshold: float = FUZZY_THRESHOLD,
+    blocking_keys: Iterable[BlockingKey] = DEFAULT_BLOCKING_KEYS,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+    parallel_block_size: int = DEFAULT_PARALLEL_BLOCK_SIZE,
+    max_workers: int | None = None,
 ) -> list[DuplicateGroup]:
     """
     Find duplicates by fuzzy matching on name + company.
 
-    Uses blocking keys to reduce comparison space, then applies
-    Jaro-Winkler similarity with composite scoring.
+    Uses multi-pass blocking (several blocking keys plus sorted-neighbourhood
+    windows) to collect candidate pairs, then applies Jaro-Winkler similarity
+    with composite scoring. Large blocks are scored in a process pool.
 
     Args:
         leads: List of lead records.
         already_matched_ids: Set of lead IDs already matched (from exact matching).
         threshold: Minimum composite score for match.
+        blocking_keys: Blocking key functions (see blocking.py).
+        window_size: Sorted-neighbourhood window size (<= 1 disables it).
+        parallel_block_size: Minimum block size scored in the process pool.
+        max_workers: Process pool size (None = CPU count, 0 = no pool).
 
     Returns:
         List of duplicate groups.
@@ -235,50 +226,33 @@ def find_fuzzy_duplicates(
     # Filter out already matched leads
     eligible_leads = [lead for lead in leads if lead.id not in already_matched_ids]
 
-    # Create blocking key index
-    blocking_index: dict[str, list[LeadRecord]] = defaultdict(list)
-    for lead in eligible_leads:
-        key = _create_blocking_key(lead)
-        if key:
-            blocking_index[key].append(lead)
-
-    # Find matches within each blocking group
-    matched_pairs: list[MatchResult] = []
-    processed: set[tuple[str, str]] = set()
-
-    for _key, block_leads in blocking_index.items():
-        if len(block_leads) < 2:
-            continue
-
-        # Compare all pairs within the block
-        for i, lead1 in enumerate(block_leads):
-            for lead2 in block_leads[i + 1 :]:
-                # Create ordered pair key for deduplication
-                if lead1.id < lead2.id:
-                    pair_key: tuple[str, str] = (lead1.id, lead2.id)
-                else:
-                    pair_key = (lead2.id, lead1.id)
-                if pair_key in processed:
-                    continue
-                processed.add(pair_key)
-
-                score, breakdown = calculate_composite_score(lead1, lead2)
-
-                if score >= threshold:
-                    matched_pairs.append(
-                        MatchResult(
-                            lead1_id=lead1.id,
-                            lead2_id=lead2.id,
-                            match_type="fuzzy",
-                            confidence=score,
-                            match_details=breakdown,
-                        )
-                    )
+    scored_pairs, stats = find_candidate_matches(
+        eligible_leads,
+        threshold=threshold,
+        blocking_keys=blocking_keys,
+        window_size=window_size,
+        parallel_block_size=parallel_block_size,
+        max_workers=max_workers,
+    )
+
+    matched_pairs = [
+        MatchResult(
+            lead1_id=eligible_leads[pair[0]].id,
+            lead2_id=eligible_leads[pair[1]].id,
+            match_type="fuzzy",
+            confidence=pair[2],
+            match_details=pair_details(pair),
+        )
+        for pair in scored_pairs
+    ]
 
     # Convert pairs to groups using union-find
     groups = _pairs_to_groups(matched_pairs)
 
-    logger.info(f"Found {len(groups)} fuzzy duplicate groups")
+    logger.info(
+        f"Found {len(groups)} fuzzy duplicate groups "
+        f"({stats.pairs_scored} pairs scored, {stats.large_blocks} large blocks)"
+    )
     return groups
 
 
@@ -321,12 +295,18 @@ def _pairs_to_groups(pairs: list[MatchResult]) -> list[DuplicateGroup]:
         root = find(lead_id)
         groups_dict[root].append(lead_id)
 
+    # Both ends of a pair share a root, so bucket pairs once instead of
+    # rescanning every pair for every group
+    pairs_by_root: dict[str, list[MatchResult]] = defaultdict(list)
+    for pair in pairs:
+        pairs_by_root[find(pair.lead1_id)].append(pair)
+
     # Build group objects with confidence scores
     groups: list[DuplicateGroup] = []
-    for lead_ids in groups_dict.values():
+    for root, lead_ids in groups_dict.items():
         if len(lead_ids) > 1:
             # Calculate average confidence for the group
-            relevant_pairs = [p for p in pairs if p.lead1_id in lead_ids or p.lead2_id in lead_ids]
+            relevant_pairs = pairs_by_root[root]
             avg_confidence = (
                 sum(p.confidence for p in relevant_pairs) / len(relevant_pairs)
                 if relevant_pairs
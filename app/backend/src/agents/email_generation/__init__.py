@@ -5,7 +5,16 @@ Generates personalized cold emails using research data, persona insights,
 and proven email frameworks with quality scoring and regeneration.
 """
 
-from src.agents.email_generation.agent import EmailGenerationAgent
+from src.agents.email_generation.agent import DirectEmailGenerator, EmailGenerationAgent
+from src.agents.email_generation.generation_cache import (
+    EmailGenerationCache,
+    configure_generation_cache,
+)
+from src.agents.email_generation.message_batches import (
+    MessageBatchCheckpointStore,
+    MessageBatchConfig,
+    MessageBatchRunner,
+)
 from src.agents.email_generation.quality_scorer import EmailQualityScorer
 from src.agents.email_generation.schemas import (
     EmailFramework,
@@ -16,11 +25,17 @@ from src.agents.email_generation.schemas import (
 )
 
 __all__ = [
+    "DirectEmailGenerator",
     "EmailGenerationAgent",
+    "EmailGenerationCache",
+    "MessageBatchCheckpointStore",
+    "MessageBatchConfig",
+    "MessageBatchRunner",
     "EmailQualityScorer",
     "EmailFramework",
     "EmailGenerationResult",
     "GeneratedEmail",
     "LeadTier",
     "QualityScore",
+    "configure_generation_cache",
 ]
@@ -31,7 +31,8 @@ Handoff:
 import asyncio
 import json
 import logging
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from claude_agent_sdk import (
@@ -45,11 +46,24 @@ from claude_agent_sdk import (
 )
 from claude_agent_sdk.types import AssistantMessage, ResultMessage, TextBlock
 
-from src.agents.email_generation.schemas import EmailGenerationResult, TierConfig
+from src.agents.email_generation.generation_cache import get_generation_cache
+from src.agents.email_generation.message_batches import (
+    MessageBatchConfig,
+    MessageBatchRunner,
+    MessageBatchStats,
+)
+from src.agents.email_generation.schemas import (
+    EmailGenerationResult,
+    GenerationTokenUsage,
+    TierConfig,
+)
 from src.agents.email_generation.tools import (
     generate_email,
     generate_email_impl,
+    get_anthropic_rate_limiter,
+    get_generation_usage,
     load_campaign_context,
+    prepare_generation_request,
     save_generated_email,
     save_to_personalization_library,
     score_email_quality,
@@ -117,6 +131,9 @@ class EmailGenerationAgent:
             "regeneration_improved": 0,
             "lines_saved_to_library": 0,
             "framework_usage": {},
+            "token_usage": {},
+            "generation_cache_hits": 0,
+            "generation_cache_misses": 0,
         }
 
     @property
@@ -186,6 +203,9 @@ Always complete all leads before finishing."""
         """
         logger.info(f"Starting email generation for campaign: {campaign_id}")
         self._reset_stats()
+        usage_baseline = replace(get_generation_usage())
+        cache = get_generation_cache()
+        cache_baseline = replace(cache.stats) if cache is not None else None
 
         # Create SDK MCP server with all tools
         sdk_server = create_sdk_mcp_server(
@@ -232,6 +252,13 @@ Report progress as you work."""
 
         # Execute agent
         result = await self._execute_agent(prompt, options, campaign_id)
+        self._stats["token_usage"] = get_generation_usage().since(usage_baseline).to_dict()
+        result.token_usage = self._stats["token_usage"]
+        if cache is not None and cache_baseline is not None:
+            self._stats["generation_cache_hits"] = cache.stats.hits - cache_baseline.hits
+            self._stats["generation_cache_misses"] = cache.stats.misses - cache_baseline.misses
+        result.generation_cache_hits = self._stats["generation_cache_hits"]
+        result.generation_cache_misses = self._stats["generation_cache_misses"]
 
         if result.success:
             logger.info(
@@ -396,21 +423,57 @@ class DirectEmailGenerator:
     Direct email generator for batch processing without agent orchestration.
 
     Use this for high-volume email generation where agent overhead is
-    unnecessary. Directly calls the LLM and scoring functions.
+    unnecessary. Directly calls the LLM and scoring functions, or submits
+    the prompts as Message Batches jobs when a batch_config is given.
     """
 
-    def __init__(self) -> None:
-        """Initialize the direct generator."""
+    def __init__(self, batch_config: MessageBatchConfig | None = None) -> None:
+        """
+        Initialize the direct generator.
+
+        Args:
+            batch_config: Use the Message Batches API with these settings
+                instead of one Messages API call per lead.
+        """
         self.name = "direct_email_generator"
+        self.batch_config = batch_config
+        self.last_batch_stats: MessageBatchStats | None = None
+        self.last_usage: GenerationTokenUsage | None = None
         logger.info(f"Initialized {self.name}")
 
+    @staticmethod
+    def _generation_args(
+        lead: dict[str, Any], persona_context: dict[str, Any], campaign_id: str
+    ) -> dict[str, Any]:
+        """generate_email tool args for one lead."""
+        return {
+            "lead_id": lead.get("id", ""),
+            "campaign_id": campaign_id,
+            "first_name": lead.get("first_name", ""),
+            "last_name": lead.get("last_name", ""),
+            "title": lead.get("title", ""),
+            "company_name": lead.get("company_name", ""),
+            "lead_tier": lead.get("lead_tier", "C"),
+            "persona_challenges": ",".join(persona_context.get("challenges", [])),
+            "persona_goals": ",".join(persona_context.get("goals", [])),
+            "messaging_tone": persona_context.get("messaging_tone", "professional"),
+            "lead_research_json": json.dumps(lead.get("lead_research"))
+            if lead.get("lead_research")
+            else None,
+            "company_research_json": json.dumps(lead.get("company_research"))
+            if lead.get("company_research")
+            else None,
+            "company_research_id": lead.get("company_research_id"),
+            "lead_research_id": lead.get("lead_research_id"),
+        }
+
     async def generate_batch(
         self,
         leads: list[dict[str, Any]],
         persona_context: dict[str, Any],
         niche_context: dict[str, Any],
         campaign_id: str,
-        concurrency: int = 50,
+        concurrency: int | None = None,
     ) -> list[dict[str, Any]]:
         """
         Generate emails for a batch of leads concurrently.
@@ -420,61 +483,86 @@ class DirectEmailGenerator:
             persona_context: Persona messaging context.
             niche_context: Niche pain points and value props.
             campaign_id: Campaign UUID.
-            concurrency: Max concurrent generations.
+            concurrency: Max concurrent generations; by default adjusted to the
+                rate limiter's token budget (ignored in Message Batches mode).
 
         Returns:
             List of generated email results.
         """
-        semaphore = asyncio.Semaphore(concurrency)
-        results = []
-
-        async def generate_one(lead: dict[str, Any]) -> dict[str, Any] | None:
-            async with semaphore:
-                try:
-                    # Call generate_email tool with args dict (SDK pattern)
-                    args = {
-                        "lead_id": lead.get("id", ""),
-                        "campaign_id": campaign_id,
-                        "first_name": lead.get("first_name", ""),
-                        "last_name": lead.get("last_name", ""),
-                        "title": lead.get("title", ""),
-                        "company_name": lead.get("company_name", ""),
-                        "lead_tier": lead.get("lead_tier", "C"),
-                        "persona_challenges": ",".join(persona_context.get("challenges", [])),
-                        "persona_goals": ",".join(persona_context.get("goals", [])),
-                        "messaging_tone": persona_context.get("messaging_tone", "professional"),
-                        "lead_research_json": json.dumps(lead.get("lead_research"))
-                        if lead.get("lead_research")
-                        else None,
-                        "company_research_json": json.dumps(lead.get("company_research"))
-                        if lead.get("company_research")
-                        else None,
-                        "company_research_id": lead.get("company_research_id"),
-                        "lead_research_id": lead.get("lead_research_id"),
-                    }
-                    result = await generate_email_impl(args)
-
-                    if not result.get("is_error"):
-                        # Parse response
-                        content = result.get("content", [{}])[0]
-                        text = content.get("text", "{}")
-                        parsed: dict[str, Any] = json.loads(text)
-                        return parsed
-                    return None
-
-                except Exception as e:
-                    logger.warning(f"Failed to generate email for lead {lead.get('id')}: {e}")
-                    return None
-
-        # Generate concurrently
-        tasks = [generate_one(lead) for lead in leads]
-        completed = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for result in completed:
-            if isinstance(result, dict):
-                results.append(result)
-
-        return results
+        usage_baseline = replace(get_generation_usage())
+        try:
+            return await self._generate_batch(leads, persona_context, campaign_id, concurrency)
+        finally:
+            self.last_usage = get_generation_usage().since(usage_baseline)
+            logger.info(f"Email generation token usage: {self.last_usage.to_dict()}")
+
+    async def _generate_batch(
+        self,
+        leads: list[dict[str, Any]],
+        persona_context: dict[str, Any],
+        campaign_id: str,
+        concurrency: int | None,
+    ) -> list[dict[str, Any]]:
+        if self.batch_config is not None:
+            return await self._generate_with_message_batches(leads, persona_context, campaign_id)
+
+        # Fixed concurrency if given, else sized from the rate limiter's budget
+        limiter = get_anthropic_rate_limiter()
+        completed: list[dict[str, Any] | None] = [None] * len(leads)
+
+        async def generate_one(index: int, lead: dict[str, Any]) -> None:
+            try:
+                # Call generate_email tool with args dict (SDK pattern)
+                args = self._generation_args(lead, persona_context, campaign_id)
+                result = await generate_email_impl(args)
+
+                if not result.get("is_error"):
+                    # Parse response
+                    content = result.get("content", [{}])[0]
+                    text = content.get("text", "{}")
+                    completed[index] = json.loads(text)
+
+            except Exception as e:
+                logger.warning(f"Failed to generate email for lead {lead.get('id')}: {e}")
+
+        pending = deque(enumerate(leads))
+        running: set[asyncio.Task[None]] = set()
+        peak = 0
+        while pending or running:
+            limit = concurrency or limiter.recommended_concurrency()
+            while pending and len(running) < limit:
+                running.add(asyncio.create_task(generate_one(*pending.popleft())))
+            peak = max(peak, len(running))
+            _, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+        logger.info(
+            f"Generated {len(leads)} emails with up to {peak} concurrent calls; "
+            f"rate limiter: {limiter.utilization()}"
+        )
+        return [result for result in completed if isinstance(result, dict)]
+
+    async def _generate_with_message_batches(
+        self,
+        leads: list[dict[str, Any]],
+        persona_context: dict[str, Any],
+        campaign_id: str,
+    ) -> list[dict[str, Any]]:
+        """Generate emails through Message Batches jobs."""
+        requests = []
+        for lead in leads:
+            if not lead.get("id"):
+                continue
+            try:
+                args = self._generation_args(lead, persona_context, campaign_id)
+                requests.append(prepare_generation_request(args))
+            except Exception as e:
+                logger.warning(f"Failed to build prompt for lead {lead.get('id')}: {e}")
+
+        runner = MessageBatchRunner(self.batch_config)
+        try:
+            return await runner.run(campaign_id, requests)
+        finally:
+            self.last_batch_stats = runner.stats
 
 
 # =============================================================================
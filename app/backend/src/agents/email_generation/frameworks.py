@@ -23,6 +23,26 @@ class FrameworkTemplate:
     best_for: list[str]
 
 
+@dataclass
+class GenerationPrompt:
+    """
+    Generation prompt split at the prompt-cache breakpoint.
+
+    The prefix (instructions, persona, framework, requirements) is the same
+    for every lead with the same framework, tier and persona, so it can be
+    sent with a cache_control breakpoint; the suffix holds the lead and
+    research block.
+    """
+
+    prefix: str
+    suffix: str
+
+    @property
+    def text(self) -> str:
+        """The complete prompt."""
+        return f"{self.prefix}\n\n{self.suffix}"
+
+
 # =============================================================================
 # Framework Definitions
 # =============================================================================
@@ -162,7 +182,7 @@ SOFT_CTAS: list[str] = [
 # =============================================================================
 
 
-def build_generation_prompt(
+def build_generation_prompt_parts(
     framework: EmailFramework,
     lead_context: dict[str, Any],
     persona_context: dict[str, Any],
@@ -172,9 +192,9 @@ def build_generation_prompt(
     proven_lines: list[str] | None = None,
     max_words: int = 150,
     personalization_level: str = "personalized",
-) -> str:
+) -> GenerationPrompt:
     """
-    Build the generation prompt for the LLM.
+    Build the generation prompt for the LLM as a shared prefix and per-lead suffix.
 
     Args:
         framework: Email framework to use.
@@ -188,7 +208,8 @@ def build_generation_prompt(
         personalization_level: Level of personalization.
 
     Returns:
-        Complete prompt for email generation.
+        GenerationPrompt; the prefix depends only on framework, persona,
+        proven lines, max words and personalization level.
     """
     template = get_framework_template(framework)
 
@@ -267,21 +288,53 @@ Return ONLY valid JSON with no markdown:
   "full_email": "Complete email combining opening, body, and CTA"
 }}"""
 
-    # Combine all sections
-    prompt = f"""You are an expert cold email copywriter specializing in B2B outreach.
+    # Shared sections first so the prefix can be cached across leads
+    prefix = f"""You are an expert cold email copywriter specializing in B2B outreach.
 Generate a personalized cold email that sounds human, not like AI.
-
-{lead_info}
-{research_section}
 {persona_section}
 {proven_section}
 {framework_section}
 {avoid_section}
-{output_section}
+{output_section}"""
+
+    suffix = f"""{lead_info}
+{research_section}
 
 Write the email now. Be specific, not generic. Focus on THEIR problems."""
 
-    return prompt
+    return GenerationPrompt(prefix=prefix, suffix=suffix)
+
+
+def build_generation_prompt(
+    framework: EmailFramework,
+    lead_context: dict[str, Any],
+    persona_context: dict[str, Any],
+    niche_context: dict[str, Any],
+    lead_research: dict[str, Any] | None = None,
+    company_research: dict[str, Any] | None = None,
+    proven_lines: list[str] | None = None,
+    max_words: int = 150,
+    personalization_level: str = "personalized",
+) -> str:
+    """
+    Build the complete generation prompt for the LLM.
+
+    Same arguments as build_generation_prompt_parts().
+
+    Returns:
+        Complete prompt for email generation.
+    """
+    return build_generation_prompt_parts(
+        framework=framework,
+        lead_context=lead_context,
+        persona_context=persona_context,
+        niche_context=niche_context,
+        lead_research=lead_research,
+        company_research=company_research,
+        proven_lines=proven_lines,
+        max_words=max_words,
+        personalization_level=personalization_level,
+    ).text
 
 
 def select_framework_for_tier(tier: str, variation: int = 0) -> EmailFramework:
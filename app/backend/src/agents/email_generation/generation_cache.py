@@ -0,0 +1,244 @@
+"""
+Content-addressed cache of generated emails.
+
+A retried or resumed Phase 4 run used to call Claude again for every lead,
+even when nothing that feeds the prompt had changed. Model replies are now
+stored under a SHA-256 of the fully rendered prompt, the model parameters
+and PROMPT_VERSION in a local SQLite file (WAL). On a hit the API call is
+skipped and only JSON extraction and quality scoring run again, so scorer
+changes still apply to cached emails. Only replies that parsed and met the
+tier's quality threshold are stored: the key is the same for every
+regeneration attempt, so a cached weak reply would be handed back each time.
+
+Entries expire after ``ttl_seconds`` and the least recently used entries
+are evicted once the cache holds more than ``max_entries``.
+
+Bump PROMPT_VERSION whenever the prompt-building code changes in a way the
+rendered text does not capture (e.g. response parsing expectations).
+
+Configuration (environment, read on first use):
+    EMAIL_GENERATION_CACHE_PATH=/var/lib/smarter-team/email_generation.db
+    EMAIL_GENERATION_CACHE_MAX_ENTRIES=50000
+    EMAIL_GENERATION_CACHE_TTL_DAYS=30
+
+Usage:
+    configure_generation_cache(EmailGenerationCache("data/email_generation.db"))
+    result = await generate_email_impl(args)   # reruns hit the cache
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PROMPT_VERSION = "3"
+
+DEFAULT_MAX_ENTRIES = 50_000
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600.0
+
+# Eviction runs on open and after every this many stores
+_EVICT_EVERY = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS generated_email_cache (
+    key TEXT PRIMARY KEY,
+    response_text TEXT NOT NULL,
+    model TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_generated_email_cache_last_used
+    ON generated_email_cache (last_used_at);
+"""
+
+
+def generation_cache_key(
+    prompt_prefix: str,
+    prompt_suffix: str,
+    model: str,
+    max_tokens: int,
+    temperature: float,
+) -> str:
+    """SHA-256 key of a rendered prompt and the parameters it is sent with."""
+    payload = json.dumps(
+        {
+            "version": PROMPT_VERSION,
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "prefix": prompt_prefix,
+            "suffix": prompt_suffix,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class GenerationCacheStats:
+    """Counters for one cache instance (one process)."""
+
+    lookups: int = 0
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class EmailGenerationCache:
+    """
+    Model replies keyed by generation_cache_key(), persisted in SQLite.
+
+    Attributes:
+        stats: Hit/miss counters since this cache was opened.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """
+        Open (or create) the cache file.
+
+        Args:
+            path: SQLite file path. ":memory:" keeps replies for this process only.
+            max_entries: Entries kept before least recently used ones are evicted.
+            ttl_seconds: Age after which an entry is no longer served.
+        """
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = GenerationCacheStats()
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._evict(time.time())
+        self._conn.commit()
+
+    def __enter__(self) -> "EmailGenerationCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
+    def get(self, key: str) -> str | None:
+        """The cached reply for a key, or None on a miss or expired entry."""
+        self.stats.lookups += 1
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT response_text, created_at FROM generated_email_cache WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None or now - row[1] > self.ttl_seconds:
+            self.stats.misses += 1
+            return None
+
+        self._conn.execute(
+            "UPDATE generated_email_cache SET last_used_at = ? WHERE key = ?", (now, key)
+        )
+        self._conn.commit()
+        self.stats.hits += 1
+        return str(row[0])
+
+    def put(self, key: str, response_text: str, model: str) -> None:
+        """Store a reply; entries over the size limit are evicted periodically."""
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO generated_email_cache "
+            "(key, response_text, model, created_at, last_used_at) VALUES (?, ?, ?, ?, ?)",
+            (key, response_text, model, now, now),
+        )
+        self.stats.stores += 1
+        if self.stats.stores % _EVICT_EVERY == 0:
+            self._evict(now)
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        row = self._conn.execute("SELECT COUNT(*) FROM generated_email_cache").fetchone()
+        return int(row[0])
+
+    def evict(self) -> int:
+        """Drop expired and over-limit entries now; returns how many were removed."""
+        evicted = self._evict(time.time())
+        self._conn.commit()
+        return evicted
+
+    def _evict(self, now: float) -> int:
+        """Drop expired entries, then the least recently used beyond max_entries."""
+        evicted = self._conn.execute(
+            "DELETE FROM generated_email_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        overflow = len(self) - self.max_entries
+        if overflow > 0:
+            evicted += self._conn.execute(
+                "DELETE FROM generated_email_cache WHERE key IN ("
+                "SELECT key FROM generated_email_cache ORDER BY last_used_at, created_at LIMIT ?)",
+                (overflow,),
+            ).rowcount
+        if evicted:
+            self.stats.evictions += evicted
+            logger.debug(f"Evicted {evicted} generated email cache entries")
+        return evicted
+
+
+# Module-level singleton (per LEARN-030); None when caching is not configured
+_generation_cache: EmailGenerationCache | None = None
+_generation_cache_loaded = False
+
+
+def get_generation_cache() -> EmailGenerationCache | None:
+    """The process-wide cache, opened from EMAIL_GENERATION_CACHE_PATH on first use."""
+    global _generation_cache, _generation_cache_loaded
+    if not _generation_cache_loaded:
+        _generation_cache_loaded = True
+        path = os.getenv("EMAIL_GENERATION_CACHE_PATH")
+        if path:
+            _generation_cache = EmailGenerationCache(
+                path,
+                max_entries=int(
+                    os.getenv("EMAIL_GENERATION_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+                ),
+                ttl_seconds=float(os.getenv("EMAIL_GENERATION_CACHE_TTL_DAYS", 30)) * 24 * 3600,
+            )
+    return _generation_cache
+
+
+def configure_generation_cache(cache: EmailGenerationCache | None) -> None:
+    """Set (or with None, disable) the process-wide cache."""
+    global _generation_cache, _generation_cache_loaded
+    _generation_cache = cache
+    _generation_cache_loaded = True
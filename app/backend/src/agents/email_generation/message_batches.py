@@ -0,0 +1,462 @@
+"""
+Message Batches mode for DirectEmailGenerator.
+
+The default direct path sends one Messages API call per lead through the
+token-aware rate limiter, so a 20k-lead overnight campaign spends most of
+its time waiting for rate-limit budget. In batch mode the same generation prompts are
+packed into Message Batches jobs (up to MessageBatchConfig.max_requests_per_batch
+per job), polled until they end, and each reply is streamed back through
+the same JSON extraction and EmailQualityScorer as the synchronous path.
+
+Progress is checkpointed to a local SQLite file (MessageBatchCheckpointStore):
+submitted batch ids and every scored result are recorded as they arrive, so
+a process that stops while batches are still running picks them up again on
+the next call instead of paying for a second submission. Checkpoints carry
+each lead's generation cache key (prompt hash), so a rerun with changed
+inputs ignores them, and a campaign's checkpoints are cleared once a run
+ends with no batch left pending.
+
+API Documentation:
+- Message Batches: https://docs.anthropic.com/en/api/creating-message-batches
+
+Usage:
+    generator = DirectEmailGenerator(
+        batch_config=MessageBatchConfig(checkpoint_path="data/email_batches.db")
+    )
+    results = await generator.generate_batch(leads, persona, niche, campaign_id)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.agents.email_generation.generation_cache import (
+    generation_cache_key,
+    get_generation_cache,
+)
+from src.agents.email_generation.tools import (
+    GENERATION_MAX_TOKENS,
+    GENERATION_MODEL,
+    GENERATION_TEMPERATURE,
+    GenerationRequest,
+    _get_anthropic_client,
+    build_system_prompt,
+    complete_generation,
+    is_cacheable_reply,
+    record_generation_usage,
+)
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+    from anthropic.types.messages.batch_create_params import Request
+
+logger = logging.getLogger(__name__)
+
+# Message Batches API limit is 100,000 requests / 256 MB per batch
+DEFAULT_MAX_REQUESTS_PER_BATCH = 10_000
+
+_CHECKPOINT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS email_batch_jobs (
+    batch_id TEXT PRIMARY KEY,
+    campaign_id TEXT NOT NULL,
+    requests TEXT NOT NULL,
+    ended INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS email_batch_results (
+    campaign_id TEXT NOT NULL,
+    lead_id TEXT NOT NULL,
+    cache_key TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (campaign_id, lead_id)
+);
+"""
+
+
+@dataclass
+class MessageBatchConfig:
+    """Settings for generating emails through the Message Batches API."""
+
+    model: str = GENERATION_MODEL
+    max_tokens: int = GENERATION_MAX_TOKENS
+    temperature: float = GENERATION_TEMPERATURE
+    max_requests_per_batch: int = DEFAULT_MAX_REQUESTS_PER_BATCH
+    poll_interval: float = 60.0
+    max_wait: float = 24 * 3600.0
+    api_key: str | None = None
+    base_url: str | None = None  # e.g. a local stub endpoint in tests
+    checkpoint_path: str | None = None
+
+
+@dataclass
+class MessageBatchStats:
+    """Counters for one batch-mode run."""
+
+    batches_submitted: int = 0
+    batches_resumed: int = 0
+    requests_submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    from_checkpoint: int = 0
+    from_cache: int = 0
+    unfinished_batches: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            "batches_submitted": self.batches_submitted,
+            "batches_resumed": self.batches_resumed,
+            "requests_submitted": self.requests_submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "from_checkpoint": self.from_checkpoint,
+            "from_cache": self.from_cache,
+            "unfinished_batches": self.unfinished_batches,
+        }
+
+
+class MessageBatchCheckpointStore:
+    """
+    Submitted batches and scored results per campaign (SQLite, WAL).
+
+    A batch stays pending until all its results were read. Batch requests
+    and results are stored with the lead's generation cache key so callers
+    can ignore checkpoints made for a different prompt.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Open (or create) the checkpoint file.
+
+        Args:
+            path: SQLite file path. ":memory:" keeps checkpoints for this process only.
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_CHECKPOINT_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "MessageBatchCheckpointStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
+    def add_batch(
+        self, campaign_id: str, batch_id: str, requests: dict[str, tuple[str, str]]
+    ) -> None:
+        """Record a submitted batch and its custom_id -> (lead_id, cache_key) map."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO email_batch_jobs "
+            "(batch_id, campaign_id, requests, ended, created_at) VALUES (?, ?, ?, 0, ?)",
+            (batch_id, str(campaign_id), json.dumps(requests), time.time()),
+        )
+        self._conn.commit()
+
+    def pending_batches(self, campaign_id: str) -> dict[str, dict[str, tuple[str, str]]]:
+        """Batches whose results were not read yet, as batch_id -> request map."""
+        rows = self._conn.execute(
+            "SELECT batch_id, requests FROM email_batch_jobs "
+            "WHERE campaign_id = ? AND ended = 0 ORDER BY created_at",
+            (str(campaign_id),),
+        ).fetchall()
+        return {
+            str(batch_id): {
+                custom_id: (str(lead_id), str(cache_key))
+                for custom_id, (lead_id, cache_key) in json.loads(requests).items()
+            }
+            for batch_id, requests in rows
+        }
+
+    def finish_batch(self, batch_id: str) -> None:
+        """Mark a batch's results as read."""
+        self._conn.execute("UPDATE email_batch_jobs SET ended = 1 WHERE batch_id = ?", (batch_id,))
+        self._conn.commit()
+
+    def save_result(
+        self, campaign_id: str, lead_id: str, cache_key: str, result: dict[str, Any]
+    ) -> None:
+        """Record one scored email and the cache key of the prompt it answered."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO email_batch_results "
+            "(campaign_id, lead_id, cache_key, result, created_at) VALUES (?, ?, ?, ?, ?)",
+            (str(campaign_id), str(lead_id), cache_key, json.dumps(result), time.time()),
+        )
+        self._conn.commit()
+
+    def results(self, campaign_id: str) -> dict[str, tuple[str, dict[str, Any]]]:
+        """Scored emails recorded for a campaign, as lead_id -> (cache_key, result)."""
+        rows = self._conn.execute(
+            "SELECT lead_id, cache_key, result FROM email_batch_results WHERE campaign_id = ?",
+            (str(campaign_id),),
+        ).fetchall()
+        return {
+            str(lead_id): (str(cache_key), json.loads(result))
+            for lead_id, cache_key, result in rows
+        }
+
+    def clear(self, campaign_id: str) -> None:
+        """Drop a campaign's batches and results."""
+        self._conn.execute(
+            "DELETE FROM email_batch_jobs WHERE campaign_id = ?", (str(campaign_id),)
+        )
+        self._conn.execute(
+            "DELETE FROM email_batch_results WHERE campaign_id = ?", (str(campaign_id),)
+        )
+        self._conn.commit()
+
+
+class MessageBatchRunner:
+    """
+    Submits generation requests as Message Batches and scores the replies.
+
+    Attributes:
+        config: Batch settings.
+        stats: Counters for the most recent run().
+    """
+
+    def __init__(
+        self,
+        config: MessageBatchConfig | None = None,
+        client: "AsyncAnthropic | None" = None,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            config: Batch settings (defaults to MessageBatchConfig()).
+            client: AsyncAnthropic client; built from the config when omitted.
+        """
+        self.config = config or MessageBatchConfig()
+        self.stats = MessageBatchStats()
+        self._client = client
+
+    def _get_client(self) -> "AsyncAnthropic":
+        if self._client is None:
+            # Prefer backup key to avoid SDK conflict (per LEARN-001)
+            api_key = (
+                self.config.api_key
+                or os.environ.get("ANTHROPIC_API_KEY_BACKUP")
+                or os.environ.get("ANTHROPIC_API_KEY")
+            )
+            if not api_key:
+                raise ValueError("ANTHROPIC_API_KEY not configured")
+            if self.config.base_url:
+                import anthropic as anthropic_module
+
+                self._client = anthropic_module.AsyncAnthropic(
+                    api_key=api_key, base_url=self.config.base_url
+                )
+            else:
+                self._client = _get_anthropic_client(api_key)
+        return self._client
+
+    def _batch_request(self, custom_id: str, request: GenerationRequest) -> "Request":
+        return {
+            "custom_id": custom_id,
+            "params": {
+                "model": self.config.model,
+                "max_tokens": self.config.max_tokens,
+                "temperature": self.config.temperature,
+                "system": build_system_prompt(request.prompt_prefix),
+                "messages": [{"role": "user", "content": request.prompt_suffix}],
+            },
+        }
+
+    def _cache_key(self, request: GenerationRequest) -> str:
+        return generation_cache_key(
+            request.prompt_prefix,
+            request.prompt_suffix,
+            self.config.model,
+            self.config.max_tokens,
+            self.config.temperature,
+        )
+
+    async def run(
+        self, campaign_id: str, requests: list[GenerationRequest]
+    ) -> list[dict[str, Any]]:
+        """
+        Generate and score emails for every request.
+
+        Leads with a checkpointed result or a pending batch from an earlier
+        run for the same prompt are not submitted again. The campaign's
+        checkpoints are cleared once no batch is left pending.
+
+        Args:
+            campaign_id: Campaign UUID (checkpoint key).
+            requests: Prepared generation requests.
+
+        Returns:
+            Scored results in request order; failed leads are left out.
+        """
+        self.stats = MessageBatchStats()
+        store = (
+            MessageBatchCheckpointStore(self.config.checkpoint_path)
+            if self.config.checkpoint_path
+            else None
+        )
+        try:
+            return await self._run(campaign_id, requests, store)
+        finally:
+            if store is not None:
+                store.close()
+
+    async def _run(
+        self,
+        campaign_id: str,
+        requests: list[GenerationRequest],
+        store: MessageBatchCheckpointStore | None,
+    ) -> list[dict[str, Any]]:
+        by_lead = {request.lead_id: request for request in requests}
+        cache_keys = {request.lead_id: self._cache_key(request) for request in requests}
+        results: dict[str, dict[str, Any]] = {}
+        batches: dict[str, dict[str, tuple[str, str]]] = {}
+
+        if store is not None:
+            # Checkpoints made for a different prompt are stale
+            results = {
+                lead_id: result
+                for lead_id, (cache_key, result) in store.results(campaign_id).items()
+                if cache_keys.get(lead_id) == cache_key
+            }
+            self.stats.from_checkpoint = len(results)
+            batches = store.pending_batches(campaign_id)
+            self.stats.batches_resumed = len(batches)
+
+        in_flight = {
+            lead_id
+            for requests_map in batches.values()
+            for lead_id, cache_key in requests_map.values()
+            if cache_keys.get(lead_id) == cache_key
+        }
+        todo = []
+        cache = get_generation_cache()
+        for request in requests:
+            if request.lead_id in results or request.lead_id in in_flight:
+                continue
+            # Unchanged inputs reuse the stored reply; only scoring runs again
+            cached = cache.get(self._cache_key(request)) if cache is not None else None
+            if cached is None:
+                todo.append(request)
+                continue
+            results[request.lead_id] = {**complete_generation(request, cached), "cached": True}
+            self.stats.from_cache += 1
+
+        client = self._get_client()
+        size = max(1, self.config.max_requests_per_batch)
+        for start in range(0, len(todo), size):
+            chunk = todo[start : start + size]
+            custom_ids = {
+                f"req-{i}": (request.lead_id, cache_keys[request.lead_id])
+                for i, request in enumerate(chunk)
+            }
+            try:
+                batch = await client.messages.batches.create(
+                    requests=[
+                        self._batch_request(custom_id, request)
+                        for custom_id, request in zip(custom_ids, chunk, strict=True)
+                    ]
+                )
+            except Exception as e:
+                logger.error(f"Failed to submit message batch of {len(chunk)} emails: {e}")
+                self.stats.failed += len(chunk)
+                continue
+            batches[batch.id] = custom_ids
+            if store is not None:
+                store.add_batch(campaign_id, batch.id, custom_ids)
+            self.stats.batches_submitted += 1
+            self.stats.requests_submitted += len(chunk)
+            logger.info(f"Submitted message batch {batch.id} with {len(chunk)} emails")
+
+        await asyncio.gather(
+            *(
+                self._collect(
+                    client, campaign_id, batch_id, custom_ids, by_lead, cache_keys, results, store
+                )
+                for batch_id, custom_ids in batches.items()
+            )
+        )
+
+        if store is not None and self.stats.unfinished_batches == 0:
+            # Nothing left to resume; keep the file from growing across campaigns
+            store.clear(campaign_id)
+
+        logger.info(f"Message batch run for campaign {campaign_id}: {self.stats.to_dict()}")
+        return [results[r.lead_id] for r in requests if r.lead_id in results]
+
+    async def _collect(
+        self,
+        client: "AsyncAnthropic",
+        campaign_id: str,
+        batch_id: str,
+        custom_ids: dict[str, tuple[str, str]],
+        by_lead: dict[str, GenerationRequest],
+        cache_keys: dict[str, str],
+        results: dict[str, dict[str, Any]],
+        store: MessageBatchCheckpointStore | None,
+    ) -> None:
+        """Wait for a batch to end, then score and checkpoint its replies."""
+        deadline = time.monotonic() + self.config.max_wait
+        try:
+            batch = await client.messages.batches.retrieve(batch_id)
+            while batch.processing_status != "ended":
+                if time.monotonic() >= deadline:
+                    logger.warning(
+                        f"Message batch {batch_id} still {batch.processing_status} after "
+                        f"{self.config.max_wait:.0f}s; left pending for the next run"
+                    )
+                    self.stats.unfinished_batches += 1
+                    return
+                await asyncio.sleep(self.config.poll_interval)
+                batch = await client.messages.batches.retrieve(batch_id)
+
+            async for entry in await client.messages.batches.results(batch_id):
+                lead_id, cache_key = custom_ids.get(entry.custom_id, ("", ""))
+                request = by_lead.get(lead_id)
+                if request is None or cache_keys[lead_id] != cache_key:
+                    # Submitted for a lead or prompt this run no longer has
+                    continue
+                if entry.result.type != "succeeded":
+                    logger.warning(f"Message batch request for lead {lead_id} {entry.result.type}")
+                    self.stats.failed += 1
+                    continue
+                message = entry.result.message
+                record_generation_usage(getattr(message, "usage", None))
+                text = "".join(block.text for block in message.content if block.type == "text")
+                try:
+                    result = {**complete_generation(request, text), "cached": False}
+                except Exception as e:
+                    logger.warning(f"Failed to score batched email for lead {lead_id}: {e}")
+                    self.stats.failed += 1
+                    continue
+                cache = get_generation_cache()
+                if cache is not None and is_cacheable_reply(request, text, result):
+                    cache.put(cache_key, text, self.config.model)
+                results[request.lead_id] = result
+                self.stats.succeeded += 1
+                if store is not None:
+                    store.save_result(campaign_id, request.lead_id, cache_key, result)
+        except Exception as e:
+            # Batch stays pending in the checkpoint and is retried next run
+            logger.error(f"Failed to collect message batch {batch_id}: {e}")
+            self.stats.unfinished_batches += 1
+            return
+
+        if store is not None:
+            store.finish_batch(batch_id)
@@ -0,0 +1,306 @@
+"""
+Token-aware adaptive rate limiter for Anthropic Messages API calls.
+
+Anthropic limits each organization on requests, input tokens and output
+tokens per minute, and the numbers differ by usage tier. A request-count
+bucket alone either trips 429s on bursts of long Tier A research prompts
+or leaves capacity unused on short Tier C prompts. This limiter keeps
+three buckets (requests, input tokens, output tokens) that each refill to
+their per-minute limit:
+
+- acquire() reserves an estimate for the request (prompt length / 4 for
+  input, the running average reply size for output) and waits until every
+  bucket can cover it
+- reconcile() corrects the buckets with the response's actual ``usage``
+  (prompt-cache reads do not count against the input-token limit)
+- update_from_headers() adopts the limits and remaining budgets reported
+  in ``anthropic-ratelimit-*`` response headers, so the ceiling follows the
+  account's real tier
+- on_rate_limited() drains the buckets and pauses callers for retry-after
+
+utilization() reports the current use of each bucket, and
+recommended_concurrency() sizes a worker pool from the allowed request
+rate and observed latency (Little's law).
+
+Configuration (environment, read on first use; defaults are Tier 1):
+    ANTHROPIC_REQUESTS_PER_MINUTE=50
+    ANTHROPIC_INPUT_TOKENS_PER_MINUTE=30000
+    ANTHROPIC_OUTPUT_TOKENS_PER_MINUTE=8000
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Rough characters per token for English prompts
+CHARS_PER_TOKEN = 4.0
+
+DEFAULT_REQUESTS_PER_MINUTE = 50.0
+DEFAULT_INPUT_TOKENS_PER_MINUTE = 30_000.0
+DEFAULT_OUTPUT_TOKENS_PER_MINUTE = 8_000.0
+
+# Latency assumed before any response has been observed
+DEFAULT_LATENCY_SECONDS = 10.0
+
+_HEADER_PREFIX = "anthropic-ratelimit-"
+_BUCKET_HEADERS = {
+    "requests": "requests",
+    "input": "input-tokens",
+    "output": "output-tokens",
+}
+
+
+@dataclass
+class TokenRateLimits:
+    """Per-minute request and token limits."""
+
+    requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE
+    input_tokens_per_minute: float = DEFAULT_INPUT_TOKENS_PER_MINUTE
+    output_tokens_per_minute: float = DEFAULT_OUTPUT_TOKENS_PER_MINUTE
+
+    @classmethod
+    def from_env(cls) -> "TokenRateLimits":
+        """Build the limits from ANTHROPIC_*_PER_MINUTE environment variables."""
+        return cls(
+            requests_per_minute=float(
+                os.getenv("ANTHROPIC_REQUESTS_PER_MINUTE", DEFAULT_REQUESTS_PER_MINUTE)
+            ),
+            input_tokens_per_minute=float(
+                os.getenv("ANTHROPIC_INPUT_TOKENS_PER_MINUTE", DEFAULT_INPUT_TOKENS_PER_MINUTE)
+            ),
+            output_tokens_per_minute=float(
+                os.getenv("ANTHROPIC_OUTPUT_TOKENS_PER_MINUTE", DEFAULT_OUTPUT_TOKENS_PER_MINUTE)
+            ),
+        )
+
+
+@dataclass
+class TokenReservation:
+    """Budget taken by one acquire(), corrected later by reconcile()."""
+
+    input_tokens: float
+    output_tokens: float
+    started_at: float
+
+
+class _Bucket:
+    """One per-minute budget; the level may go negative after reconciliation."""
+
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.level = limit
+        self.updated_at = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self.limit / 60.0
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.limit, self.level + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_for(self, amount: float) -> float:
+        # A request larger than the whole budget only needs a full bucket
+        needed = min(amount, self.limit) - self.level
+        return needed / self.rate if needed > 0 and self.rate > 0 else 0.0
+
+
+class TokenAwareRateLimiter:
+    """
+    Request, input-token and output-token budgets for one API account.
+
+    Attributes:
+        max_tokens: Output token cap used to estimate replies until usage is seen.
+        max_concurrency: Upper bound for recommended_concurrency().
+    """
+
+    def __init__(
+        self,
+        limits: TokenRateLimits | None = None,
+        max_tokens: int = 1000,
+        max_concurrency: int = 50,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            limits: Starting limits (defaults to TokenRateLimits.from_env()).
+            max_tokens: Output token cap of the calls being limited.
+            max_concurrency: Upper bound for recommended_concurrency().
+        """
+        limits = limits or TokenRateLimits.from_env()
+        self.max_tokens = max_tokens
+        self.max_concurrency = max_concurrency
+        self._buckets = {
+            "requests": _Bucket(limits.requests_per_minute),
+            "input": _Bucket(limits.input_tokens_per_minute),
+            "output": _Bucket(limits.output_tokens_per_minute),
+        }
+        self._lock: asyncio.Lock | None = None
+        self._blocked_until = 0.0
+        self._avg_output_tokens: float | None = None
+        self._avg_input_tokens: float | None = None
+        self._avg_latency: float | None = None
+        self.in_flight = 0
+        self.rate_limited = 0
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _refill(self, now: float) -> None:
+        for bucket in self._buckets.values():
+            bucket.refill(now)
+
+    @staticmethod
+    def estimate_input_tokens(prompt: str) -> int:
+        """Rough input token count of a prompt."""
+        return max(1, math.ceil(len(prompt) / CHARS_PER_TOKEN))
+
+    def estimate_output_tokens(self) -> float:
+        """Expected reply size: running average once replies were seen."""
+        if self._avg_output_tokens is None:
+            return float(self.max_tokens)
+        return min(float(self.max_tokens), self._avg_output_tokens * 1.2)
+
+    async def acquire(self, input_tokens: float) -> TokenReservation:
+        """
+        Wait until the budgets cover one request, then reserve it.
+
+        Args:
+            input_tokens: Estimated (uncached) input tokens of the request.
+
+        Returns:
+            Reservation to pass to reconcile() with the response usage.
+        """
+        output_tokens = self.estimate_output_tokens()
+        needs = {"requests": 1.0, "input": float(input_tokens), "output": output_tokens}
+
+        # One waiter at a time keeps acquisitions first-come first-served
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = max(
+                    self._blocked_until - now,
+                    *(bucket.wait_for(needs[name]) for name, bucket in self._buckets.items()),
+                )
+                if wait <= 0:
+                    break
+                logger.debug(f"Anthropic rate limiter: waiting {wait:.2f}s for budget")
+                await asyncio.sleep(wait)
+
+            for name, bucket in self._buckets.items():
+                bucket.level -= needs[name]
+            self.in_flight += 1
+
+        return TokenReservation(
+            input_tokens=float(input_tokens),
+            output_tokens=output_tokens,
+            started_at=time.monotonic(),
+        )
+
+    def reconcile(self, reservation: TokenReservation, usage: Any) -> None:
+        """
+        Replace a reservation's estimates with the response's actual usage.
+
+        Args:
+            reservation: Value returned by acquire().
+            usage: Response ``usage`` block, or None if the call failed.
+        """
+        self.in_flight = max(0, self.in_flight - 1)
+        latency = time.monotonic() - reservation.started_at
+        self._avg_latency = _ewma(self._avg_latency, latency)
+        if usage is None:
+            return
+
+        # Cache reads don't count toward the input-token limit
+        actual_input = (getattr(usage, "input_tokens", 0) or 0) + (
+            getattr(usage, "cache_creation_input_tokens", 0) or 0
+        )
+        actual_output = getattr(usage, "output_tokens", 0) or 0
+        self._buckets["input"].level += reservation.input_tokens - actual_input
+        self._buckets["output"].level += reservation.output_tokens - actual_output
+        self._avg_input_tokens = _ewma(self._avg_input_tokens, actual_input)
+        self._avg_output_tokens = _ewma(self._avg_output_tokens, actual_output)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Adopt limits and remaining budgets from anthropic-ratelimit-* headers."""
+        now = time.monotonic()
+        self._refill(now)
+        for name, header in _BUCKET_HEADERS.items():
+            bucket = self._buckets[name]
+            limit = _header_float(headers, f"{_HEADER_PREFIX}{header}-limit")
+            if limit is not None and limit > 0 and limit != bucket.limit:
+                logger.info(f"Anthropic {header} limit is {limit:.0f}/min (was {bucket.limit:.0f})")
+                bucket.limit = limit
+            remaining = _header_float(headers, f"{_HEADER_PREFIX}{header}-remaining")
+            if remaining is not None:
+                bucket.level = min(bucket.level, remaining)
+
+    def on_rate_limited(self, retry_after: float | None = None) -> None:
+        """Drain the budgets and hold callers after a 429 response."""
+        self.rate_limited += 1
+        now = time.monotonic()
+        for bucket in self._buckets.values():
+            bucket.refill(now)
+            bucket.level = min(bucket.level, 0.0)
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def requests_per_second(self) -> float:
+        """Request rate the current limits allow for average-sized requests."""
+        rates = [self._buckets["requests"].rate]
+        avg_input = self._avg_input_tokens
+        if avg_input:
+            rates.append(self._buckets["input"].rate / avg_input)
+        rates.append(self._buckets["output"].rate / max(self.estimate_output_tokens(), 1.0))
+        return min(rates)
+
+    def recommended_concurrency(self) -> int:
+        """Concurrent calls needed to use the allowed rate at the observed latency."""
+        latency = self._avg_latency or DEFAULT_LATENCY_SECONDS
+        return max(1, min(self.max_concurrency, math.ceil(self.requests_per_second() * latency)))
+
+    def utilization(self) -> dict[str, Any]:
+        """Share of each per-minute budget in use, plus in-flight requests."""
+        self._refill(time.monotonic())
+        result: dict[str, Any] = {
+            name: {
+                "limit": bucket.limit,
+                "available": round(max(bucket.level, 0.0), 1),
+                "utilization": round(min(1.0, max(0.0, 1 - bucket.level / bucket.limit)), 4),
+            }
+            for name, bucket in self._buckets.items()
+        }
+        result["in_flight"] = self.in_flight
+        result["rate_limited"] = self.rate_limited
+        result["recommended_concurrency"] = self.recommended_concurrency()
+        return result
+
+
+def _ewma(current: float | None, value: float, alpha: float = 0.2) -> float:
+    return value if current is None else current + alpha * (value - current)
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    """Seconds from a retry-after header, if present."""
+    return _header_float(headers, "retry-after")
@@ -199,6 +199,64 @@ class TierConfig:
         )
 
 
+@dataclass
+class GenerationTokenUsage:
+    """
+    Input/output tokens spent on email generation.
+
+    input_tokens are uncached prompt tokens; prompt-cache writes and reads
+    are counted separately, as the Messages API reports them.
+    """
+
+    requests: int = 0
+    input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def total_input_tokens(self) -> int:
+        """All prompt tokens, cached or not."""
+        return self.input_tokens + self.cache_creation_input_tokens + self.cache_read_input_tokens
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Share of prompt tokens served from the prompt cache."""
+        total = self.total_input_tokens
+        return self.cache_read_input_tokens / total if total else 0.0
+
+    def add(self, usage: Any) -> None:
+        """Add the usage block of one Messages API response."""
+        self.requests += 1
+        self.input_tokens += getattr(usage, "input_tokens", 0) or 0
+        self.cache_creation_input_tokens += getattr(usage, "cache_creation_input_tokens", 0) or 0
+        self.cache_read_input_tokens += getattr(usage, "cache_read_input_tokens", 0) or 0
+        self.output_tokens += getattr(usage, "output_tokens", 0) or 0
+
+    def since(self, baseline: "GenerationTokenUsage") -> "GenerationTokenUsage":
+        """Usage accumulated after a baseline copy was taken."""
+        return GenerationTokenUsage(
+            requests=self.requests - baseline.requests,
+            input_tokens=self.input_tokens - baseline.input_tokens,
+            cache_creation_input_tokens=(
+                self.cache_creation_input_tokens - baseline.cache_creation_input_tokens
+            ),
+            cache_read_input_tokens=self.cache_read_input_tokens - baseline.cache_read_input_tokens,
+            output_tokens=self.output_tokens - baseline.output_tokens,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            "requests": self.requests,
+            "input_tokens": self.input_tokens,
+            "cache_creation_input_tokens": self.cache_creation_input_tokens,
+            "cache_read_input_tokens": self.cache_read_input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_hit_rate": round(self.cache_hit_rate, 4),
+        }
+
+
 @dataclass
 class EmailGenerationResult:
     """Result from email generation agent execution."""
@@ -214,6 +272,9 @@ class EmailGenerationResult:
     framework_usage: dict[str, int] = field(default_factory=dict)
     regeneration_stats: dict[str, int] = field(default_factory=dict)
     lines_saved_to_library: int = 0
+    token_usage: dict[str, Any] = field(default_factory=dict)
+    generation_cache_hits: int = 0
+    generation_cache_misses: int = 0
     error: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
@@ -232,5 +293,10 @@ class EmailGenerationResult:
             "framework_usage": self.framework_usage,
             "regeneration_stats": self.regeneration_stats,
             "lines_saved_to_library": self.lines_saved_to_library,
+            "token_usage": self.token_usage,
+            "generation_cache": {
+                "hits": self.generation_cache_hits,
+                "misses": self.generation_cache_misses,
+            },
             "error": self.error,
         }
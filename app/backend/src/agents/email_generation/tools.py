@@ -12,7 +12,10 @@ All tools return SDK-compliant format: {"content": [...], "is_error": bool}
 Per LEARN-029: Tools must return this exact format.
 
 Integration Resilience:
-- Anthropic API calls use AsyncAnthropic with retry and rate limiting
+- Anthropic API calls use AsyncAnthropic with retry and a token-aware rate
+  limiter (requests, input and output tokens per minute; see rate_limiter.py)
+- The shared prompt prefix is sent with a prompt-cache breakpoint; cached vs
+  uncached input tokens are tracked in get_generation_usage()
 - Per LEARN-030: Module-level singleton for rate limiter
 - Per LEARN-002: Tenacity retry uses tuple syntax for exception types
 """
@@ -23,6 +26,7 @@ import logging
 import os
 import random
 import uuid
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -31,15 +35,25 @@ from claude_agent_sdk import tool
 # Lazy import for anthropic to allow tests to run without it installed
 if TYPE_CHECKING:
     import anthropic
+    from anthropic.types import TextBlockParam
 
 from src.agents.email_generation.frameworks import (
-    build_generation_prompt,
+    build_generation_prompt_parts,
     select_framework_for_tier,
 )
+from src.agents.email_generation.generation_cache import (
+    generation_cache_key,
+    get_generation_cache,
+)
 from src.agents.email_generation.quality_scorer import get_quality_scorer
+from src.agents.email_generation.rate_limiter import (
+    TokenAwareRateLimiter,
+    retry_after_seconds,
+)
 from src.agents.email_generation.schemas import (
     EmailFramework,
     GeneratedEmail,
+    GenerationTokenUsage,
     LeadContext,
     LeadTier,
     PersonalizationLevel,
@@ -55,74 +69,23 @@ logger = logging.getLogger(__name__)
 # Rate Limiter (Module-level Singleton per LEARN-030)
 # =============================================================================
 
-
-class TokenBucketRateLimiter:
-    """
-    Token bucket rate limiter for Anthropic API.
-
-    Anthropic limits:
-    - Tier 1: 50 RPM (requests per minute)
-    - Tier 2: 1000 RPM
-    - Tier 3: 2000 RPM
-
-    Default configured for Tier 1 with safety margin.
-    """
-
-    def __init__(self, rate: float = 40.0, capacity: float = 50.0) -> None:
-        """
-        Initialize rate limiter.
-
-        Args:
-            rate: Tokens added per second (default: 40/60 = 0.67 per second for 40 RPM)
-            capacity: Maximum tokens in bucket
-        """
-        self._rate = rate / 60.0  # Convert to per-second
-        self._capacity = capacity
-        self._tokens = capacity
-        self._last_update = (
-            asyncio.get_event_loop().time() if asyncio.get_event_loop().is_running() else 0.0
-        )
-        self._lock = asyncio.Lock()
-
-    async def acquire(self, tokens: float = 1.0) -> None:
-        """
-        Acquire tokens, waiting if necessary.
-
-        Args:
-            tokens: Number of tokens to acquire (default: 1 for one API call)
-        """
-        async with self._lock:
-            now = asyncio.get_event_loop().time()
-
-            # Refill tokens based on time elapsed
-            elapsed = now - self._last_update
-            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
-            self._last_update = now
-
-            # Wait if not enough tokens
-            if self._tokens < tokens:
-                wait_time = (tokens - self._tokens) / self._rate
-                # Add jitter to prevent thundering herd (per best practices)
-                wait_time += random.uniform(0.1, 0.5)
-                logger.debug(f"Rate limiter: waiting {wait_time:.2f}s for tokens")
-                await asyncio.sleep(wait_time)
-                self._tokens = tokens  # Reset after wait
-
-            self._tokens -= tokens
-
-
 # Module-level singleton (per LEARN-030)
-_anthropic_rate_limiter: TokenBucketRateLimiter | None = None
+_anthropic_rate_limiter: TokenAwareRateLimiter | None = None
 
 
-def _get_anthropic_rate_limiter() -> TokenBucketRateLimiter:
+def _get_anthropic_rate_limiter() -> TokenAwareRateLimiter:
     """Get or create the Anthropic rate limiter singleton."""
     global _anthropic_rate_limiter
     if _anthropic_rate_limiter is None:
-        _anthropic_rate_limiter = TokenBucketRateLimiter(rate=40.0, capacity=50.0)
+        _anthropic_rate_limiter = TokenAwareRateLimiter(max_tokens=GENERATION_MAX_TOKENS)
     return _anthropic_rate_limiter
 
 
+def get_anthropic_rate_limiter() -> TokenAwareRateLimiter:
+    """The limiter shared by all generation calls (e.g. to read utilization())."""
+    return _get_anthropic_rate_limiter()
+
+
 # Module-level singleton for async client (per LEARN-030)
 _anthropic_client: "AsyncAnthropic | None" = None
 
@@ -145,6 +108,33 @@ def _get_anthropic_client(api_key: str) -> "anthropic.AsyncAnthropic":
     return _anthropic_client
 
 
+# Process-wide token counters; callers diff a copy taken before a run
+_generation_usage = GenerationTokenUsage()
+
+
+def get_generation_usage() -> GenerationTokenUsage:
+    """Token usage of every generation call in this process so far."""
+    return _generation_usage
+
+
+def record_generation_usage(usage: Any) -> None:
+    """Add one Messages API response's usage block to the process counters."""
+    if usage is not None:
+        _generation_usage.add(usage)
+
+
+def build_system_prompt(prompt_prefix: str) -> "list[TextBlockParam]":
+    """
+    System blocks carrying the shared instructions with a prompt-cache breakpoint.
+
+    Only the instructions shared by every lead with the same framework,
+    persona and tier sit before the breakpoint; the per-lead block goes in the
+    user message. Prefixes shorter than the model's minimum cacheable length
+    (1024 tokens for Sonnet) are sent normally and simply not cached.
+    """
+    return [{"type": "text", "text": prompt_prefix, "cache_control": {"type": "ephemeral"}}]
+
+
 # =============================================================================
 # Retry-wrapped Anthropic API Call
 # =============================================================================
@@ -168,17 +158,19 @@ async def _call_anthropic_with_retry(
     max_tokens: int = 1000,
     temperature: float = 0.7,
     max_retries: int = 3,
+    prompt_prefix: str | None = None,
 ) -> str:
     """
     Call Anthropic API with retry and rate limiting.
 
     Args:
         client: AsyncAnthropic client
-        prompt: User message content
+        prompt: User message content (the per-lead suffix when prompt_prefix is given)
         model: Model to use
         max_tokens: Maximum response tokens
         temperature: Sampling temperature
         max_retries: Maximum retry attempts
+        prompt_prefix: Shared instructions sent as a cached system block
 
     Returns:
         Response text from the model
@@ -190,24 +182,43 @@ async def _call_anthropic_with_retry(
 
     retryable_exceptions = _get_anthropic_retryable_exceptions()
     last_exception: Exception | None = None
+    system: list[TextBlockParam] | anthropic_module.NotGiven = (
+        build_system_prompt(prompt_prefix) if prompt_prefix else anthropic_module.NOT_GIVEN
+    )
 
     for attempt in range(max_retries):
         try:
-            # Acquire rate limit token
+            # Reserve request and estimated token budget
             rate_limiter = _get_anthropic_rate_limiter()
-            await rate_limiter.acquire()
+            reservation = await rate_limiter.acquire(
+                rate_limiter.estimate_input_tokens(f"{prompt_prefix or ''}{prompt}")
+            )
 
             logger.debug(
                 f"Calling Anthropic API (attempt {attempt + 1}/{max_retries}) "
                 f"with model={model}, max_tokens={max_tokens}"
             )
 
-            message = await client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            usage: Any = None
+            try:
+                raw = await client.messages.with_raw_response.create(
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system=system,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                rate_limiter.update_from_headers(raw.headers)
+                message = raw.parse()
+                usage = getattr(message, "usage", None)
+            except anthropic_module.RateLimitError as e:
+                headers = e.response.headers
+                rate_limiter.update_from_headers(headers)
+                rate_limiter.on_rate_limited(retry_after_seconds(headers))
+                raise
+            finally:
+                rate_limiter.reconcile(reservation, usage)
+            record_generation_usage(usage)
 
             # Extract text from response
             if message.content and len(message.content) > 0:
@@ -348,21 +359,50 @@ async def load_campaign_context(args: dict[str, Any]) -> dict[str, Any]:
 # Tool: Generate Email
 # =============================================================================
 
-
-async def generate_email_impl(args: dict[str, Any]) -> dict[str, Any]:
+GENERATION_MODEL = "claude-sonnet-4-20250514"
+GENERATION_MAX_TOKENS = 1000
+GENERATION_TEMPERATURE = 0.7
+
+# Minimum quality score per tier before an email should be regenerated
+QUALITY_THRESHOLDS = {"A": 70, "B": 60, "C": 50}
+
+
+@dataclass
+class GenerationRequest:
+    """A lead's generation prompt plus the context needed to score the reply."""
+
+    lead_id: str
+    campaign_id: str
+    first_name: str
+    last_name: str
+    title: str
+    company_name: str
+    tier: str
+    framework: EmailFramework
+    personalization_level: PersonalizationLevel
+    prompt_prefix: str
+    prompt_suffix: str
+    lead_research: dict[str, Any] | None = None
+    company_research: dict[str, Any] | None = None
+    company_research_id: str | None = None
+    lead_research_id: str | None = None
+
+    @property
+    def prompt(self) -> str:
+        """The complete prompt."""
+        return f"{self.prompt_prefix}\n\n{self.prompt_suffix}"
+
+
+def prepare_generation_request(args: dict[str, Any]) -> GenerationRequest:
     """
-    Internal implementation of email generation.
-
-    This function is called by both the SDK tool and DirectEmailGenerator.
+    Build the generation prompt for one lead.
 
     Args:
-        args: Dictionary with lead details and context.
+        args: Same dictionary generate_email_impl takes.
 
     Returns:
-        SDK-compliant response with generated email.
+        GenerationRequest ready to send to the Messages API.
     """
-    lead_id = args.get("lead_id")
-    campaign_id = args.get("campaign_id")
     first_name = args.get("first_name", "")
     last_name = args.get("last_name", "")
     title = args.get("title", "")
@@ -374,160 +414,258 @@ async def generate_email_impl(args: dict[str, Any]) -> dict[str, Any]:
     framework = args.get("framework")
     lead_research_json = args.get("lead_research_json")
     company_research_json = args.get("company_research_json")
-    company_research_id = args.get("company_research_id")
-    lead_research_id = args.get("lead_research_id")
 
-    if not lead_id or not campaign_id:
-        return {
-            "content": [{"type": "text", "text": "Error: lead_id and campaign_id are required"}],
-            "is_error": True,
-        }
+    # Parse research data
+    lead_research = json.loads(lead_research_json) if lead_research_json else None
+    company_research = json.loads(company_research_json) if company_research_json else None
+
+    # Determine framework
+    tier = lead_tier.upper() if lead_tier else "C"
+    email_framework = (
+        EmailFramework(framework.lower()) if framework else select_framework_for_tier(tier)
+    )
+
+    # Determine personalization level
+    personalization_map = {
+        "A": PersonalizationLevel.HYPER_PERSONALIZED,
+        "B": PersonalizationLevel.PERSONALIZED,
+        "C": PersonalizationLevel.SEMI_PERSONALIZED,
+    }
+    personalization_level = personalization_map.get(tier, PersonalizationLevel.SEMI_PERSONALIZED)
+
+    # Determine max words
+    max_words_map = {"A": 150, "B": 120, "C": 100}
+    max_words = max_words_map.get(tier, 100)
+
+    # Build lead context
+    lead_context = {
+        "first_name": first_name,
+        "last_name": last_name,
+        "title": title,
+        "company_name": company_name,
+        "lead_tier": tier,
+    }
+
+    # Build persona context
+    persona_context = {
+        "challenges": [c.strip() for c in persona_challenges.split(",") if c.strip()],
+        "goals": [g.strip() for g in persona_goals.split(",") if g.strip()],
+        "messaging_tone": messaging_tone,
+    }
+
+    # Build niche context (simplified)
+    niche_context = {
+        "pain_points": persona_context["challenges"],
+        "value_propositions": [],
+    }
+
+    # Build prompt (shared prefix + per-lead suffix)
+    prompt = build_generation_prompt_parts(
+        framework=email_framework,
+        lead_context=lead_context,
+        persona_context=persona_context,
+        niche_context=niche_context,
+        lead_research=lead_research,
+        company_research=company_research,
+        max_words=max_words,
+        personalization_level=personalization_level.value,
+    )
+
+    return GenerationRequest(
+        lead_id=args.get("lead_id", ""),
+        campaign_id=args.get("campaign_id", ""),
+        first_name=first_name,
+        last_name=last_name,
+        title=title,
+        company_name=company_name,
+        tier=tier,
+        framework=email_framework,
+        personalization_level=personalization_level,
+        prompt_prefix=prompt.prefix,
+        prompt_suffix=prompt.suffix,
+        lead_research=lead_research,
+        company_research=company_research,
+        company_research_id=args.get("company_research_id"),
+        lead_research_id=args.get("lead_research_id"),
+    )
+
+
+def _extract_json_object(response_text: str) -> str | None:
+    """Text from the first "{" to the last "}" of a reply, or None."""
+    start = response_text.find("{")
+    end = response_text.rfind("}") + 1
+    return response_text[start:end] if start >= 0 and end > start else None
+
 
+def is_cacheable_reply(
+    request: GenerationRequest, response_text: str, result: dict[str, Any]
+) -> bool:
+    """
+    Whether a scored reply may be stored in the generation cache.
+
+    Only replies that parsed as JSON and met the tier's quality threshold are
+    cached. A weak or malformed reply is what triggers regeneration, and the
+    cache key does not change between attempts, so caching it would hand the
+    same reply back to every retry.
+
+    Args:
+        request: The request the reply answers.
+        response_text: Raw model output.
+        result: complete_generation() result for the reply.
+    """
+    json_str = _extract_json_object(response_text)
+    if json_str is None:
+        return False
     try:
-        # Get API key (prefer backup to avoid SDK conflict per LEARN-001)
-        api_key = os.environ.get("ANTHROPIC_API_KEY_BACKUP") or os.environ.get("ANTHROPIC_API_KEY")
+        json.loads(json_str)
+    except json.JSONDecodeError:
+        return False
+    threshold = QUALITY_THRESHOLDS.get(request.tier, QUALITY_THRESHOLDS["C"])
+    return bool(result["quality_score"] >= threshold)
 
-        if not api_key:
-            return {
-                "content": [{"type": "text", "text": "ANTHROPIC_API_KEY not configured"}],
-                "is_error": True,
-            }
 
-        # Parse research data
-        lead_research = json.loads(lead_research_json) if lead_research_json else None
-        company_research = json.loads(company_research_json) if company_research_json else None
+def complete_generation(request: GenerationRequest, response_text: str) -> dict[str, Any]:
+    """
+    Parse a model reply into a GeneratedEmail and score it.
 
-        # Determine framework
-        tier = lead_tier.upper() if lead_tier else "C"
-        email_framework = (
-            EmailFramework(framework.lower()) if framework else select_framework_for_tier(tier)
-        )
+    Args:
+        request: The request the reply answers.
+        response_text: Raw model output.
 
-        # Determine personalization level
-        personalization_map = {
-            "A": PersonalizationLevel.HYPER_PERSONALIZED,
-            "B": PersonalizationLevel.PERSONALIZED,
-            "C": PersonalizationLevel.SEMI_PERSONALIZED,
-        }
-        personalization_level = personalization_map.get(
-            tier, PersonalizationLevel.SEMI_PERSONALIZED
-        )
+    Returns:
+        Result dict with lead_id, email, quality_score, score_breakdown, framework.
+    """
+    first_name = request.first_name
 
-        # Determine max words
-        max_words_map = {"A": 150, "B": 120, "C": 100}
-        max_words = max_words_map.get(tier, 100)
-
-        # Build lead context
-        lead_context = {
-            "first_name": first_name,
-            "last_name": last_name,
-            "title": title,
-            "company_name": company_name,
-            "lead_tier": tier,
+    # Extract JSON from response (per LEARN-016: JSON parsing returns Any)
+    email_data: dict[str, Any] = {}
+    try:
+        json_str = _extract_json_object(response_text)
+        if json_str is not None:
+            email_data = json.loads(json_str)
+    except json.JSONDecodeError as je:
+        logger.warning(f"Failed to parse JSON from response: {je}")
+        # Fallback: create structured email from text
+        email_data = {
+            "subject_line": f"Quick question for {first_name}",
+            "opening_line": response_text[:100] if response_text else "",
+            "body": response_text[:500] if response_text else "",
+            "cta": "Would you be open to a quick chat?",
+            "full_email": response_text[:600] if response_text else "",
         }
 
-        # Build persona context
-        persona_context = {
-            "challenges": [c.strip() for c in persona_challenges.split(",") if c.strip()],
-            "goals": [g.strip() for g in persona_goals.split(",") if g.strip()],
-            "messaging_tone": messaging_tone,
-        }
+    # Create GeneratedEmail object
+    generated = GeneratedEmail(
+        lead_id=request.lead_id,
+        campaign_id=request.campaign_id,
+        subject_line=email_data.get("subject_line", "")[:255],
+        opening_line=email_data.get("opening_line", ""),
+        body=email_data.get("body", ""),
+        cta=email_data.get("cta", ""),
+        full_email=email_data.get("full_email", ""),
+        framework=request.framework,
+        personalization_level=request.personalization_level,
+        company_research_id=request.company_research_id,
+        lead_research_id=request.lead_research_id,
+        generation_prompt=request.prompt[:2000],  # Truncate for storage
+    )
 
-        # Build niche context (simplified)
-        niche_context = {
-            "pain_points": persona_context["challenges"],
-            "value_propositions": [],
-        }
+    # Score the email
+    lead_ctx = LeadContext(
+        lead_id=request.lead_id,
+        first_name=first_name,
+        last_name=request.last_name,
+        title=request.title,
+        company_name=request.company_name,
+        company_domain=None,
+        lead_tier=LeadTier(request.tier),
+        lead_score=0,
+        lead_research=request.lead_research,
+        company_research=request.company_research,
+    )
 
-        # Build prompt
-        prompt = build_generation_prompt(
-            framework=email_framework,
-            lead_context=lead_context,
-            persona_context=persona_context,
-            niche_context=niche_context,
-            lead_research=lead_research,
-            company_research=company_research,
-            max_words=max_words,
-            personalization_level=personalization_level.value,
-        )
+    scorer = get_quality_scorer()
+    quality_score = scorer.score_email(generated, lead_ctx)
+    generated.score_breakdown = quality_score
+    generated.quality_score = quality_score.total_score
 
-        # Call Claude API with retry and rate limiting (using AsyncAnthropic)
-        client = _get_anthropic_client(api_key)
-        response_text = await _call_anthropic_with_retry(
-            client=client,
-            prompt=prompt,
-            model="claude-sonnet-4-20250514",
-            max_tokens=1000,
-            temperature=0.7,
-        )
+    logger.info(
+        f"Generated email for {first_name} {request.last_name}: "
+        f"score={quality_score.total_score:.0f}, framework={request.framework.value}"
+    )
 
-        # Extract JSON from response (per LEARN-016: JSON parsing returns Any)
-        email_data: dict[str, Any] = {}
-        try:
-            # Try to find JSON in response
-            start = response_text.find("{")
-            end = response_text.rfind("}") + 1
-            if start >= 0 and end > start:
-                json_str = response_text[start:end]
-                email_data = json.loads(json_str)
-        except json.JSONDecodeError as je:
-            logger.warning(f"Failed to parse JSON from response: {je}")
-            # Fallback: create structured email from text
-            email_data = {
-                "subject_line": f"Quick question for {first_name}",
-                "opening_line": response_text[:100] if response_text else "",
-                "body": response_text[:500] if response_text else "",
-                "cta": "Would you be open to a quick chat?",
-                "full_email": response_text[:600] if response_text else "",
-            }
+    return {
+        "lead_id": request.lead_id,
+        "email": generated.to_dict(),
+        "quality_score": quality_score.total_score,
+        "score_breakdown": quality_score.to_dict(),
+        "framework": request.framework.value,
+    }
 
-        # Create GeneratedEmail object
-        generated = GeneratedEmail(
-            lead_id=lead_id,
-            campaign_id=campaign_id,
-            subject_line=email_data.get("subject_line", "")[:255],
-            opening_line=email_data.get("opening_line", ""),
-            body=email_data.get("body", ""),
-            cta=email_data.get("cta", ""),
-            full_email=email_data.get("full_email", ""),
-            framework=email_framework,
-            personalization_level=personalization_level,
-            company_research_id=company_research_id,
-            lead_research_id=lead_research_id,
-            generation_prompt=prompt[:2000],  # Truncate for storage
-        )
 
-        # Score the email
-        lead_ctx = LeadContext(
-            lead_id=lead_id,
-            first_name=first_name,
-            last_name=last_name,
-            title=title,
-            company_name=company_name,
-            company_domain=None,
-            lead_tier=LeadTier(tier),
-            lead_score=0,
-            lead_research=lead_research,
-            company_research=company_research,
-        )
+async def generate_email_impl(args: dict[str, Any]) -> dict[str, Any]:
+    """
+    Internal implementation of email generation.
 
-        scorer = get_quality_scorer()
-        quality_score = scorer.score_email(generated, lead_ctx)
-        generated.score_breakdown = quality_score
-        generated.quality_score = quality_score.total_score
+    This function is called by both the SDK tool and DirectEmailGenerator.
 
-        result = {
-            "lead_id": lead_id,
-            "email": generated.to_dict(),
-            "quality_score": quality_score.total_score,
-            "score_breakdown": quality_score.to_dict(),
-            "framework": email_framework.value,
+    Args:
+        args: Dictionary with lead details and context.
+
+    Returns:
+        SDK-compliant response with generated email.
+    """
+    lead_id = args.get("lead_id")
+    campaign_id = args.get("campaign_id")
+
+    if not lead_id or not campaign_id:
+        return {
+            "content": [{"type": "text", "text": "Error: lead_id and campaign_id are required"}],
+            "is_error": True,
         }
 
-        logger.info(
-            f"Generated email for {first_name} {last_name}: "
-            f"score={quality_score.total_score:.0f}, framework={email_framework.value}"
+    try:
+        # Get API key (prefer backup to avoid SDK conflict per LEARN-001)
+        api_key = os.environ.get("ANTHROPIC_API_KEY_BACKUP") or os.environ.get("ANTHROPIC_API_KEY")
+
+        if not api_key:
+            return {
+                "content": [{"type": "text", "text": "ANTHROPIC_API_KEY not configured"}],
+                "is_error": True,
+            }
+
+        request = prepare_generation_request(args)
+
+        # Unchanged inputs reuse the stored reply; only scoring runs again
+        cache = get_generation_cache()
+        cache_key = generation_cache_key(
+            request.prompt_prefix,
+            request.prompt_suffix,
+            GENERATION_MODEL,
+            GENERATION_MAX_TOKENS,
+            GENERATION_TEMPERATURE,
         )
+        response_text = cache.get(cache_key) if cache is not None else None
+
+        if response_text is None:
+            # Call Claude API with retry and rate limiting (using AsyncAnthropic)
+            client = _get_anthropic_client(api_key)
+            response_text = await _call_anthropic_with_retry(
+                client=client,
+                prompt=request.prompt_suffix,
+                prompt_prefix=request.prompt_prefix,
+                model=GENERATION_MODEL,
+                max_tokens=GENERATION_MAX_TOKENS,
+                temperature=GENERATION_TEMPERATURE,
+            )
+            cached = False
+        else:
+            cached = True
+
+        result = complete_generation(request, response_text)
+        result["cached"] = cached
+        if cache is not None and not cached and is_cacheable_reply(request, response_text, result):
+            cache.put(cache_key, response_text, GENERATION_MODEL)
 
         return {
             "content": [{"type": "text", "text": json.dumps(result)}],
@@ -667,8 +805,7 @@ async def score_email_quality(args: dict[str, Any]) -> dict[str, Any]:
         quality_score = scorer.score_email(email, lead_ctx)
 
         # Get threshold for tier
-        threshold_map = {"A": 70, "B": 60, "C": 50}
-        threshold = threshold_map.get(tier, 50)
+        threshold = QUALITY_THRESHOLDS.get(tier, QUALITY_THRESHOLDS["C"])
 
         result = {
             "total_score": quality_score.total_score,
@@ -13,6 +13,7 @@ from src.agents.email_sending.schemas import (
     BatchResult,
     EmailSendingResult,
     SendingProgress,
+    UploadThroughput,
 )
 
 __all__ = [
@@ -21,4 +22,5 @@ __all__ = [
     "EmailSendingResult",
     "SendingProgress",
     "BatchResult",
+    "UploadThroughput",
 ]
@@ -32,6 +32,8 @@ import json
 import logging
 import os
 import re
+import time
+from collections.abc import AsyncIterable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -46,7 +48,11 @@ from claude_agent_sdk import (
 )
 from claude_agent_sdk.types import AssistantMessage, ResultMessage, TextBlock
 
-from src.agents.email_sending.schemas import EmailSendingResult, SendingProgress
+from src.agents.email_sending.schemas import (
+    EmailSendingResult,
+    SendingProgress,
+    UploadThroughput,
+)
 from src.agents.email_sending.tools import (
     check_resume_state,
     get_campaign_cost,
@@ -57,6 +63,8 @@ from src.agents.email_sending.tools import (
     upload_to_instantly,
     verify_upload,
 )
+from src.agents.email_sending.upload_window import AdaptiveUploadWindow
+from src.integrations.instantly import InstantlyClient, InstantlyError
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +89,12 @@ class EmailSendingConfig:
     budget_alert_percent: int = 80
     send_tier_a_first: bool = True
     verify_tolerance_percent: float = 5.0
+    # Streamed uploads (DirectEmailUploader.upload_campaign)
+    stream_page_size: int = 1000
+    max_in_flight_batches: int = 20
+    rate_limit_backoff_seconds: float = 2.0
+    max_rate_limit_retries: int = 8
+    max_upload_attempts: int = 5
 
 
 # =============================================================================
@@ -438,6 +452,7 @@ class DirectEmailUploader:
         """Initialize the direct uploader."""
         self.config = config or EmailSendingConfig()
         self.name = "direct_email_uploader"
+        self.last_upload_stats: UploadThroughput | None = None
         logger.info(f"Initialized {self.name}")
 
     async def upload_batch(
@@ -530,6 +545,210 @@ class DirectEmailUploader:
 
         return results
 
+    async def upload_campaign(
+        self,
+        instantly_campaign_id: str,
+        campaign_id: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Stream a campaign's pending leads from the database into Instantly.
+
+        Batches are read page by page in tier priority order and uploaded as
+        they arrive, so the first upload starts after one page is loaded.
+
+        Args:
+            instantly_campaign_id: Instantly campaign UUID.
+            campaign_id: Internal campaign UUID.
+
+        Returns:
+            List of upload results in batch order (see upload_stream).
+        """
+        from src.agents.email_sending.tools import stream_upload_batches
+
+        batches = stream_upload_batches(
+            campaign_id,
+            batch_size=self.config.batch_size,
+            max_leads=self.config.max_leads_per_run,
+            page_size=self.config.stream_page_size,
+        )
+        return await self.upload_stream(instantly_campaign_id, campaign_id, batches)
+
+    async def upload_stream(
+        self,
+        instantly_campaign_id: str,
+        campaign_id: str,
+        batches: AsyncIterable[list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """
+        Upload batches continuously through an adaptive in-flight window.
+
+        A new batch starts as soon as a slot frees up instead of waiting for
+        a fixed group and sleep. The window starts at max_parallel_batches,
+        grows while Instantly accepts uploads and halves on 429 (see
+        AdaptiveUploadWindow); rate-limited batches are retried rather than
+        counted as failures. At most one window's worth of batches is read
+        ahead of the uploads. Throughput is kept in last_upload_stats.
+
+        Args:
+            instantly_campaign_id: Instantly campaign UUID.
+            campaign_id: Internal campaign UUID.
+            batches: Async iterable of lead batches (e.g. stream_upload_batches).
+
+        Returns:
+            List of upload results in batch order.
+        """
+        from src.agents.email_sending.tools import _get_instantly_client
+
+        # 429s must reach the window, so the client itself does not retry
+        client = _get_instantly_client(max_retries=0)
+        window = AdaptiveUploadWindow(
+            initial=self.config.max_parallel_batches,
+            maximum=max(self.config.max_in_flight_batches, self.config.max_parallel_batches),
+            backoff_seconds=self.config.rate_limit_backoff_seconds,
+        )
+        stats = UploadThroughput()
+        results: dict[int, dict[str, Any]] = {}
+        running: set[asyncio.Task[dict[str, Any]]] = set()
+        started = time.monotonic()
+
+        def collect(done: set[asyncio.Task[dict[str, Any]]]) -> None:
+            for task in done:
+                result = task.result()
+                results[result["batch_number"]] = result
+                if result.get("success"):
+                    stats.batches_uploaded += 1
+                    stats.leads_uploaded += result["leads_uploaded"]
+                    stats.cost_incurred += result["cost_incurred"]
+                else:
+                    stats.batches_failed += 1
+                stats.leads_failed += result.get("leads_failed", 0)
+                stats.retries += result.get("attempts", 1) - 1
+
+        batch_number = 0
+        async for leads in batches:
+            while len(running) >= window.size:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                collect(done)
+            batch_number += 1
+            running.add(
+                asyncio.create_task(
+                    self._upload_windowed_batch(
+                        client, window, instantly_campaign_id, campaign_id, leads, batch_number
+                    )
+                )
+            )
+
+        if running:
+            done, _ = await asyncio.wait(running)
+            collect(done)
+
+        stats.elapsed_seconds = time.monotonic() - started
+        stats.rate_limited = window.rate_limited
+        stats.peak_in_flight = window.peak_in_flight
+        stats.peak_window = window.peak_size
+        stats.final_window = window.size
+        self.last_upload_stats = stats
+        logger.info(
+            f"Uploaded {stats.leads_uploaded} leads in {stats.batches_uploaded} batches "
+            f"({stats.batches_failed} failed) in {stats.elapsed_seconds:.1f}s: "
+            f"{stats.leads_per_second:.1f} leads/s, {stats.rate_limited} rate limited, "
+            f"peak window {stats.peak_window}"
+        )
+        return [results[number] for number in sorted(results)]
+
+    async def _upload_windowed_batch(
+        self,
+        client: InstantlyClient,
+        window: AdaptiveUploadWindow,
+        instantly_campaign_id: str,
+        campaign_id: str,
+        leads: list[dict[str, Any]],
+        batch_number: int,
+    ) -> dict[str, Any]:
+        """Upload one batch inside the window, retrying 429s and transient errors."""
+        from src.agents.email_sending.tools import (
+            _instantly_circuit_breaker,
+            bulk_add_batch,
+            record_uploaded_batch,
+        )
+
+        attempts = 0
+        rate_limited = 0
+        errors = 0
+        while True:
+            if not _instantly_circuit_breaker.can_proceed():
+                return self._failed_batch(
+                    batch_number,
+                    leads,
+                    attempts,
+                    "Circuit breaker open - Instantly API unavailable",
+                )
+
+            await window.acquire()
+            attempts += 1
+            try:
+                result = await bulk_add_batch(client, instantly_campaign_id, leads)
+            except (ConnectionError, TimeoutError, InstantlyError) as e:
+                if isinstance(e, InstantlyError) and e.status_code == 429:
+                    rate_limited += 1
+                    await window.release(rate_limited=True, retry_after=_retry_after(e))
+                    if rate_limited > self.config.max_rate_limit_retries:
+                        return self._failed_batch(batch_number, leads, attempts, str(e))
+                    continue
+
+                await window.release()
+                _instantly_circuit_breaker.record_failure()
+                errors += 1
+                if errors >= self.config.max_upload_attempts:
+                    logger.error(f"Batch {batch_number} failed after {attempts} attempts: {e}")
+                    return self._failed_batch(batch_number, leads, attempts, str(e))
+                delay = min(self.config.rate_limit_backoff_seconds * (2 ** (errors - 1)), 120.0)
+                logger.warning(f"Batch {batch_number} attempt {attempts} failed, retrying: {e}")
+                await asyncio.sleep(delay)
+                continue
+            except Exception as e:
+                await window.release()
+                _instantly_circuit_breaker.record_failure()
+                logger.error(f"Failed to upload batch {batch_number}: {e}")
+                return self._failed_batch(batch_number, leads, attempts, str(e))
+
+            await window.release()
+            _instantly_circuit_breaker.record_success()
+            leads_uploaded, cost = await record_uploaded_batch(
+                campaign_id=campaign_id,
+                instantly_campaign_id=instantly_campaign_id,
+                batch_number=batch_number,
+                leads=leads,
+                result=result,
+            )
+            return {
+                "success": True,
+                "batch_number": batch_number,
+                "leads_uploaded": leads_uploaded,
+                "leads_failed": result["failed_count"],
+                "created_count": result["created_count"],
+                "updated_count": result["updated_count"],
+                "cost_incurred": cost,
+                "attempts": attempts,
+            }
+
+    @staticmethod
+    def _failed_batch(
+        batch_number: int, leads: list[dict[str, Any]], attempts: int, error: str
+    ) -> dict[str, Any]:
+        return {
+            "error": error,
+            "batch_number": batch_number,
+            "leads_failed": len(leads),
+            "attempts": attempts,
+        }
+
+
+def _retry_after(error: InstantlyError) -> float | None:
+    """Retry-after seconds carried by the RateLimitError behind an InstantlyError."""
+    retry_after = getattr(error.__cause__, "retry_after", None)
+    return float(retry_after) if retry_after is not None else None
+
 
 # =============================================================================
 # Main Entry Point
@@ -39,6 +39,47 @@ class BatchResult:
         }
 
 
+@dataclass
+class UploadThroughput:
+    """Throughput of one streamed upload run."""
+
+    batches_uploaded: int = 0
+    batches_failed: int = 0
+    leads_uploaded: int = 0
+    leads_failed: int = 0
+    rate_limited: int = 0
+    retries: int = 0
+    peak_in_flight: int = 0
+    peak_window: int = 0
+    final_window: int = 0
+    cost_incurred: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def leads_per_second(self) -> float:
+        """Leads accepted by Instantly per second of wall-clock time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.leads_uploaded / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "batches_uploaded": self.batches_uploaded,
+            "batches_failed": self.batches_failed,
+            "leads_uploaded": self.leads_uploaded,
+            "leads_failed": self.leads_failed,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+            "peak_in_flight": self.peak_in_flight,
+            "peak_window": self.peak_window,
+            "final_window": self.final_window,
+            "cost_incurred": round(self.cost_incurred, 4),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "leads_per_second": round(self.leads_per_second, 2),
+        }
+
+
 @dataclass
 class SendingProgress:
     """Progress tracking for email sending operation."""
@@ -15,6 +15,7 @@ import json
 import logging
 import os
 import random
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
@@ -54,12 +55,12 @@ _cost_tracker: dict[str, float] = {}
 # =============================================================================
 
 
-def _get_instantly_client() -> InstantlyClient:
+def _get_instantly_client(max_retries: int = 3) -> InstantlyClient:
     """Get Instantly client with API key from environment."""
     api_key = os.getenv("INSTANTLY_API_KEY")
     if not api_key:
         raise ValueError("INSTANTLY_API_KEY environment variable not set")
-    return InstantlyClient(api_key=api_key)
+    return InstantlyClient(api_key=api_key, max_retries=max_retries)
 
 
 def _format_lead_for_instantly(
@@ -265,6 +266,45 @@ async def load_leads(args: dict[str, Any]) -> dict[str, Any]:
     return await load_leads_impl(args)
 
 
+# Columns loaded for each lead to upload (lead fields + its generated email)
+_UPLOAD_LEAD_COLUMNS = """
+    l.id, l.email, l.first_name, l.last_name,
+    l.company_name, l.lead_tier, l.generated_email_id, l.lead_score,
+    ge.subject_line, ge.full_email, ge.quality_score
+"""
+
+_UPLOAD_LEAD_FILTERS = """
+    l.campaign_id = :campaign_id
+    AND l.email_status = 'valid'
+    AND l.email_generation_status = 'generated'
+"""
+
+_EXCLUDE_UPLOADED_CLAUSE = "AND (l.sending_status IS NULL OR l.sending_status = 'pending')"
+
+# Tier priority (A > B > C; unknown tiers upload with C)
+_TIER_RANK_SQL = "CASE UPPER(COALESCE(l.lead_tier, 'C')) WHEN 'A' THEN 0 WHEN 'B' THEN 1 ELSE 2 END"
+_SCORE_KEY_SQL = "COALESCE(l.lead_score, -1)"
+
+
+def _lead_from_row(row: Any) -> dict[str, Any]:
+    """Map a leads/generated_emails row to the lead dict used for uploads."""
+    return {
+        "id": str(row.id),
+        "email": row.email,
+        "first_name": row.first_name,
+        "last_name": row.last_name,
+        "company_name": row.company_name,
+        "lead_tier": row.lead_tier or "C",
+        "generated_email_id": str(row.generated_email_id) if row.generated_email_id else None,
+        "lead_score": row.lead_score,
+        "email_data": {
+            "subject_line": row.subject_line,
+            "full_email": row.full_email,
+            "quality_score": row.quality_score,
+        },
+    }
+
+
 async def load_leads_impl(args: dict[str, Any]) -> dict[str, Any]:
     """Implementation for load_leads."""
     campaign_id = args.get("campaign_id", "")
@@ -279,21 +319,14 @@ async def load_leads_impl(args: dict[str, Any]) -> dict[str, Any]:
             from sqlalchemy import text
 
             # Build query with filters
-            exclude_clause = ""
-            if exclude_uploaded:
-                exclude_clause = "AND (sending_status IS NULL OR sending_status = 'pending')"
+            exclude_clause = _EXCLUDE_UPLOADED_CLAUSE if exclude_uploaded else ""
 
             # exclude_clause is hardcoded string, not user input - safe
             query = f"""
-                SELECT
-                    l.id, l.email, l.first_name, l.last_name,
-                    l.company_name, l.lead_tier, l.generated_email_id, l.lead_score,
-                    ge.subject_line, ge.full_email, ge.quality_score
+                SELECT {_UPLOAD_LEAD_COLUMNS}
                 FROM leads l
                 LEFT JOIN generated_emails ge ON l.generated_email_id = ge.id
-                WHERE l.campaign_id = :campaign_id
-                  AND l.email_status = 'valid'
-                  AND l.email_generation_status = 'generated'
+                WHERE {_UPLOAD_LEAD_FILTERS}
                   {exclude_clause}
                 ORDER BY l.lead_score DESC, l.lead_tier ASC
                 LIMIT :max_leads
@@ -307,23 +340,7 @@ async def load_leads_impl(args: dict[str, Any]) -> dict[str, Any]:
             # Group by tier
             leads_by_tier: dict[str, list[dict[str, Any]]] = {"A": [], "B": [], "C": []}
             for row in rows:
-                lead_data = {
-                    "id": str(row.id),
-                    "email": row.email,
-                    "first_name": row.first_name,
-                    "last_name": row.last_name,
-                    "company_name": row.company_name,
-                    "lead_tier": row.lead_tier or "C",
-                    "generated_email_id": str(row.generated_email_id)
-                    if row.generated_email_id
-                    else None,
-                    "lead_score": row.lead_score,
-                    "email_data": {
-                        "subject_line": row.subject_line,
-                        "full_email": row.full_email,
-                        "quality_score": row.quality_score,
-                    },
-                }
+                lead_data = _lead_from_row(row)
                 tier = lead_data["lead_tier"].upper()
                 if tier in leads_by_tier:
                     leads_by_tier[tier].append(lead_data)
@@ -364,6 +381,91 @@ async def load_leads_impl(args: dict[str, Any]) -> dict[str, Any]:
         }
 
 
+async def stream_upload_batches(
+    campaign_id: str,
+    batch_size: int = 100,
+    max_leads: int = 10000,
+    exclude_uploaded: bool = True,
+    page_size: int = 1000,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Yield upload batches in tier priority order, one keyset page at a time.
+
+    Leads are ordered by tier (A > B > C), then lead_score descending, then
+    id, and each page resumes after the last (tier, score, id) seen instead
+    of using OFFSET. Only one page of email bodies is held in memory, and
+    leads marked "queued" by concurrent uploads do not shift later pages.
+
+    Args:
+        campaign_id: Campaign UUID to load leads for.
+        batch_size: Leads per yielded batch.
+        max_leads: Maximum leads to yield in total.
+        exclude_uploaded: Skip leads whose sending_status is already set.
+        page_size: Rows fetched per query.
+
+    Yields:
+        Lists of up to batch_size lead dicts (same shape as load_leads).
+    """
+    from sqlalchemy import text
+
+    from src.database.connection import get_session
+
+    exclude_clause = _EXCLUDE_UPLOADED_CLAUSE if exclude_uploaded else ""
+    select = f"""
+        SELECT {_UPLOAD_LEAD_COLUMNS},
+               {_TIER_RANK_SQL} AS tier_rank,
+               {_SCORE_KEY_SQL} AS score_key
+        FROM leads l
+        LEFT JOIN generated_emails ge ON l.generated_email_id = ge.id
+        WHERE {_UPLOAD_LEAD_FILTERS}
+          {exclude_clause}
+    """  # nosec B608 - clauses are hardcoded, not user input
+    order = "ORDER BY tier_rank ASC, score_key DESC, l.id ASC LIMIT :limit"
+    first_page = text(f"{select} {order}")
+    next_page = text(
+        f"""{select}
+          AND ({_TIER_RANK_SQL}, -{_SCORE_KEY_SQL}, l.id)
+              > (:after_rank, :after_score, :after_id)
+        {order}"""  # nosec B608 - clauses are hardcoded, not user input
+    )
+
+    cursor: dict[str, Any] | None = None
+    pending: list[dict[str, Any]] = []
+    loaded = 0
+
+    while loaded < max_leads:
+        limit = min(page_size, max_leads - loaded)
+        params: dict[str, Any] = {"campaign_id": campaign_id, "limit": limit}
+        async with get_session() as session:
+            if cursor is None:
+                result = await session.execute(first_page, params)
+            else:
+                result = await session.execute(next_page, {**params, **cursor})
+            rows = result.fetchall()
+
+        if not rows:
+            break
+
+        loaded += len(rows)
+        last = rows[-1]
+        cursor = {
+            "after_rank": last.tier_rank,
+            "after_score": -last.score_key,
+            "after_id": last.id,
+        }
+
+        pending.extend(_lead_from_row(row) for row in rows)
+        while len(pending) >= batch_size:
+            yield pending[:batch_size]
+            pending = pending[batch_size:]
+
+        if len(rows) < limit:
+            break
+
+    if pending:
+        yield pending
+
+
 @tool(  # type: ignore[misc]
     name="upload_to_instantly",
     description="Upload a batch of leads to Instantly campaign with retry logic",
@@ -438,52 +540,25 @@ async def upload_to_instantly_impl(args: dict[str, Any]) -> dict[str, Any]:
         # Rate limiting
         await _instantly_rate_limiter.acquire()
 
-        # Format leads for Instantly
-        formatted_leads = []
-        for lead in leads:
-            email_data = lead.get("email_data", {})
-            formatted_leads.append(_format_lead_for_instantly(lead, email_data))
-
         # Get client and upload
         client = _get_instantly_client()
 
         async def do_upload() -> dict[str, Any]:
-            result = await client.bulk_add_leads(
-                leads=formatted_leads,
-                campaign_id=instantly_campaign_id,
-            )
-            return {
-                "created_count": result.created_count,
-                "updated_count": result.updated_count,
-                "failed_count": result.failed_count,
-                "created_leads": result.created_leads,
-                "failed_leads": result.failed_leads,
-            }
+            return await bulk_add_batch(client, instantly_campaign_id, leads)
 
         result = await _retry_with_exponential_backoff(do_upload)
 
         # Record success
         _instantly_circuit_breaker.record_success()
 
-        # Track cost (per YAML: $0.001 per lead)
-        leads_uploaded = result["created_count"] + result["updated_count"]
-        cost = leads_uploaded * 0.001
-        _cost_tracker[campaign_id] = _cost_tracker.get(campaign_id, 0.0) + cost
-
-        # Log batch to database
-        await _log_batch_to_database(
+        leads_uploaded, cost = await record_uploaded_batch(
             campaign_id=campaign_id,
             instantly_campaign_id=instantly_campaign_id,
             batch_number=batch_number,
-            leads_uploaded=leads_uploaded,
-            lead_ids=[lead.get("id") for lead in leads],
-            instantly_response=result,
+            leads=leads,
+            result=result,
         )
 
-        # Update leads sending status
-        lead_ids = [lead.get("id") for lead in leads if lead.get("id")]
-        await _update_leads_status(lead_ids, "queued")
-
         return {
             "content": [
                 {
@@ -531,6 +606,76 @@ async def upload_to_instantly_impl(args: dict[str, Any]) -> dict[str, Any]:
         }
 
 
+async def bulk_add_batch(
+    client: InstantlyClient,
+    instantly_campaign_id: str,
+    leads: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Format leads and send them to Instantly in one bulk add call (no retry).
+
+    Args:
+        client: Instantly client.
+        instantly_campaign_id: Instantly campaign UUID.
+        leads: Lead dicts with email_data.
+
+    Returns:
+        Created/updated/failed counts and leads from Instantly.
+
+    Raises:
+        InstantlyError: If the bulk add fails (status_code 429 when rate limited).
+    """
+    formatted_leads = [
+        _format_lead_for_instantly(lead, lead.get("email_data", {})) for lead in leads
+    ]
+    result = await client.bulk_add_leads(
+        leads=formatted_leads,
+        campaign_id=instantly_campaign_id,
+    )
+    return {
+        "created_count": result.created_count,
+        "updated_count": result.updated_count,
+        "failed_count": result.failed_count,
+        "created_leads": result.created_leads,
+        "failed_leads": result.failed_leads,
+    }
+
+
+async def record_uploaded_batch(
+    campaign_id: str,
+    instantly_campaign_id: str,
+    batch_number: int,
+    leads: list[dict[str, Any]],
+    result: dict[str, Any],
+) -> tuple[int, float]:
+    """
+    Track cost, log the batch and mark its leads queued after an upload.
+
+    Returns:
+        Tuple of (leads uploaded, cost incurred).
+    """
+    # Track cost (per YAML: $0.001 per lead)
+    leads_uploaded = int(result["created_count"] + result["updated_count"])
+    cost = leads_uploaded * 0.001
+    _cost_tracker[campaign_id] = _cost_tracker.get(campaign_id, 0.0) + cost
+
+    # Log batch to database
+    await _log_batch_to_database(
+        campaign_id=campaign_id,
+        instantly_campaign_id=instantly_campaign_id,
+        batch_number=batch_number,
+        leads_uploaded=leads_uploaded,
+        lead_ids=[lead.get("id") for lead in leads],
+        instantly_response=result,
+    )
+
+    # Update leads sending status
+    lead_ids = [lead["id"] for lead in leads if lead.get("id")]
+    await _update_leads_status(lead_ids, "queued")
+
+    return leads_uploaded, cost
+
+
 async def _log_batch_to_database(
     campaign_id: str,
     instantly_campaign_id: str,
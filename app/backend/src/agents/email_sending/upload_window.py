@@ -0,0 +1,122 @@
+"""
+Adaptive in-flight window for Instantly uploads.
+
+Uploads used to run in fixed groups of five batches separated by fixed
+sleeps, which both wasted time when Instantly had headroom and still hit
+429s when it didn't. The window instead bounds how many bulk add calls are
+in flight and adapts that bound to the API's answers (AIMD):
+
+- every ``size`` successful calls widen the window by one, up to ``maximum``
+- a 429 halves the window (down to ``minimum``) and pauses new calls for
+  the response's retry-after, or ``backoff_seconds`` if none was given
+
+429s from calls that were already in flight when the first one arrived
+only extend the pause; they do not halve the window again.
+
+Usage:
+    window = AdaptiveUploadWindow(initial=5, maximum=20)
+    await window.acquire()
+    try:
+        await bulk_add(...)
+    except RateLimited as e:
+        await window.release(rate_limited=True, retry_after=e.retry_after)
+    else:
+        await window.release()
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveUploadWindow:
+    """
+    Bound on concurrent upload calls that grows on success and halves on 429.
+
+    Attributes:
+        size: Current number of calls allowed in flight.
+        in_flight: Calls currently holding a slot.
+        peak_in_flight: Highest in_flight seen.
+        peak_size: Largest window size reached.
+        rate_limited: 429 responses reported through release().
+    """
+
+    def __init__(
+        self,
+        initial: int = 5,
+        minimum: int = 1,
+        maximum: int = 20,
+        backoff_seconds: float = 2.0,
+    ) -> None:
+        """
+        Initialize the window.
+
+        Args:
+            initial: Starting window size.
+            minimum: Smallest size a 429 can shrink the window to.
+            maximum: Largest size successes can grow the window to.
+            backoff_seconds: Pause after a 429 without a retry-after header.
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.size = min(self.maximum, max(self.minimum, initial))
+        self.backoff_seconds = backoff_seconds
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.peak_size = self.size
+        self.rate_limited = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._condition: asyncio.Condition | None = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self) -> None:
+        """Wait for a free slot outside any 429 pause, then take it."""
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                delay = self._paused_until - time.monotonic()
+                if delay <= 0 and self.in_flight < self.size:
+                    break
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(condition.wait(), timeout=delay if delay > 0 else None)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    async def release(self, rate_limited: bool = False, retry_after: float | None = None) -> None:
+        """
+        Give a slot back and adapt the window to the call's outcome.
+
+        Args:
+            rate_limited: True if the call was answered with 429.
+            retry_after: Seconds Instantly asked to wait, if given.
+        """
+        self.in_flight = max(0, self.in_flight - 1)
+        now = time.monotonic()
+
+        if rate_limited:
+            self.rate_limited += 1
+            self._successes = 0
+            if now >= self._paused_until:
+                previous = self.size
+                self.size = max(self.minimum, self.size // 2)
+                logger.warning(f"Instantly rate limited: upload window {previous} -> {self.size}")
+            pause = retry_after if retry_after is not None else self.backoff_seconds
+            self._paused_until = max(self._paused_until, now + pause)
+        elif now >= self._paused_until:
+            self._successes += 1
+            if self._successes >= self.size and self.size < self.maximum:
+                self.size += 1
+                self.peak_size = max(self.peak_size, self.size)
+                self._successes = 0
+
+        condition = self._get_condition()
+        async with condition:
+            condition.notify_all()
@@ -1,18 +1,39 @@
 """Email Verification Agent - Phase 3, Agent 3.1."""
 
 from src.agents.email_verification.agent import (
-    EmailFinderProvider,
-    EmailFindingResult,
     EmailVerificationAgent,
     EmailVerificationAgentError,
     EmailVerificationError,
+    ProviderError,
+)
+from src.agents.email_verification.bulk_verifier import (
+    BatchVerificationResult,
+    BulkEmailVerifier,
+)
+from src.agents.email_verification.pattern_cache import (
+    EmailPatternCache,
+    PatternCacheStats,
+    PatternGuess,
+    infer_email_pattern,
+    render_email_pattern,
+)
+from src.agents.email_verification.quota_store import ProviderQuotaStore
+from src.agents.email_verification.schemas import (
+    EmailFinderProvider,
+    EmailFindingResult,
     EmailVerificationProvider,
     EmailVerificationResult,
     EmailVerificationStatus,
     EnrichmentResult,
-    ProviderError,
+    ProviderConfig,
     ProviderRegistry,
 )
+from src.agents.email_verification.waterfall import (
+    BatchEnrichmentResult,
+    DailyQuota,
+    ProviderMetrics,
+    WaterfallScheduler,
+)
 
 __all__ = [
     "EmailVerificationAgent",
@@ -25,5 +46,22 @@ __all__ = [
     "EmailVerificationAgentError",
     "ProviderError",
     "EmailVerificationError",
+    "ProviderConfig",
     "ProviderRegistry",
+    # Batch waterfall
+    "BatchEnrichmentResult",
+    "DailyQuota",
+    "ProviderMetrics",
+    "WaterfallScheduler",
+    # Bulk verification
+    "BatchVerificationResult",
+    "BulkEmailVerifier",
+    # Domain pattern cache
+    "EmailPatternCache",
+    "PatternCacheStats",
+    "PatternGuess",
+    "infer_email_pattern",
+    "render_email_pattern",
+    # Persistent daily quotas
+    "ProviderQuotaStore",
 ]
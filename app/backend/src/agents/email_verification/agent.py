@@ -8,7 +8,7 @@ and MailVerify (catchall specialist).
 
 Waterfall Strategy:
 1. Check if email already exists
-2. Try pattern-based guess (free)
+2. Try the domain's learned email pattern (verification only, see pattern_cache)
 3. Use waterfall providers in priority order:
    - Tier 1: Tomba.io ($0.002/lookup) - Primary, cheapest
    - Tier 2: Muraena, Voila Norbert, Nimbler, Icypeas, Anymailfinder
@@ -29,8 +29,7 @@ import asyncio
 import json
 import logging
 import os
-from dataclasses import dataclass
-from enum import Enum
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 from claude_agent_sdk import ClaudeAgentOptions, create_sdk_mcp_server, query, tool
@@ -43,6 +42,26 @@ from tenacity import (
     wait_exponential,
 )
 
+from src.agents.email_verification.bulk_verifier import (
+    BatchVerificationResult,
+    BulkEmailVerifier,
+)
+from src.agents.email_verification.pattern_cache import EmailPatternCache
+from src.agents.email_verification.quota_store import ProviderQuotaStore
+from src.agents.email_verification.schemas import (
+    EmailFinderProvider,
+    EmailVerificationProvider,
+    EmailVerificationResult,
+    EmailVerificationStatus,
+    EnrichmentResult,
+    ProviderRegistry,
+)
+from src.agents.email_verification.waterfall import (
+    DEFAULT_MAX_CONCURRENT_LEADS,
+    BatchEnrichmentResult,
+    ProviderBreaker,
+    WaterfallScheduler,
+)
 from src.integrations.anymailfinder import AnymailfinderClient
 from src.integrations.findymail import FindymailClient
 from src.integrations.icypeas import IcypeasClient
@@ -57,83 +76,6 @@ from src.utils.rate_limiter import CircuitBreaker, TokenBucketRateLimiter
 logger = logging.getLogger(__name__)
 
 
-# ============================================================================
-# Enums and Data Classes
-# ============================================================================
-
-
-class EmailVerificationStatus(str, Enum):
-    """Email verification status."""
-
-    VALID = "valid"
-    INVALID = "invalid"
-    RISKY = "risky"
-    CATCHALL = "catchall"
-    DISPOSABLE = "disposable"
-    ROLE_BASED = "role_based"
-    UNKNOWN = "unknown"
-
-
-class EmailFinderProvider(str, Enum):
-    """Email finder providers in waterfall priority order."""
-
-    TOMBA = "tomba"  # Tier 1, Primary (cheapest)
-    MURAENA = "muraena"  # Tier 2
-    VOILA_NORBERT = "voila_norbert"  # Tier 2
-    NIMBLER = "nimbler"  # Tier 2
-    ICYPEAS = "icypeas"  # Tier 2
-    ANYMAILFINDER = "anymailfinder"  # Tier 2
-    FINDYMAIL = "findymail"  # Tier 3, Last resort
-
-
-class EmailVerificationProvider(str, Enum):
-    """Email verification providers."""
-
-    REOON = "reoon"  # Primary verifier
-    MAILVERIFY = "mailverify"  # Secondary + catchall specialist
-
-
-@dataclass
-class EmailFindingResult:
-    """Result of email finding attempt."""
-
-    email: str | None
-    provider: EmailFinderProvider
-    confidence: float
-    cost: float
-    response_time_ms: int
-    success: bool
-    error: str | None = None
-
-
-@dataclass
-class EmailVerificationResult:
-    """Result of email verification."""
-
-    email: str
-    status: EmailVerificationStatus
-    provider: EmailVerificationProvider
-    confidence: float
-    cost: float
-    is_catchall: bool = False
-    is_disposable: bool = False
-    is_role_based: bool = False
-
-
-@dataclass
-class EnrichmentResult:
-    """Final enrichment result for a lead."""
-
-    lead_id: str
-    email: str | None
-    verification_status: EmailVerificationStatus | None
-    provider_used: EmailFinderProvider | None
-    verifier_used: EmailVerificationProvider | None
-    total_cost: float
-    attempts: list[EmailFindingResult]
-    verification: EmailVerificationResult | None
-
-
 # ============================================================================
 # Exceptions
 # ============================================================================
@@ -160,91 +102,6 @@ class EmailVerificationError(EmailVerificationAgentError):
     pass
 
 
-# ============================================================================
-# Provider Registry
-# ============================================================================
-
-
-@dataclass
-class ProviderConfig:
-    """Configuration for an email finder provider."""
-
-    name: EmailFinderProvider
-    cost_per_lookup: float
-    accuracy: float
-    daily_limit: int
-    priority: int
-    tier: str
-
-
-class ProviderRegistry:
-    """Registry of email finder providers in waterfall priority order."""
-
-    PROVIDERS: dict[EmailFinderProvider, ProviderConfig] = {
-        EmailFinderProvider.TOMBA: ProviderConfig(
-            name=EmailFinderProvider.TOMBA,
-            cost_per_lookup=0.002,
-            accuracy=0.85,
-            daily_limit=5000,
-            priority=1,
-            tier="tier_1_primary",
-        ),
-        EmailFinderProvider.MURAENA: ProviderConfig(
-            name=EmailFinderProvider.MURAENA,
-            cost_per_lookup=0.012,
-            accuracy=0.87,
-            daily_limit=1500,
-            priority=2,
-            tier="tier_2_secondary",
-        ),
-        EmailFinderProvider.VOILA_NORBERT: ProviderConfig(
-            name=EmailFinderProvider.VOILA_NORBERT,
-            cost_per_lookup=0.015,
-            accuracy=0.92,
-            daily_limit=1000,
-            priority=3,
-            tier="tier_2_secondary",
-        ),
-        EmailFinderProvider.NIMBLER: ProviderConfig(
-            name=EmailFinderProvider.NIMBLER,
-            cost_per_lookup=0.010,
-            accuracy=0.86,
-            daily_limit=2000,
-            priority=4,
-            tier="tier_2_secondary",
-        ),
-        EmailFinderProvider.ICYPEAS: ProviderConfig(
-            name=EmailFinderProvider.ICYPEAS,
-            cost_per_lookup=0.010,
-            accuracy=0.88,
-            daily_limit=2000,
-            priority=5,
-            tier="tier_2_secondary",
-        ),
-        EmailFinderProvider.ANYMAILFINDER: ProviderConfig(
-            name=EmailFinderProvider.ANYMAILFINDER,
-            cost_per_lookup=0.012,
-            accuracy=0.85,
-            daily_limit=1500,
-            priority=6,
-            tier="tier_2_secondary",
-        ),
-        EmailFinderProvider.FINDYMAIL: ProviderConfig(
-            name=EmailFinderProvider.FINDYMAIL,
-            cost_per_lookup=0.008,
-            accuracy=0.90,
-            daily_limit=2000,
-            priority=7,
-            tier="tier_3_fallback",
-        ),
-    }
-
-    @classmethod
-    def get_providers_in_order(cls) -> list[ProviderConfig]:
-        """Get all providers sorted by priority (cheapest first)."""
-        return sorted(cls.PROVIDERS.values(), key=lambda p: p.priority)
-
-
 # ============================================================================
 # Email Verification Agent
 # ============================================================================
@@ -263,8 +120,20 @@ class EmailVerificationAgent:
     - Sends: verified_email, verification_status to Personalization Agent (4.1)
     """
 
-    def __init__(self) -> None:
-        """Initialize the email verification agent with API clients."""
+    def __init__(
+        self,
+        pattern_cache: EmailPatternCache | None = None,
+        quota_store: ProviderQuotaStore | None = None,
+    ) -> None:
+        """
+        Initialize the email verification agent with API clients.
+
+        Args:
+            pattern_cache: Learned per-domain email patterns. Defaults to a
+                cache at EMAIL_PATTERN_CACHE_PATH, or an in-memory one.
+            quota_store: Daily finder usage per provider. Defaults to a store
+                at EMAIL_QUOTA_STORE_PATH, or an in-memory one.
+        """
         self.name = "email_verification_agent"
         self.description = "Finds and verifies email addresses using waterfall enrichment"
 
@@ -304,6 +173,28 @@ class EmailVerificationAgent:
             ),
         }
 
+        # Domain patterns learned from verified results (skips paid finder lookups)
+        self.pattern_cache = pattern_cache or EmailPatternCache(
+            os.getenv("EMAIL_PATTERN_CACHE_PATH") or ":memory:"
+        )
+
+        # Daily finder usage shared by every scheduler this agent builds
+        self.quota_store = quota_store or ProviderQuotaStore(
+            os.getenv("EMAIL_QUOTA_STORE_PATH") or ":memory:"
+        )
+
+        # Batch waterfall (shares breakers and rate limiters; keeps daily quotas)
+        self.scheduler = self.create_scheduler(self._circuit_breakers)
+
+        # Whole lists go through the verifiers' bulk jobs (single calls as fallback)
+        self.bulk_verifier = BulkEmailVerifier(
+            verify_single=self._verify_email_if_configured,
+            map_reoon_status=self._map_reoon_status,
+            map_mailverify_status=self._map_mailverify_status,
+            reoon_client=self.reoon_client,
+            mailverify_client=self.mailverify_client,
+        )
+
         logger.info(f"Initialized {self.name} agent with email verification clients")
 
     @staticmethod
@@ -440,8 +331,9 @@ class EmailVerificationAgent:
         """
         Find email address using waterfall pattern.
 
-        Tries providers in priority order (cheapest first) until email is found
-        or max_providers is reached.
+        Verifies the domain's learned pattern address first, if there is one.
+        Otherwise tries providers in priority order (cheapest first) until
+        email is found or max_providers is reached.
 
         Args:
             first_name: Lead's first name
@@ -467,6 +359,12 @@ class EmailVerificationAgent:
 
         providers_to_try = ProviderRegistry.get_providers_in_order()[:max_providers]
 
+        finder_cost = providers_to_try[0].cost_per_lookup if providers_to_try else 0.0
+        if await self._try_pattern_guess(
+            result, first_name, last_name, company_domain, finder_cost
+        ):
+            return result
+
         for provider_config in providers_to_try:
             provider_key = provider_config.name.value
             circuit_breaker = self._circuit_breakers.get(provider_key)
@@ -497,8 +395,9 @@ class EmailVerificationAgent:
                     result.provider_used = provider_config.name
                     result.verification_status = verification.status
                     result.verifier_used = verification.provider
-                    result.total_cost = provider_config.cost_per_lookup + verification.cost
+                    result.total_cost += provider_config.cost_per_lookup + verification.cost
                     result.verification = verification
+                    self.pattern_cache.observe(first_name, last_name, company_domain, verification)
                     logger.info(f"Found email {email} using {provider_config.name}")
                     return result
 
@@ -524,6 +423,154 @@ class EmailVerificationAgent:
         logger.warning(f"Could not find email for {first_name} {last_name} at {company_domain}")
         return result
 
+    async def _try_pattern_guess(
+        self,
+        result: EnrichmentResult,
+        first_name: str,
+        last_name: str,
+        company_domain: str,
+        finder_cost: float,
+    ) -> bool:
+        """Verify the learned-pattern address; fills result and returns True if valid."""
+        if not self.reoon_client:
+            return False
+        guess = self.pattern_cache.guess(first_name, last_name, company_domain)
+        if guess is None:
+            return False
+
+        try:
+            verification = await self._verify_email(guess.email)
+        except Exception as e:
+            logger.warning(f"Pattern verification failed for {guess.email}: {e}")
+            return False
+
+        result.total_cost += verification.cost
+        if not self.pattern_cache.record_guess(guess, verification, finder_cost):
+            return False
+
+        result.email = guess.email
+        result.provider_used = EmailFinderProvider.PATTERN
+        result.verification_status = verification.status
+        result.verifier_used = verification.provider
+        result.verification = verification
+        logger.info(f"Found email {guess.email} from {company_domain} pattern {guess.pattern}")
+        return True
+
+    def configured_finder_providers(self) -> list[EmailFinderProvider]:
+        """Finder providers with an initialized client, in waterfall order."""
+        clients = {
+            EmailFinderProvider.TOMBA: self.tomba_client,
+            EmailFinderProvider.MURAENA: self.muraena_client,
+            EmailFinderProvider.VOILA_NORBERT: self.voila_client,
+            EmailFinderProvider.NIMBLER: self.nimbler_client,
+            EmailFinderProvider.ICYPEAS: self.icypeas_client,
+            EmailFinderProvider.ANYMAILFINDER: self.anymailfinder_client,
+            EmailFinderProvider.FINDYMAIL: self.findymail_client,
+        }
+        return [
+            config.name
+            for config in ProviderRegistry.get_providers_in_order()
+            if clients[config.name] is not None
+        ]
+
+    async def find_emails_batch(
+        self,
+        leads: list[dict[str, Any]],
+        max_providers: int = 3,
+    ) -> BatchEnrichmentResult:
+        """
+        Find and verify emails for many leads concurrently.
+
+        Runs the same cheapest-first waterfall as find_email for every lead,
+        with per-provider in-flight limits and daily quotas enforced across
+        the batch. Only providers with configured clients are used.
+
+        Args:
+            leads: Dicts with id, first_name, last_name, company_domain
+            max_providers: Maximum provider lookups per lead (default 3)
+
+        Returns:
+            BatchEnrichmentResult with per-lead results and per-provider metrics
+        """
+        logger.info(f"Starting batch email search for {len(leads)} leads")
+        return await self.scheduler.run(
+            leads,
+            max_providers=max_providers,
+            providers=self.configured_finder_providers(),
+        )
+
+    async def verify_emails_batch(self, emails: Sequence[str]) -> BatchVerificationResult:
+        """
+        Verify many addresses with Reoon and MailVerify bulk jobs.
+
+        Args:
+            emails: Addresses to verify (thousands per call are fine)
+
+        Returns:
+            BatchVerificationResult keyed by lower-cased address
+        """
+        return await self.bulk_verifier.verify(emails)
+
+    def create_scheduler(
+        self,
+        circuit_breakers: Mapping[str, ProviderBreaker] | None = None,
+        max_concurrent_leads: int = DEFAULT_MAX_CONCURRENT_LEADS,
+        verify: bool = True,
+        verifier_breaker: ProviderBreaker | None = None,
+    ) -> WaterfallScheduler:
+        """
+        Build a WaterfallScheduler over this agent's clients.
+
+        Used by callers that bring their own breakers, such as the Phase 3
+        orchestrator. Rate limiters, the pattern cache and the quota store
+        are shared with this agent, so daily quotas carry over from earlier
+        schedulers (and earlier processes when the store is a file).
+
+        Args:
+            circuit_breakers: Breakers by finder provider value
+            max_concurrent_leads: Leads whose waterfall runs at the same time
+            verify: Verify found emails (Reoon, MailVerify for catchall)
+            verifier_breaker: Breaker checked before each verification call
+
+        Returns:
+            WaterfallScheduler for find_emails_batch-style runs
+        """
+
+        async def verify_email(email: str) -> EmailVerificationResult:
+            if verifier_breaker is None:
+                return await self._verify_email_if_configured(email)
+            if not verifier_breaker.can_proceed():
+                raise EmailVerificationError("Email verifier circuit breaker open")
+            try:
+                result = await self._verify_email_if_configured(email)
+            except Exception:
+                verifier_breaker.record_failure()
+                raise
+            verifier_breaker.record_success()
+            return result
+
+        return WaterfallScheduler(
+            find_email=self._find_email_with_provider,
+            verify_email=verify_email if verify else None,
+            max_concurrent_leads=max_concurrent_leads,
+            circuit_breakers=circuit_breakers,
+            rate_limiters=self._rate_limiters,
+            pattern_cache=self.pattern_cache,
+            quota_store=self.quota_store,
+        )
+
+    async def _verify_email_if_configured(self, email: str) -> EmailVerificationResult:
+        """Verify with Reoon, or return UNKNOWN without spending when no verifier is set."""
+        if not self.reoon_client:
+            return EmailVerificationResult(
+                email=email,
+                status=EmailVerificationStatus.UNKNOWN,
+                provider=EmailVerificationProvider.REOON,
+                confidence=0.0,
+                cost=0.0,
+            )
+        return await self._verify_email(email)
+
     async def _find_email_with_provider(
         self,
         provider: EmailFinderProvider,
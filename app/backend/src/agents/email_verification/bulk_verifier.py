@@ -0,0 +1,348 @@
+"""
+Batch email verification through the verifiers' bulk endpoints.
+
+Verifying one address per HTTP call costs a round-trip per lead. Reoon and
+MailVerify both accept whole lists as asynchronous jobs, so a batch is
+verified as:
+
+- Reoon bulk tasks of up to 50,000 addresses, polled until completed
+- one MailVerify bulk job for the addresses Reoon reports as catch-all,
+  polled until every address is processed (same catch-all handling as
+  EmailVerificationAgent._verify_email)
+- bounded-concurrency single verification for whatever a bulk job cannot
+  take or did not return: batches below Reoon's 10-address minimum, failed
+  or timed-out tasks, and addresses missing from a task's results
+
+Polling starts at poll_interval and backs off to max_poll_interval, so a
+10,000-address campaign takes a task submission and a few dozen status
+polls instead of 10,000 verification calls. Statuses go through the
+agent's _map_reoon_status / _map_mailverify_status, so bulk and single
+results are interchangeable.
+
+Usage:
+    verifier = agent.bulk_verifier
+    batch = await verifier.verify(emails)
+    result = batch.get("jane.doe@acme.com")
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from src.agents.email_verification.schemas import (
+    EmailVerificationProvider,
+    EmailVerificationResult,
+    EmailVerificationStatus,
+)
+from src.integrations.mailverify import MailVerifyClient, MailVerifyError
+from src.integrations.reoon import ReoonClient, ReoonError
+
+logger = logging.getLogger(__name__)
+
+VerifyEmailFn = Callable[[str], Awaitable[EmailVerificationResult]]
+MapStatusFn = Callable[[str], EmailVerificationStatus]
+
+T = TypeVar("T")
+
+# Reoon bulk task limits
+REOON_MIN_BULK_EMAILS = 10
+REOON_MAX_BULK_EMAILS = 50_000
+
+DEFAULT_POLL_INTERVAL_SECONDS = 5.0
+DEFAULT_MAX_POLL_INTERVAL_SECONDS = 30.0
+DEFAULT_JOB_TIMEOUT_SECONDS = 1800.0
+DEFAULT_SINGLE_CONCURRENCY = 10
+
+# Same per-address costs as single verification
+REOON_COST = 0.003
+CATCHALL_COST = 0.008
+
+
+class BulkJobError(Exception):
+    """A bulk verification job failed or did not finish in time."""
+
+
+@dataclass
+class BatchVerificationResult:
+    """Verification results for a batch of addresses."""
+
+    results: dict[str, EmailVerificationResult] = field(default_factory=dict)
+    failed: list[str] = field(default_factory=list)
+    bulk_jobs: int = 0
+    http_calls: int = 0
+    single_calls: int = 0
+    duration_ms: int = 0
+
+    def get(self, email: str) -> EmailVerificationResult | None:
+        """Result for an address (case and surrounding space are ignored)."""
+        return self.results.get(normalize_email(email))
+
+    @property
+    def total_cost(self) -> float:
+        """Verification cost of the batch."""
+        return sum(result.cost for result in self.results.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary (without per-address results)."""
+        statuses: dict[str, int] = {}
+        for result in self.results.values():
+            statuses[result.status.value] = statuses.get(result.status.value, 0) + 1
+        return {
+            "verified": len(self.results),
+            "failed": len(self.failed),
+            "statuses": statuses,
+            "bulk_jobs": self.bulk_jobs,
+            "http_calls": self.http_calls,
+            "single_calls": self.single_calls,
+            "total_cost": round(self.total_cost, 4),
+            "duration_ms": self.duration_ms,
+        }
+
+
+def normalize_email(email: str) -> str:
+    """Lower-case, stripped address (the form the bulk endpoints return)."""
+    return email.strip().lower()
+
+
+class BulkEmailVerifier:
+    """
+    Verifies many addresses with bulk jobs, falling back to single calls.
+
+    Attributes:
+        max_concurrency: Single verification calls in flight at once.
+        poll_interval: First delay between job status polls, in seconds.
+        max_poll_interval: Longest delay between polls, in seconds.
+        job_timeout: Seconds to wait for a job before falling back.
+    """
+
+    def __init__(
+        self,
+        verify_single: VerifyEmailFn,
+        map_reoon_status: MapStatusFn,
+        map_mailverify_status: MapStatusFn,
+        reoon_client: ReoonClient | None = None,
+        mailverify_client: MailVerifyClient | None = None,
+        max_concurrency: int = DEFAULT_SINGLE_CONCURRENCY,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS,
+        job_timeout: float = DEFAULT_JOB_TIMEOUT_SECONDS,
+    ) -> None:
+        """
+        Initialize the verifier.
+
+        Args:
+            verify_single: Verifies one address (the fallback path).
+            map_reoon_status: Maps a Reoon status string to internal status.
+            map_mailverify_status: Maps a MailVerify status string to internal status.
+            reoon_client: Reoon client for bulk tasks (None: single calls only).
+            mailverify_client: MailVerify client for catch-all bulk jobs.
+            max_concurrency: Single verification calls in flight at once.
+            poll_interval: First delay between job status polls, in seconds.
+            max_poll_interval: Longest delay between polls, in seconds.
+            job_timeout: Seconds to wait for a job before falling back.
+        """
+        self._verify_single = verify_single
+        self._map_reoon_status = map_reoon_status
+        self._map_mailverify_status = map_mailverify_status
+        self.reoon_client = reoon_client
+        self.mailverify_client = mailverify_client
+        self.max_concurrency = max(1, max_concurrency)
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max(poll_interval, max_poll_interval)
+        self.job_timeout = job_timeout
+
+    async def verify(self, emails: Iterable[str]) -> BatchVerificationResult:
+        """
+        Verify a batch of addresses.
+
+        Args:
+            emails: Addresses to verify; duplicates are verified once.
+
+        Returns:
+            BatchVerificationResult keyed by normalized address. Addresses
+            whose single verification raised are listed in ``failed``;
+            http_calls counts a single verification as one call.
+        """
+        start = time.perf_counter()
+        unique = list(dict.fromkeys(normalize_email(e) for e in emails if e and e.strip()))
+        batch = BatchVerificationResult()
+
+        remaining = unique
+        client = self.reoon_client
+        if client is not None and len(unique) >= REOON_MIN_BULK_EMAILS:
+            chunks = [
+                unique[i : i + REOON_MAX_BULK_EMAILS]
+                for i in range(0, len(unique), REOON_MAX_BULK_EMAILS)
+            ]
+            # A trailing chunk below the minimum goes through single calls
+            if len(chunks) > 1 and len(chunks[-1]) < REOON_MIN_BULK_EMAILS:
+                chunks.pop()
+            for results in await asyncio.gather(
+                *(self._verify_chunk(client, chunk, batch) for chunk in chunks)
+            ):
+                batch.results.update(results)
+            remaining = [email for email in unique if email not in batch.results]
+
+        if remaining:
+            await self._verify_singly(remaining, batch)
+
+        batch.duration_ms = int((time.perf_counter() - start) * 1000)
+        logger.info(
+            f"Bulk verification complete: {len(batch.results)}/{len(unique)} verified, "
+            f"{batch.bulk_jobs} bulk jobs, {batch.http_calls} HTTP calls "
+            f"({batch.single_calls} single), time={batch.duration_ms}ms"
+        )
+        return batch
+
+    # =========================================================================
+    # Bulk Jobs
+    # =========================================================================
+
+    async def _verify_chunk(
+        self, client: ReoonClient, emails: list[str], batch: BatchVerificationResult
+    ) -> dict[str, EmailVerificationResult]:
+        """Reoon bulk task for one chunk, then MailVerify for its catch-alls."""
+        try:
+            items = await self._run_reoon_task(client, emails, batch)
+        except (ReoonError, BulkJobError, ValueError) as e:
+            logger.warning(f"Reoon bulk task for {len(emails)} emails failed: {e}")
+            return {}
+
+        statuses: dict[str, tuple[EmailVerificationStatus, bool]] = {}
+        for email, item in items.items():
+            status = self._map_reoon_status(str(item.get("status", "")))
+            is_catchall = status == EmailVerificationStatus.CATCHALL or bool(
+                item.get("is_catch_all")
+            )
+            statuses[normalize_email(email)] = (status, is_catchall)
+
+        catchalls = [email for email, (_, is_catchall) in statuses.items() if is_catchall]
+        resolved: dict[str, EmailVerificationStatus] = {}
+        if catchalls and self.mailverify_client is not None:
+            try:
+                resolved = await self._run_mailverify_job(self.mailverify_client, catchalls, batch)
+            except (MailVerifyError, BulkJobError, ValueError) as e:
+                # Keep Reoon's catch-all verdict for these addresses
+                logger.warning(f"MailVerify bulk job for {len(catchalls)} catch-alls failed: {e}")
+
+        results = {}
+        for email, (status, is_catchall) in statuses.items():
+            if email in resolved:
+                status = resolved[email]
+                is_catchall = status == EmailVerificationStatus.CATCHALL
+                provider = (
+                    EmailVerificationProvider.MAILVERIFY
+                    if is_catchall
+                    else EmailVerificationProvider.REOON
+                )
+            else:
+                provider = EmailVerificationProvider.REOON
+            results[email] = EmailVerificationResult(
+                email=email,
+                status=status,
+                provider=provider,
+                confidence=0.95,
+                cost=CATCHALL_COST if is_catchall else REOON_COST,
+                is_catchall=is_catchall,
+                is_disposable=status == EmailVerificationStatus.DISPOSABLE,
+                is_role_based=status == EmailVerificationStatus.ROLE_BASED,
+            )
+        return results
+
+    async def _run_reoon_task(
+        self, client: ReoonClient, emails: list[str], batch: BatchVerificationResult
+    ) -> dict[str, dict[str, Any]]:
+        """Submit a Reoon bulk task and wait for its per-address results."""
+        batch.http_calls += 1
+        task = await client.create_bulk_verification_task(emails)
+        if not task.is_created:
+            raise BulkJobError(f"task not created (status={task.status!r})")
+        batch.bulk_jobs += 1
+        logger.info(f"Reoon bulk task {task.task_id} created for {len(emails)} emails")
+
+        async def fetch() -> Any:
+            batch.http_calls += 1
+            return await client.get_bulk_verification_status(task.task_id)
+
+        status = await self._poll(
+            fetch,
+            done=lambda s: s.is_completed,
+            failed=lambda s: s.is_failed,
+            label=f"Reoon task {task.task_id}",
+        )
+        results: dict[str, dict[str, Any]] = status.results
+        return results
+
+    async def _run_mailverify_job(
+        self, client: MailVerifyClient, emails: list[str], batch: BatchVerificationResult
+    ) -> dict[str, EmailVerificationStatus]:
+        """Submit a MailVerify bulk job and map its results."""
+        batch.http_calls += 1
+        job = await client.verify_bulk(emails)
+        batch.bulk_jobs += 1
+
+        if not job.is_complete:
+            if not job.job_id:
+                raise BulkJobError("bulk job returned no job_id")
+
+            async def fetch() -> Any:
+                batch.http_calls += 1
+                return await client.get_bulk_status(job.job_id)
+
+            job = await self._poll(
+                fetch,
+                done=lambda j: j.is_complete,
+                failed=lambda j: j.status in ("failed", "error"),
+                label=f"MailVerify job {job.job_id}",
+            )
+
+        return {
+            normalize_email(result.email): self._map_mailverify_status(
+                getattr(result.status, "value", result.status)
+            )
+            for result in job.results
+        }
+
+    async def _poll(
+        self,
+        fetch: Callable[[], Awaitable[T]],
+        done: Callable[[T], bool],
+        failed: Callable[[T], bool],
+        label: str,
+    ) -> T:
+        """Poll fetch() with a growing interval until done, failed or timed out."""
+        deadline = time.monotonic() + self.job_timeout
+        interval = self.poll_interval
+        while True:
+            await asyncio.sleep(interval)
+            state = await fetch()
+            if done(state):
+                return state
+            if failed(state):
+                raise BulkJobError(f"{label} failed")
+            if time.monotonic() + interval > deadline:
+                raise BulkJobError(f"{label} did not finish in {self.job_timeout:.0f}s")
+            interval = min(self.max_poll_interval, interval * 1.5)
+
+    # =========================================================================
+    # Single Fallback
+    # =========================================================================
+
+    async def _verify_singly(self, emails: Sequence[str], batch: BatchVerificationResult) -> None:
+        """Verify addresses one call each, max_concurrency at a time."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def verify_one(email: str) -> None:
+            async with semaphore:
+                batch.single_calls += 1
+                batch.http_calls += 1
+                try:
+                    batch.results[email] = await self._verify_single(email)
+                except Exception as e:
+                    logger.warning(f"Verification failed for {email}: {e}")
+                    batch.failed.append(email)
+
+        await asyncio.gather(*(verify_one(email) for email in emails))
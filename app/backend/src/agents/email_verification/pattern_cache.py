@@ -0,0 +1,368 @@
+"""
+Per-domain email pattern cache for the email waterfall.
+
+Learns the dominant address format of each company domain (``first.last@``,
+``flast@``, ...) from verified results and keeps it in a local SQLite file
+(WAL), so what one campaign run learned is reused by the next. When a
+domain has a trusted pattern, the waterfall builds the address from the
+lead's name and only pays for verification; finder lookups are skipped when
+the guess verifies as valid.
+
+A pattern is trusted once it has at least ``min_samples`` verified
+addresses, covers ``min_share`` of the domain's verified addresses and has
+not been rejected by the verifier too often (``min_precision``). Domains
+where a verifier reports catch-all are never guessed, since any address
+"verifies" there.
+
+Usage:
+    with EmailPatternCache("/var/lib/smarter-team/email_patterns.db") as cache:
+        agent = EmailVerificationAgent(pattern_cache=cache)
+        batch = await agent.find_emails_batch(leads)
+        logger.info(cache.stats.to_dict())
+"""
+
+import logging
+import re
+import sqlite3
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.agents.email_verification.schemas import (
+    EmailVerificationResult,
+    EmailVerificationStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# Local-part templates, most common first ({f}/{l} are initials)
+EMAIL_PATTERNS: tuple[str, ...] = (
+    "{first}.{last}",
+    "{f}{last}",
+    "{first}",
+    "{first}{last}",
+    "{first}_{last}",
+    "{f}.{last}",
+    "{first}{l}",
+    "{first}.{l}",
+    "{first}-{last}",
+    "{last}.{first}",
+    "{last}{f}",
+    "{last}{first}",
+    "{last}",
+)
+
+DEFAULT_MIN_SAMPLES = 2
+DEFAULT_MIN_SHARE = 0.6
+DEFAULT_MIN_PRECISION = 0.7
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS email_patterns (
+    domain TEXT NOT NULL,
+    pattern TEXT NOT NULL,
+    verified INTEGER NOT NULL DEFAULT 0,
+    rejected INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL,
+    PRIMARY KEY (domain, pattern)
+);
+CREATE TABLE IF NOT EXISTS catchall_domains (domain TEXT PRIMARY KEY, updated_at REAL);
+"""
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]")
+
+
+def _normalize_name(name: str) -> str:
+    """Lowercase ASCII letters and digits only ("José-Luis" -> "joseluis")."""
+    decomposed = unicodedata.normalize("NFKD", name or "")
+    ascii_name = decomposed.encode("ascii", "ignore").decode("ascii")
+    return _NON_ALNUM.sub("", ascii_name.lower())
+
+
+def _normalize_domain(domain: str) -> str:
+    domain = (domain or "").strip().lower()
+    return domain[4:] if domain.startswith("www.") else domain
+
+
+def render_email_pattern(pattern: str, first_name: str, last_name: str, domain: str) -> str | None:
+    """
+    Build an address from a pattern.
+
+    Returns:
+        The address, or None when a name part the pattern needs is missing.
+    """
+    first = _normalize_name(first_name)
+    last = _normalize_name(last_name)
+    domain = _normalize_domain(domain)
+    if not domain:
+        return None
+    if ("{first}" in pattern or "{f}" in pattern) and not first:
+        return None
+    if ("{last}" in pattern or "{l}" in pattern) and not last:
+        return None
+    local = pattern.format(first=first, last=last, f=first[:1], l=last[:1])
+    return f"{local}@{domain}"
+
+
+def infer_email_pattern(email: str, first_name: str, last_name: str) -> str | None:
+    """
+    Find the pattern that produces an address from the lead's name.
+
+    Returns:
+        The first matching pattern from EMAIL_PATTERNS, or None.
+    """
+    local, _, domain = (email or "").strip().lower().partition("@")
+    if not local or not domain:
+        return None
+    for pattern in EMAIL_PATTERNS:
+        if render_email_pattern(pattern, first_name, last_name, domain) == f"{local}@{domain}":
+            return pattern
+    return None
+
+
+@dataclass
+class PatternGuess:
+    """An address built from a domain's learned pattern."""
+
+    email: str
+    domain: str
+    pattern: str
+
+
+@dataclass
+class PatternCacheStats:
+    """Counters for one cache instance (one process)."""
+
+    lookups: int = 0
+    guesses: int = 0
+    hits: int = 0
+    misses: int = 0
+    learned: int = 0
+    finder_cost_saved: float = 0.0
+    verification_cost_wasted: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered by a verified pattern guess."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def cost_saved(self) -> float:
+        """Finder spend avoided minus verification spent on rejected guesses."""
+        return self.finder_cost_saved - self.verification_cost_wasted
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            "lookups": self.lookups,
+            "guesses": self.guesses,
+            "hits": self.hits,
+            "misses": self.misses,
+            "learned": self.learned,
+            "hit_rate": round(self.hit_rate, 4),
+            "finder_cost_saved": round(self.finder_cost_saved, 4),
+            "verification_cost_wasted": round(self.verification_cost_wasted, 4),
+            "cost_saved": round(self.cost_saved, 4),
+        }
+
+
+class EmailPatternCache:
+    """
+    Learned email patterns per company domain, persisted in SQLite.
+
+    Attributes:
+        stats: Hit/miss and cost counters since this cache was opened.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        min_share: float = DEFAULT_MIN_SHARE,
+        min_precision: float = DEFAULT_MIN_PRECISION,
+    ) -> None:
+        """
+        Open (or create) the cache file.
+
+        Args:
+            path: SQLite file path. ":memory:" keeps patterns for this process only.
+            min_samples: Verified addresses needed before a pattern is guessed.
+            min_share: Share of the domain's verified addresses the pattern must cover.
+            min_precision: Minimum verified / (verified + rejected) for the pattern.
+        """
+        self.path = str(path)
+        self.min_samples = min_samples
+        self.min_share = min_share
+        self.min_precision = min_precision
+        self.stats = PatternCacheStats()
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "EmailPatternCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def is_catchall(self, domain: str) -> bool:
+        """Whether a verifier has reported this domain as catch-all."""
+        row = self._conn.execute(
+            "SELECT 1 FROM catchall_domains WHERE domain = ?", (_normalize_domain(domain),)
+        ).fetchone()
+        return row is not None
+
+    def dominant_pattern(self, domain: str) -> str | None:
+        """The domain's trusted pattern, or None if none qualifies yet."""
+        domain = _normalize_domain(domain)
+        if not domain or self.is_catchall(domain):
+            return None
+        rows = self._conn.execute(
+            "SELECT pattern, verified, rejected FROM email_patterns WHERE domain = ? "
+            "ORDER BY verified DESC, rejected ASC",
+            (domain,),
+        ).fetchall()
+        if not rows:
+            return None
+
+        pattern, verified, rejected = rows[0]
+        total_verified = sum(row[1] for row in rows)
+        if verified < self.min_samples or verified / total_verified < self.min_share:
+            return None
+        if verified / (verified + rejected) < self.min_precision:
+            return None
+        return str(pattern)
+
+    def guess(self, first_name: str, last_name: str, domain: str) -> PatternGuess | None:
+        """
+        Build the lead's address from the domain's trusted pattern.
+
+        Counts as a cache lookup in stats.
+
+        Returns:
+            PatternGuess to verify, or None when the domain has no trusted pattern.
+        """
+        self.stats.lookups += 1
+        pattern = self.dominant_pattern(domain)
+        if pattern is None:
+            return None
+        email = render_email_pattern(pattern, first_name, last_name, domain)
+        if email is None:
+            return None
+        self.stats.guesses += 1
+        return PatternGuess(email=email, domain=_normalize_domain(domain), pattern=pattern)
+
+    def domain_patterns(self, domain: str) -> dict[str, tuple[int, int]]:
+        """(verified, rejected) counts per pattern for a domain."""
+        rows = self._conn.execute(
+            "SELECT pattern, verified, rejected FROM email_patterns WHERE domain = ?",
+            (_normalize_domain(domain),),
+        )
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def record_guess(
+        self,
+        guess: PatternGuess,
+        verification: EmailVerificationResult,
+        finder_cost: float,
+    ) -> bool:
+        """
+        Record the verifier's answer for a guess.
+
+        Args:
+            guess: The guess that was verified.
+            verification: Verifier result for guess.email.
+            finder_cost: Finder spend the guess replaces when it is accepted.
+
+        Returns:
+            True when the guess is accepted (verified valid).
+        """
+        catchall = (
+            verification.status == EmailVerificationStatus.CATCHALL or verification.is_catchall
+        )
+        if verification.status == EmailVerificationStatus.VALID and not catchall:
+            self.stats.hits += 1
+            self.stats.finder_cost_saved += finder_cost
+            self._bump(guess.domain, guess.pattern, verified=1)
+            return True
+
+        self.stats.misses += 1
+        self.stats.verification_cost_wasted += verification.cost
+        if catchall:
+            self._mark_catchall(guess.domain)
+        elif verification.status == EmailVerificationStatus.INVALID:
+            self._bump(guess.domain, guess.pattern, rejected=1)
+        self._conn.commit()
+        return False
+
+    def observe(
+        self,
+        first_name: str,
+        last_name: str,
+        domain: str,
+        verification: EmailVerificationResult,
+    ) -> str | None:
+        """
+        Learn from an address a finder returned and the verifier checked.
+
+        Only valid addresses on the lead's own domain teach a pattern;
+        catch-all results mark the domain as not guessable.
+
+        Returns:
+            The pattern learned, or None.
+        """
+        domain = _normalize_domain(domain)
+        email_domain = verification.email.strip().lower().rpartition("@")[2]
+        if not domain or _normalize_domain(email_domain) != domain:
+            return None
+
+        if verification.status == EmailVerificationStatus.CATCHALL or verification.is_catchall:
+            self._mark_catchall(domain)
+            self._conn.commit()
+            return None
+        if verification.status != EmailVerificationStatus.VALID:
+            return None
+
+        pattern = infer_email_pattern(verification.email, first_name, last_name)
+        if pattern is None:
+            return None
+        self._bump(domain, pattern, verified=1)
+        self.stats.learned += 1
+        return pattern
+
+    def _bump(self, domain: str, pattern: str, verified: int = 0, rejected: int = 0) -> None:
+        self._conn.execute(
+            "INSERT INTO email_patterns (domain, pattern, verified, rejected, updated_at) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT(domain, pattern) DO UPDATE SET "
+            "verified = verified + excluded.verified, "
+            "rejected = rejected + excluded.rejected, "
+            "updated_at = excluded.updated_at",
+            (domain, pattern, verified, rejected, time.time()),
+        )
+        self._conn.commit()
+
+    def _mark_catchall(self, domain: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO catchall_domains (domain, updated_at) VALUES (?, ?)",
+            (domain, time.time()),
+        )
+        logger.info(f"Domain {domain} is catch-all; pattern guesses disabled")
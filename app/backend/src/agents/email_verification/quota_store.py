@@ -0,0 +1,97 @@
+"""
+Persistent daily quota usage for email finder providers.
+
+WaterfallScheduler enforces each provider's daily_limit in memory, so every
+new scheduler (one per Phase 3 run) and every process restart used to start
+the day at zero and could overspend a provider's plan. Usage is now kept in
+a local SQLite file (WAL) per provider and UTC date: a scheduler seeds its
+quotas from today's rows when it is built and adds one to the provider's row
+for every lookup it makes.
+
+Rows older than ``retention_days`` are dropped when the store is opened.
+
+Usage:
+    with ProviderQuotaStore("/var/lib/smarter-team/email_quota.db") as store:
+        agent = EmailVerificationAgent(quota_store=store)
+        batch = await agent.find_emails_batch(leads)
+        logger.info(store.usage())
+"""
+
+import logging
+import sqlite3
+import time
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETENTION_DAYS = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS provider_quota_usage (
+    provider TEXT NOT NULL,
+    day TEXT NOT NULL,
+    used INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (provider, day)
+);
+"""
+
+
+def _utc_today() -> date:
+    return datetime.now(UTC).date()
+
+
+class ProviderQuotaStore:
+    """Lookups made per finder provider and UTC day, persisted in SQLite."""
+
+    def __init__(
+        self, path: str | Path = ":memory:", retention_days: int = DEFAULT_RETENTION_DAYS
+    ) -> None:
+        """
+        Open (or create) the usage file.
+
+        Args:
+            path: SQLite file path. ":memory:" keeps usage for this process only.
+            retention_days: Days of usage rows to keep.
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        cutoff = _utc_today() - timedelta(days=retention_days)
+        self._conn.execute("DELETE FROM provider_quota_usage WHERE day < ?", (cutoff.isoformat(),))
+        self._conn.commit()
+
+    def __enter__(self) -> "ProviderQuotaStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
+    def usage(self, day: date | None = None) -> dict[str, int]:
+        """Lookups per provider value on a UTC day (today by default)."""
+        rows = self._conn.execute(
+            "SELECT provider, used FROM provider_quota_usage WHERE day = ?",
+            ((day or _utc_today()).isoformat(),),
+        ).fetchall()
+        return {str(provider): int(used) for provider, used in rows}
+
+    def record_use(self, provider: str, day: date | None = None, count: int = 1) -> None:
+        """Add lookups to a provider's usage for a UTC day (today by default)."""
+        self._conn.execute(
+            "INSERT INTO provider_quota_usage (provider, day, used, updated_at) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (provider, day) DO UPDATE SET "
+            "used = used + excluded.used, updated_at = excluded.updated_at",
+            (provider, (day or _utc_today()).isoformat(), count, time.time()),
+        )
+        self._conn.commit()
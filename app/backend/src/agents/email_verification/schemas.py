@@ -0,0 +1,174 @@
+"""
+Schemas for Email Verification Agent.
+
+Defines provider enums, the provider registry and the dataclasses exchanged
+between the agent and the waterfall scheduler.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+
+# ============================================================================
+# Enums and Data Classes
+# ============================================================================
+
+
+class EmailVerificationStatus(str, Enum):
+    """Email verification status."""
+
+    VALID = "valid"
+    INVALID = "invalid"
+    RISKY = "risky"
+    CATCHALL = "catchall"
+    DISPOSABLE = "disposable"
+    ROLE_BASED = "role_based"
+    UNKNOWN = "unknown"
+
+
+class EmailFinderProvider(str, Enum):
+    """Email finder providers in waterfall priority order."""
+
+    TOMBA = "tomba"  # Tier 1, Primary (cheapest)
+    MURAENA = "muraena"  # Tier 2
+    VOILA_NORBERT = "voila_norbert"  # Tier 2
+    NIMBLER = "nimbler"  # Tier 2
+    ICYPEAS = "icypeas"  # Tier 2
+    ANYMAILFINDER = "anymailfinder"  # Tier 2
+    FINDYMAIL = "findymail"  # Tier 3, Last resort
+    PATTERN = "pattern"  # Learned domain pattern, verification only (not in registry)
+
+
+class EmailVerificationProvider(str, Enum):
+    """Email verification providers."""
+
+    REOON = "reoon"  # Primary verifier
+    MAILVERIFY = "mailverify"  # Secondary + catchall specialist
+
+
+@dataclass
+class EmailFindingResult:
+    """Result of email finding attempt."""
+
+    email: str | None
+    provider: EmailFinderProvider
+    confidence: float
+    cost: float
+    response_time_ms: int
+    success: bool
+    error: str | None = None
+
+
+@dataclass
+class EmailVerificationResult:
+    """Result of email verification."""
+
+    email: str
+    status: EmailVerificationStatus
+    provider: EmailVerificationProvider
+    confidence: float
+    cost: float
+    is_catchall: bool = False
+    is_disposable: bool = False
+    is_role_based: bool = False
+
+
+@dataclass
+class EnrichmentResult:
+    """Final enrichment result for a lead."""
+
+    lead_id: str
+    email: str | None
+    verification_status: EmailVerificationStatus | None
+    provider_used: EmailFinderProvider | None
+    verifier_used: EmailVerificationProvider | None
+    total_cost: float
+    attempts: list[EmailFindingResult]
+    verification: EmailVerificationResult | None
+    # No provider answered: every one was skipped (quota, breaker) or failed
+    unresolved: bool = False
+
+
+# ============================================================================
+# Provider Registry
+# ============================================================================
+
+
+@dataclass
+class ProviderConfig:
+    """Configuration for an email finder provider."""
+
+    name: EmailFinderProvider
+    cost_per_lookup: float
+    accuracy: float
+    daily_limit: int
+    priority: int
+    tier: str
+    max_in_flight: int = 10  # Concurrent lookups allowed by the waterfall scheduler
+
+
+class ProviderRegistry:
+    """Registry of email finder providers in waterfall priority order."""
+
+    PROVIDERS: dict[EmailFinderProvider, ProviderConfig] = {
+        EmailFinderProvider.TOMBA: ProviderConfig(
+            name=EmailFinderProvider.TOMBA,
+            cost_per_lookup=0.002,
+            accuracy=0.85,
+            daily_limit=5000,
+            priority=1,
+            tier="tier_1_primary",
+        ),
+        EmailFinderProvider.MURAENA: ProviderConfig(
+            name=EmailFinderProvider.MURAENA,
+            cost_per_lookup=0.012,
+            accuracy=0.87,
+            daily_limit=1500,
+            priority=2,
+            tier="tier_2_secondary",
+        ),
+        EmailFinderProvider.VOILA_NORBERT: ProviderConfig(
+            name=EmailFinderProvider.VOILA_NORBERT,
+            cost_per_lookup=0.015,
+            accuracy=0.92,
+            daily_limit=1000,
+            priority=3,
+            tier="tier_2_secondary",
+        ),
+        EmailFinderProvider.NIMBLER: ProviderConfig(
+            name=EmailFinderProvider.NIMBLER,
+            cost_per_lookup=0.010,
+            accuracy=0.86,
+            daily_limit=2000,
+            priority=4,
+            tier="tier_2_secondary",
+        ),
+        EmailFinderProvider.ICYPEAS: ProviderConfig(
+            name=EmailFinderProvider.ICYPEAS,
+            cost_per_lookup=0.010,
+            accuracy=0.88,
+            daily_limit=2000,
+            priority=5,
+            tier="tier_2_secondary",
+        ),
+        EmailFinderProvider.ANYMAILFINDER: ProviderConfig(
+            name=EmailFinderProvider.ANYMAILFINDER,
+            cost_per_lookup=0.012,
+            accuracy=0.85,
+            daily_limit=1500,
+            priority=6,
+            tier="tier_2_secondary",
+        ),
+        EmailFinderProvider.FINDYMAIL: ProviderConfig(
+            name=EmailFinderProvider.FINDYMAIL,
+            cost_per_lookup=0.008,
+            accuracy=0.90,
+            daily_limit=2000,
+            priority=7,
+            tier="tier_3_fallback",
+        ),
+    }
+
+    @classmethod
+    def get_providers_in_order(cls) -> list[ProviderConfig]:
+        """Get all providers sorted by priority (cheapest first)."""
+        return sorted(cls.PROVIDERS.values(), key=lambda p: p.priority)
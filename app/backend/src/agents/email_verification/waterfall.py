@@ -0,0 +1,464 @@
+"""
+Concurrent, quota-aware email waterfall scheduler.
+
+Runs the email finder waterfall for many leads at once. Each lead still walks
+providers in priority order (cheapest first), but many leads are in flight
+together and every provider call passes through that provider's own gate:
+
+- a bounded in-flight count (ProviderConfig.max_in_flight)
+- a remaining daily quota (ProviderConfig.daily_limit, reset at UTC midnight),
+  optionally persisted per UTC date in a ProviderQuotaStore
+- its circuit breaker and optional token-bucket rate limiter
+
+Providers that are exhausted or have an open breaker are skipped, so a lead's
+waterfall routes around them instead of spending one of its attempts there.
+
+With an EmailPatternCache, a lead whose domain has a learned pattern first
+has the pattern address verified; finder lookups only run when that guess
+is rejected. Verified finder results feed the cache.
+
+The scheduler only sees two callables, one to look up an email with a given
+provider and one to verify a found address, so it can be driven by the real
+EmailVerificationAgent clients or by local stub providers in tests.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from typing import Any, Protocol
+
+from src.agents.email_verification.pattern_cache import EmailPatternCache
+from src.agents.email_verification.quota_store import ProviderQuotaStore
+from src.agents.email_verification.schemas import (
+    EmailFinderProvider,
+    EmailFindingResult,
+    EmailVerificationResult,
+    EnrichmentResult,
+    ProviderConfig,
+    ProviderRegistry,
+)
+from src.utils.rate_limiter import CircuitBreaker, TokenBucketRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# (provider, first_name, last_name, domain) -> email or None
+FindEmailFn = Callable[[EmailFinderProvider, str, str, str], Awaitable[str | None]]
+VerifyEmailFn = Callable[[str], Awaitable[EmailVerificationResult]]
+
+
+class ProviderBreaker(Protocol):
+    """Circuit breaker interface the scheduler needs (src.utils.rate_limiter style)."""
+
+    def can_proceed(self) -> bool: ...
+
+    def record_success(self) -> None: ...
+
+    def record_failure(self) -> None: ...
+
+
+DEFAULT_MAX_CONCURRENT_LEADS = 50
+DEFAULT_MAX_VERIFICATIONS_IN_FLIGHT = 20
+
+
+def _utc_today() -> date:
+    return datetime.now(UTC).date()
+
+
+@dataclass
+class DailyQuota:
+    """Remaining lookups for one provider today (UTC)."""
+
+    limit: int
+    used: int = 0
+    day: date = field(default_factory=_utc_today)
+
+    def _roll_over(self) -> None:
+        today = _utc_today()
+        if today != self.day:
+            self.day = today
+            self.used = 0
+
+    @property
+    def remaining(self) -> int:
+        """Lookups left today."""
+        self._roll_over()
+        return max(self.limit - self.used, 0)
+
+    def try_consume(self) -> bool:
+        """Reserve one lookup; False when today's quota is spent."""
+        if self.remaining <= 0:
+            return False
+        self.used += 1
+        return True
+
+
+@dataclass
+class ProviderMetrics:
+    """Per-provider counters for one scheduler."""
+
+    provider: str
+    lookups: int = 0
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+    skipped_quota: int = 0
+    skipped_breaker: int = 0
+    cost: float = 0.0
+    total_latency_ms: int = 0
+    peak_in_flight: int = 0
+    in_flight: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that returned an email."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def avg_latency_ms(self) -> float:
+        """Mean lookup latency."""
+        return self.total_latency_ms / self.lookups if self.lookups else 0.0
+
+    def to_dict(self, elapsed_seconds: float = 0.0) -> dict[str, Any]:
+        """Convert to dictionary, with throughput over elapsed_seconds."""
+        return {
+            "provider": self.provider,
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "skipped_quota": self.skipped_quota,
+            "skipped_breaker": self.skipped_breaker,
+            "hit_rate": round(self.hit_rate, 4),
+            "cost": round(self.cost, 4),
+            "avg_latency_ms": round(self.avg_latency_ms, 1),
+            "lookups_per_second": (
+                round(self.lookups / elapsed_seconds, 2) if elapsed_seconds > 0 else 0.0
+            ),
+            "peak_in_flight": self.peak_in_flight,
+        }
+
+
+@dataclass
+class BatchEnrichmentResult:
+    """Result of running the waterfall for a batch of leads."""
+
+    results: list[EnrichmentResult] = field(default_factory=list)
+    provider_metrics: dict[str, ProviderMetrics] = field(default_factory=dict)
+    duration_ms: int = 0
+
+    @property
+    def emails_found(self) -> int:
+        """Leads that ended with an email."""
+        return sum(1 for r in self.results if r.email)
+
+    @property
+    def total_cost(self) -> float:
+        """Lookup plus verification cost across all leads."""
+        return sum(r.total_cost for r in self.results)
+
+    @property
+    def pattern_hits(self) -> int:
+        """Leads answered by a learned domain pattern, without finder lookups."""
+        return sum(1 for r in self.results if r.provider_used == EmailFinderProvider.PATTERN)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for orchestrator consumption."""
+        elapsed = self.duration_ms / 1000
+        return {
+            "total_leads": len(self.results),
+            "emails_found": self.emails_found,
+            "pattern_hits": self.pattern_hits,
+            "hit_rate": round(self.emails_found / len(self.results), 4) if self.results else 0.0,
+            "total_cost": round(self.total_cost, 4),
+            "duration_ms": self.duration_ms,
+            "leads_per_second": round(len(self.results) / elapsed, 2) if elapsed > 0 else 0.0,
+            "providers": {
+                name: metrics.to_dict(elapsed) for name, metrics in self.provider_metrics.items()
+            },
+        }
+
+
+class _ProviderGate:
+    """Concurrency, quota and breaker state for one provider."""
+
+    def __init__(
+        self,
+        config: ProviderConfig,
+        breaker: ProviderBreaker,
+        rate_limiter: TokenBucketRateLimiter | None,
+    ) -> None:
+        self.config = config
+        self.breaker = breaker
+        self.rate_limiter = rate_limiter
+        self.quota = DailyQuota(limit=config.daily_limit)
+        self.semaphore = asyncio.Semaphore(config.max_in_flight)
+        self.metrics = ProviderMetrics(provider=config.name.value)
+
+
+class WaterfallScheduler:
+    """
+    Runs many lead waterfalls concurrently under per-provider limits.
+
+    Daily quotas and breakers live on the scheduler, so reuse one instance
+    across batches to keep enforcing them. With a quota_store, quotas are
+    loaded from today's recorded usage at the start of every run and each
+    lookup is written back, so they also hold across schedulers and restarts.
+
+    Attributes:
+        max_concurrent_leads: Leads whose waterfall runs at the same time.
+    """
+
+    def __init__(
+        self,
+        find_email: FindEmailFn,
+        verify_email: VerifyEmailFn | None = None,
+        providers: Sequence[ProviderConfig] | None = None,
+        max_concurrent_leads: int = DEFAULT_MAX_CONCURRENT_LEADS,
+        max_verifications_in_flight: int = DEFAULT_MAX_VERIFICATIONS_IN_FLIGHT,
+        circuit_breakers: Mapping[str, ProviderBreaker] | None = None,
+        rate_limiters: Mapping[str, TokenBucketRateLimiter] | None = None,
+        pattern_cache: EmailPatternCache | None = None,
+        quota_store: ProviderQuotaStore | None = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            find_email: Looks up an email with one provider.
+            verify_email: Verifies a found email (None skips verification).
+            providers: Provider configs; defaults to ProviderRegistry order.
+            max_concurrent_leads: Leads whose waterfall runs at the same time.
+            max_verifications_in_flight: Concurrent verification calls.
+            circuit_breakers: Existing breakers by provider value, shared with
+                the caller; missing providers get a new breaker.
+            rate_limiters: Optional token buckets by provider value.
+            pattern_cache: Learned domain patterns to try before finders
+                (needs verify_email).
+            quota_store: Persisted daily usage per provider.
+        """
+        self._find_email = find_email
+        self._verify_email = verify_email
+        self.pattern_cache = pattern_cache
+        self.quota_store = quota_store
+        self.max_concurrent_leads = max_concurrent_leads
+        self._verify_semaphore = asyncio.Semaphore(max_verifications_in_flight)
+
+        breakers = circuit_breakers or {}
+        limiters = rate_limiters or {}
+        configs = providers or ProviderRegistry.get_providers_in_order()
+        self._gates: dict[EmailFinderProvider, _ProviderGate] = {}
+        for config in sorted(configs, key=lambda c: c.priority):
+            key = config.name.value
+            breaker: ProviderBreaker = breakers.get(key) or CircuitBreaker(
+                failure_threshold=3, recovery_timeout=60.0, service_name=key
+            )
+            self._gates[config.name] = _ProviderGate(config, breaker, limiters.get(key))
+        if quota_store is not None:
+            self.set_quota_used(quota_store.usage())
+
+    def remaining_quota(self) -> dict[str, int]:
+        """Remaining daily lookups per provider."""
+        return {gate.metrics.provider: gate.quota.remaining for gate in self._gates.values()}
+
+    def set_quota_used(self, usage: dict[str, int]) -> None:
+        """Seed today's usage per provider, e.g. from a previous process."""
+        today = _utc_today()
+        for gate in self._gates.values():
+            if gate.metrics.provider in usage:
+                gate.quota.day = today
+                gate.quota.used = usage[gate.metrics.provider]
+
+    async def run(
+        self,
+        leads: Sequence[dict[str, Any]],
+        max_providers: int = 3,
+        providers: Sequence[EmailFinderProvider] | None = None,
+    ) -> BatchEnrichmentResult:
+        """
+        Run the waterfall for every lead.
+
+        Args:
+            leads: Dicts with id (or lead_id), first_name, last_name, company_domain.
+            max_providers: Lookups allowed per lead; skipped providers don't count.
+            providers: Restrict to these providers (e.g. the configured ones).
+
+        Returns:
+            BatchEnrichmentResult with one EnrichmentResult per lead, in input order.
+        """
+        start = time.perf_counter()
+        if self.quota_store is not None:
+            # Pick up lookups made by other schedulers since the last run
+            self.set_quota_used(self.quota_store.usage())
+        allowed = set(providers) if providers is not None else None
+        gates = [g for p, g in self._gates.items() if allowed is None or p in allowed]
+        lead_semaphore = asyncio.Semaphore(self.max_concurrent_leads)
+
+        async def run_lead(lead: dict[str, Any]) -> EnrichmentResult:
+            async with lead_semaphore:
+                return await self._run_waterfall(lead, gates, max_providers)
+
+        results = await asyncio.gather(*(run_lead(lead) for lead in leads))
+
+        batch = BatchEnrichmentResult(
+            results=list(results),
+            provider_metrics={g.metrics.provider: g.metrics for g in gates},
+            duration_ms=int((time.perf_counter() - start) * 1000),
+        )
+        logger.info(
+            f"Waterfall batch complete: {batch.emails_found}/{len(leads)} emails found, "
+            f"cost=${batch.total_cost:.2f}, time={batch.duration_ms}ms"
+        )
+        return batch
+
+    async def _run_waterfall(
+        self,
+        lead: dict[str, Any],
+        gates: list[_ProviderGate],
+        max_providers: int,
+    ) -> EnrichmentResult:
+        """Walk providers in priority order for one lead."""
+        result = EnrichmentResult(
+            lead_id=str(lead.get("id") or lead.get("lead_id") or ""),
+            email=None,
+            verification_status=None,
+            provider_used=None,
+            verifier_used=None,
+            total_cost=0.0,
+            attempts=[],
+            verification=None,
+        )
+        first_name = lead.get("first_name") or ""
+        last_name = lead.get("last_name") or ""
+        domain = lead.get("company_domain") or ""
+        if not (first_name and last_name and domain):
+            return result
+
+        if await self._try_pattern(result, gates, first_name, last_name, domain):
+            return result
+
+        for gate in gates:
+            if len(result.attempts) >= max_providers:
+                break
+
+            # Route around providers that can't take the call right now
+            if not gate.breaker.can_proceed():
+                gate.metrics.skipped_breaker += 1
+                continue
+            if not gate.quota.try_consume():
+                gate.metrics.skipped_quota += 1
+                continue
+            if self.quota_store is not None:
+                self.quota_store.record_use(gate.metrics.provider, gate.quota.day)
+
+            attempt = await self._lookup(gate, first_name, last_name, domain)
+            result.attempts.append(attempt)
+            result.total_cost += attempt.cost
+
+            if attempt.email:
+                result.email = attempt.email
+                result.provider_used = gate.config.name
+                await self._verify(result)
+                if self.pattern_cache is not None and result.verification is not None:
+                    self.pattern_cache.observe(first_name, last_name, domain, result.verification)
+                return result
+
+        result.unresolved = not any(attempt.error is None for attempt in result.attempts)
+        return result
+
+    async def _try_pattern(
+        self,
+        result: EnrichmentResult,
+        gates: list[_ProviderGate],
+        first_name: str,
+        last_name: str,
+        domain: str,
+    ) -> bool:
+        """Verify the domain's learned-pattern address; True when it is accepted."""
+        if self.pattern_cache is None or self._verify_email is None:
+            return False
+        guess = self.pattern_cache.guess(first_name, last_name, domain)
+        if guess is None:
+            return False
+        try:
+            async with self._verify_semaphore:
+                verification = await self._verify_email(guess.email)
+        except Exception as e:
+            logger.warning(f"Pattern verification failed for lead {result.lead_id}: {e}")
+            return False
+
+        result.total_cost += verification.cost
+        # The first lookup the waterfall would otherwise have paid for
+        finder_cost = gates[0].config.cost_per_lookup if gates else 0.0
+        if not self.pattern_cache.record_guess(guess, verification, finder_cost):
+            return False
+
+        result.email = guess.email
+        result.provider_used = EmailFinderProvider.PATTERN
+        result.verification = verification
+        result.verification_status = verification.status
+        result.verifier_used = verification.provider
+        return True
+
+    async def _lookup(
+        self, gate: _ProviderGate, first_name: str, last_name: str, domain: str
+    ) -> EmailFindingResult:
+        """One provider call under the provider's concurrency limit."""
+        metrics = gate.metrics
+        async with gate.semaphore:
+            if gate.rate_limiter:
+                await gate.rate_limiter.acquire()
+
+            metrics.in_flight += 1
+            metrics.peak_in_flight = max(metrics.peak_in_flight, metrics.in_flight)
+            started = time.perf_counter()
+            email: str | None = None
+            error: str | None = None
+            try:
+                email = await self._find_email(gate.config.name, first_name, last_name, domain)
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            finally:
+                metrics.in_flight -= 1
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+
+        metrics.lookups += 1
+        metrics.total_latency_ms += elapsed_ms
+        metrics.cost += gate.config.cost_per_lookup
+        if error is not None:
+            metrics.errors += 1
+            gate.breaker.record_failure()
+            logger.warning(f"Provider {metrics.provider} failed: {error}")
+        else:
+            gate.breaker.record_success()
+            if email:
+                metrics.hits += 1
+            else:
+                metrics.misses += 1
+
+        return EmailFindingResult(
+            email=email,
+            provider=gate.config.name,
+            confidence=gate.config.accuracy if email else 0.0,
+            cost=gate.config.cost_per_lookup,
+            response_time_ms=elapsed_ms,
+            success=email is not None,
+            error=error,
+        )
+
+    async def _verify(self, result: EnrichmentResult) -> None:
+        """Verify the found email; a failed verification keeps the email unverified."""
+        if self._verify_email is None or result.email is None:
+            return
+        try:
+            async with self._verify_semaphore:
+                verification = await self._verify_email(result.email)
+        except Exception as e:
+            logger.warning(f"Verification failed for lead {result.lead_id}: {e}")
+            return
+        result.verification = verification
+        result.verification_status = verification.status
+        result.verifier_used = verification.provider
+        result.total_cost += verification.cost
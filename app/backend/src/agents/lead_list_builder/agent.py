@@ -42,6 +42,8 @@ Database Interactions:
 
 import logging
 import os
+import time
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -421,8 +423,6 @@ Return a summary of scraped leads including count, actor used, and cost."""
         Returns:
             LeadListBuilderResult with scraped leads and metadata.
         """
-        import time
-
         start_time = time.time()
         result = LeadListBuilderResult(
             target_leads=target_leads,
@@ -683,6 +683,101 @@ Return a summary of scraped leads including count, actor used, and cost."""
             "errors": errors,
         }
 
+    async def stream_leads(
+        self,
+        result: LeadListBuilderResult,
+        job_titles: list[str] | None = None,
+        seniority_levels: list[str] | None = None,
+        industries: list[str] | None = None,
+        company_sizes: list[str] | None = None,
+        locations: list[str] | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Scrape leads directly via the Apify waterfall, yielding batches as they arrive.
+
+        Skips Claude orchestration so the orchestrator can write each batch
+        while the actor is still running. Leads are not kept in result.leads;
+        counts, cost, runs, errors and status are filled in on result as the
+        stream progresses and when it ends.
+
+        Args:
+            result: Result to update; its target_leads sets the scrape size.
+            job_titles: Target job titles from persona.
+            seniority_levels: Target seniority levels.
+            industries: Target industries from niche.
+            company_sizes: Target company sizes.
+            locations: Target locations/regions.
+            batch_size: Dataset items per page (and per yielded batch).
+
+        Yields:
+            Lists of lead dictionaries (ApifyLead.to_dict()).
+        """
+        start_time = time.time()
+        result.started_at = result.started_at or datetime.now()
+
+        # Primary actor ID for tracking
+        primary_actor = "IoSHqwTR9YGhzccez"
+
+        if not self.apify_token:
+            result.errors.append({"source": "apify_waterfall", "error": "APIFY_API_TOKEN not set"})
+        else:
+            client = ApifyLeadScraperClient(api_token=self.apify_token)
+            stream = client.stream_leads(
+                job_titles=job_titles or None,
+                seniority_levels=seniority_levels or None,
+                industries=industries or None,
+                company_sizes=company_sizes or None,
+                locations=locations or None,
+                max_leads=result.target_leads,
+                batch_size=batch_size,
+            )
+            try:
+                # Closing the stream aborts a run that is still going
+                async with client, stream:
+                    async for batch in stream:
+                        leads = [lead.to_dict() for lead in batch]
+                        result.total_scraped += len(leads)
+                        if stream.runs[-1].actor_id == primary_actor:
+                            result.primary_actor_leads += len(leads)
+                        else:
+                            result.fallback_actor_leads += len(leads)
+                        yield leads
+            except ApifyError as e:
+                logger.error(f"[{self.name}] Lead streaming failed: {e}")
+                result.errors.append({"source": "apify_waterfall", "error": str(e)})
+            finally:
+                result.total_cost_usd = stream.total_cost_usd
+                result.apify_runs = [
+                    {
+                        "run_id": run.run_id,
+                        "actor_id": run.actor_id,
+                        "cost_usd": run.cost_usd,
+                        "leads_count": run.total_items,
+                    }
+                    for run in stream.runs
+                ]
+
+        result.completed_at = datetime.now()
+        result.execution_time_ms = int((time.time() - start_time) * 1000)
+        if result.total_scraped == 0:
+            result.success = False
+            result.status = "failed"
+            result.errors.append(
+                {"type": "no_leads", "message": "No leads could be scraped from any source"}
+            )
+        elif result.total_scraped < result.target_leads * 0.5:
+            result.status = "partial"
+            result.warnings.append(
+                f"Only scraped {result.total_scraped}/{result.target_leads} leads"
+            )
+
+        logger.info(
+            f"[{self.name}] Lead stream completed: {result.total_scraped} leads "
+            f"(primary={result.primary_actor_leads}, fallback={result.fallback_actor_leads}, "
+            f"cost=${result.total_cost_usd:.2f}, time={result.execution_time_ms}ms)"
+        )
+
     def _build_task_prompt(
         self,
         niche_id: str,
@@ -31,11 +31,17 @@ Database Interactions:
    - Upstream Dependencies: Company Research Agent must complete first
    - Downstream Consumers: Email Generation Agent reads personalization_angles
    - Failure Handling: Returns empty result on budget exceeded, fallback to company angles
+
+All tiers are researched at once from one priority queue (see scheduler.py),
+with per-tier concurrency ceilings and a shared in-flight cap per search backend.
+The campaign budget is shared too, but lower tiers only start a lead when the
+budget left also covers every higher-tier lead still queued.
 """
 
-import asyncio
 import logging
 import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from decimal import Decimal
 from typing import Any
 from uuid import UUID
@@ -54,6 +60,13 @@ from src.agents.lead_research.fact_extractor import (
     extract_facts_from_research,
     rank_angles_from_facts,
 )
+from src.agents.lead_research.scheduler import (
+    DEFAULT_BACKEND_CONCURRENCY,
+    TIER_PRIORITY,
+    PrioritySemaphore,
+    ResearchScheduler,
+    lead_tier,
+)
 from src.agents.lead_research.schemas import (
     COST_CONTROLS,
     LeadData,
@@ -62,6 +75,7 @@ from src.agents.lead_research.schemas import (
     LeadTier,
     ResearchDepth,
     ResearchResult,
+    TierConfig,
 )
 from src.agents.lead_research.tools import LEAD_RESEARCH_TOOLS
 from src.utils.rate_limiter import CircuitBreaker, TokenBucketRateLimiter
@@ -121,12 +135,27 @@ class LeadResearchAgent:
         cost_tracker: Tracks research costs.
         rate_limiters: Per-service rate limiters.
         circuit_breakers: Per-service circuit breakers.
+        tier_concurrency: Per-tier ceilings for concurrently researched leads.
+        backend_slots: Per-service caps on search calls in flight.
     """
 
-    def __init__(self) -> None:
-        """Initialize the Lead Research Agent."""
+    def __init__(
+        self,
+        tier_concurrency: dict[LeadTier, int] | None = None,
+        backend_concurrency: dict[str, int] | None = None,
+    ) -> None:
+        """
+        Initialize the Lead Research Agent.
+
+        Args:
+            tier_concurrency: Leads researched at once per tier
+                (defaults to 10 for A, 20 for B, 30 for C and D).
+            backend_concurrency: Search calls in flight per service across
+                all tiers (defaults to DEFAULT_BACKEND_CONCURRENCY).
+        """
         self.name = "lead_research_agent"
         self.campaign_id: UUID | None = None
+        self.tier_concurrency = tier_concurrency
 
         # Cost tracking
         self._total_cost = Decimal("0.0")
@@ -136,6 +165,11 @@ class LeadResearchAgent:
             "tier_c": Decimal("0.0"),
         }
         self._cost_by_lead: dict[str, Decimal] = {}
+        # Per-lead maximum held for leads still being researched
+        self._reserved_cost = Decimal("0.0")
+        # Leads waiting to start per tier; lower tiers leave their per-lead
+        # maximum free so they cannot spend the budget higher tiers still need
+        self._queued_by_tier: dict[LeadTier, int] = dict.fromkeys(TIER_PRIORITY, 0)
 
         # Rate limiters per service
         self._rate_limiters: dict[str, TokenBucketRateLimiter] = {
@@ -159,6 +193,15 @@ class LeadResearchAgent:
             ),
         }
 
+        # Search calls in flight per service, shared by all tiers
+        self._backend_slots: dict[str, PrioritySemaphore] = {
+            service: PrioritySemaphore(limit)
+            for service, limit in {
+                **DEFAULT_BACKEND_CONCURRENCY,
+                **(backend_concurrency or {}),
+            }.items()
+        }
+
         # SDK MCP server with tools
         self._mcp_server = create_sdk_mcp_server(
             name="lead_research",
@@ -198,13 +241,19 @@ If no specific hooks are found, flag for fallback to company-level personalizati
         self,
         input_data: LeadResearchInput,
         db_session: Any = None,
+        on_result: Callable[[ResearchResult], Awaitable[None]] | None = None,
     ) -> LeadResearchOutput:
         """
         Research all leads in a campaign.
 
+        Every tier runs at once through ResearchScheduler; results are
+        aggregated and passed to on_result as each lead completes rather
+        than after the whole campaign.
+
         Args:
             input_data: Input parameters including campaign_id.
             db_session: Optional database session for persistence.
+            on_result: Optional callback that persists each ResearchResult.
 
         Returns:
             LeadResearchOutput with research summary.
@@ -227,6 +276,8 @@ If no specific hooks are found, flag for fallback to company-level personalizati
 
         # Reset cost tracking
         self._total_cost = Decimal("0.0")
+        self._reserved_cost = Decimal("0.0")
+        self._queued_by_tier = dict.fromkeys(TIER_PRIORITY, 0)
         self._cost_by_tier = {
             "tier_a": Decimal("0.0"),
             "tier_b": Decimal("0.0"),
@@ -249,41 +300,13 @@ If no specific hooks are found, flag for fallback to company-level personalizati
                 fallback_to_company_research=0,
             )
 
-        # Group leads by tier for parallel processing
-        leads_by_tier: dict[str, list[LeadData]] = {"A": [], "B": [], "C": []}
         for lead in leads:
-            tier = lead.lead_tier.value if lead.lead_tier else "C"
-            leads_by_tier[tier].append(lead)
-
-        # Process each tier in parallel (respecting concurrency limits)
-        all_results: list[ResearchResult] = []
+            self._queued_by_tier[lead_tier(lead)] += 1
 
-        # Process Tier A (max 10 concurrent)
-        if leads_by_tier["A"]:
-            tier_a_results = await self._process_tier_parallel(
-                leads_by_tier["A"], LeadTier.A, max_concurrent=10
-            )
-            all_results.extend(tier_a_results)
-            tier_breakdown["tier_a"] = len(tier_a_results)
-
-        # Process Tier B (max 20 concurrent)
-        if leads_by_tier["B"]:
-            tier_b_results = await self._process_tier_parallel(
-                leads_by_tier["B"], LeadTier.B, max_concurrent=20
-            )
-            all_results.extend(tier_b_results)
-            tier_breakdown["tier_b"] = len(tier_b_results)
-
-        # Process Tier C (max 30 concurrent)
-        if leads_by_tier["C"]:
-            tier_c_results = await self._process_tier_parallel(
-                leads_by_tier["C"], LeadTier.C, max_concurrent=30
-            )
-            all_results.extend(tier_c_results)
-            tier_breakdown["tier_c"] = len(tier_c_results)
-
-        # Aggregate results
-        for result in all_results:
+        async def record_result(lead: LeadData, result: ResearchResult) -> None:
+            nonlocal total_researched, facts_extracted, opening_lines_generated, fallback_count
+            tier_key = f"tier_{lead_tier(lead).value.lower()}"
+            tier_breakdown[tier_key] = tier_breakdown.get(tier_key, 0) + 1
             total_researched += 1
             facts_extracted += len(result.facts)
             opening_lines_generated += len(result.angles)
@@ -292,6 +315,18 @@ If no specific hooks are found, flag for fallback to company-level personalizati
             if result.angles and any(a.is_fallback for a in result.angles):
                 fallback_count += 1
 
+            if on_result is not None:
+                await on_result(result)
+
+        # All tiers at once, Tier A first, within per-tier ceilings
+        scheduler = ResearchScheduler(self.research_single_lead, self.tier_concurrency)
+        report = await scheduler.run(leads, on_result=record_result)
+
+        tier_timings = ", ".join(
+            f"{tier.value}={ms}ms" for tier, ms in sorted(report.tier_finished_ms.items())
+        )
+        logger.info(f"Research tiers finished: {tier_timings}")
+
         # Calculate averages
         avg_hooks = opening_lines_generated / total_researched if total_researched > 0 else 0.0
 
@@ -338,11 +373,31 @@ If no specific hooks are found, flag for fallback to company-level personalizati
             f"tier={lead.lead_tier}, depth={tier_config.depth}"
         )
 
-        # Check budget
-        if not self._check_lead_budget(lead.lead_tier or LeadTier.C):
+        # Check budget, then hold this tier's per-lead maximum until the lead's
+        # actual cost is known so concurrent leads cannot overrun the campaign
+        tier = lead_tier(lead)
+        if self._queued_by_tier[tier] > 0:
+            self._queued_by_tier[tier] -= 1
+        if not self._check_lead_budget(tier):
             logger.warning(f"Budget exceeded for lead {lead_id}")
             return self._create_empty_result(lead, tier_config.depth)
 
+        reserved = self._max_cost_per_lead(tier)
+        self._reserved_cost += reserved
+        try:
+            return await self._research_lead(lead, tier_config, company_research)
+        finally:
+            self._reserved_cost -= reserved
+
+    async def _research_lead(
+        self,
+        lead: LeadData,
+        tier_config: TierConfig,
+        company_research: dict[str, Any] | None,
+    ) -> ResearchResult:
+        """Run the tier's searches for one lead and build its ResearchResult."""
+        lead_id = str(lead.id)
+
         # Collect research data
         research_data: dict[str, Any] = {
             "linkedin_posts": [],
@@ -429,33 +484,11 @@ If no specific hooks are found, flag for fallback to company-level personalizati
     # Private Methods: Research Helpers
     # =========================================================================
 
-    async def _process_tier_parallel(
-        self,
-        leads: list[LeadData],
-        tier: LeadTier,
-        max_concurrent: int,
-    ) -> list[ResearchResult]:
-        """Process leads of a tier in parallel."""
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def research_with_semaphore(lead: LeadData) -> ResearchResult:
-            async with semaphore:
-                return await self.research_single_lead(lead)
-
-        tasks = [research_with_semaphore(lead) for lead in leads]
-        gather_results: list[ResearchResult | BaseException] = await asyncio.gather(
-            *tasks, return_exceptions=True
-        )
-
-        # Filter out exceptions
-        valid_results: list[ResearchResult] = []
-        for i, result in enumerate(gather_results):
-            if isinstance(result, BaseException):
-                logger.error(f"Failed to research lead {leads[i].id}: {result}")
-            elif isinstance(result, ResearchResult):
-                valid_results.append(result)
-
-        return valid_results
+    @asynccontextmanager
+    async def _backend_slot(self, service: str, lead: LeadData) -> AsyncIterator[None]:
+        """Hold one of the service's shared in-flight slots, admitted by tier."""
+        async with self._backend_slots[service].slot(TIER_PRIORITY[lead_tier(lead)]):
+            yield
 
     @retry(  # type: ignore[misc]
         retry=retry_if_exception_type((RateLimitExceededError,)),
@@ -477,15 +510,16 @@ If no specific hooks are found, flag for fallback to company-level personalizati
 
         try:
             # Use .handler to call SDK MCP tool
-            result = await search_linkedin_posts_tool.handler(
-                {
-                    "first_name": lead.first_name or "",
-                    "last_name": lead.last_name or "",
-                    "title": lead.title or "",
-                    "company_name": lead.company_name or "",
-                    "max_results": 5,
-                }
-            )
+            async with self._backend_slot("tavily", lead):
+                result = await search_linkedin_posts_tool.handler(
+                    {
+                        "first_name": lead.first_name or "",
+                        "last_name": lead.last_name or "",
+                        "title": lead.title or "",
+                        "company_name": lead.company_name or "",
+                        "max_results": 5,
+                    }
+                )
 
             if result.get("is_error"):
                 self._circuit_breakers["tavily"].record_failure()
@@ -517,14 +551,15 @@ If no specific hooks are found, flag for fallback to company-level personalizati
 
         try:
             # Use .handler to call SDK MCP tool
-            result = await search_linkedin_profile_tool.handler(
-                {
-                    "first_name": lead.first_name or "",
-                    "last_name": lead.last_name or "",
-                    "title": lead.title or "",
-                    "company_name": lead.company_name or "",
-                }
-            )
+            async with self._backend_slot("serper", lead):
+                result = await search_linkedin_profile_tool.handler(
+                    {
+                        "first_name": lead.first_name or "",
+                        "last_name": lead.last_name or "",
+                        "title": lead.title or "",
+                        "company_name": lead.company_name or "",
+                    }
+                )
 
             if result.get("is_error"):
                 self._circuit_breakers["serper"].record_failure()
@@ -556,14 +591,15 @@ If no specific hooks are found, flag for fallback to company-level personalizati
 
         try:
             # Use .handler to call SDK MCP tool
-            result = await search_articles_authored_tool.handler(
-                {
-                    "first_name": lead.first_name or "",
-                    "last_name": lead.last_name or "",
-                    "title": lead.title or "",
-                    "max_results": 3,
-                }
-            )
+            async with self._backend_slot("tavily", lead):
+                result = await search_articles_authored_tool.handler(
+                    {
+                        "first_name": lead.first_name or "",
+                        "last_name": lead.last_name or "",
+                        "title": lead.title or "",
+                        "max_results": 3,
+                    }
+                )
 
             if result.get("is_error"):
                 self._circuit_breakers["tavily"].record_failure()
@@ -595,14 +631,15 @@ If no specific hooks are found, flag for fallback to company-level personalizati
 
         try:
             # Use .handler to call SDK MCP tool
-            result = await search_podcast_appearances_tool.handler(
-                {
-                    "first_name": lead.first_name or "",
-                    "last_name": lead.last_name or "",
-                    "title": lead.title or "",
-                    "max_results": 3,
-                }
-            )
+            async with self._backend_slot("tavily", lead):
+                result = await search_podcast_appearances_tool.handler(
+                    {
+                        "first_name": lead.first_name or "",
+                        "last_name": lead.last_name or "",
+                        "title": lead.title or "",
+                        "max_results": 3,
+                    }
+                )
 
             if result.get("is_error"):
                 self._circuit_breakers["tavily"].record_failure()
@@ -648,16 +685,31 @@ If no specific hooks are found, flag for fallback to company-level personalizati
     # =========================================================================
 
     def _check_lead_budget(self, tier: LeadTier) -> bool:
-        """Check if we have budget for this lead's tier."""
+        """
+        Check if we have budget for this lead's tier.
+
+        Leads still being researched count at their tier's per-lead maximum,
+        so tiers running concurrently cannot jointly overrun the campaign.
+        Leads of higher tiers that have not started yet are held back at
+        their maximum too, so lower tiers cannot starve them.
+        """
         max_campaign: Decimal = COST_CONTROLS["max_per_campaign"]  # type: ignore[assignment]
-        if self._total_cost >= max_campaign:
+        committed = self._total_cost + self._reserved_cost
+        if committed >= max_campaign:
             return False
 
-        tier_key = f"max_per_lead_{tier.value.lower()}"
-        max_per_lead: Decimal = COST_CONTROLS.get(tier_key, Decimal("0.01"))  # type: ignore[assignment]
+        # Budget still owed to queued leads of higher tiers
+        held_back = sum(
+            (
+                self._max_cost_per_lead(higher) * queued
+                for higher, queued in self._queued_by_tier.items()
+                if TIER_PRIORITY[higher] < TIER_PRIORITY[tier]
+            ),
+            Decimal("0.0"),
+        )
 
         # Check if adding max cost would exceed budget
-        if self._total_cost + max_per_lead > max_campaign:
+        if committed + held_back + self._max_cost_per_lead(tier) > max_campaign:
             return False
 
         # Check alert threshold
@@ -668,6 +720,12 @@ If no specific hooks are found, flag for fallback to company-level personalizati
 
         return True
 
+    def _max_cost_per_lead(self, tier: LeadTier) -> Decimal:
+        """The tier's per-lead cost ceiling from COST_CONTROLS."""
+        tier_key = f"max_per_lead_tier_{tier.value.lower()}"
+        max_per_lead: Decimal = COST_CONTROLS.get(tier_key, Decimal("0.01"))  # type: ignore[assignment]
+        return max_per_lead
+
     def _update_cost(self, tier: LeadTier, cost: Decimal, lead_id: str) -> None:
         """Update cost tracking."""
         self._total_cost += cost
@@ -0,0 +1,229 @@
+"""
+Tier-aware research scheduling.
+
+Campaign research used to run Tier A, then Tier B, then Tier C, each tier
+waiting for the slowest lead of the one before it. ResearchScheduler instead
+treats the tiers as priority bands of one work queue and runs them all at
+once: whenever a tier is below its concurrency ceiling, its next lead is
+started, highest tier first.
+
+Outbound search calls from all tiers share one PrioritySemaphore per search
+backend, which caps the calls in flight to that backend. Waiting calls are
+admitted by tier, so Tier A never queues behind Tier C searches and campaign
+wall time approaches Tier A's own critical path.
+
+Each ResearchResult is handed to ``on_result`` as soon as its lead finishes,
+so results can be persisted while the rest of the campaign is still running.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.agents.lead_research.schemas import LeadData, LeadTier, ResearchResult
+
+logger = logging.getLogger(__name__)
+
+# Lower runs first
+TIER_PRIORITY: dict[LeadTier, int] = {
+    LeadTier.A: 0,
+    LeadTier.B: 1,
+    LeadTier.C: 2,
+    LeadTier.D: 3,
+}
+
+# Leads researched at once, per tier
+DEFAULT_TIER_CONCURRENCY: dict[LeadTier, int] = {
+    LeadTier.A: 10,
+    LeadTier.B: 20,
+    LeadTier.C: 30,
+    LeadTier.D: 30,
+}
+
+# Search calls in flight at once, per backend, across all tiers
+DEFAULT_BACKEND_CONCURRENCY: dict[str, int] = {
+    "tavily": 20,
+    "serper": 20,
+    "perplexity": 10,
+}
+
+
+def lead_tier(lead: LeadData) -> LeadTier:
+    """The lead's tier; untiered leads are researched as Tier C."""
+    return lead.lead_tier or LeadTier.C
+
+
+class PrioritySemaphore:
+    """
+    Semaphore that admits waiters by priority (lower first), then FIFO.
+
+    Usage:
+        async with semaphore.slot(priority=0):
+            await call_backend()
+    """
+
+    def __init__(self, value: int) -> None:
+        """
+        Initialize the semaphore.
+
+        Args:
+            value: Number of slots.
+        """
+        self._value = value
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Hold one slot for the duration of the block."""
+        await self._acquire(priority)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # A slot handed over just before cancellation goes to the next waiter
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+
+@dataclass
+class ScheduleReport:
+    """Outcome of one scheduled campaign run."""
+
+    completed: dict[LeadTier, int] = field(default_factory=dict)
+    failed: dict[LeadTier, int] = field(default_factory=dict)
+    # Milliseconds from start until each tier's last lead finished
+    tier_finished_ms: dict[LeadTier, int] = field(default_factory=dict)
+    duration_ms: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "completed": {tier.value: count for tier, count in self.completed.items()},
+            "failed": {tier.value: count for tier, count in self.failed.items()},
+            "tier_finished_ms": {tier.value: ms for tier, ms in self.tier_finished_ms.items()},
+            "duration_ms": self.duration_ms,
+        }
+
+
+class ResearchScheduler:
+    """
+    Runs lead research for all tiers from one priority queue.
+
+    Attributes:
+        tier_concurrency: Maximum leads in flight per tier.
+    """
+
+    def __init__(
+        self,
+        research: Callable[[LeadData], Awaitable[ResearchResult]],
+        tier_concurrency: dict[LeadTier, int] | None = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            research: Researches one lead (LeadResearchAgent.research_single_lead).
+            tier_concurrency: Per-tier ceilings (defaults to DEFAULT_TIER_CONCURRENCY).
+        """
+        self._research = research
+        self.tier_concurrency = {
+            tier: max(1, limit)
+            for tier, limit in {**DEFAULT_TIER_CONCURRENCY, **(tier_concurrency or {})}.items()
+        }
+
+    async def run(
+        self,
+        leads: list[LeadData],
+        on_result: Callable[[LeadData, ResearchResult], Awaitable[None]] | None = None,
+    ) -> ScheduleReport:
+        """
+        Research all leads, streaming each result to on_result.
+
+        A lead whose research raises is logged and counted as failed.
+
+        Args:
+            leads: Leads of any tier.
+            on_result: Awaited once per successful lead, as it completes.
+
+        Returns:
+            ScheduleReport with per-tier counts and finish times.
+        """
+        start_time = time.time()
+        report = ScheduleReport()
+
+        queues: dict[LeadTier, deque[LeadData]] = {tier: deque() for tier in TIER_PRIORITY}
+        for lead in leads:
+            queues[lead_tier(lead)].append(lead)
+        in_flight = dict.fromkeys(TIER_PRIORITY, 0)
+        pending: dict[asyncio.Task[bool], LeadTier] = {}
+
+        async def research_one(lead: LeadData) -> bool:
+            try:
+                result = await self._research(lead)
+            except Exception as e:
+                logger.error(f"Failed to research lead {lead.id}: {e}")
+                return False
+            if on_result is not None:
+                try:
+                    await on_result(lead, result)
+                except Exception as e:
+                    logger.error(f"Failed to persist research for lead {lead.id}: {e}")
+            return True
+
+        try:
+            while pending or any(queues.values()):
+                # Fill every tier up to its ceiling, highest priority first
+                for tier in TIER_PRIORITY:
+                    queue = queues[tier]
+                    while queue and in_flight[tier] < self.tier_concurrency[tier]:
+                        task = asyncio.create_task(research_one(queue.popleft()))
+                        pending[task] = tier
+                        in_flight[tier] += 1
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tier = pending.pop(task)
+                    in_flight[tier] -= 1
+                    counts = report.completed if task.result() else report.failed
+                    counts[tier] = counts.get(tier, 0) + 1
+                    if not queues[tier] and not in_flight[tier]:
+                        report.tier_finished_ms[tier] = int((time.time() - start_time) * 1000)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        report.duration_ms = int((time.time() - start_time) * 1000)
+        return report
@@ -12,9 +12,11 @@ from src.agents.lead_scoring.agent import (
     score_leads,
 )
 from src.agents.lead_scoring.job_title_matcher import (
+    CompiledTitleMatcher,
     JobTitleMatcher,
     extract_seniority_level,
 )
+from src.agents.lead_scoring.parallel import ParallelScorer
 from src.agents.lead_scoring.schemas import (
     LeadScoreRecord,
     ScoringContext,
@@ -33,8 +35,11 @@ __all__ = [
     "LeadScoringResult",
     "score_leads",
     # Matcher
+    "CompiledTitleMatcher",
     "JobTitleMatcher",
     "extract_seniority_level",
+    # Parallel scoring
+    "ParallelScorer",
     # Schemas
     "LeadScoreRecord",
     "ScoringContext",
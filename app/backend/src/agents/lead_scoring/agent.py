@@ -34,6 +34,7 @@ Database Interactions:
    - Failure Handling: Returns LeadScoringResult with success=False, errors populated
 """
 
+import asyncio
 import logging
 import os
 import time
@@ -44,6 +45,7 @@ from typing import Any, Final
 from claude_agent_sdk import ClaudeAgentOptions, create_sdk_mcp_server, query
 from claude_agent_sdk.types import AssistantMessage
 
+from src.agents.lead_scoring.parallel import ParallelScorer
 from src.agents.lead_scoring.schemas import (
     LeadScore,
     LeadScoreRecord,
@@ -167,6 +169,7 @@ class LeadScoringAgent:
         name: Agent name for logging.
         model: Claude model to use.
         batch_size: Number of leads per batch.
+        scoring_workers: Worker processes for direct-mode scoring (0 = in-process).
     """
 
     def __init__(
@@ -174,6 +177,7 @@ class LeadScoringAgent:
         model: str = DEFAULT_MODEL,
         batch_size: int = 2000,
         job_title_threshold: float = 0.80,
+        scoring_workers: int | None = 0,
     ) -> None:
         """
         Initialize Lead Scoring Agent.
@@ -182,16 +186,21 @@ class LeadScoringAgent:
             model: Claude model to use.
             batch_size: Number of leads to process per batch.
             job_title_threshold: Threshold for job title fuzzy matching.
+            scoring_workers: Worker processes for direct-mode scoring. 0 scores
+                in-process; None uses one per CPU. The pool is only started
+                when there is more than one batch to score.
         """
         self.name = "lead_scoring"
         self.model = model
         self.batch_size = batch_size
         self.job_title_threshold = job_title_threshold
+        self.scoring_workers = scoring_workers
 
         logger.info(
             f"[{self.name}] Agent initialized "
             f"(model={model}, batch_size={batch_size}, "
-            f"job_title_threshold={job_title_threshold})"
+            f"job_title_threshold={job_title_threshold}, "
+            f"scoring_workers={scoring_workers})"
         )
 
     @property
@@ -316,23 +325,10 @@ QUALITY GOALS:
             started_at=datetime.now(),
         )
 
-        # Create scoring model
-        context = ScoringContext.from_dict(scoring_context_data)
-        model = ScoringModel(context, job_title_threshold=self.job_title_threshold)
-
-        # Convert leads to records
-        lead_records = [LeadScoreRecord.from_dict(lead) for lead in leads_data]
-
-        # Score all leads
-        all_scores: list[LeadScore] = []
-        for i in range(0, len(lead_records), self.batch_size):
-            batch = lead_records[i : i + self.batch_size]
-            batch_scores = model.score_leads_batch(batch)
-            all_scores.extend(batch_scores)
-
-            logger.debug(
-                f"[{self.name}] Scored batch {i // self.batch_size + 1}: {len(batch_scores)} leads"
-            )
+        if self.scoring_workers != 0 and len(leads_data) > self.batch_size:
+            all_scores = await self._score_in_pool(leads_data, scoring_context_data)
+        else:
+            all_scores = await self._score_in_process(leads_data, scoring_context_data)
 
         # Calculate statistics
         total_scored = len(all_scores)
@@ -386,6 +382,50 @@ QUALITY GOALS:
 
         return result
 
+    async def _score_in_process(
+        self,
+        leads_data: list[dict[str, Any]],
+        scoring_context_data: dict[str, Any],
+    ) -> list[LeadScore]:
+        """Score all leads in this process, yielding to the event loop between batches."""
+        # Create scoring model
+        context = ScoringContext.from_dict(scoring_context_data)
+        model = ScoringModel(context, job_title_threshold=self.job_title_threshold)
+
+        # Convert leads to records
+        lead_records = [LeadScoreRecord.from_dict(lead) for lead in leads_data]
+
+        # Score all leads
+        all_scores: list[LeadScore] = []
+        for i in range(0, len(lead_records), self.batch_size):
+            batch = lead_records[i : i + self.batch_size]
+            batch_scores = model.score_leads_batch(batch)
+            all_scores.extend(batch_scores)
+
+            logger.debug(
+                f"[{self.name}] Scored batch {i // self.batch_size + 1}: {len(batch_scores)} leads"
+            )
+            await asyncio.sleep(0)
+
+        return all_scores
+
+    async def _score_in_pool(
+        self,
+        leads_data: list[dict[str, Any]],
+        scoring_context_data: dict[str, Any],
+    ) -> list[LeadScore]:
+        """Score all leads on worker processes; same results and order as in-process."""
+        async with ParallelScorer(
+            scoring_context_data,
+            job_title_threshold=self.job_title_threshold,
+            max_workers=self.scoring_workers,
+        ) as scorer:
+            logger.info(
+                f"[{self.name}] Scoring {len(leads_data)} leads on "
+                f"{scorer.max_workers} worker processes"
+            )
+            return await scorer.score(leads_data, self.batch_size)
+
     async def _run_with_claude(
         self,
         campaign_id: str,
@@ -515,6 +555,7 @@ async def score_leads(
     scoring_context: dict[str, Any],
     batch_size: int = 2000,
     use_claude: bool = False,
+    scoring_workers: int | None = 0,
 ) -> LeadScoringResult:
     """
     Convenience function to score leads.
@@ -525,11 +566,12 @@ async def score_leads(
         scoring_context: Scoring context dictionary.
         batch_size: Number of leads per batch.
         use_claude: If True, use Claude for orchestration.
+        scoring_workers: Worker processes for direct-mode scoring (0 = in-process).
 
     Returns:
         LeadScoringResult with scores and statistics.
     """
-    agent = LeadScoringAgent(batch_size=batch_size)
+    agent = LeadScoringAgent(batch_size=batch_size, scoring_workers=scoring_workers)
     return await agent.run(
         campaign_id=campaign_id,
         leads=leads,
@@ -5,8 +5,9 @@ Provides fuzzy matching with synonyms and seniority extraction.
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Any, Final
 
 # =============================================================================
@@ -59,6 +60,21 @@ SENIORITY_PATTERNS: Final[list[tuple[str, str]]] = [
     (r"\b(specialist|coordinator|analyst|associate)\b", "ic"),
 ]
 
+_COMPILED_SENIORITY_PATTERNS: Final[list[tuple[re.Pattern[str], str]]] = [
+    (re.compile(pattern, re.IGNORECASE), level) for pattern, level in SENIORITY_PATTERNS
+]
+
+# Noise removed by normalize_title, applied in order
+_TITLE_NOISE_PATTERNS: Final[list[re.Pattern[str]]] = [
+    re.compile(r"\s*-\s*"),  # Dashes
+    re.compile(r"\s*,\s*"),  # Commas
+    re.compile(r"\s+"),  # Multiple spaces
+    re.compile(r"[^\w\s]"),  # Special characters
+]
+
+# Default size of the per-matcher lead title cache
+DEFAULT_TITLE_CACHE_SIZE: Final[int] = 8192
+
 # Job title synonyms for better matching
 TITLE_SYNONYMS: Final[dict[str, list[str]]] = {
     # Marketing titles
@@ -176,15 +192,8 @@ def normalize_title(title: str) -> str:
     normalized = title.lower()
 
     # Remove common noise
-    noise_patterns = [
-        r"\s*-\s*",  # Dashes
-        r"\s*,\s*",  # Commas
-        r"\s+",  # Multiple spaces
-        r"[^\w\s]",  # Special characters
-    ]
-
-    for pattern in noise_patterns:
-        normalized = re.sub(pattern, " ", normalized)
+    for pattern in _TITLE_NOISE_PATTERNS:
+        normalized = pattern.sub(" ", normalized)
 
     return normalized.strip()
 
@@ -228,8 +237,8 @@ def extract_seniority_level(title: str) -> str:
     title_lower = title.lower()
 
     # Check patterns in order of seniority (highest first)
-    for pattern, level in SENIORITY_PATTERNS:
-        if re.search(pattern, title_lower, re.IGNORECASE):
+    for pattern, level in _COMPILED_SENIORITY_PATTERNS:
+        if pattern.search(title_lower):
             return level
 
     return "ic"  # Default to individual contributor
@@ -240,12 +249,15 @@ def get_seniority_rank(level: str) -> int:
     return SENIORITY_LEVELS.get(level.lower(), 0)
 
 
-def expand_with_synonyms(title: str) -> list[str]:
+def expand_with_synonyms(
+    title: str,
+    synonym_map: dict[str, list[str]] | None = None,
+) -> list[str]:
     """Expand title with synonyms."""
     result = [title]
 
     title_lower = title.lower()
-    for canonical, synonyms in TITLE_SYNONYMS.items():
+    for canonical, synonyms in (synonym_map or TITLE_SYNONYMS).items():
         if title_lower == canonical.lower():
             result.extend(synonyms)
         elif title_lower in [s.lower() for s in synonyms]:
@@ -255,6 +267,186 @@ def expand_with_synonyms(title: str) -> list[str]:
     return list(set(result))
 
 
+def _build_synonym_index(synonym_map: dict[str, list[str]]) -> dict[str, set[str]]:
+    """
+    Map a lowercased title to every title expand_with_synonyms adds for it.
+
+    Lets compiled matchers expand a title with one dict lookup instead of
+    scanning the whole synonym dictionary.
+    """
+    index: dict[str, set[str]] = {}
+    for canonical, synonyms in synonym_map.items():
+        index.setdefault(canonical.lower(), set()).update(synonyms)
+        for synonym in synonyms:
+            synonym_lower = synonym.lower()
+            if synonym_lower == canonical.lower():
+                continue
+            index.setdefault(synonym_lower, set()).add(canonical)
+            index[synonym_lower].update(s for s in synonyms if s.lower() != synonym_lower)
+    return index
+
+
+class _TargetVariants:
+    """One target title with its synonym variants normalized once."""
+
+    __slots__ = ("title", "persona", "matchers")
+
+    def __init__(self, title: str, persona: str | None, variants: set[str]) -> None:
+        self.title = title
+        self.persona = persona
+        # (normalized variant, matcher with seq2 preprocessed); None for empty
+        # raw titles, which calculate_similarity always scores 0.0
+        self.matchers: list[tuple[str, SequenceMatcher[str] | None]] = []
+        for variant in {normalize_title(v) for v in variants if v}:
+            matcher: SequenceMatcher[str] = SequenceMatcher(None)
+            matcher.set_seq2(variant)
+            self.matchers.append((variant, matcher))
+        if "" in variants:
+            self.matchers.append(("", None))
+
+
+class CompiledTitleMatcher:
+    """
+    Job title matcher compiled for one fixed set of targets.
+
+    Built once per scoring context: target and persona titles are expanded
+    with synonyms and normalized up front, each target variant keeps a
+    SequenceMatcher with its second sequence preprocessed, and results are
+    cached per lead title (titles repeat heavily within a campaign).
+
+    The optional prefilter uses difflib's real_quick_ratio/quick_ratio upper
+    bounds to skip pairs that cannot beat the current best score, so results
+    are identical to JobTitleMatcher.match.
+
+    Example:
+        >>> compiled = JobTitleMatcher().compile(target_titles, personas)
+        >>> result = compiled.match("VP of Marketing")
+    """
+
+    def __init__(
+        self,
+        target_titles: list[str],
+        personas: list[dict[str, Any]] | None = None,
+        threshold: float = 0.80,
+        synonyms: dict[str, list[str]] | None = None,
+        cache_size: int = DEFAULT_TITLE_CACHE_SIZE,
+        prefilter: bool = True,
+    ) -> None:
+        """
+        Compile targets.
+
+        Args:
+            target_titles: Target job titles
+            personas: Optional persona dictionaries with name and job_titles
+            threshold: Minimum similarity score for a match (0.0-1.0)
+            synonyms: Custom synonym dictionary
+            cache_size: Maximum cached lead titles (0 disables caching)
+            prefilter: Skip pairs whose upper bound cannot beat the best score
+        """
+        self.threshold = threshold
+        self.prefilter = prefilter
+        self._synonym_index = _build_synonym_index(synonyms or TITLE_SYNONYMS)
+
+        self._targets = [self._compile_target(t, None) for t in target_titles]
+        self._persona_targets = [
+            self._compile_target(title, persona.get("name", "Unknown"))
+            for persona in personas or []
+            for title in persona.get("job_titles", [])
+        ]
+
+        self._cached_match = lru_cache(maxsize=cache_size)(self._match_uncached)
+
+    def _expand(self, title: str) -> set[str]:
+        """Same variants as expand_with_synonyms, via the precomputed index."""
+        return {title} | self._synonym_index.get(title.lower(), set())
+
+    def _compile_target(self, title: str, persona: str | None) -> _TargetVariants:
+        return _TargetVariants(title, persona, self._expand(title))
+
+    def _best_variant_score(
+        self,
+        lead_variants: list[str],
+        target: _TargetVariants,
+        floor: float,
+        inclusive: bool,
+    ) -> float | None:
+        """
+        Best similarity between any lead and target variant.
+
+        Returns None when the prefilter proves the score cannot reach
+        ``floor`` (``>= floor`` if inclusive, else ``> floor``).
+        """
+        best: float | None = None
+        for variant, matcher in target.matchers:
+            if matcher is None:
+                best = max(best or 0.0, 0.0)
+                continue
+            for lead_variant in lead_variants:
+                if lead_variant == variant:
+                    return 1.0
+                matcher.set_seq1(lead_variant)
+                if self.prefilter:
+                    bound = matcher.real_quick_ratio()
+                    if bound < floor or (not inclusive and bound == floor):
+                        continue
+                    bound = matcher.quick_ratio()
+                    if bound < floor or (not inclusive and bound == floor):
+                        continue
+                score = matcher.ratio()
+                if best is None or score > best:
+                    best = score
+        return best
+
+    def _match_uncached(self, lead_title_lower: str) -> MatchResult:
+        lead_variants = list({normalize_title(v) for v in self._expand(lead_title_lower)})
+
+        best_score = 0.0
+        best_title: str | None = None
+        best_persona: str | None = None
+
+        # Strictly better scores win for target titles (first best target kept)
+        for target in self._targets:
+            score = self._best_variant_score(lead_variants, target, best_score, False)
+            if score is not None and score > best_score:
+                best_score = score
+                best_title = target.title
+
+        # Ties go to persona titles (last tied persona title kept)
+        for target in self._persona_targets:
+            score = self._best_variant_score(lead_variants, target, best_score, True)
+            if score is not None and score >= best_score:
+                best_score = score
+                best_title = target.title
+                best_persona = target.persona
+
+        matched = best_score >= self.threshold
+        return MatchResult(
+            matched=matched,
+            score=best_score,
+            matched_title=best_title if matched else None,
+            matched_persona=best_persona if matched else None,
+            seniority_level=extract_seniority_level(lead_title_lower),
+        )
+
+    def match(self, lead_title: str | None) -> MatchResult:
+        """
+        Match a lead title against the compiled targets.
+
+        Args:
+            lead_title: Lead's job title
+
+        Returns:
+            MatchResult with match details (a fresh copy on every call)
+        """
+        if not lead_title:
+            return MatchResult()
+        return replace(self._cached_match(lead_title.lower()))
+
+    def cache_info(self) -> Any:
+        """functools cache statistics for the lead title cache."""
+        return self._cached_match.cache_info()
+
+
 class JobTitleMatcher:
     """
     Job title matcher with fuzzy matching and synonym support.
@@ -303,11 +495,11 @@ class JobTitleMatcher:
         best_persona: str | None = None
 
         # Expand lead title with synonyms
-        lead_variants = expand_with_synonyms(lead_title)
+        lead_variants = expand_with_synonyms(lead_title, self.synonyms)
 
         # Match against target titles
         for target in target_titles:
-            target_variants = expand_with_synonyms(target)
+            target_variants = expand_with_synonyms(target, self.synonyms)
 
             for lead_var in lead_variants:
                 for target_var in target_variants:
@@ -324,7 +516,7 @@ class JobTitleMatcher:
                 persona_name = persona.get("name", "Unknown")
 
                 for target in persona_titles:
-                    target_variants = expand_with_synonyms(target)
+                    target_variants = expand_with_synonyms(target, self.synonyms)
 
                     for lead_var in lead_variants:
                         for target_var in target_variants:
@@ -345,6 +537,34 @@ class JobTitleMatcher:
             seniority_level=seniority,
         )
 
+    def compile(
+        self,
+        target_titles: list[str],
+        personas: list[dict[str, Any]] | None = None,
+        cache_size: int = DEFAULT_TITLE_CACHE_SIZE,
+        prefilter: bool = True,
+    ) -> CompiledTitleMatcher:
+        """
+        Compile a matcher for a fixed set of targets (same results as match()).
+
+        Args:
+            target_titles: List of target job titles to match against
+            personas: Optional list of persona dictionaries
+            cache_size: Maximum cached lead titles
+            prefilter: Skip pairs that cannot beat the current best score
+
+        Returns:
+            CompiledTitleMatcher bound to these targets
+        """
+        return CompiledTitleMatcher(
+            target_titles,
+            personas,
+            threshold=self.threshold,
+            synonyms=self.synonyms,
+            cache_size=cache_size,
+            prefilter=prefilter,
+        )
+
     def match_seniority(
         self,
         lead_seniority: str | None,
@@ -0,0 +1,135 @@
+"""
+Process-pool lead scoring.
+
+Scoring is pure CPU work, so large campaigns are split into batches and scored
+across worker processes. The serialized ScoringContext is handed to each worker
+once through the pool initializer, where it builds its own ScoringModel (and
+compiled title matcher); afterwards only lead batches and their scores cross
+the process boundary.
+
+Batches are submitted in order with a bounded number in flight and collected
+in submission order, so results are identical to, and in the same order as,
+serial ScoringModel.score_leads_batch calls. The event loop only awaits
+executor futures and stays free to serve other work while workers score.
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from src.agents.lead_scoring.schemas import LeadScore, LeadScoreRecord, ScoringContext
+from src.agents.lead_scoring.scoring_model import ScoringModel
+
+logger = logging.getLogger(__name__)
+
+# Per-process model, built once by _init_worker
+_worker_model: ScoringModel | None = None
+
+
+def _init_worker(scoring_context_data: dict[str, Any], job_title_threshold: float) -> None:
+    """Build this worker's ScoringModel from the serialized context."""
+    global _worker_model
+    context = ScoringContext.from_dict(scoring_context_data)
+    _worker_model = ScoringModel(context, job_title_threshold=job_title_threshold)
+
+
+def _score_batch(leads_data: list[dict[str, Any]]) -> list[LeadScore]:
+    """Score one batch of raw lead dicts in a worker process."""
+    if _worker_model is None:
+        raise RuntimeError("Scoring worker was not initialized")
+    return _worker_model.score_leads_batch([LeadScoreRecord.from_dict(lead) for lead in leads_data])
+
+
+class ParallelScorer:
+    """
+    Scores lead batches on a pool of worker processes.
+
+    Use as an async context manager so the pool is shut down, without
+    blocking the event loop, when scoring finishes:
+
+        async with ParallelScorer(context_data, max_workers=4) as scorer:
+            scores = await scorer.score(leads, batch_size=2000)
+
+    Attributes:
+        max_workers: Number of worker processes.
+        max_pending: Maximum batches submitted but not yet collected.
+    """
+
+    def __init__(
+        self,
+        scoring_context_data: dict[str, Any],
+        job_title_threshold: float = 0.80,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        """
+        Start the worker pool.
+
+        Args:
+            scoring_context_data: ScoringContext as a dict (see ScoringContext.from_dict).
+            job_title_threshold: Threshold for job title fuzzy matching.
+            max_workers: Worker processes; defaults to one per CPU.
+            max_pending: Batches in flight; defaults to twice the worker count.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.max_workers
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(scoring_context_data, job_title_threshold),
+        )
+
+    def __enter__(self) -> "ParallelScorer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool, dropping batches not yet started."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    async def __aenter__(self) -> "ParallelScorer":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Shut down the worker pool off the event loop, dropping batches not yet started."""
+        await asyncio.to_thread(self.close)
+
+    async def score(self, leads_data: list[dict[str, Any]], batch_size: int) -> list[LeadScore]:
+        """
+        Score leads across the pool.
+
+        Args:
+            leads_data: Lead dictionaries (see LeadScoreRecord.from_dict).
+            batch_size: Leads per batch sent to a worker.
+
+        Returns:
+            One LeadScore per lead, in input order.
+        """
+        loop = asyncio.get_running_loop()
+        pending: deque[asyncio.Future[list[LeadScore]]] = deque()
+        scores: list[LeadScore] = []
+
+        try:
+            for start in range(0, len(leads_data), batch_size):
+                if len(pending) >= self.max_pending:
+                    scores.extend(await pending.popleft())
+                batch = leads_data[start : start + batch_size]
+                pending.append(loop.run_in_executor(self._pool, _score_batch, batch))
+
+            while pending:
+                scores.extend(await pending.popleft())
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+        logger.debug(f"Scored {len(scores)} leads on {self.max_workers} worker processes")
+        return scores
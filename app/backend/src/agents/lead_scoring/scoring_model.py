@@ -179,6 +179,10 @@ class ScoringModel:
 
         # Pre-compute target values for efficiency
         self._target_titles = context.get_all_target_job_titles()
+        self._title_matcher = self.job_title_matcher.compile(
+            self._target_titles,
+            [{"name": p.name, "job_titles": p.job_titles} for p in context.personas],
+        )
         self._target_seniorities = context.get_all_target_seniorities()
         self._target_sizes = context.get_all_target_company_sizes()
         self._target_countries = context.target_countries
@@ -241,20 +245,8 @@ class ScoringModel:
                 "reason": "No job title provided",
             }
 
-        # Match against target titles and personas
-        personas_dicts = [
-            {
-                "name": p.name,
-                "job_titles": p.job_titles,
-            }
-            for p in self.context.personas
-        ]
-
-        match_result = self.job_title_matcher.match(
-            lead.title,
-            self._target_titles,
-            personas_dicts,
-        )
+        # Match against target titles and personas (compiled once per context)
+        match_result = self._title_matcher.match(lead.title)
 
         if match_result.matched:
             # Scale similarity to max points
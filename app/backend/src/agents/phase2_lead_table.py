@@ -0,0 +1,366 @@
+"""
+Columnar lead table and stage checkpoints for the in-memory Phase 2 pipeline.
+
+In the default pipeline every stage reloads the campaign's leads as ORM rows
+and writes its results back before the next stage runs. With
+Phase2Config.in_memory_pipeline the orchestrator instead loads the campaign
+once into a LeadTable (one list per column, low-cardinality strings
+interned), runs validation, dedup, cross-campaign dedup, scoring and the
+import finalizer against it, and writes only the final state of each
+changed lead back in one set-based bulk write.
+
+After every stage the changed lead state is saved to a local SQLite file
+(Phase2CheckpointStore), so a run that fails before the write-back can be
+resumed with ``resume_from`` without losing earlier stages.
+
+Usage:
+    table = LeadTable(campaign_id)
+    async for rows in lead_repo.stream_campaign_lead_rows(campaign_id):
+        table.append_rows(rows)
+    leads = table.records(status="new")
+    ...
+    await lead_repo.bulk_write_lead_state(table.state_rows())
+"""
+
+import json
+import logging
+import sqlite3
+import sys
+import time
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from src.agents.data_validation.schemas import LeadValidationResult
+from src.database.repositories.lead_repository import NORMALIZED_LEAD_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Column order of the rows produced by LeadRepository.stream_campaign_lead_rows
+LEAD_TABLE_COLUMNS: tuple[str, ...] = (
+    "id",
+    "campaign_id",
+    "first_name",
+    "last_name",
+    "full_name",
+    "email",
+    "phone",
+    "linkedin_url",
+    "title",
+    "seniority",
+    "department",
+    "company_name",
+    "company_domain",
+    "company_size",
+    "company_industry",
+    "location",
+    "city",
+    "state",
+    "country",
+    "status",
+    "source",
+    "validation_status",
+    "validation_errors",
+    "duplicate_of",
+    "exclusion_reason",
+    "excluded_due_to_campaign",
+    "lead_score",
+    "score_breakdown",
+    "lead_tier",
+    "persona_tags",
+    "created_at",
+    "updated_at",
+)
+
+# Columns the pipeline stages change and the final write-back persists
+LEAD_STATE_COLUMNS: tuple[str, ...] = (
+    "status",
+    "validation_status",
+    "validation_errors",
+    "duplicate_of",
+    "exclusion_reason",
+    "excluded_due_to_campaign",
+    "lead_score",
+    "lead_tier",
+    "score_breakdown",
+    "persona_tags",
+    *NORMALIZED_LEAD_FIELDS,
+)
+
+_UUID_COLUMNS = frozenset({"id", "campaign_id", "duplicate_of", "excluded_due_to_campaign"})
+
+# Repeated values shared as one string object per distinct value
+_INTERNED_COLUMNS = frozenset(
+    {
+        "seniority",
+        "department",
+        "company_size",
+        "company_industry",
+        "city",
+        "state",
+        "country",
+        "status",
+        "source",
+        "validation_status",
+        "exclusion_reason",
+        "lead_tier",
+    }
+)
+
+# Empty values LeadModel.to_dict() returns for NULL JSON/array columns
+_RECORD_DEFAULTS: dict[str, type] = {
+    "validation_errors": list,
+    "score_breakdown": dict,
+    "persona_tags": list,
+}
+
+_CHECKPOINT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS phase2_checkpoints (
+    campaign_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    state TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (campaign_id, stage)
+);
+"""
+
+
+class LeadTable:
+    """
+    One campaign's leads held column-wise in memory.
+
+    Stages read leads with records() (same dict shape as LeadModel.to_dict())
+    and record their results with the apply_* / mark_* methods; every lead a
+    stage changes is tracked for the final write-back.
+
+    Attributes:
+        campaign_id: Campaign the leads belong to.
+        columns: Column name -> values, one entry per lead.
+    """
+
+    def __init__(self, campaign_id: str) -> None:
+        self.campaign_id = campaign_id
+        self.columns: dict[str, list[Any]] = {name: [] for name in LEAD_TABLE_COLUMNS}
+        self._index: dict[str, int] = {}
+        self._dirty: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def append_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Add rows whose values follow LEAD_TABLE_COLUMNS."""
+        targets = [
+            (self.columns[name], name in _UUID_COLUMNS, name in _INTERNED_COLUMNS)
+            for name in LEAD_TABLE_COLUMNS
+        ]
+        for row in rows:
+            self._index[str(row[0])] = len(self._index)
+            for (values, is_uuid, interned), value in zip(targets, row, strict=True):
+                if value is not None and is_uuid:
+                    value = str(value)
+                elif interned and isinstance(value, str):
+                    value = sys.intern(value)
+                values.append(value)
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def _rows(
+        self,
+        status: str | Sequence[str] | None = None,
+        exclude_status: str | Sequence[str] | None = None,
+    ) -> list[int]:
+        statuses = self.columns["status"]
+        include = {status} if isinstance(status, str) else set(status or ())
+        exclude = {exclude_status} if isinstance(exclude_status, str) else set(exclude_status or ())
+        return [
+            i
+            for i, value in enumerate(statuses)
+            if (not include or value in include) and value not in exclude
+        ]
+
+    def records(
+        self,
+        status: str | Sequence[str] | None = None,
+        exclude_status: str | Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Leads as dicts, filtered like LeadRepository.get_campaign_leads.
+
+        Args:
+            status: Only leads with these status(es)
+            exclude_status: Skip leads with these status(es)
+
+        Returns:
+            Lead dicts in load order, shaped like LeadModel.to_dict()
+        """
+        return [self.record(i) for i in self._rows(status, exclude_status)]
+
+    def record(self, row: int) -> dict[str, Any]:
+        """One lead as a dict."""
+        data = {name: values[row] for name, values in self.columns.items()}
+        data["job_title"] = data["title"]  # Alias for agent compatibility
+        for name, default in _RECORD_DEFAULTS.items():
+            if data[name] is None:
+                data[name] = default()
+        return data
+
+    def count(
+        self,
+        status: str | Sequence[str] | None = None,
+        exclude_status: str | Sequence[str] | None = None,
+    ) -> int:
+        """Number of leads matching the filters."""
+        return len(self._rows(status, exclude_status))
+
+    # =========================================================================
+    # Stage results
+    # =========================================================================
+
+    def _set(self, lead_id: str, **values: Any) -> bool:
+        row = self._index.get(str(lead_id))
+        if row is None:
+            return False
+        for name, value in values.items():
+            self.columns[name][row] = value
+        self._dirty.add(row)
+        return True
+
+    def apply_validation(self, results: Iterable[LeadValidationResult]) -> int:
+        """Record validation results and normalized field values."""
+        return sum(
+            self._set(
+                result.lead_id,
+                validation_status="valid" if result.is_valid else "invalid",
+                validation_errors=list(result.errors),
+                status="validated" if result.is_valid else "invalid",
+                **{
+                    name: result.normalized_data[name]
+                    for name in NORMALIZED_LEAD_FIELDS
+                    if result.normalized_data.get(name) is not None
+                },
+            )
+            for result in results
+        )
+
+    def mark_duplicates(self, duplicate_pairs: Iterable[tuple[str, str]]) -> int:
+        """Mark (duplicate_id, primary_id) pairs as duplicates."""
+        return sum(
+            self._set(dup_id, duplicate_of=str(primary_id), status="duplicate")
+            for dup_id, primary_id in duplicate_pairs
+        )
+
+    def mark_cross_duplicates(self, exclusions: Iterable[dict[str, Any]]) -> int:
+        """Exclude leads found in other campaigns or the suppression list."""
+        marked = 0
+        for exclusion in exclusions:
+            values: dict[str, Any] = {
+                "exclusion_reason": exclusion.get("exclusion_reason", "cross_campaign_duplicate"),
+                "status": "cross_campaign_duplicate",
+            }
+            # Keep the existing campaign when none is given
+            if exclusion.get("excluded_due_to_campaign"):
+                values["excluded_due_to_campaign"] = str(exclusion["excluded_due_to_campaign"])
+            marked += self._set(exclusion["lead_id"], **values)
+        return marked
+
+    def apply_scores(self, scores: Iterable[dict[str, Any]]) -> int:
+        """Record lead scores and tiers."""
+        return sum(
+            self._set(
+                score["lead_id"],
+                lead_score=score["score"],
+                lead_tier=score["tier"],
+                score_breakdown=score.get("breakdown", {}),
+                persona_tags=score.get("persona_tags", []),
+                status="scored",
+            )
+            for score in scores
+        )
+
+    # =========================================================================
+    # Write-back and checkpoints
+    # =========================================================================
+
+    def state_rows(self) -> list[dict[str, Any]]:
+        """Final state of every lead a stage changed, for the bulk write-back."""
+        ids = self.columns["id"]
+        return [
+            {"id": ids[row], **{name: self.columns[name][row] for name in LEAD_STATE_COLUMNS}}
+            for row in sorted(self._dirty)
+        ]
+
+    def restore_state(self, rows: Iterable[dict[str, Any]]) -> int:
+        """Re-apply state rows saved from an earlier run."""
+        return sum(
+            self._set(row["id"], **{name: row.get(name) for name in LEAD_STATE_COLUMNS})
+            for row in rows
+        )
+
+
+class Phase2CheckpointStore:
+    """
+    Changed lead state saved after each in-memory pipeline stage (SQLite, WAL).
+
+    Each checkpoint holds the cumulative state_rows() of the campaign's
+    LeadTable when the stage finished; the newest one is restored on resume.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Open (or create) the checkpoint file.
+
+        Args:
+            path: SQLite file path. ":memory:" keeps checkpoints for this process only.
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_CHECKPOINT_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "Phase2CheckpointStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
+    def save(self, campaign_id: str, stage: str, table: LeadTable) -> None:
+        """Save the table's changed state as the checkpoint for a finished stage."""
+        rows = table.state_rows()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO phase2_checkpoints (campaign_id, stage, state, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            (str(campaign_id), stage, json.dumps(rows), time.time()),
+        )
+        self._conn.commit()
+        logger.info(
+            f"Checkpointed {len(rows)} lead states after {stage} for campaign {campaign_id}"
+        )
+
+    def load(self, campaign_id: str) -> tuple[str, list[dict[str, Any]]] | None:
+        """The newest checkpoint as (stage, state rows), or None."""
+        row = self._conn.execute(
+            "SELECT stage, state FROM phase2_checkpoints WHERE campaign_id = ? "
+            "ORDER BY created_at DESC, rowid DESC LIMIT 1",
+            (str(campaign_id),),
+        ).fetchone()
+        if row is None:
+            return None
+        return str(row[0]), json.loads(row[1])
+
+    def clear(self, campaign_id: str) -> None:
+        """Drop a campaign's checkpoints once its state is persisted."""
+        self._conn.execute(
+            "DELETE FROM phase2_checkpoints WHERE campaign_id = ?", (str(campaign_id),)
+        )
+        self._conn.commit()
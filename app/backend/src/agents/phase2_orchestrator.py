@@ -31,6 +31,7 @@ Per LEARN-007: Agents are pure functions. The orchestrator handles all persisten
 
 import logging
 import time
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -38,14 +39,16 @@ from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.agents.cross_campaign_dedup.agent import CrossCampaignDedupAgent
+from src.agents.cross_campaign_dedup.exclusion_index import ExclusionIndexStore
 from src.agents.data_validation.agent import DataValidationAgent
 from src.agents.duplicate_detection.agent import DuplicateDetectionAgent
 from src.agents.exceptions import (
     AgentExecutionError,
 )
 from src.agents.import_finalizer.agent import ImportFinalizerAgent
-from src.agents.lead_list_builder import LeadListBuilderAgent
+from src.agents.lead_list_builder import LeadListBuilderAgent, LeadListBuilderResult
 from src.agents.lead_scoring.agent import LeadScoringAgent
+from src.agents.phase2_lead_table import LeadTable, Phase2CheckpointStore
 from src.agents.retry_utils import with_agent_retry
 from src.database.repositories import (
     CampaignRepository,
@@ -78,6 +81,25 @@ class Phase2Config:
     lookback_days: int = 90
     exclude_bounced: bool = True
     exclude_unsubscribed: bool = True
+    historical_chunk_size: int = 5000  # Rows per server-side fetch of history
+    # Local SQLite exclusion index synced incrementally across runs (None = query Postgres)
+    exclusion_index_path: str | None = None
+
+    # Persistence settings
+    write_chunk_size: int = 1000  # Leads per set-based UPDATE statement
+    # Stream Apify dataset pages straight into leads while the scrape runs,
+    # skipping Claude orchestration and the in-memory lead list
+    stream_lead_ingestion: bool = False
+    ingest_chunk_size: int = 1000  # Leads per multi-row INSERT when streaming
+    # Load the campaign once into an in-memory lead table, run every stage
+    # against it and write each lead's final state back in one bulk write
+    in_memory_pipeline: bool = False
+    # SQLite file for per-stage checkpoints of the in-memory table (None = none)
+    checkpoint_path: str | None = None
+
+    # Worker processes for CPU-bound stages (0 = stay in-process, None = one per CPU)
+    validation_workers: int | None = 0
+    scoring_workers: int | None = 0
 
     # Export settings
     export_to_sheets: bool = True
@@ -181,6 +203,10 @@ class Phase2Orchestrator:
         self.niche_repo = NicheRepository(session)
         self.persona_repo = PersonaRepository(session)
 
+        # In-memory pipeline state (only used with config.in_memory_pipeline)
+        self._lead_table: LeadTable | None = None
+        self._checkpoints: Phase2CheckpointStore | None = None
+
     async def run(
         self,
         campaign_id: str,
@@ -215,7 +241,44 @@ class Phase2Orchestrator:
 
         Returns:
             Phase2Result with outcomes and lead list URL
+
+        With config.in_memory_pipeline, steps 3-11 run against a lead table
+        loaded once from the database; lead updates are written back in one
+        bulk write at the end, and checkpointed after each step when
+        config.checkpoint_path is set.
         """
+        if not self.config.in_memory_pipeline:
+            return await self._run_stages(
+                campaign_id, niche_id, target_leads, resume_from, force_continue
+            )
+
+        self._lead_table = None
+        self._checkpoints = (
+            Phase2CheckpointStore(self.config.checkpoint_path)
+            if self.config.checkpoint_path
+            else None
+        )
+        try:
+            result = await self._run_stages(
+                campaign_id, niche_id, target_leads, resume_from, force_continue
+            )
+            await self._write_back_lead_table(campaign_id, result)
+            return result
+        finally:
+            if self._checkpoints is not None:
+                self._checkpoints.close()
+            self._checkpoints = None
+            self._lead_table = None
+
+    async def _run_stages(
+        self,
+        campaign_id: str,
+        niche_id: str,
+        target_leads: int,
+        resume_from: str | None,
+        force_continue: bool,
+    ) -> Phase2Result:
+        """Run the Phase 2 steps; see run()."""
         start_time = time.time()
         result = Phase2Result(campaign_id=campaign_id, niche_id=niche_id)
 
@@ -305,9 +368,11 @@ class Phase2Orchestrator:
                     details={
                         "total_valid": result.total_valid,
                         "total_invalid": result.total_invalid,
+                        "persistence_ms": validation_result.get("persistence_ms", 0),
                     },
                 )
                 await self.campaign_repo.commit()
+                self._checkpoint(campaign_id, "data_validation")
 
             except AgentExecutionError as e:
                 logger.error(f"Data Validation Agent failed: {e}")
@@ -372,6 +437,7 @@ class Phase2Orchestrator:
                     details=dedup_result.get("details", {}),
                 )
                 await self.campaign_repo.commit()
+                self._checkpoint(campaign_id, "duplicate_detection")
 
             except AgentExecutionError as e:
                 logger.error(f"Duplicate Detection Agent failed: {e}")
@@ -443,6 +509,7 @@ class Phase2Orchestrator:
                     details=cross_dedup_result.get("details", {}),
                 )
                 await self.campaign_repo.commit()
+                self._checkpoint(campaign_id, "cross_campaign_dedup")
 
             except AgentExecutionError as e:
                 logger.error(f"Cross-Campaign Dedup Agent failed: {e}")
@@ -508,6 +575,7 @@ class Phase2Orchestrator:
                     tier_c=result.tier_c_count,
                 )
                 await self.campaign_repo.commit()
+                self._checkpoint(campaign_id, "lead_scoring")
 
             except AgentExecutionError as e:
                 logger.error(f"Lead Scoring Agent failed: {e}")
@@ -648,8 +716,36 @@ class Phase2Orchestrator:
         industries = list(set(industries))
         company_sizes = list(set(company_sizes))
 
-        # Run the agent (pure function - no side effects)
         agent = LeadListBuilderAgent()
+        if self.config.stream_lead_ingestion:
+            result = LeadListBuilderResult(target_leads=target_leads)
+            # Closed even if ingestion fails, which aborts a still-running scrape
+            async with aclosing(
+                agent.stream_leads(
+                    result,
+                    job_titles=job_titles,
+                    seniority_levels=seniority_levels,
+                    industries=industries,
+                    company_sizes=company_sizes,
+                    batch_size=self.config.ingest_chunk_size,
+                )
+            ) as batches:
+                inserted = await self.lead_repo.ingest_leads(
+                    campaign_id=campaign_id,
+                    batches=batches,
+                    chunk_size=self.config.ingest_chunk_size,
+                )
+            logger.info(f"Streamed {inserted} leads into database")
+            return {
+                "total_scraped": result.total_scraped,
+                "cost": result.total_cost_usd,
+                "primary_actor_leads": result.primary_actor_leads,
+                "fallback_actor_leads": result.fallback_actor_leads,
+                "apify_runs": result.apify_runs,
+                "errors": result.errors,
+            }
+
+        # Run the agent (pure function - no side effects)
         result = await agent.run(
             niche_id=niche_id,
             campaign_id=campaign_id,
@@ -691,36 +787,34 @@ class Phase2Orchestrator:
         """
         logger.info(f"Running Data Validation Agent for campaign {campaign_id}")
 
-        # Get leads from database (status='new' from Lead List Builder)
-        leads = await self.lead_repo.get_campaign_leads(
-            campaign_id=campaign_id,
-            status="new",
-        )
+        # Get leads (status='new' from Lead List Builder)
+        leads_data = await self._stage_leads(campaign_id, status="new")
 
-        if not leads:
+        if not leads_data:
             logger.warning(f"No leads found for validation in campaign {campaign_id}")
             return {"total_valid": 0, "total_invalid": 0, "validation_rate": 0.0}
 
-        # Convert to dict format for agent
-        leads_data = [lead.to_dict() for lead in leads]
-
         # Run the agent (pure function - no side effects)
-        agent = DataValidationAgent()
+        agent = DataValidationAgent(validation_workers=self.config.validation_workers)
         result = await agent.run(campaign_id=campaign_id, leads=leads_data)
 
         # Persist validation results to database (orchestrator handles persistence)
-        if result.batch_results:
-            for batch in result.batch_results:
-                for lead_result in batch.results:
-                    await self.lead_repo.update_lead_validation(
-                        lead_id=lead_result.lead_id,
-                        is_valid=lead_result.is_valid,
-                        validation_errors=lead_result.errors,
-                    )
+        persist_start = time.perf_counter()
+        lead_results = [
+            lead_result for batch in result.batch_results for lead_result in batch.results
+        ]
+        if self._lead_table is not None:
+            self._lead_table.apply_validation(lead_results)
+        else:
+            await self.lead_repo.bulk_update_validation_results(
+                [lead_result.to_dict() for lead_result in lead_results],
+                chunk_size=self.config.write_chunk_size,
+            )
+        persistence_ms = int((time.perf_counter() - persist_start) * 1000)
 
         logger.info(
             f"Data Validation complete: {result.total_valid}/{result.total_processed} valid "
-            f"({result.validation_rate:.1%})"
+            f"({result.validation_rate:.1%}), persisted in {persistence_ms}ms"
         )
 
         return {
@@ -729,6 +823,7 @@ class Phase2Orchestrator:
             "validation_rate": result.validation_rate,
             "needs_enrichment": result.needs_enrichment,
             "error_breakdown": result.error_breakdown,
+            "persistence_ms": persistence_ms,
         }
 
     async def _run_duplicate_detection(
@@ -746,13 +841,10 @@ class Phase2Orchestrator:
         """
         logger.info(f"Running Duplicate Detection Agent for campaign {campaign_id}")
 
-        # Get valid leads from database
-        leads = await self.lead_repo.get_campaign_leads(
-            campaign_id=campaign_id,
-            status="valid",
-        )
+        # Get leads that passed validation
+        leads_data = await self._stage_leads(campaign_id, status="validated")
 
-        if not leads:
+        if not leads_data:
             logger.warning(f"No valid leads for dedup in campaign {campaign_id}")
             return {
                 "total_checked": 0,
@@ -764,9 +856,6 @@ class Phase2Orchestrator:
                 "details": {},
             }
 
-        # Convert to dict format for agent
-        leads_data = [lead.to_dict() for lead in leads]
-
         # Run the agent (pure function - no side effects)
         agent = DuplicateDetectionAgent()
         result = await agent.run(campaign_id=campaign_id, leads=leads_data)
@@ -777,10 +866,14 @@ class Phase2Orchestrator:
         _ = result.primary_updates  # Acknowledged but not persisted yet
 
         # Mark duplicates with duplicate_of reference
-        for update in result.duplicate_updates:
-            await self.lead_repo.mark_as_duplicate(
-                lead_id=update["lead_id"],
-                duplicate_of=update["duplicate_of"],
+        duplicate_pairs = [
+            (update["lead_id"], update["duplicate_of"]) for update in result.duplicate_updates
+        ]
+        if self._lead_table is not None:
+            self._lead_table.mark_duplicates(duplicate_pairs)
+        else:
+            await self.lead_repo.bulk_mark_duplicates(
+                duplicate_pairs, chunk_size=self.config.write_chunk_size
             )
 
         logger.info(
@@ -823,12 +916,9 @@ class Phase2Orchestrator:
         logger.info(f"Running Cross-Campaign Dedup Agent for campaign {campaign_id}")
 
         # Get unique leads (not invalid, not duplicate)
-        leads = await self.lead_repo.get_campaign_leads(
-            campaign_id=campaign_id,
-            exclude_status=["invalid", "duplicate"],
-        )
+        leads_data = await self._stage_leads(campaign_id, exclude_status=["invalid", "duplicate"])
 
-        if not leads:
+        if not leads_data:
             logger.warning(f"No leads for cross-campaign dedup in campaign {campaign_id}")
             return {
                 "total_checked": 0,
@@ -841,34 +931,58 @@ class Phase2Orchestrator:
                 "details": {},
             }
 
-        # Convert to dict format for agent
-        leads_data = [lead.to_dict() for lead in leads]
-
-        # Get historical leads from other campaigns within lookback period
-        # TODO: Implement get_historical_leads in LeadRepository
-        historical_data: list[dict[str, Any]] = []  # Placeholder until method exists
-
-        # Get suppression list
-        suppression_list = await self.lead_repo.get_suppression_list()
-
         # Run the agent (pure function - no side effects)
         agent = CrossCampaignDedupAgent(
             lookback_days=lookback_days,
             fuzzy_threshold=0.85,
         )
-        result = await agent.run(
-            campaign_id=campaign_id,
-            leads=leads_data,
-            historical_data=historical_data,
-            suppression_list=suppression_list,
-        )
+
+        if self.config.exclusion_index_path:
+            # Apply only rows changed since the last run, then match locally
+            with ExclusionIndexStore(self.config.exclusion_index_path) as store:
+                await store.sync(self.lead_repo, chunk_size=self.config.historical_chunk_size)
+                result = await agent.run_streaming(
+                    campaign_id=campaign_id,
+                    leads=leads_data,
+                    historical_chunks=store.stream_historical_contacts(
+                        campaign_id=campaign_id,
+                        lookback_days=lookback_days,
+                        chunk_size=self.config.historical_chunk_size,
+                    ),
+                    suppression_list=store.get_suppression_list(),
+                )
+        else:
+            # Get suppression list
+            suppression_list = await self.lead_repo.get_suppression_list()
+
+            # Stream historical leads from other campaigns within lookback period.
+            # Only projected columns are fetched and matching starts on the first chunk.
+            historical_chunks = self.lead_repo.stream_historical_contacts(
+                campaign_id=campaign_id,
+                lookback_days=lookback_days,
+                chunk_size=self.config.historical_chunk_size,
+            )
+            result = await agent.run_streaming(
+                campaign_id=campaign_id,
+                leads=leads_data,
+                historical_chunks=historical_chunks,
+                suppression_list=suppression_list,
+            )
 
         # Persist exclusion results to database (orchestrator handles persistence)
-        for exclusion in result.exclusions:
-            await self.lead_repo.mark_cross_campaign_duplicate(
-                lead_id=exclusion.lead_id,
-                exclusion_reason=exclusion.exclusion_reason,
-                excluded_due_to_campaign=exclusion.excluded_due_to_campaign,
+        exclusions = [
+            {
+                "lead_id": exclusion.lead_id,
+                "exclusion_reason": exclusion.exclusion_reason,
+                "excluded_due_to_campaign": exclusion.excluded_due_to_campaign,
+            }
+            for exclusion in result.exclusions
+        ]
+        if self._lead_table is not None:
+            self._lead_table.mark_cross_duplicates(exclusions)
+        else:
+            await self.lead_repo.bulk_mark_cross_duplicates(
+                exclusions, chunk_size=self.config.write_chunk_size
             )
 
         logger.info(
@@ -915,12 +1029,11 @@ class Phase2Orchestrator:
         logger.info(f"Running Lead Scoring Agent for campaign {campaign_id}")
 
         # Get available leads (not invalid, not duplicate, not cross-campaign duplicate)
-        leads = await self.lead_repo.get_campaign_leads(
-            campaign_id=campaign_id,
-            exclude_status=["invalid", "duplicate", "cross_campaign_duplicate"],
+        leads_data = await self._stage_leads(
+            campaign_id, exclude_status=["invalid", "duplicate", "cross_campaign_duplicate"]
         )
 
-        if not leads:
+        if not leads_data:
             logger.warning(f"No leads for scoring in campaign {campaign_id}")
             return {
                 "total_scored": 0,
@@ -931,9 +1044,6 @@ class Phase2Orchestrator:
                 "tier_d_count": 0,
             }
 
-        # Convert to dict format for agent
-        leads_data = [lead.to_dict() for lead in leads]
-
         # Build scoring context from niche and personas
         niche = await self.niche_repo.get_niche(niche_id)
         personas = await self.persona_repo.get_personas_by_niche(niche_id)
@@ -961,7 +1071,7 @@ class Phase2Orchestrator:
         }
 
         # Run the agent (pure function - no side effects)
-        agent = LeadScoringAgent()
+        agent = LeadScoringAgent(scoring_workers=self.config.scoring_workers)
         result = await agent.run(
             campaign_id=campaign_id,
             leads=leads_data,
@@ -969,13 +1079,11 @@ class Phase2Orchestrator:
         )
 
         # Persist scoring results to database (orchestrator handles persistence)
-        for score in result.lead_scores:
-            await self.lead_repo.update_lead_score(
-                lead_id=score["lead_id"],
-                score=score["score"],
-                tier=score["tier"],
-                breakdown=score["breakdown"],
-                persona_tags=score.get("persona_tags", []),
+        if self._lead_table is not None:
+            self._lead_table.apply_scores(result.lead_scores)
+        else:
+            await self.lead_repo.bulk_update_scores(
+                result.lead_scores, chunk_size=self.config.write_chunk_size
             )
 
         logger.info(
@@ -1024,17 +1132,11 @@ class Phase2Orchestrator:
         niche_data = niche.to_dict() if niche else None
 
         # Get all valid leads and filter by tier
-        all_leads = await self.lead_repo.get_campaign_leads(
-            campaign_id=campaign_id,
-            exclude_status=["invalid", "duplicate", "cross_campaign_duplicate"],
+        all_leads_data = await self._stage_leads(
+            campaign_id, exclude_status=["invalid", "duplicate", "cross_campaign_duplicate"]
         )
-        tier_a_leads = [lead for lead in all_leads if getattr(lead, "tier", None) == "A"]
-        tier_b_leads = [lead for lead in all_leads if getattr(lead, "tier", None) == "B"]
-
-        # Convert to dict format for agent
-        tier_a_data = [lead.to_dict() for lead in tier_a_leads]
-        tier_b_data = [lead.to_dict() for lead in tier_b_leads]
-        all_leads_data = [lead.to_dict() for lead in all_leads]
+        tier_a_data = [lead for lead in all_leads_data if lead.get("lead_tier") == "A"]
+        tier_b_data = [lead for lead in all_leads_data if lead.get("lead_tier") == "B"]
 
         # Run the agent (pure function - no side effects)
         agent = ImportFinalizerAgent()
@@ -1064,6 +1166,91 @@ class Phase2Orchestrator:
             "errors": result.errors,
         }
 
+    # =========================================================================
+    # Lead Loading and In-Memory Pipeline
+    # =========================================================================
+
+    async def _stage_leads(
+        self,
+        campaign_id: str,
+        status: str | list[str] | None = None,
+        exclude_status: str | list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Leads for a stage as dicts.
+
+        Reads the in-memory lead table when config.in_memory_pipeline is set
+        (loading it on first use), otherwise queries the database.
+        """
+        if self.config.in_memory_pipeline:
+            table = await self._get_lead_table(campaign_id)
+            return table.records(status=status, exclude_status=exclude_status)
+
+        leads = await self.lead_repo.get_campaign_leads(
+            campaign_id=campaign_id,
+            status=status,
+            exclude_status=exclude_status,
+        )
+        return [lead.to_dict() for lead in leads]
+
+    async def _get_lead_table(self, campaign_id: str) -> LeadTable:
+        """Load the campaign's leads once, re-applying the newest checkpoint if any."""
+        if self._lead_table is not None:
+            return self._lead_table
+
+        start = time.perf_counter()
+        table = LeadTable(campaign_id)
+        async for rows in self.lead_repo.stream_campaign_lead_rows(campaign_id):
+            table.append_rows(rows)
+
+        if self._checkpoints is not None:
+            checkpoint = self._checkpoints.load(campaign_id)
+            if checkpoint is not None:
+                stage, states = checkpoint
+                restored = table.restore_state(states)
+                logger.info(f"Restored {restored} lead states from {stage} checkpoint")
+
+        logger.info(
+            f"Loaded {len(table)} leads into memory for campaign {campaign_id} "
+            f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+        )
+        self._lead_table = table
+        return table
+
+    def _checkpoint(self, campaign_id: str, stage: str) -> None:
+        """Save the lead table's changed state after a stage (in-memory mode only)."""
+        if self._checkpoints is not None and self._lead_table is not None:
+            self._checkpoints.save(campaign_id, stage, self._lead_table)
+
+    async def _write_back_lead_table(self, campaign_id: str, result: Phase2Result) -> None:
+        """Persist the final state of every lead the in-memory stages changed."""
+        if self._lead_table is None:
+            return
+
+        start = time.perf_counter()
+        try:
+            written = await self.lead_repo.bulk_write_lead_state(
+                self._lead_table.state_rows(),
+                chunk_size=self.config.write_chunk_size,
+            )
+            await self.lead_repo.commit()
+        except Exception as e:
+            # Checkpoints are kept, so the run can be resumed
+            logger.error(f"Writing back Phase 2 lead state failed: {e}")
+            await self.lead_repo.rollback()
+            result.agent_errors["lead_write_back"] = str(e)
+            result.status = "failed"
+            result.error = f"Lead write-back failed: {e}"
+            return
+
+        if self._checkpoints is not None:
+            self._checkpoints.clear(campaign_id)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        result.execution_time_ms += int(elapsed_ms)
+        logger.info(
+            f"Wrote back {written} lead states for campaign {campaign_id} in {elapsed_ms:.0f}ms"
+        )
+
     # =========================================================================
     # Retry Wrappers
     # =========================================================================
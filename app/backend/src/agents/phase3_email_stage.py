@@ -0,0 +1,513 @@
+"""
+Concurrent email-finding stage for the Phase 3 orchestrator (Agent 3.1).
+
+Streams the campaign's leads that still need an email from the repository
+in id-ordered pages and runs the EmailVerificationAgent waterfall for each
+page through a WaterfallScheduler, so many leads are in flight at once
+under per-provider concurrency limits and daily quotas. Provider calls go
+through the orchestrator's circuit breakers (email_finder_*,
+email_verifier_reoon); the stage stops with CircuitBreakerError when every
+finder circuit is open.
+
+Pages are pipelined: while the waterfall runs for one page, the previous
+page's results are written with one set-based UPDATE per chunk
+(LeadRepository.bulk_update_email_results) and the next page is read.
+After each write the last lead id and running totals are saved to the
+workflow checkpoint (agent "email_verification", step "email_stage") in
+the same transaction, so a resumed run continues after that id. Finished
+leads also get an email_status ("not_found" when a provider answered
+without one), which keeps them out of later queries even without a
+checkpoint. Leads no provider answered for (all skipped by quota or
+breaker, or failed) keep a NULL status, and the cursor stops before the
+first of them so a later run retries them.
+
+Per-provider latency histograms and per-lead cost histograms (by the
+provider that found the email) are reported in provider_breakdown.
+
+Usage:
+    stage = Phase3EmailStage(lead_repo, checkpoint_repo, config, breakers)
+    report = await stage.run(campaign_id, workflow_id=workflow_id)
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field, fields
+from typing import TYPE_CHECKING, Any
+
+from src.agents.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from src.agents.email_verification.agent import EmailVerificationAgent
+from src.agents.email_verification.schemas import (
+    EmailFinderProvider,
+    EmailVerificationStatus,
+    EnrichmentResult,
+)
+from src.agents.email_verification.waterfall import BatchEnrichmentResult, WaterfallScheduler
+from src.agents.exceptions import CircuitBreakerError
+from src.database.repositories import LeadRepository, WorkflowCheckpointRepository
+
+if TYPE_CHECKING:
+    from src.agents.phase3_orchestrator import Phase3Config
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_AGENT_ID = "email_verification"
+CHECKPOINT_STEP_ID = "email_stage"
+
+# Phase3Config.email_provider_order names that differ from EmailFinderProvider values
+_CONFIG_PROVIDER_NAMES = {"norbert": EmailFinderProvider.VOILA_NORBERT}
+
+LATENCY_BUCKETS_MS: tuple[float, ...] = (100, 250, 500, 1000, 2500, 5000, 10000)
+COST_BUCKETS_USD: tuple[float, ...] = (0.0, 0.003, 0.01, 0.02, 0.03, 0.05)
+
+NOT_FOUND = "not_found"
+UNVERIFIED = "unverified"
+
+
+# =============================================================================
+# Histograms and Progress
+# =============================================================================
+
+
+@dataclass
+class Histogram:
+    """Fixed-bucket histogram; a value lands in the first bucket whose bound is >= it."""
+
+    bounds: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    @property
+    def count(self) -> int:
+        """Number of observed values."""
+        return sum(self.counts)
+
+    def observe(self, value: float) -> None:
+        """Add one value."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the q-quantile (None past the last bound)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary (per-bucket counts, not cumulative)."""
+        labels = [f"<={bound:g}" for bound in self.bounds] + [f">{self.bounds[-1]:g}"]
+        return {
+            "count": self.count,
+            "sum": round(self.total, 4),
+            "mean": round(self.total / self.count, 4) if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+@dataclass
+class EmailStageProgress:
+    """Running totals of the email stage, saved in the workflow checkpoint."""
+
+    cursor: str | None = None
+    processed: int = 0
+    found: int = 0
+    verified: int = 0
+    invalid: int = 0
+    risky: int = 0
+    catchall: int = 0
+    unverified: int = 0
+    not_found: int = 0
+    deferred: int = 0
+    pattern_hits: int = 0
+    cost_usd: float = 0.0
+    chunks: int = 0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "EmailStageProgress":
+        """Restore from checkpoint output_data (unknown keys are ignored)."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known})
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for the checkpoint."""
+        data = asdict(self)
+        data["cost_usd"] = round(self.cost_usd, 4)
+        return data
+
+    def add(self, result: EnrichmentResult, email_status: str | None) -> None:
+        """Count one lead (deferred when it has no email_status to write)."""
+        self.cost_usd += result.total_cost
+        if email_status is None:
+            self.deferred += 1
+            return
+        self.processed += 1
+        if result.email is None:
+            self.not_found += 1
+            return
+        self.found += 1
+        if result.provider_used == EmailFinderProvider.PATTERN:
+            self.pattern_hits += 1
+        if email_status == EmailVerificationStatus.VALID.value:
+            self.verified += 1
+        elif email_status in (
+            EmailVerificationStatus.INVALID.value,
+            EmailVerificationStatus.DISPOSABLE.value,
+        ):
+            self.invalid += 1
+        elif email_status == EmailVerificationStatus.CATCHALL.value:
+            self.catchall += 1
+        elif email_status == UNVERIFIED:
+            self.unverified += 1
+        else:
+            self.risky += 1
+
+
+@dataclass
+class EmailStageReport:
+    """Outcome of one email stage run (totals include resumed progress)."""
+
+    progress: EmailStageProgress
+    provider_breakdown: dict[str, dict[str, Any]] = field(default_factory=dict)
+    resumed: bool = False
+    duration_ms: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            **self.progress.to_dict(),
+            "resumed": self.resumed,
+            "duration_ms": self.duration_ms,
+            "providers": self.provider_breakdown,
+            "errors": self.errors,
+        }
+
+
+def email_status_for(result: EnrichmentResult) -> str | None:
+    """
+    Value written to leads.email_status for a lead, or None to leave it
+    unset because no provider answered (retried by a later run).
+    """
+    if result.email is None:
+        return None if result.unresolved else NOT_FOUND
+    if result.verification_status is None:
+        return UNVERIFIED
+    return result.verification_status.value
+
+
+class _RegistryBreaker:
+    """Orchestrator CircuitBreaker behind the scheduler's breaker interface."""
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        self._breaker = breaker
+
+    def can_proceed(self) -> bool:
+        return self._breaker.can_execute()
+
+    def record_success(self) -> None:
+        self._breaker.record_success()
+
+    def record_failure(self) -> None:
+        self._breaker.record_failure()
+
+
+# =============================================================================
+# Stage
+# =============================================================================
+
+
+class Phase3EmailStage:
+    """
+    Finds and verifies emails for a campaign's leads, chunk by chunk.
+
+    Attributes:
+        latency_histograms: Lookup latency (ms) per finder provider, this run.
+        cost_histograms: Per-lead cost (USD) by the provider that found the
+            email ("not_found" for misses), this run.
+    """
+
+    def __init__(
+        self,
+        lead_repo: LeadRepository,
+        checkpoint_repo: WorkflowCheckpointRepository,
+        config: "Phase3Config",
+        circuit_breakers: CircuitBreakerRegistry,
+        agent: EmailVerificationAgent | None = None,
+    ) -> None:
+        """
+        Initialize the stage.
+
+        Args:
+            lead_repo: Lead repository (its session is committed per chunk).
+            checkpoint_repo: Checkpoint repository on the same session.
+            config: Phase 3 configuration.
+            circuit_breakers: The orchestrator's breaker registry.
+            agent: Email agent providing the clients (created if omitted).
+        """
+        self.lead_repo = lead_repo
+        self.checkpoint_repo = checkpoint_repo
+        self.config = config
+        self.circuit_breakers = circuit_breakers
+        self.agent = agent or EmailVerificationAgent()
+        self.latency_histograms: dict[str, Histogram] = {}
+        self.cost_histograms: dict[str, Histogram] = {}
+        # Set once a deferred lead is seen; the cursor stays before it
+        self._cursor_held = False
+
+    def finder_providers(self) -> list[EmailFinderProvider]:
+        """Configured providers (Phase3Config order) that have an API client."""
+        available = set(self.agent.configured_finder_providers())
+        providers = []
+        for name in self.config.email_provider_order:
+            provider = _CONFIG_PROVIDER_NAMES.get(name)
+            if provider is None:
+                try:
+                    provider = EmailFinderProvider(name)
+                except ValueError:
+                    logger.warning(f"Unknown email provider in config: {name}")
+                    continue
+            if provider in available:
+                providers.append(provider)
+        return providers
+
+    def _finder_breakers(
+        self, providers: Sequence[EmailFinderProvider]
+    ) -> dict[str, _RegistryBreaker]:
+        """Registry breakers keyed by provider value, for the scheduler."""
+        names = {provider: name for name, provider in _CONFIG_PROVIDER_NAMES.items()}
+        breakers: dict[str, _RegistryBreaker] = {}
+        for provider in providers:
+            breaker = self.circuit_breakers.get_or_create(
+                f"email_finder_{names.get(provider, provider.value)}",
+                failure_threshold=self.config.circuit_breaker_threshold,
+                recovery_timeout_seconds=self.config.circuit_breaker_timeout_seconds,
+            )
+            breakers[provider.value] = _RegistryBreaker(breaker)
+        return breakers
+
+    async def _load_progress(self, workflow_id: str | None) -> EmailStageProgress | None:
+        if not workflow_id:
+            return None
+        checkpoint = await self.checkpoint_repo.get_checkpoint(
+            workflow_id, CHECKPOINT_AGENT_ID, CHECKPOINT_STEP_ID
+        )
+        output_data: dict[str, Any] | None = checkpoint.output_data if checkpoint else None  # type: ignore[assignment]
+        if not output_data:
+            return None
+        return EmailStageProgress.from_dict(output_data)
+
+    async def run(self, campaign_id: str, workflow_id: str | None = None) -> EmailStageReport:
+        """
+        Run the waterfall for every lead still needing an email.
+
+        Args:
+            campaign_id: Campaign UUID.
+            workflow_id: Workflow whose checkpoint stores progress; a saved
+                checkpoint resumes after its last lead id.
+
+        Returns:
+            EmailStageReport with totals and per-provider breakdown.
+
+        Raises:
+            CircuitBreakerError: If every finder provider's circuit is open.
+        """
+        start = time.perf_counter()
+        saved = await self._load_progress(workflow_id)
+        progress = saved or EmailStageProgress()
+        # Deferred leads are counted per run; a resumed run retries them
+        progress.deferred = 0
+        self._cursor_held = False
+        report = EmailStageReport(progress=progress, resumed=saved is not None)
+        if saved is not None:
+            logger.info(
+                f"Resuming email stage for {campaign_id} after lead {saved.cursor} "
+                f"({saved.processed} leads done)"
+            )
+
+        providers = self.finder_providers()
+        if not providers:
+            report.errors.append("No email finder providers configured")
+            logger.error(f"No email finder providers configured for campaign {campaign_id}")
+            return report
+
+        finder_breakers = self._finder_breakers(providers)
+        verifier = self.circuit_breakers.get("email_verifier_reoon")
+        scheduler = self.agent.create_scheduler(
+            circuit_breakers=finder_breakers,
+            max_concurrent_leads=self.config.email_concurrent_leads,
+            verify=self.config.email_verification_enabled,
+            verifier_breaker=_RegistryBreaker(verifier) if verifier else None,
+        )
+
+        pages = self.lead_repo.stream_leads_needing_email(
+            campaign_id, after_id=progress.cursor, chunk_size=self.config.batch_size
+        )
+        page = await anext(pages, None)
+        pending: tuple[list[dict[str, Any]], BatchEnrichmentResult] | None = None
+        last_batch: BatchEnrichmentResult | None = None
+
+        while page is not None or pending is not None:
+            if page is not None and not any(b.can_proceed() for b in finder_breakers.values()):
+                if pending is not None:
+                    await self._persist(workflow_id, progress, *pending)
+                raise CircuitBreakerError(
+                    service_name="email_finders",
+                    failure_count=len(finder_breakers),
+                    details={"open_circuits": self.circuit_breakers.get_open_circuits()},
+                )
+
+            task = (
+                asyncio.create_task(self._run_chunk(scheduler, page, providers))
+                if page is not None
+                else None
+            )
+            try:
+                # Database work overlaps the provider calls of the running chunk
+                if pending is not None:
+                    await self._persist(workflow_id, progress, *pending)
+                    pending = None
+                next_page = None
+                if page is not None:
+                    if progress.cost_usd < self.config.email_budget_usd:
+                        next_page = await anext(pages, None)
+                    else:
+                        report.errors.append(
+                            f"Email budget ${self.config.email_budget_usd:.2f} reached"
+                        )
+                        logger.warning(f"Email budget reached for campaign {campaign_id}")
+            except BaseException:
+                if task is not None:
+                    task.cancel()
+                raise
+
+            if task is not None and page is not None:
+                last_batch = await task
+                pending = (page, last_batch)
+            page = next_page
+
+        if workflow_id:
+            await self.checkpoint_repo.update_checkpoint(
+                workflow_id=workflow_id,
+                agent_id=CHECKPOINT_AGENT_ID,
+                step_id=CHECKPOINT_STEP_ID,
+                status="completed",
+                output_data=progress.to_dict(),
+                items_processed=progress.processed,
+            )
+            await self.checkpoint_repo.commit()
+
+        report.duration_ms = int((time.perf_counter() - start) * 1000)
+        report.provider_breakdown = self._provider_breakdown(last_batch, report.duration_ms)
+        logger.info(
+            f"Email stage complete for {campaign_id}: {progress.found}/{progress.processed} "
+            f"found, {progress.verified} verified, cost=${progress.cost_usd:.2f}, "
+            f"time={report.duration_ms}ms"
+        )
+        return report
+
+    async def _run_chunk(
+        self,
+        scheduler: WaterfallScheduler,
+        leads: list[dict[str, Any]],
+        providers: list[EmailFinderProvider],
+    ) -> BatchEnrichmentResult:
+        batch = await scheduler.run(
+            leads, max_providers=self.config.max_email_providers, providers=providers
+        )
+        for result in batch.results:
+            for attempt in result.attempts:
+                latency = self._histogram(
+                    self.latency_histograms, attempt.provider.value, LATENCY_BUCKETS_MS
+                )
+                latency.observe(attempt.response_time_ms)
+            outcome = result.provider_used.value if result.provider_used else NOT_FOUND
+            self._histogram(self.cost_histograms, outcome, COST_BUCKETS_USD).observe(
+                result.total_cost
+            )
+        return batch
+
+    @staticmethod
+    def _histogram(
+        histograms: dict[str, Histogram], key: str, bounds: tuple[float, ...]
+    ) -> Histogram:
+        if key not in histograms:
+            histograms[key] = Histogram(bounds)
+        return histograms[key]
+
+    async def _persist(
+        self,
+        workflow_id: str | None,
+        progress: EmailStageProgress,
+        leads: list[dict[str, Any]],
+        batch: BatchEnrichmentResult,
+    ) -> None:
+        """
+        Write one chunk's results and move the checkpoint past it.
+
+        Deferred leads are not written, and the cursor stops before the first
+        of them for the rest of the run.
+        """
+        rows = []
+        deferred: set[str] = set()
+        for result in batch.results:
+            email_status = email_status_for(result)
+            progress.add(result, email_status)
+            if email_status is None:
+                deferred.add(result.lead_id)
+            elif result.lead_id:
+                rows.append(
+                    {"lead_id": result.lead_id, "email": result.email, "email_status": email_status}
+                )
+        await self.lead_repo.bulk_update_email_results(rows)
+
+        if deferred:
+            logger.warning(
+                f"{len(deferred)} leads got no provider answer (quota, breaker or errors); "
+                "left for a later run"
+            )
+        if not self._cursor_held:
+            for lead in leads:
+                if str(lead["id"]) in deferred:
+                    self._cursor_held = True
+                    break
+                progress.cursor = lead["id"]
+        progress.chunks += 1
+        if workflow_id:
+            await self.checkpoint_repo.update_checkpoint(
+                workflow_id=workflow_id,
+                agent_id=CHECKPOINT_AGENT_ID,
+                step_id=CHECKPOINT_STEP_ID,
+                status="in_progress",
+                output_data=progress.to_dict(),
+                items_processed=progress.processed,
+            )
+        await self.lead_repo.commit()
+
+    def _provider_breakdown(
+        self, batch: BatchEnrichmentResult | None, duration_ms: int
+    ) -> dict[str, dict[str, Any]]:
+        """Scheduler metrics plus latency and cost histograms per provider."""
+        breakdown: dict[str, dict[str, Any]] = {}
+        if batch is not None:
+            # Provider metrics are cumulative on the scheduler across chunks
+            for name, metrics in batch.provider_metrics.items():
+                breakdown[name] = metrics.to_dict(duration_ms / 1000)
+        for name, histogram in self.latency_histograms.items():
+            breakdown.setdefault(name, {})["latency_ms"] = histogram.to_dict()
+        for name, histogram in self.cost_histograms.items():
+            breakdown.setdefault(name, {})["cost_per_lead_usd"] = histogram.to_dict()
+        return breakdown
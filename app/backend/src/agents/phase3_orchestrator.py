@@ -41,6 +41,7 @@ from src.agents.exceptions import (
     AgentExecutionError,
     CircuitBreakerError,
 )
+from src.agents.phase3_email_stage import Phase3EmailStage
 from src.agents.retry_utils import with_agent_retry
 from src.database.repositories import (
     CampaignRepository,
@@ -120,6 +121,7 @@ class Phase3Config:
     # Batch processing
     batch_size: int = 100  # Process leads in batches
     parallel_workers: int = 5  # Concurrent API calls
+    email_concurrent_leads: int = 50  # Leads whose email waterfall runs at once
 
     # Human gate settings
     auto_approve_phase4: bool = False  # Require human approval by default
@@ -140,6 +142,7 @@ class Phase3Config:
             min_ready_for_approval=10,
             batch_size=50,
             parallel_workers=3,
+            email_concurrent_leads=20,
         )
 
 
@@ -366,6 +369,7 @@ class Phase3Orchestrator:
             try:
                 email_result = await self._run_email_verification_with_retry(
                     campaign_id=campaign_id,
+                    workflow_id=workflow_id,
                 )
 
                 result.total_leads_processed = email_result.total_processed
@@ -707,12 +711,13 @@ class Phase3Orchestrator:
         return result
 
     # =========================================================================
-    # Agent Runners (Placeholder implementations - agents not yet built)
+    # Agent Runners (enrichment and finalizer are placeholders - not yet built)
     # =========================================================================
 
     async def _run_email_verification(
         self,
         campaign_id: str,
+        workflow_id: str | None = None,
     ) -> EmailVerificationResult:
         """
         Run Email Verification Agent (3.1) and persist results.
@@ -721,43 +726,35 @@ class Phase3Orchestrator:
         Tomba → Muraena → Voila Norbert → Nimbler → Icypeas → Anymailfinder → Findymail
 
         Then verifies emails with Reoon (primary), MailVerify for catchall.
+        Leads are streamed and run concurrently by Phase3EmailStage, which
+        writes results in bulk chunks and checkpoints progress under
+        workflow_id so a retried or resumed run skips finished leads.
 
         Returns:
             EmailVerificationResult with found/verified counts and costs
         """
         logger.info(f"Running Email Verification Agent for campaign {campaign_id}")
 
-        # TODO: Wire to real EmailVerificationAgent when implemented
-        # For now, return placeholder that simulates the expected behavior
-
-        # Get leads that need email finding (have LinkedIn URL but no email)
-        leads = await self.lead_repo.get_campaign_leads(
-            campaign_id=campaign_id,
-            needs_email=True,
-            exclude_status=["invalid", "duplicate", "cross_campaign_duplicate"],
-        )
-
-        total_processed = len(leads) if leads else 0
-
-        # PLACEHOLDER: Simulate email finding results
-        # Real implementation will call:
-        # agent = EmailVerificationAgent(config=self.config)
-        # result = await agent.run(campaign_id=campaign_id, leads=leads_data)
-
-        logger.warning(
-            f"Email Verification Agent not yet implemented. "
-            f"Returning placeholder for {total_processed} leads."
+        stage = Phase3EmailStage(
+            lead_repo=self.lead_repo,
+            checkpoint_repo=self.checkpoint_repo,
+            config=self.config,
+            circuit_breakers=self._circuit_breakers,
         )
+        report = await stage.run(campaign_id, workflow_id=workflow_id)
+        progress = report.progress
 
         return EmailVerificationResult(
-            total_processed=total_processed,
-            emails_found=0,  # Placeholder
-            emails_verified=0,  # Placeholder
-            emails_invalid=0,
-            emails_not_found=total_processed,
-            total_cost_usd=0.0,
-            provider_breakdown={},
-            errors=["Agent not implemented - placeholder result"],
+            total_processed=progress.processed,
+            emails_found=progress.found,
+            emails_verified=progress.verified,
+            emails_invalid=progress.invalid,
+            emails_not_found=progress.not_found,
+            emails_risky=progress.risky,
+            emails_catchall=progress.catchall,
+            total_cost_usd=progress.cost_usd,
+            provider_breakdown=report.provider_breakdown,
+            errors=report.errors,
         )
 
     async def _run_waterfall_enrichment(
@@ -999,9 +996,10 @@ class Phase3Orchestrator:
     async def _run_email_verification_with_retry(
         self,
         campaign_id: str,
+        workflow_id: str | None = None,
     ) -> "EmailVerificationResult":
         """Email Verification with retry logic."""
-        return await self._run_email_verification(campaign_id)
+        return await self._run_email_verification(campaign_id, workflow_id)
 
     @with_agent_retry(agent_id="waterfall_enrichment", max_attempts=3)
     async def _run_waterfall_enrichment_with_retry(
@@ -794,7 +794,14 @@ class LeadModel(Base):
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), nullable=True, server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), nullable=True, server_default=func.now())
+    # onupdate keeps updated_at moving on email_status changes, which the
+    # persistent cross-campaign exclusion index uses as its high-water mark
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
 
     # Relationships
     campaign = relationship("CampaignModel", back_populates="leads")
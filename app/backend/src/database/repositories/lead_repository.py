@@ -6,17 +6,190 @@ Used by Phase 2 agents for lead acquisition.
 """
 
 import logging
-from datetime import UTC
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy import (
+    Integer,
+    Select,
+    String,
+    Text,
+    Values,
+    and_,
+    cast,
+    column,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import TypeEngine
 
 from src.database.models import LeadModel, SuppressionListModel
 
 logger = logging.getLogger(__name__)
 
+# Columns read by cross-campaign dedup (Agent 2.4)
+HISTORICAL_CONTACT_COLUMNS = (
+    LeadModel.linkedin_url,
+    LeadModel.email,
+    LeadModel.first_name,
+    LeadModel.last_name,
+    LeadModel.company_name,
+    LeadModel.campaign_id,
+    LeadModel.email_status,
+    LeadModel.last_contacted_at,
+)
+
+# Columns the in-memory Phase 2 pipeline loads once per campaign, in the
+# order of src.agents.phase2_lead_table.LEAD_TABLE_COLUMNS
+PIPELINE_LEAD_COLUMNS = (
+    LeadModel.id,
+    LeadModel.campaign_id,
+    LeadModel.first_name,
+    LeadModel.last_name,
+    LeadModel.full_name,
+    LeadModel.email,
+    LeadModel.phone,
+    LeadModel.linkedin_url,
+    LeadModel.title,
+    LeadModel.seniority,
+    LeadModel.department,
+    LeadModel.company_name,
+    LeadModel.company_domain,
+    LeadModel.company_size,
+    LeadModel.company_industry,
+    LeadModel.location,
+    LeadModel.city,
+    LeadModel.state,
+    LeadModel.country,
+    LeadModel.status,
+    LeadModel.source,
+    LeadModel.validation_status,
+    LeadModel.validation_errors,
+    LeadModel.duplicate_of,
+    LeadModel.exclusion_reason,
+    LeadModel.excluded_due_to_campaign,
+    LeadModel.lead_score,
+    LeadModel.score_breakdown,
+    LeadModel.lead_tier,
+    LeadModel.persona_tags,
+    LeadModel.created_at,
+    LeadModel.updated_at,
+)
+
+# Fields DataValidationAgent normalizes; written back with validation results
+NORMALIZED_LEAD_FIELDS = (
+    "first_name",
+    "last_name",
+    "full_name",
+    "title",
+    "seniority",
+    "company_name",
+    "linkedin_url",
+    "email",
+    "company_domain",
+    "city",
+    "state",
+    "country",
+)
+
+# Rows per UPDATE ... FROM (VALUES ...) statement; keeps bind params well under
+# Postgres' 32767 limit for the widest writer (5 columns)
+DEFAULT_WRITE_CHUNK_SIZE = 1000
+
+# Rows per multi-row INSERT in ingest_leads (19 columns -> 19k bind params)
+DEFAULT_INGEST_CHUNK_SIZE = 1000
+
+
+@dataclass
+class BulkWriteStats:
+    """Timing for one set-based bulk write."""
+
+    operation: str
+    rows_written: int = 0
+    statements: int = 0
+    duration_ms: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Rows written per second of database time."""
+        if self.duration_ms <= 0:
+            return 0.0
+        return self.rows_written / (self.duration_ms / 1000)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "operation": self.operation,
+            "rows_written": self.rows_written,
+            "statements": self.statements,
+            "duration_ms": round(self.duration_ms, 1),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+def _as_uuid(value: str | UUID) -> UUID:
+    """Accept either a UUID or its string form."""
+    return UUID(value) if isinstance(value, str) else value
+
+
+def _fit_column(name: str, value: Any) -> Any:
+    """Truncate a string to the LeadModel column's length."""
+    length = getattr(getattr(LeadModel, name).type, "length", None)
+    if length and isinstance(value, str) and len(value) > length:
+        return value[:length]
+    return value
+
+
+# JSONB type for VALUES columns, taken from the model since JSONB() is untyped
+_JSONB_TYPE: TypeEngine[Any] = LeadModel.validation_errors.type
+
+
+def _normalized_columns() -> list[tuple[str, TypeEngine[Any]]]:
+    return [(name, getattr(LeadModel, name).type) for name in NORMALIZED_LEAD_FIELDS]
+
+
+def _keep_existing(v: Values) -> dict[str, Any]:
+    """SET clause for normalized fields; NULL keeps the stored value."""
+    return {
+        name: func.coalesce(v.c[name], getattr(LeadModel, name)) for name in NORMALIZED_LEAD_FIELDS
+    }
+
+
+def _new_lead_values(campaign_id: UUID, data: dict[str, Any]) -> dict[str, Any]:
+    """Column values for a scraped lead dict; every row gets the same keys."""
+    return {
+        "campaign_id": campaign_id,
+        "first_name": data.get("first_name"),
+        "last_name": data.get("last_name"),
+        "email": data.get("email"),
+        "linkedin_url": data.get("linkedin_url"),
+        "title": data.get("title") or data.get("job_title"),
+        "company_name": data.get("company_name"),
+        "company_domain": data.get("company_domain"),
+        "company_size": data.get("company_size"),
+        "company_industry": data.get("company_industry") or data.get("industry"),
+        "location": data.get("location"),
+        "city": data.get("city"),
+        "state": data.get("state"),
+        "country": data.get("country"),
+        "seniority": data.get("seniority"),
+        "department": data.get("department"),
+        "source": data.get("source"),
+        "source_url": data.get("source_url"),
+        "status": "new",
+    }
+
 
 class LeadRepository:
     """
@@ -33,6 +206,8 @@ class LeadRepository:
             session: SQLAlchemy async session
         """
         self.session = session
+        # Stats from the most recent bulk_* writer, for callers that report throughput
+        self.last_bulk_write: BulkWriteStats | None = None
 
     # =========================================================================
     # Lead CRUD
@@ -103,30 +278,7 @@ class LeadRepository:
         if isinstance(campaign_id, str):
             campaign_id = UUID(campaign_id)
 
-        leads = []
-        for data in leads_data:
-            lead = LeadModel(
-                campaign_id=campaign_id,
-                first_name=data.get("first_name"),
-                last_name=data.get("last_name"),
-                email=data.get("email"),
-                linkedin_url=data.get("linkedin_url"),
-                title=data.get("title") or data.get("job_title"),
-                company_name=data.get("company_name"),
-                company_domain=data.get("company_domain"),
-                company_size=data.get("company_size"),
-                company_industry=data.get("company_industry") or data.get("industry"),
-                location=data.get("location"),
-                city=data.get("city"),
-                state=data.get("state"),
-                country=data.get("country"),
-                seniority=data.get("seniority"),
-                department=data.get("department"),
-                source=data.get("source"),
-                source_url=data.get("source_url"),
-                status="new",
-            )
-            leads.append(lead)
+        leads = [LeadModel(**_new_lead_values(campaign_id, data)) for data in leads_data]
 
         self.session.add_all(leads)
         await self.session.flush()
@@ -134,6 +286,61 @@ class LeadRepository:
         logger.info(f"Bulk created {len(leads)} leads for campaign: {campaign_id}")
         return len(leads)
 
+    async def ingest_leads(
+        self,
+        campaign_id: str | UUID,
+        batches: AsyncIterable[list[dict[str, Any]]],
+        chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE,
+    ) -> int:
+        """
+        Insert leads from an async stream of batches as multi-row INSERTs.
+
+        Rows are buffered up to chunk_size and written as one
+        INSERT ... VALUES statement per chunk while the stream keeps
+        producing, so at most one chunk plus one batch is held in memory and
+        no ORM objects are created. Pair with ApifyLeadScraperClient.stream_leads
+        to write leads while the scrape is still running.
+
+        Args:
+            campaign_id: Campaign UUID
+            batches: Async iterable of lead dictionary lists
+            chunk_size: Rows per INSERT statement
+
+        Returns:
+            Number of leads inserted
+        """
+        campaign_id = _as_uuid(campaign_id)
+        stats = BulkWriteStats(operation="ingest_leads")
+        db_time = 0.0
+        buffer: list[dict[str, Any]] = []
+
+        async def write(chunk: list[dict[str, Any]]) -> None:
+            nonlocal db_time
+            start = time.perf_counter()
+            await self.session.execute(insert(LeadModel).values(chunk))
+            db_time += time.perf_counter() - start
+            stats.rows_written += len(chunk)
+            stats.statements += 1
+
+        async for batch in batches:
+            buffer.extend(_new_lead_values(campaign_id, data) for data in batch)
+            while len(buffer) >= chunk_size:
+                await write(buffer[:chunk_size])
+                del buffer[:chunk_size]
+
+        if buffer:
+            await write(buffer)
+
+        # Time spent waiting on the stream is not database time
+        stats.duration_ms = db_time * 1000
+        self.last_bulk_write = stats
+        logger.info(
+            f"ingest_leads: {stats.rows_written} rows in {stats.statements} statements "
+            f"({stats.duration_ms:.0f}ms, {stats.rows_per_second:.0f} rows/s) "
+            f"for campaign: {campaign_id}"
+        )
+        return stats.rows_written
+
     async def get_lead(self, lead_id: str | UUID) -> LeadModel | None:
         """
         Get lead by ID.
@@ -313,6 +520,56 @@ class LeadRepository:
         await self.session.refresh(lead)
         return lead
 
+    async def bulk_update_validation_results(
+        self,
+        results: list[dict[str, Any]],
+        chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    ) -> int:
+        """
+        Bulk persist per-lead validation results with normalized field values.
+
+        Each chunk is one UPDATE ... FROM (VALUES ...) statement carrying the
+        validation status, that lead's own error list and the normalized
+        fields, instead of a SELECT, UPDATE and refresh per lead.
+        Normalized fields that are None keep the stored value.
+
+        Args:
+            results: Dicts with lead_id, is_valid, errors and normalized_data
+                (LeadValidationResult.to_dict())
+            chunk_size: Rows per UPDATE statement
+
+        Returns:
+            Number of leads updated
+        """
+        rows: dict[UUID, tuple[Any, ...]] = {}
+        for result in results:
+            normalized = result.get("normalized_data") or {}
+            rows[_as_uuid(result["lead_id"])] = (
+                "valid" if result["is_valid"] else "invalid",
+                list(result.get("errors") or []),
+                "validated" if result["is_valid"] else "invalid",
+                *(_fit_column(name, normalized.get(name)) for name in NORMALIZED_LEAD_FIELDS),
+            )
+
+        return await self._update_from_values(
+            "bulk_update_validation_results",
+            [
+                ("id", PG_UUID(as_uuid=True)),
+                ("validation_status", String(50)),
+                ("validation_errors", _JSONB_TYPE),
+                ("status", String(50)),
+                *_normalized_columns(),
+            ],
+            [(lead_id, *values_) for lead_id, values_ in rows.items()],
+            lambda v: {
+                "validation_status": v.c.validation_status,
+                "validation_errors": v.c.validation_errors,
+                "status": v.c.status,
+                **_keep_existing(v),
+            },
+            chunk_size,
+        )
+
     async def bulk_update_validation(
         self,
         lead_ids: list[str | UUID],
@@ -383,36 +640,28 @@ class LeadRepository:
     async def bulk_mark_duplicates(
         self,
         duplicate_pairs: list[tuple[str | UUID, str | UUID]],
+        chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
     ) -> int:
         """
         Bulk mark leads as duplicates.
 
         Args:
             duplicate_pairs: List of (duplicate_id, primary_id) tuples
+            chunk_size: Rows per UPDATE statement
 
         Returns:
             Number of leads marked as duplicates
         """
-        count = 0
-        for dup_id, primary_id in duplicate_pairs:
-            if isinstance(dup_id, str):
-                dup_id = UUID(dup_id)
-            if isinstance(primary_id, str):
-                primary_id = UUID(primary_id)
-
-            stmt = (
-                update(LeadModel)
-                .where(LeadModel.id == dup_id)
-                .values(
-                    duplicate_of=primary_id,
-                    status="duplicate",
-                )
-            )
-            result = await self.session.execute(stmt)
-            count += result.rowcount
-
-        await self.session.flush()
-        return count
+        # Last pair wins for a repeated duplicate id, as with row-by-row updates
+        rows = {_as_uuid(dup_id): _as_uuid(primary_id) for dup_id, primary_id in duplicate_pairs}
+
+        return await self._update_from_values(
+            "bulk_mark_duplicates",
+            [("id", PG_UUID(as_uuid=True)), ("duplicate_of", PG_UUID(as_uuid=True))],
+            list(rows.items()),
+            lambda v: {"duplicate_of": v.c.duplicate_of, "status": "duplicate"},
+            chunk_size,
+        )
 
     async def merge_lead_data(
         self,
@@ -480,39 +729,48 @@ class LeadRepository:
     async def bulk_mark_cross_duplicates(
         self,
         exclusions: list[dict[str, Any]],
+        chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
     ) -> int:
         """
         Bulk mark leads as cross-campaign duplicates.
 
         Args:
             exclusions: List of dicts with lead_id, exclusion_reason, excluded_due_to_campaign
+            chunk_size: Rows per UPDATE statement
 
         Returns:
             Number of leads excluded
         """
-        count = 0
-        for exc in exclusions:
-            lead_id = exc["lead_id"]
-            if isinstance(lead_id, str):
-                lead_id = UUID(lead_id)
-
-            values = {
-                "exclusion_reason": exc.get("exclusion_reason", "cross_campaign_duplicate"),
+        rows = {
+            _as_uuid(exc["lead_id"]): (
+                exc.get("exclusion_reason", "cross_campaign_duplicate"),
+                _as_uuid(exc["excluded_due_to_campaign"])
+                if exc.get("excluded_due_to_campaign")
+                else None,
+            )
+            for exc in exclusions
+        }
+
+        return await self._update_from_values(
+            "bulk_mark_cross_duplicates",
+            [
+                ("id", PG_UUID(as_uuid=True)),
+                ("exclusion_reason", String(100)),
+                ("excluded_due_to_campaign", PG_UUID(as_uuid=True)),
+            ],
+            [(lead_id, *values_) for lead_id, values_ in rows.items()],
+            lambda v: {
+                "exclusion_reason": v.c.exclusion_reason,
                 "status": "cross_campaign_duplicate",
-            }
-
-            if exc.get("excluded_due_to_campaign"):
-                campaign_id = exc["excluded_due_to_campaign"]
-                if isinstance(campaign_id, str):
-                    campaign_id = UUID(campaign_id)
-                values["excluded_due_to_campaign"] = campaign_id
-
-            stmt = update(LeadModel).where(LeadModel.id == lead_id).values(**values)
-            result = await self.session.execute(stmt)
-            count += result.rowcount
-
-        await self.session.flush()
-        return count
+                # Leave the existing campaign in place when none is given. The cast
+                # types the column when every row in the chunk is NULL.
+                "excluded_due_to_campaign": func.coalesce(
+                    cast(v.c.excluded_due_to_campaign, PG_UUID(as_uuid=True)),
+                    LeadModel.excluded_due_to_campaign,
+                ),
+            },
+            chunk_size,
+        )
 
     async def get_suppression_list(self) -> list[str]:
         """
@@ -524,55 +782,202 @@ class LeadRepository:
         result = await self.session.execute(select(SuppressionListModel.email))
         return [row[0] for row in result.all()]
 
-    async def check_historical_contacts(
+    def _historical_contacts_query(
+        self,
+        campaign_id: UUID,
+        lookback_days: int,
+    ) -> Select[Any]:
+        """
+        Build the projected historical-contacts query.
+
+        Selects only the columns cross-campaign dedup reads instead of full
+        LeadModel rows (which carry large JSONB research/score columns).
+        """
+        cutoff_date = datetime.now(UTC) - timedelta(days=lookback_days)
+
+        return select(*HISTORICAL_CONTACT_COLUMNS).where(
+            and_(
+                LeadModel.campaign_id != campaign_id,
+                or_(
+                    LeadModel.last_contacted_at > cutoff_date,
+                    LeadModel.email_status.in_(["bounced", "unsubscribed", "complained"]),
+                ),
+            )
+        )
+
+    @staticmethod
+    def _historical_row_to_dict(row: Any) -> dict[str, Any]:
+        """Convert a projected historical-contact row to the dedup dict format."""
+        return {
+            "linkedin_url": row.linkedin_url,
+            "email": row.email,
+            "first_name": row.first_name,
+            "last_name": row.last_name,
+            "company_name": row.company_name,
+            "campaign_id": str(row.campaign_id),
+            "email_status": row.email_status,
+            "last_contacted_at": row.last_contacted_at,
+        }
+
+    async def stream_historical_contacts(
         self,
         campaign_id: str | UUID,
         lookback_days: int = 90,
-    ) -> list[dict[str, Any]]:
+        chunk_size: int = 5000,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
         """
-        Find leads that were contacted in other campaigns recently.
+        Stream leads contacted in other campaigns in fixed-size chunks.
+
+        Uses a server-side cursor so only one chunk of projected rows is held
+        in memory at a time. Consumers can start matching on the first chunk.
 
         Args:
             campaign_id: Current campaign UUID (to exclude)
             lookback_days: Days to look back
+            chunk_size: Rows fetched per round trip
 
-        Returns:
-            List of leads with contact history
+        Yields:
+            Lists of historical contact dicts (at most chunk_size each)
         """
-        from datetime import datetime, timedelta
-
         if isinstance(campaign_id, str):
             campaign_id = UUID(campaign_id)
 
-        cutoff_date = datetime.now(UTC) - timedelta(days=lookback_days)
+        query = self._historical_contacts_query(campaign_id, lookback_days)
+        result = await self.session.stream(query.execution_options(yield_per=chunk_size))
 
-        # Get leads from other campaigns that were contacted recently
-        result = await self.session.execute(
-            select(LeadModel).where(
-                and_(
-                    LeadModel.campaign_id != campaign_id,
-                    or_(
-                        LeadModel.last_contacted_at > cutoff_date,
-                        LeadModel.email_status.in_(["bounced", "unsubscribed", "complained"]),
-                    ),
+        total = 0
+        async for partition in result.partitions(chunk_size):
+            total += len(partition)
+            yield [self._historical_row_to_dict(row) for row in partition]
+
+        logger.info(f"Streamed {total} historical contacts for campaign: {campaign_id}")
+
+    async def stream_campaign_lead_rows(
+        self,
+        campaign_id: str | UUID,
+        chunk_size: int = 5000,
+    ) -> AsyncIterator[list[tuple[Any, ...]]]:
+        """
+        Stream a campaign's leads as projected row tuples.
+
+        Used to load the in-memory Phase 2 lead table once; rows hold the
+        PIPELINE_LEAD_COLUMNS values and no ORM objects are created.
+
+        Args:
+            campaign_id: Campaign UUID
+            chunk_size: Rows fetched per round trip
+
+        Yields:
+            Lists of row tuples (at most chunk_size each)
+        """
+        campaign_id = _as_uuid(campaign_id)
+        query = (
+            select(*PIPELINE_LEAD_COLUMNS)
+            .where(LeadModel.campaign_id == campaign_id)
+            .order_by(LeadModel.created_at)
+        )
+        result = await self.session.stream(query.execution_options(yield_per=chunk_size))
+
+        total = 0
+        async for partition in result.partitions(chunk_size):
+            total += len(partition)
+            yield [tuple(row) for row in partition]
+
+        logger.info(f"Loaded {total} leads for campaign: {campaign_id}")
+
+    async def stream_contact_changes(
+        self,
+        last_contacted_since: datetime | None = None,
+        updated_since: datetime | None = None,
+        chunk_size: int = 5000,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Stream contact-history rows across all campaigns for an exclusion index.
+
+        With no high-water marks this streams every row that can ever be an
+        exclusion (contacted at least once, or bounced/unsubscribed/complained).
+        With high-water marks it streams every row contacted or updated since
+        then, including rows that no longer qualify, so the index can drop them.
+
+        Args:
+            last_contacted_since: Only rows contacted after this time
+            updated_since: Or rows updated (e.g. email_status change) after this time
+            chunk_size: Rows fetched per round trip
+
+        Yields:
+            Lists of contact dicts with id, updated_at and the dedup columns
+        """
+        query = select(LeadModel.id, LeadModel.updated_at, *HISTORICAL_CONTACT_COLUMNS)
+
+        if last_contacted_since is None and updated_since is None:
+            query = query.where(
+                or_(
+                    LeadModel.last_contacted_at.isnot(None),
+                    LeadModel.email_status.in_(["bounced", "unsubscribed", "complained"]),
                 )
             )
-        )
-        leads = result.scalars().all()
-
-        return [
-            {
-                "linkedin_url": lead.linkedin_url,
-                "email": lead.email,
-                "first_name": lead.first_name,
-                "last_name": lead.last_name,
-                "company_name": lead.company_name,
-                "campaign_id": str(lead.campaign_id),
-                "email_status": lead.email_status,
-                "last_contacted_at": lead.last_contacted_at,
-            }
-            for lead in leads
-        ]
+        else:
+            conditions = []
+            if last_contacted_since is not None:
+                conditions.append(LeadModel.last_contacted_at > last_contacted_since)
+            if updated_since is not None:
+                conditions.append(LeadModel.updated_at > updated_since)
+            query = query.where(or_(*conditions))
+
+        result = await self.session.stream(query.execution_options(yield_per=chunk_size))
+
+        async for partition in result.partitions(chunk_size):
+            yield [
+                {
+                    **self._historical_row_to_dict(row),
+                    "id": str(row.id),
+                    "updated_at": row.updated_at,
+                }
+                for row in partition
+            ]
+
+    async def get_suppression_entries(
+        self,
+        since: datetime | None = None,
+    ) -> list[tuple[str, datetime]]:
+        """
+        Get suppressed emails with the time they were added.
+
+        Args:
+            since: Only entries created after this time
+
+        Returns:
+            List of (email, created_at) tuples
+        """
+        query = select(SuppressionListModel.email, SuppressionListModel.created_at)
+        if since is not None:
+            query = query.where(SuppressionListModel.created_at > since)
+
+        result = await self.session.execute(query)
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def check_historical_contacts(
+        self,
+        campaign_id: str | UUID,
+        lookback_days: int = 90,
+    ) -> list[dict[str, Any]]:
+        """
+        Find leads that were contacted in other campaigns recently.
+
+        Loads the whole history into a list. Prefer stream_historical_contacts
+        for large histories.
+
+        Args:
+            campaign_id: Current campaign UUID (to exclude)
+            lookback_days: Days to look back
+
+        Returns:
+            List of leads with contact history
+        """
+        contacts: list[dict[str, Any]] = []
+        async for chunk in self.stream_historical_contacts(campaign_id, lookback_days):
+            contacts.extend(chunk)
+        return contacts
 
     # =========================================================================
     # Phase 2: Scoring (Agent 2.5)
@@ -616,38 +1021,121 @@ class LeadRepository:
     async def bulk_update_scores(
         self,
         scores: list[dict[str, Any]],
+        chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
     ) -> int:
         """
         Bulk update lead scores.
 
         Args:
             scores: List of dicts with lead_id, score, tier, breakdown, persona_tags
+            chunk_size: Rows per UPDATE statement
 
         Returns:
             Number of leads updated
         """
-        count = 0
-        for s in scores:
-            lead_id = s["lead_id"]
-            if isinstance(lead_id, str):
-                lead_id = UUID(lead_id)
-
-            stmt = (
-                update(LeadModel)
-                .where(LeadModel.id == lead_id)
-                .values(
-                    lead_score=s["score"],
-                    lead_tier=s["tier"],
-                    score_breakdown=s.get("breakdown", {}),
-                    persona_tags=s.get("persona_tags", []),
-                    status="scored",
-                )
+        rows = {
+            _as_uuid(s["lead_id"]): (
+                s["score"],
+                s["tier"],
+                s.get("breakdown", {}),
+                s.get("persona_tags", []),
             )
-            result = await self.session.execute(stmt)
-            count += result.rowcount
+            for s in scores
+        }
+
+        return await self._update_from_values(
+            "bulk_update_scores",
+            [
+                ("id", PG_UUID(as_uuid=True)),
+                ("lead_score", Integer()),
+                ("lead_tier", String(1)),
+                ("score_breakdown", _JSONB_TYPE),
+                ("persona_tags", ARRAY(Text)),
+            ],
+            [(lead_id, *values_) for lead_id, values_ in rows.items()],
+            lambda v: {
+                "lead_score": cast(v.c.lead_score, Integer()),
+                "lead_tier": v.c.lead_tier,
+                "score_breakdown": v.c.score_breakdown,
+                "persona_tags": v.c.persona_tags,
+                "status": "scored",
+            },
+            chunk_size,
+        )
 
-        await self.session.flush()
-        return count
+    async def bulk_write_lead_state(
+        self,
+        states: list[dict[str, Any]],
+        chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    ) -> int:
+        """
+        Write the final Phase 2 state of leads in one set-based pass.
+
+        Used by the in-memory Phase 2 pipeline instead of one write per stage.
+        Normalized fields that are None keep the stored value.
+
+        Args:
+            states: Dicts with id plus status, validation, dedup, exclusion,
+                scoring and normalized columns (LeadTable.state_rows())
+            chunk_size: Rows per UPDATE statement
+
+        Returns:
+            Number of leads updated
+        """
+        rows = {
+            _as_uuid(state["id"]): (
+                state.get("status"),
+                state.get("validation_status"),
+                state.get("validation_errors") or [],
+                _as_uuid(state["duplicate_of"]) if state.get("duplicate_of") else None,
+                state.get("exclusion_reason"),
+                _as_uuid(state["excluded_due_to_campaign"])
+                if state.get("excluded_due_to_campaign")
+                else None,
+                state.get("lead_score"),
+                state.get("lead_tier"),
+                state.get("score_breakdown") or {},
+                state.get("persona_tags") or [],
+                *(_fit_column(name, state.get(name)) for name in NORMALIZED_LEAD_FIELDS),
+            )
+            for state in states
+        }
+
+        return await self._update_from_values(
+            "bulk_write_lead_state",
+            [
+                ("id", PG_UUID(as_uuid=True)),
+                ("status", String(50)),
+                ("validation_status", String(50)),
+                ("validation_errors", _JSONB_TYPE),
+                ("duplicate_of", PG_UUID(as_uuid=True)),
+                ("exclusion_reason", String(100)),
+                ("excluded_due_to_campaign", PG_UUID(as_uuid=True)),
+                ("lead_score", Integer()),
+                ("lead_tier", String(1)),
+                ("score_breakdown", _JSONB_TYPE),
+                ("persona_tags", ARRAY(Text)),
+                *_normalized_columns(),
+            ],
+            [(lead_id, *values_) for lead_id, values_ in rows.items()],
+            lambda v: {
+                "status": v.c.status,
+                "validation_status": v.c.validation_status,
+                "validation_errors": v.c.validation_errors,
+                # Casts type the non-text columns when every row in the chunk is NULL
+                "duplicate_of": cast(v.c.duplicate_of, PG_UUID(as_uuid=True)),
+                "exclusion_reason": v.c.exclusion_reason,
+                "excluded_due_to_campaign": cast(
+                    v.c.excluded_due_to_campaign, PG_UUID(as_uuid=True)
+                ),
+                "lead_score": cast(v.c.lead_score, Integer()),
+                "lead_tier": v.c.lead_tier,
+                "score_breakdown": v.c.score_breakdown,
+                "persona_tags": v.c.persona_tags,
+                **_keep_existing(v),
+            },
+            chunk_size,
+        )
 
     async def get_tier_counts(
         self,
@@ -677,6 +1165,172 @@ class LeadRepository:
 
         return counts
 
+    # =========================================================================
+    # Phase 3: Email Finding (Agent 3.1)
+    # =========================================================================
+
+    async def stream_leads_needing_email(
+        self,
+        campaign_id: str | UUID,
+        after_id: str | UUID | None = None,
+        chunk_size: int = 500,
+        exclude_status: Sequence[str] = ("invalid", "duplicate", "cross_campaign_duplicate"),
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Stream leads that still need an email, in id order.
+
+        Same filter as get_campaign_leads(needs_email=True), limited to leads
+        with no email_status yet, so leads the email stage already finished
+        (found or not) are never loaded again. Pages are read by keyset
+        (id > last id seen), so rows updated between pages don't shift them
+        and a run can restart from a checkpointed id.
+
+        Args:
+            campaign_id: Campaign UUID
+            after_id: Resume after this lead id
+            chunk_size: Leads per page
+            exclude_status: Lead statuses to skip
+
+        Yields:
+            Lists of dicts with id, first_name, last_name, company_domain, lead_tier
+        """
+        campaign_id = _as_uuid(campaign_id)
+        cursor = _as_uuid(after_id) if after_id else None
+        query = (
+            select(
+                LeadModel.id,
+                LeadModel.first_name,
+                LeadModel.last_name,
+                LeadModel.company_domain,
+                LeadModel.lead_tier,
+            )
+            .where(
+                LeadModel.campaign_id == campaign_id,
+                LeadModel.linkedin_url.isnot(None),
+                LeadModel.linkedin_url != "",
+                or_(LeadModel.email.is_(None), LeadModel.email == ""),
+                LeadModel.email_status.is_(None),
+                ~LeadModel.status.in_(list(exclude_status)),
+            )
+            .order_by(LeadModel.id)
+            .limit(chunk_size)
+        )
+
+        total = 0
+        while True:
+            page = query if cursor is None else query.where(LeadModel.id > cursor)
+            rows = (await self.session.execute(page)).all()
+            if not rows:
+                break
+            total += len(rows)
+            cursor = rows[-1].id
+            yield [
+                {
+                    "id": str(row.id),
+                    "first_name": row.first_name,
+                    "last_name": row.last_name,
+                    "company_domain": row.company_domain,
+                    "lead_tier": row.lead_tier,
+                }
+                for row in rows
+            ]
+            if len(rows) < chunk_size:
+                break
+
+        logger.info(f"Streamed {total} leads needing email for campaign: {campaign_id}")
+
+    async def bulk_update_email_results(
+        self,
+        results: list[dict[str, Any]],
+        chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+    ) -> int:
+        """
+        Bulk persist found emails and their verification status.
+
+        Args:
+            results: Dicts with lead_id, email (None keeps the stored value)
+                and email_status
+            chunk_size: Rows per UPDATE statement
+
+        Returns:
+            Number of leads updated
+        """
+        rows = {
+            _as_uuid(r["lead_id"]): (_fit_column("email", r.get("email")), r["email_status"])
+            for r in results
+        }
+
+        return await self._update_from_values(
+            "bulk_update_email_results",
+            [
+                ("id", PG_UUID(as_uuid=True)),
+                ("email", String(255)),
+                ("email_status", String(50)),
+            ],
+            [(lead_id, *values_) for lead_id, values_ in rows.items()],
+            lambda v: {
+                "email": func.coalesce(v.c.email, LeadModel.email),
+                "email_status": v.c.email_status,
+            },
+            chunk_size,
+        )
+
+    # =========================================================================
+    # Set-based Bulk Writes
+    # =========================================================================
+
+    async def _update_from_values(
+        self,
+        operation: str,
+        columns: Sequence[tuple[str, TypeEngine[Any]]],
+        rows: list[tuple[Any, ...]],
+        set_values: Callable[[Values], dict[str, Any]],
+        chunk_size: int,
+    ) -> int:
+        """
+        Apply per-lead updates as UPDATE leads ... FROM (VALUES ...) statements.
+
+        Each chunk of rows is sent as one statement joined on leads.id, instead
+        of one UPDATE round-trip per lead.
+
+        Args:
+            operation: Name used in logs and BulkWriteStats
+            columns: (name, type) of each VALUES column; the first must be "id"
+            rows: Tuples matching columns, at most one per lead id
+            set_values: Builds the SET clause from the VALUES alias
+            chunk_size: Rows per statement
+
+        Returns:
+            Number of leads updated
+        """
+        stats = BulkWriteStats(operation=operation)
+        start = time.perf_counter()
+
+        for offset in range(0, len(rows), chunk_size):
+            chunk = rows[offset : offset + chunk_size]
+            source = values(*(column(name, type_) for name, type_ in columns), name="v")
+            source = source.data(chunk)
+            stmt = (
+                update(LeadModel)
+                .where(LeadModel.id == source.c.id)
+                .values(**set_values(source))
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.session.execute(stmt)
+            stats.rows_written += result.rowcount
+            stats.statements += 1
+
+        if rows:
+            await self.session.flush()
+
+        stats.duration_ms = (time.perf_counter() - start) * 1000
+        self.last_bulk_write = stats
+        logger.info(
+            f"{operation}: {stats.rows_written} rows in {stats.statements} statements "
+            f"({stats.duration_ms:.0f}ms, {stats.rows_per_second:.0f} rows/s)"
+        )
+        return stats.rows_written
+
     # =========================================================================
     # Convenience Methods
     # =========================================================================
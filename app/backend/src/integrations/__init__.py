@@ -73,6 +73,7 @@ from src.integrations.apify import (
     ApifyError,
     ApifyLead,
     ApifyLeadScraperClient,
+    ApifyLeadStream,
     ApifyRateLimitError,
     ApifyRunStatus,
     ApifyScrapeResult,
@@ -229,6 +230,13 @@ from src.integrations.reoon import (
     ReoonVerificationResult,
     ReoonVerificationStatus,
 )
+from src.integrations.response_cache import (
+    ResponseCacheStats,
+    SearchResponseCache,
+    configure_response_cache,
+    get_response_cache,
+    response_cache_stats,
+)
 from src.integrations.serper import (
     SerperAnswerBox,
     SerperAutocompleteResult,
@@ -247,6 +255,12 @@ from src.integrations.serper import (
     SerperShoppingResult,
     SerperVideoResult,
 )
+from src.integrations.single_flight import (
+    SingleFlight,
+    SingleFlightStats,
+    get_single_flight,
+    single_flight_stats,
+)
 from src.integrations.tavily import (
     TavilyAnswer,
     TavilyCitationFormat,
@@ -293,6 +307,14 @@ from src.integrations.tomba import (
     TombaVerificationResult,
     TombaVerificationStatus,
 )
+from src.integrations.transport_pool import (
+    HostPoolConfig,
+    TransportPoolConfig,
+    TransportRegistry,
+    close_transport_pool,
+    configure_transport_pool,
+    transport_pool_stats,
+)
 from src.integrations.voilanorbert import (
     VoilaNorbertAccountInfo,
     VoilaNorbertClient,
@@ -309,6 +331,24 @@ __all__ = [
     "AuthenticationError",
     "PaymentRequiredError",
     "RateLimitError",
+    # Shared HTTP transport pool
+    "HostPoolConfig",
+    "TransportPoolConfig",
+    "TransportRegistry",
+    "configure_transport_pool",
+    "transport_pool_stats",
+    "close_transport_pool",
+    # Shared search response cache
+    "SearchResponseCache",
+    "ResponseCacheStats",
+    "get_response_cache",
+    "configure_response_cache",
+    "response_cache_stats",
+    # Single-flight request coalescing
+    "SingleFlight",
+    "SingleFlightStats",
+    "get_single_flight",
+    "single_flight_stats",
     # Brave Search (Privacy-Focused Web Search)
     "BraveClient",
     "BraveError",
@@ -532,5 +572,6 @@ __all__ = [
     "ApifyActorId",
     "ApifyRunStatus",
     "ApifyLead",
+    "ApifyLeadStream",
     "ApifyScrapeResult",
 ]
@@ -11,6 +11,13 @@ cost-effective waterfall pattern:
 Uses ApifyClientAsync for non-blocking operations with comprehensive
 error handling, rate limiting, and retry logic.
 
+For large scrapes, stream_leads() yields parsed lead batches while the
+actor is still running, prefetching the next dataset page while the caller
+handles the current one, so memory stays bounded by the batch size. A run
+that is still going when the stream times out or is closed early (use
+``async with`` so a failing consumer closes it) is aborted, so it stops
+billing.
+
 Example:
     >>> client = ApifyLeadScraperClient(api_token=os.environ["APIFY_API_TOKEN"])
     >>> async with client:
@@ -20,11 +27,18 @@ Example:
     ...         max_leads=1000,
     ...     )
     ...     print(f"Scraped {len(result.leads)} leads")
+    ...
+    ...     async with client.stream_leads(job_titles=["VP"], max_leads=100_000) as stream:
+    ...         async for batch in stream:
+    ...             print(f"Received {len(batch)} more leads")
 """
 
 import asyncio
 import logging
 import os
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -277,6 +291,101 @@ class ApifyScrapeResult:
         }
 
 
+# Statuses after which an actor run writes no more dataset items
+TERMINAL_RUN_STATUSES = frozenset(
+    {
+        ApifyRunStatus.SUCCEEDED.value,
+        ApifyRunStatus.FAILED.value,
+        ApifyRunStatus.ABORTED.value,
+        ApifyRunStatus.TIMED_OUT.value,
+    }
+)
+
+
+class ApifyLeadStream:
+    """
+    Parsed lead batches from the lead scraper waterfall, streamed while actors run.
+
+    Actors are tried in waterfall order; the first one that yields any leads
+    is the only one used. Iterate it once, inside ``async with`` so the
+    actor run is aborted if the consumer stops early or raises.
+
+    Attributes:
+        runs: One ApifyScrapeResult per actor run started, updated as it runs.
+        errors: Messages from actors that failed or returned no leads.
+        total_leads: Leads yielded so far.
+    """
+
+    def __init__(
+        self,
+        client: "ApifyLeadScraperClient",
+        actor_ids: list[str | ApifyActorId],
+        run_input: dict[str, Any],
+        batch_size: int,
+    ) -> None:
+        self._client = client
+        self._actor_ids = actor_ids
+        self._run_input = run_input
+        self._batch_size = batch_size
+        self.runs: list[ApifyScrapeResult] = []
+        self.errors: list[str] = []
+        self.total_leads = 0
+        self._iterator: AsyncGenerator[list[ApifyLead], None] | None = None
+
+    @property
+    def total_cost_usd(self) -> float:
+        """Cost reported by Apify across all runs started."""
+        return sum(run.cost_usd for run in self.runs)
+
+    def __aiter__(self) -> AsyncIterator[list["ApifyLead"]]:
+        if self._iterator is None:
+            self._iterator = self._iterate()
+        return self._iterator
+
+    async def __aenter__(self) -> "ApifyLeadStream":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop streaming, aborting the current actor run if it is still going."""
+        if self._iterator is not None:
+            await self._iterator.aclose()
+
+    async def _iterate(self) -> AsyncGenerator[list["ApifyLead"], None]:
+        for actor_id in self._actor_ids:
+            actor_str = actor_id.value if isinstance(actor_id, ApifyActorId) else actor_id
+            leads_before = self.total_leads
+            try:
+                async with aclosing(
+                    self._client._stream_actor_run(
+                        actor_id, self._run_input, self._batch_size, self.runs
+                    )
+                ) as batches:
+                    async for batch in batches:
+                        self.total_leads += len(batch)
+                        yield batch
+            except (ApifyActorError, ApifyTimeoutError) as e:
+                self.errors.append(f"{actor_str}: {e}")
+                # Leads from this run were already handed out; don't mix in another actor
+                if self.total_leads > leads_before:
+                    raise
+                logger.warning(f"[apify] {actor_str} failed: {e}")
+                continue
+
+            if self.total_leads > leads_before:
+                logger.info(f"[apify] Streamed {self.total_leads} leads from {actor_str}")
+                return
+            logger.warning(f"[apify] {actor_str} returned 0 leads, trying next")
+            self.errors.append(f"{actor_str}: 0 leads returned")
+
+        raise ApifyActorError(
+            actor_id="waterfall",
+            message=f"All lead scrapers failed: {'; '.join(self.errors)}",
+        )
+
+
 # =============================================================================
 # Token Bucket Rate Limiter
 # =============================================================================
@@ -484,18 +593,8 @@ class ApifyLeadScraperClient:
                 actor_id=actor_id_str,
                 status=run_info.get("status", "UNKNOWN"),
                 dataset_id=run_info.get("defaultDatasetId"),
-                started_at=self._parse_datetime(run_info.get("startedAt")),
-                finished_at=self._parse_datetime(run_info.get("finishedAt")),
             )
-
-            # Calculate duration
-            if result.started_at and result.finished_at:
-                result.duration_secs = int((result.finished_at - result.started_at).total_seconds())
-
-            # Extract cost info
-            usage_info = run_info.get("usage", {})
-            result.compute_units = usage_info.get("COMPUTE_UNITS", 0)
-            result.cost_usd = usage_info.get("TOTAL_USD", 0.0)
+            self._apply_run_info(result, run_info)
 
             # Check status
             status = result.status
@@ -561,6 +660,70 @@ class ApifyLeadScraperClient:
 
         return items_result.items if items_result else []
 
+    async def abort_run(self, run_id: str) -> None:
+        """
+        Abort an actor run (POST /actor-runs/{id}/abort).
+
+        Failures are logged rather than raised, since this runs while another
+        error or a cancellation is already propagating.
+
+        Args:
+            run_id: Run ID.
+        """
+        try:
+            await self._rate_limiter.acquire()
+            await self.client.run(run_id).abort()
+            logger.info(f"[apify] Aborted run {run_id}")
+        except Exception as e:
+            logger.warning(f"[apify] Failed to abort run {run_id}: {e}")
+
+    async def stream_dataset_items(
+        self,
+        dataset_id: str,
+        batch_size: int = 1000,
+        offset: int = 0,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Yield dataset items page by page.
+
+        The next page is requested before the current one is yielded, so
+        fetching overlaps with whatever the caller does with each page.
+
+        Args:
+            dataset_id: Dataset ID.
+            batch_size: Number of items per page.
+            offset: Index of the first item to read.
+
+        Yields:
+            Lists of at most batch_size items, in dataset order.
+        """
+
+        def fetch(at: int) -> asyncio.Task[list[dict[str, Any]]]:
+            return asyncio.create_task(
+                self.get_dataset_items(dataset_id=dataset_id, limit=batch_size, offset=at)
+            )
+
+        next_page = fetch(offset)
+        try:
+            while True:
+                items = await next_page
+                if not items:
+                    break
+
+                offset += len(items)
+                # A short page is the last one
+                has_more = len(items) >= batch_size
+                if has_more:
+                    next_page = fetch(offset)
+
+                yield items
+
+                if not has_more:
+                    break
+        finally:
+            if not next_page.done():
+                next_page.cancel()
+
     async def iterate_dataset_items(
         self,
         dataset_id: str,
@@ -569,6 +732,9 @@ class ApifyLeadScraperClient:
         """
         Iterate through all items in a dataset.
 
+        Loads the whole dataset into memory; use stream_dataset_items for
+        large datasets.
+
         Args:
             dataset_id: Dataset ID.
             batch_size: Number of items per batch.
@@ -577,24 +743,8 @@ class ApifyLeadScraperClient:
             All items from the dataset.
         """
         all_items: list[dict[str, Any]] = []
-        offset = 0
-
-        while True:
-            items = await self.get_dataset_items(
-                dataset_id=dataset_id,
-                limit=batch_size,
-                offset=offset,
-            )
-
-            if not items:
-                break
-
+        async for items in self.stream_dataset_items(dataset_id, batch_size=batch_size):
             all_items.extend(items)
-            offset += len(items)
-
-            # If we got fewer items than batch_size, we're done
-            if len(items) < batch_size:
-                break
 
         logger.info(f"[apify] Retrieved {len(all_items)} items from dataset {dataset_id}")
         return all_items
@@ -637,7 +787,80 @@ class ApifyLeadScraperClient:
         Returns:
             ApifyScrapeResult with scraped leads.
         """
-        # Build search input for lead scrapers
+        run_input = self._build_lead_search_input(
+            job_titles=job_titles,
+            seniority_levels=seniority_levels,
+            industries=industries,
+            company_sizes=company_sizes,
+            locations=locations,
+            keywords=keywords,
+            max_leads=max_leads,
+        )
+
+        # Use specific actor or waterfall
+        if actor_id:
+            return await self._scrape_with_actor(actor_id, run_input)
+        else:
+            return await self.scrape_leads_waterfall(run_input)
+
+    def stream_leads(
+        self,
+        job_titles: list[str] | None = None,
+        seniority_levels: list[str] | None = None,
+        industries: list[str] | None = None,
+        company_sizes: list[str] | None = None,
+        locations: list[str] | None = None,
+        keywords: list[str] | None = None,
+        max_leads: int = 1000,
+        actor_id: str | ApifyActorId | None = None,
+        batch_size: int = 1000,
+    ) -> ApifyLeadStream:
+        """
+        Stream parsed leads while the scraper runs.
+
+        Same search criteria and waterfall as scrape_leads, but leads are
+        yielded in batches as the actor writes them to its dataset instead of
+        being collected after the run finishes.
+
+        Args:
+            job_titles: Target job titles.
+            seniority_levels: Seniority levels.
+            industries: Target industries.
+            company_sizes: Company size ranges.
+            locations: Geographic locations.
+            keywords: Additional search keywords.
+            max_leads: Maximum number of leads to scrape.
+            actor_id: Specific actor to use (None = use waterfall).
+            batch_size: Dataset items per page (and per yielded batch).
+
+        Returns:
+            ApifyLeadStream to iterate with ``async for``.
+        """
+        run_input = self._build_lead_search_input(
+            job_titles=job_titles,
+            seniority_levels=seniority_levels,
+            industries=industries,
+            company_sizes=company_sizes,
+            locations=locations,
+            keywords=keywords,
+            max_leads=max_leads,
+        )
+        actors: list[str | ApifyActorId] = (
+            [actor_id] if actor_id else list(self.LEAD_SCRAPER_WATERFALL)
+        )
+        return ApifyLeadStream(self, actors, run_input, batch_size)
+
+    @staticmethod
+    def _build_lead_search_input(
+        job_titles: list[str] | None,
+        seniority_levels: list[str] | None,
+        industries: list[str] | None,
+        company_sizes: list[str] | None,
+        locations: list[str] | None,
+        keywords: list[str] | None,
+        max_leads: int,
+    ) -> dict[str, Any]:
+        """Build the actor input shared by all lead scrapers."""
         run_input: dict[str, Any] = {
             "maxResults": max_leads,
             "resultsLimit": max_leads,  # Some actors use this field
@@ -663,11 +886,7 @@ class ApifyLeadScraperClient:
             run_input["keywords"] = keywords
             run_input["query"] = " ".join(keywords)
 
-        # Use specific actor or waterfall
-        if actor_id:
-            return await self._scrape_with_actor(actor_id, run_input)
-        else:
-            return await self.scrape_leads_waterfall(run_input)
+        return run_input
 
     async def scrape_leads_waterfall(
         self,
@@ -752,6 +971,95 @@ class ApifyLeadScraperClient:
 
         return result  # type: ignore[no-any-return]
 
+    async def _stream_actor_run(
+        self,
+        actor_id: str | ApifyActorId,
+        run_input: dict[str, Any],
+        batch_size: int,
+        runs: list[ApifyScrapeResult],
+    ) -> AsyncGenerator[list[ApifyLead], None]:
+        """
+        Start an actor and yield parsed leads as its dataset grows.
+
+        Polls the run every poll_interval_secs; each poll reads the items
+        added since the last one. After the run succeeds, the rest of the
+        dataset is drained. If the stream stops before the run reaches a
+        terminal status (timeout, error, cancellation or the generator being
+        closed), the run is aborted.
+
+        Args:
+            actor_id: Apify actor ID.
+            run_input: Input parameters for the actor.
+            batch_size: Dataset items per page.
+            runs: The started run's ApifyScrapeResult is appended here.
+
+        Yields:
+            Lists of parsed leads.
+
+        Raises:
+            ApifyActorError: If the run fails or is aborted.
+            ApifyTimeoutError: If the run times out or exceeds timeout_secs.
+        """
+        result = await self.run_actor(
+            actor_id=actor_id,
+            run_input=run_input,
+            wait_for_finish=False,
+        )
+        runs.append(result)
+        if not result.dataset_id:
+            return
+
+        deadline = time.monotonic() + self.timeout_secs
+        offset = 0
+        try:
+            while True:
+                # Read the status before the items, so a finished run is fully drained
+                await self._rate_limiter.acquire()
+                run_info = await self.client.run(result.run_id).get()
+                if run_info:
+                    result.status = run_info.get("status", result.status)
+                    self._apply_run_info(result, run_info)
+                finished = result.status in TERMINAL_RUN_STATUSES
+
+                if result.status in (ApifyRunStatus.FAILED.value, ApifyRunStatus.ABORTED.value):
+                    raise ApifyActorError(
+                        actor_id=result.actor_id,
+                        run_id=result.run_id,
+                        status=result.status,
+                        message="Actor run failed",
+                    )
+                if result.status == ApifyRunStatus.TIMED_OUT.value:
+                    raise ApifyTimeoutError(
+                        actor_id=result.actor_id,
+                        run_id=result.run_id,
+                        timeout_secs=self.timeout_secs,
+                    )
+
+                async with aclosing(
+                    self.stream_dataset_items(
+                        result.dataset_id, batch_size=batch_size, offset=offset
+                    )
+                ) as pages:
+                    async for items in pages:
+                        offset += len(items)
+                        result.total_items = offset
+                        yield [self._parse_lead(item) for item in items]
+
+                if finished:
+                    return
+                if time.monotonic() > deadline:
+                    raise ApifyTimeoutError(
+                        actor_id=result.actor_id,
+                        run_id=result.run_id,
+                        timeout_secs=self.timeout_secs,
+                    )
+                await asyncio.sleep(self.poll_interval_secs)
+        except BaseException:
+            # Stop paying for a run nobody will read (GeneratorExit, cancellation, errors)
+            if result.status not in TERMINAL_RUN_STATUSES:
+                await self.abort_run(result.run_id)
+            raise
+
     async def scrape_linkedin_profiles(
         self,
         profile_urls: list[str],
@@ -978,6 +1286,20 @@ class ApifyLeadScraperClient:
             raw_data=item,
         )
 
+    def _apply_run_info(self, result: ApifyScrapeResult, run_info: dict[str, Any]) -> None:
+        """Copy timing and cost from an Apify run object onto a result."""
+        result.started_at = self._parse_datetime(run_info.get("startedAt"))
+        result.finished_at = self._parse_datetime(run_info.get("finishedAt"))
+
+        # Calculate duration
+        if result.started_at and result.finished_at:
+            result.duration_secs = int((result.finished_at - result.started_at).total_seconds())
+
+        # Extract cost info
+        usage_info = run_info.get("usage", {})
+        result.compute_units = usage_info.get("COMPUTE_UNITS", 0)
+        result.cost_usd = usage_info.get("TOTAL_USD", 0.0)
+
     def _parse_datetime(self, value: str | None) -> datetime | None:
         """Parse ISO datetime string."""
         if not value:
@@ -2,11 +2,13 @@
 Base integration client for third-party API integrations.
 
 Provides common functionality for all API clients:
-- Lazy HTTP client creation with connection pooling
+- Lazy HTTP client creation on the shared, per-host connection pool
 - Bearer token authentication
 - Exponential backoff retry logic
 - Rate limiting support
 - Structured error handling
+- Opt-in response caching per endpoint (see response_cache)
+- Coalescing of identical in-flight idempotent requests (see single_flight)
 
 Example:
     >>> class MyClient(BaseIntegrationClient):
@@ -23,10 +25,14 @@ Example:
 
 import asyncio
 import logging
-from typing import Any
+from typing import Any, ClassVar
 
 import httpx
 
+from src.integrations.response_cache import get_response_cache, response_cache_key
+from src.integrations.single_flight import get_single_flight, single_flight_key
+from src.integrations.transport_pool import get_transport_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,8 +105,15 @@ class BaseIntegrationClient:
         timeout: Request timeout in seconds.
         max_retries: Maximum number of retry attempts.
         retry_base_delay: Base delay for exponential backoff in seconds.
+        response_cache_ttls: Seconds a response is cached, per endpoint path.
+            Endpoints not listed are never cached.
+        single_flight: Coalesce identical concurrent GETs and POSTs to
+            RESPONSE_CACHE_TTLS endpoints into one request.
     """
 
+    # Cacheable endpoints and their TTLs in seconds; search clients override
+    RESPONSE_CACHE_TTLS: ClassVar[dict[str, float]] = {}
+
     def __init__(
         self,
         name: str,
@@ -127,12 +140,18 @@ class BaseIntegrationClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_base_delay = retry_base_delay
+        self.response_cache_ttls = dict(self.RESPONSE_CACHE_TTLS)
+        self.single_flight = True
         self._client: httpx.AsyncClient | None = None
 
     @property
     def client(self) -> httpx.AsyncClient:
         """
-        Lazy HTTP client creation with connection pooling.
+        Lazy HTTP client creation on the process-wide transport pool.
+
+        Connections are pooled per host and shared with every other
+        integration client (see transport_pool), so closing this client
+        leaves them open for the others.
 
         Returns:
             Configured httpx.AsyncClient instance.
@@ -140,7 +159,7 @@ class BaseIntegrationClient:
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.timeout),
-                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                transport=get_transport_registry().transport,
             )
         return self._client
 
@@ -242,6 +261,11 @@ class BaseIntegrationClient:
         """
         Make HTTP request with exponential backoff retry.
 
+        Requests to endpoints in response_cache_ttls are served from the
+        shared response cache when an identical request is still fresh, and
+        successful responses are stored there. Identical idempotent requests
+        already in flight are joined instead of sent again.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.).
             endpoint: API endpoint path.
@@ -260,6 +284,50 @@ class BaseIntegrationClient:
         if "headers" in kwargs:
             headers.update(kwargs.pop("headers"))
 
+        cache_ttl = self.response_cache_ttls.get(endpoint)
+        cache_key = response_cache_key(self.name, method, endpoint, kwargs) if cache_ttl else None
+        if cache_key is not None:
+            cached = get_response_cache().get(self.name, cache_key)
+            if cached is not None:
+                logger.debug(f"[{self.name}] Response cache hit for {method} {endpoint}")
+                return cached
+
+        async def send() -> dict[str, Any]:
+            data = await self._send_with_retry(method, url, headers, **kwargs)
+            if cache_key is not None and cache_ttl:
+                get_response_cache().put(self.name, cache_key, data, cache_ttl)
+            return data
+
+        # GETs and declared search endpoints are idempotent
+        if self.single_flight and (method.upper() == "GET" or endpoint in self.RESPONSE_CACHE_TTLS):
+            flight_key = single_flight_key(self.name, method, endpoint, headers, kwargs)
+            if flight_key is not None:
+                return await get_single_flight().do(self.name, flight_key, send)
+
+        return await send()
+
+    async def _send_with_retry(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Send one request, retrying transient errors with exponential backoff.
+
+        Args:
+            method: HTTP method.
+            url: Full request URL.
+            headers: Request headers.
+            **kwargs: Additional arguments for httpx request.
+
+        Returns:
+            Parsed JSON response data.
+
+        Raises:
+            IntegrationError: After all retries exhausted.
+        """
         last_error: Exception | None = None
 
         for attempt in range(self.max_retries + 1):
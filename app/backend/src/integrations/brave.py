@@ -38,7 +38,6 @@ Example:
 
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
 from typing import Any
 
@@ -46,6 +45,7 @@ from src.integrations.base import (
     BaseIntegrationClient,
     IntegrationError,
 )
+from src.integrations.response_cache import get_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -219,6 +219,15 @@ class BraveClient(BaseIntegrationClient):
 
     BASE_URL = "https://api.search.brave.com/res/v1"
 
+    # Cacheable endpoints and TTLs in seconds; cache_ttl overrides all of them
+    RESPONSE_CACHE_TTLS = {
+        "/web/search": 86400.0,
+        "/news/search": 86400.0,
+        "/images/search": 86400.0,
+        "/videos/search": 86400.0,
+        "/suggest/search": 86400.0,
+    }
+
     def __init__(
         self,
         api_key: str,
@@ -234,7 +243,8 @@ class BraveClient(BaseIntegrationClient):
             api_key: Brave Search API subscription token
             timeout: Request timeout in seconds (default 30s)
             max_retries: Maximum retry attempts for transient failures
-            enable_caching: Enable result caching to reduce API calls (default True)
+            enable_caching: Cache responses in the shared search response cache
+                to reduce API calls (default True)
             cache_ttl: Cache time-to-live in seconds (default 24 hours)
         """
         super().__init__(
@@ -246,7 +256,11 @@ class BraveClient(BaseIntegrationClient):
         )
         self.enable_caching = enable_caching
         self.cache_ttl = cache_ttl
-        self._cache: dict[str, tuple[BraveSearchResponse | BraveSuggestResponse, datetime]] = {}
+        # Responses go through the shared search response cache
+        if enable_caching:
+            self.response_cache_ttls = dict.fromkeys(self.RESPONSE_CACHE_TTLS, float(cache_ttl))
+        else:
+            self.response_cache_ttls = {}
 
     def _get_headers(self) -> dict[str, str]:
         """
@@ -260,61 +274,6 @@ class BraveClient(BaseIntegrationClient):
             "Accept-Encoding": "gzip",
         }
 
-    def _get_cache_key(self, search_type: str, **params: Any) -> str:
-        """
-        Generate cache key from search parameters.
-
-        Args:
-            search_type: Type of search (web, news, images, etc.)
-            **params: Search parameters
-
-        Returns:
-            Cache key string
-        """
-        sorted_params = sorted(params.items())
-        return f"{search_type}:{sorted_params}"
-
-    def _get_cached_result(
-        self, cache_key: str
-    ) -> BraveSearchResponse | BraveSuggestResponse | None:
-        """
-        Retrieve cached result if valid.
-
-        Args:
-            cache_key: Cache key to lookup
-
-        Returns:
-            Cached result if found and not expired, None otherwise
-        """
-        if not self.enable_caching or cache_key not in self._cache:
-            return None
-
-        cached_result, cached_time = self._cache[cache_key]
-        age = datetime.now() - cached_time
-
-        if age.total_seconds() < self.cache_ttl:
-            logger.debug(f"[{self.name}] Cache hit for key (age: {age.total_seconds():.0f}s)")
-            return cached_result
-
-        # Expired - remove from cache
-        del self._cache[cache_key]
-        logger.debug(f"[{self.name}] Cache expired")
-        return None
-
-    def _cache_result(
-        self, cache_key: str, result: BraveSearchResponse | BraveSuggestResponse
-    ) -> None:
-        """
-        Cache search result.
-
-        Args:
-            cache_key: Cache key
-            result: Search result to cache
-        """
-        if self.enable_caching:
-            self._cache[cache_key] = (result, datetime.now())
-            logger.debug(f"[{self.name}] Cached result")
-
     async def search(
         self,
         query: str,
@@ -387,20 +346,11 @@ class BraveClient(BaseIntegrationClient):
         if extra_snippets:
             params["extra_snippets"] = "true"
 
-        # Check cache
-        cache_key = self._get_cache_key("web", **params)
-        cached = self._get_cached_result(cache_key)
-        if cached and isinstance(cached, BraveSearchResponse):
-            return cached
-
         # Make API request
         try:
             response = await self.get("/web/search", params=params)
             result = self._parse_web_response(query, response)
 
-            # Cache result
-            self._cache_result(cache_key, result)
-
             return result
 
         except IntegrationError as e:
@@ -466,17 +416,10 @@ class BraveClient(BaseIntegrationClient):
                 freshness.value if isinstance(freshness, BraveFreshness) else freshness
             )
 
-        # Check cache
-        cache_key = self._get_cache_key("news", **params)
-        cached = self._get_cached_result(cache_key)
-        if cached and isinstance(cached, BraveSearchResponse):
-            return cached
-
         try:
             response = await self.get("/news/search", params=params)
             result = self._parse_news_response(query, response)
 
-            self._cache_result(cache_key, result)
             return result
 
         except IntegrationError as e:
@@ -539,17 +482,10 @@ class BraveClient(BaseIntegrationClient):
             "spellcheck": str(spellcheck).lower(),
         }
 
-        # Check cache
-        cache_key = self._get_cache_key("images", **params)
-        cached = self._get_cached_result(cache_key)
-        if cached and isinstance(cached, BraveSearchResponse):
-            return cached
-
         try:
             response = await self.get("/images/search", params=params)
             result = self._parse_images_response(query, response)
 
-            self._cache_result(cache_key, result)
             return result
 
         except IntegrationError as e:
@@ -614,17 +550,10 @@ class BraveClient(BaseIntegrationClient):
                 freshness.value if isinstance(freshness, BraveFreshness) else freshness
             )
 
-        # Check cache
-        cache_key = self._get_cache_key("videos", **params)
-        cached = self._get_cached_result(cache_key)
-        if cached and isinstance(cached, BraveSearchResponse):
-            return cached
-
         try:
             response = await self.get("/videos/search", params=params)
             result = self._parse_videos_response(query, response)
 
-            self._cache_result(cache_key, result)
             return result
 
         except IntegrationError as e:
@@ -673,17 +602,10 @@ class BraveClient(BaseIntegrationClient):
         if rich:
             params["rich"] = "true"
 
-        # Check cache
-        cache_key = self._get_cache_key("suggest", **params)
-        cached = self._get_cached_result(cache_key)
-        if cached and isinstance(cached, BraveSuggestResponse):
-            return cached
-
         try:
             response = await self.get("/suggest/search", params=params)
             result = self._parse_suggest_response(query, response)
 
-            self._cache_result(cache_key, result)
             return result
 
         except IntegrationError as e:
@@ -1016,17 +938,11 @@ class BraveClient(BaseIntegrationClient):
 
     def clear_cache(self) -> int:
         """
-        Clear the result cache.
+        Drop Brave responses from the shared search response cache.
 
         Returns:
             Number of cache entries cleared
         """
-        count = len(self._cache)
-        self._cache.clear()
+        count = get_response_cache().clear(self.name)
         logger.info(f"[{self.name}] Cleared {count} cache entries")
         return count
-
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit with cache cleanup."""
-        self.clear_cache()
-        await super().__aexit__(exc_type, exc_val, exc_tb)
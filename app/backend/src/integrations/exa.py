@@ -39,7 +39,6 @@ Example:
 
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
 from typing import Any
 
@@ -47,6 +46,7 @@ from src.integrations.base import (
     BaseIntegrationClient,
     IntegrationError,
 )
+from src.integrations.response_cache import get_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -188,6 +188,13 @@ class ExaClient(BaseIntegrationClient):
 
     BASE_URL = "https://api.exa.ai"
 
+    # Cacheable endpoints and TTLs in seconds; cache_ttl overrides the searches
+    RESPONSE_CACHE_TTLS = {
+        "/search": 86400.0,
+        "/findSimilar": 86400.0,
+        "/contents": 7 * 86400.0,
+    }
+
     def __init__(
         self,
         api_key: str,
@@ -203,7 +210,8 @@ class ExaClient(BaseIntegrationClient):
             api_key: Exa API key from dashboard.exa.ai
             timeout: Request timeout in seconds (default 60s)
             max_retries: Maximum retry attempts for transient failures
-            enable_caching: Enable result caching to save credits (default True)
+            enable_caching: Cache responses in the shared search response cache
+                to save credits (default True)
             cache_ttl: Cache time-to-live in seconds (default 24 hours)
         """
         super().__init__(
@@ -215,7 +223,12 @@ class ExaClient(BaseIntegrationClient):
         )
         self.enable_caching = enable_caching
         self.cache_ttl = cache_ttl
-        self._cache: dict[str, tuple[ExaSearchResponse, datetime]] = {}
+        # Responses go through the shared search response cache
+        if enable_caching:
+            self.response_cache_ttls["/search"] = float(cache_ttl)
+            self.response_cache_ttls["/findSimilar"] = float(cache_ttl)
+        else:
+            self.response_cache_ttls = {}
 
     def _get_headers(self) -> dict[str, str]:
         """Get headers for Exa API requests."""
@@ -225,35 +238,6 @@ class ExaClient(BaseIntegrationClient):
             "Accept": "application/json",
         }
 
-    def _get_cache_key(self, **params: Any) -> str:
-        """Generate cache key from search parameters."""
-        sorted_params = sorted(params.items())
-        return str(sorted_params)
-
-    def _get_cached_result(self, cache_key: str) -> ExaSearchResponse | None:
-        """Retrieve cached result if valid."""
-        if not self.enable_caching or cache_key not in self._cache:
-            return None
-
-        cached_result, cached_time = self._cache[cache_key]
-        age = datetime.now() - cached_time
-
-        if age.total_seconds() < self.cache_ttl:
-            logger.debug(
-                f"[{self.name}] Cache hit for {cache_key[:50]}... "
-                f"(age: {age.total_seconds():.0f}s)"
-            )
-            return cached_result
-
-        del self._cache[cache_key]
-        return None
-
-    def _cache_result(self, cache_key: str, result: ExaSearchResponse) -> None:
-        """Cache search result."""
-        if self.enable_caching:
-            self._cache[cache_key] = (result, datetime.now())
-            logger.debug(f"[{self.name}] Cached result for {cache_key[:50]}...")
-
     async def search(
         self,
         query: str,
@@ -333,12 +317,6 @@ class ExaClient(BaseIntegrationClient):
         if livecrawl:
             payload["livecrawl"] = livecrawl
 
-        # Check cache
-        cache_key = self._get_cache_key(**payload)
-        cached_result = self._get_cached_result(cache_key)
-        if cached_result:
-            return cached_result
-
         try:
             response = await self.post("/search", json=payload)
             search_type_enum = (
@@ -347,7 +325,6 @@ class ExaClient(BaseIntegrationClient):
                 else ExaSearchType(search_type)
             )
             result = self._parse_search_response(query, search_type_enum, response)
-            self._cache_result(cache_key, result)
             return result
 
         except IntegrationError as e:
@@ -833,13 +810,12 @@ class ExaClient(BaseIntegrationClient):
 
     def clear_cache(self) -> int:
         """
-        Clear the result cache.
+        Drop Exa responses from the shared search response cache.
 
         Returns:
             Number of cache entries cleared
         """
-        count = len(self._cache)
-        self._cache.clear()
+        count = get_response_cache().clear(self.name)
         logger.info(f"[{self.name}] Cleared {count} cache entries")
         return count
 
@@ -911,8 +887,3 @@ class ExaClient(BaseIntegrationClient):
             result.results.append(content_result)
 
         return result
-
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit with cache cleanup."""
-        self.clear_cache()
-        await super().__aexit__(exc_type, exc_val, exc_tb)
@@ -111,6 +111,12 @@ class FirecrawlClient(BaseIntegrationClient):
 
     BASE_URL = "https://api.firecrawl.dev/v2"
 
+    # Cacheable endpoints and TTLs in seconds (crawl jobs are never cached)
+    RESPONSE_CACHE_TTLS = {
+        "/scrape": 86400.0,
+        "/search": 86400.0,
+    }
+
     def __init__(
         self,
         api_key: str,
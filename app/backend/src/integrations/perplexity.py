@@ -176,6 +176,11 @@ class PerplexityClient(BaseIntegrationClient):
 
     BASE_URL = "https://api.perplexity.ai"
 
+    # Cacheable endpoints and TTLs in seconds (streamed completions bypass the cache)
+    RESPONSE_CACHE_TTLS = {
+        "/chat/completions": 86400.0,
+    }
+
     def __init__(
         self,
         api_key: str,
@@ -0,0 +1,408 @@
+"""
+Process-wide search response cache shared by the search integrations.
+
+Niche, persona, company and lead research keep sending the same Serper,
+Tavily, Exa, Firecrawl, Perplexity and Brave queries across campaigns. A
+search client opts in by listing endpoint TTLs in RESPONSE_CACHE_TTLS;
+BaseIntegrationClient._request_with_retry then serves those endpoints from
+this cache and stores successful responses in it.
+
+Two tiers:
+- an in-memory LRU of at most ``memory_entries`` responses
+- an optional SQLite file (WAL) that survives restarts, capped at
+  ``max_entries`` rows and evicted least recently used first
+
+Keys are a SHA-256 of the integration, method, endpoint and the request
+params/body canonicalized (keys sorted, None dropped, top-level credential
+fields dropped, whitespace collapsed in top-level query fields), so equivalent
+requests share an entry whichever client or agent sends them. Hits, misses, stores and evictions are counted
+per integration.
+
+Configuration (environment, read on first use):
+    SEARCH_CACHE_PATH=/var/lib/smarter-team/search_cache.db   (unset: memory only)
+    SEARCH_CACHE_MEMORY_ENTRIES=10000
+    SEARCH_CACHE_MAX_ENTRIES=200000
+
+Usage:
+    configure_response_cache(SearchResponseCache("data/search_cache.db"))
+    response_cache_stats()["serper"]["hit_rate"]
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_ENTRIES = 10_000
+DEFAULT_MAX_ENTRIES = 200_000
+
+# Top-level params/body fields that carry credentials, never the query
+_CREDENTIAL_FIELDS = frozenset({"api_key", "apikey", "apiKey"})
+
+# Top-level search query fields whose whitespace does not change the results
+_QUERY_FIELDS = frozenset({"q", "query"})
+
+# Request arguments a cached response can stand in for
+_KEYED_ARGUMENTS = ("params", "json")
+
+# Arguments that make a request uncacheable (raw bodies, uploads, streams)
+_UNCACHEABLE_ARGUMENTS = frozenset({"data", "files", "content"})
+
+# Disk eviction runs on open and after every this many stores
+_EVICT_EVERY = 100
+
+_WHITESPACE = re.compile(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_response_cache (
+    key TEXT PRIMARY KEY,
+    integration TEXT NOT NULL,
+    response_json TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_search_response_cache_last_used
+    ON search_response_cache (last_used_at);
+"""
+
+
+def _canonical(value: Any) -> Any:
+    """Normalize a request value so equivalent requests serialize identically."""
+    if isinstance(value, dict):
+        return {
+            str(k): _canonical(v)
+            for k, v in sorted(value.items(), key=lambda item: str(item[0]))
+            if v is not None
+        }
+    if isinstance(value, list | tuple):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def _canonical_argument(value: Any) -> Any:
+    """
+    Canonicalize a params/json argument.
+
+    Credentials are dropped and query whitespace collapsed only for the exact
+    top-level field names; nested values and other strings (e.g. Perplexity
+    prompts) are kept as sent.
+    """
+    if not isinstance(value, dict):
+        return _canonical(value)
+    fields = {k: v for k, v in value.items() if str(k) not in _CREDENTIAL_FIELDS}
+    for name in _QUERY_FIELDS.intersection(fields):
+        if isinstance(fields[name], str):
+            fields[name] = _WHITESPACE.sub(" ", fields[name]).strip()
+    return _canonical(fields)
+
+
+def response_cache_key(
+    integration: str,
+    method: str,
+    endpoint: str,
+    request_kwargs: dict[str, Any],
+) -> str | None:
+    """
+    Canonical key for a request, or None when it cannot be cached.
+
+    Args:
+        integration: Client name (e.g. "serper").
+        method: HTTP method.
+        endpoint: Endpoint path.
+        request_kwargs: httpx request arguments (headers and timeouts are ignored).
+
+    Returns:
+        SHA-256 hex key, or None for requests with raw bodies or uploads.
+    """
+    if _UNCACHEABLE_ARGUMENTS.intersection(request_kwargs):
+        return None
+    payload = json.dumps(
+        {
+            "integration": integration,
+            "method": method.upper(),
+            "endpoint": endpoint,
+            **{arg: _canonical_argument(request_kwargs.get(arg)) for arg in _KEYED_ARGUMENTS},
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ResponseCacheStats:
+    """Counters for one integration."""
+
+    lookups: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Lookups answered from either tier."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class SearchResponseCache:
+    """
+    Two-tier cache of JSON responses keyed by response_cache_key().
+
+    Attributes:
+        path: SQLite file path, or None for the memory tier only.
+        memory_entries: Responses kept in the in-memory LRU.
+        max_entries: Rows kept in the SQLite tier.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: SQLite file for the persistent tier; None keeps responses
+                in memory for this process only.
+            memory_entries: Size of the in-memory LRU tier.
+            max_entries: Rows kept on disk before least recently used ones go.
+        """
+        self.path = str(path) if path is not None else None
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        # key -> (integration, expires_at, response JSON)
+        self._memory: OrderedDict[str, tuple[str, float, str]] = OrderedDict()
+        self._stats: dict[str, ResponseCacheStats] = {}
+        self._disk_stores = 0
+        self._conn: sqlite3.Connection | None = None
+
+        if self.path is not None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._evict_disk(time.time())
+            self._conn.commit()
+
+    def __enter__(self) -> "SearchResponseCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the SQLite connection, if any."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get(self, integration: str, key: str) -> dict[str, Any] | None:
+        """The cached response for a key, or None on a miss or expired entry."""
+        stats = self._stats_for(integration)
+        stats.lookups += 1
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            if entry[1] > now:
+                self._memory.move_to_end(key)
+                stats.memory_hits += 1
+                return self._decode(entry[2])
+            del self._memory[key]
+
+        if self._conn is not None:
+            row = self._conn.execute(
+                "SELECT response_json, expires_at FROM search_response_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and row[1] > now:
+                self._conn.execute(
+                    "UPDATE search_response_cache SET last_used_at = ? WHERE key = ?", (now, key)
+                )
+                self._conn.commit()
+                self._remember(integration, key, row[1], row[0])
+                stats.disk_hits += 1
+                return self._decode(row[0])
+
+        stats.misses += 1
+        return None
+
+    def put(self, integration: str, key: str, response: dict[str, Any], ttl: float) -> None:
+        """Store a response in both tiers for ttl seconds."""
+        try:
+            response_json = json.dumps(response, separators=(",", ":"))
+        except (TypeError, ValueError):
+            logger.debug(f"[{integration}] Response is not JSON-serializable, not cached")
+            return
+
+        now = time.time()
+        expires_at = now + ttl
+        self._remember(integration, key, expires_at, response_json)
+        self._stats_for(integration).stores += 1
+
+        if self._conn is not None:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_response_cache "
+                "(key, integration, response_json, expires_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, integration, response_json, expires_at, now),
+            )
+            self._disk_stores += 1
+            if self._disk_stores % _EVICT_EVERY == 0:
+                self._evict_disk(now)
+            self._conn.commit()
+
+    def clear(self, integration: str | None = None) -> int:
+        """
+        Drop cached responses.
+
+        Args:
+            integration: Only drop this integration's entries (default: all).
+
+        Returns:
+            Number of distinct entries removed.
+        """
+        keys = [
+            key
+            for key, (owner, _, _) in self._memory.items()
+            if integration is None or owner == integration
+        ]
+        for key in keys:
+            del self._memory[key]
+        removed = set(keys)
+
+        if self._conn is not None:
+            if integration is None:
+                rows = self._conn.execute("DELETE FROM search_response_cache RETURNING key")
+            else:
+                rows = self._conn.execute(
+                    "DELETE FROM search_response_cache WHERE integration = ? RETURNING key",
+                    (integration,),
+                )
+            removed.update(row[0] for row in rows.fetchall())
+            self._conn.commit()
+
+        return len(removed)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Counters per integration."""
+        return {name: stats.to_dict() for name, stats in sorted(self._stats.items())}
+
+    def __len__(self) -> int:
+        if self._conn is not None:
+            row = self._conn.execute("SELECT COUNT(*) FROM search_response_cache").fetchone()
+            return int(row[0])
+        return len(self._memory)
+
+    def _stats_for(self, integration: str) -> ResponseCacheStats:
+        stats = self._stats.get(integration)
+        if stats is None:
+            stats = self._stats[integration] = ResponseCacheStats()
+        return stats
+
+    @staticmethod
+    def _decode(response_json: str) -> dict[str, Any]:
+        # Decoded per hit so callers never share (and mutate) one object
+        data: dict[str, Any] = json.loads(response_json)
+        return data
+
+    def _remember(self, integration: str, key: str, expires_at: float, response_json: str) -> None:
+        """Put an entry in the memory tier, evicting the least recently used."""
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = (integration, expires_at, response_json)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            _, (owner, _, _) = self._memory.popitem(last=False)
+            self._stats_for(owner).evictions += 1
+
+    def _evict_disk(self, now: float) -> int:
+        """Drop expired rows, then the least recently used beyond max_entries."""
+        assert self._conn is not None
+        owners = [
+            row[0]
+            for row in self._conn.execute(
+                "DELETE FROM search_response_cache WHERE expires_at <= ? RETURNING integration",
+                (now,),
+            ).fetchall()
+        ]
+        count = self._conn.execute("SELECT COUNT(*) FROM search_response_cache").fetchone()[0]
+        overflow = int(count) - self.max_entries
+        if overflow > 0:
+            owners += [
+                row[0]
+                for row in self._conn.execute(
+                    "DELETE FROM search_response_cache WHERE key IN ("
+                    "SELECT key FROM search_response_cache ORDER BY last_used_at LIMIT ?) "
+                    "RETURNING integration",
+                    (overflow,),
+                ).fetchall()
+            ]
+        for owner in owners:
+            self._stats_for(owner).evictions += 1
+        if owners:
+            logger.debug(f"Evicted {len(owners)} search response cache rows")
+        return len(owners)
+
+
+# Module-level singleton (per LEARN-030)
+_response_cache: SearchResponseCache | None = None
+
+
+def get_response_cache() -> SearchResponseCache:
+    """The process-wide cache, opened from SEARCH_CACHE_* settings on first use."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = SearchResponseCache(
+            os.getenv("SEARCH_CACHE_PATH") or None,
+            memory_entries=int(os.getenv("SEARCH_CACHE_MEMORY_ENTRIES", DEFAULT_MEMORY_ENTRIES)),
+            max_entries=int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+        )
+    return _response_cache
+
+
+def configure_response_cache(cache: SearchResponseCache) -> None:
+    """Replace the process-wide cache (closing the previous one)."""
+    global _response_cache
+    if _response_cache is not None and _response_cache is not cache:
+        _response_cache.close()
+    _response_cache = cache
+
+
+def response_cache_stats() -> dict[str, dict[str, Any]]:
+    """Hit, miss, store and eviction counters per integration."""
+    return get_response_cache().stats()
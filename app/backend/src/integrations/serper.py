@@ -266,6 +266,20 @@ class SerperClient(BaseIntegrationClient):
 
     BASE_URL = "https://google.serper.dev"
 
+    # Cacheable endpoints and TTLs in seconds (news and shopping change fastest)
+    RESPONSE_CACHE_TTLS = {
+        "/search": 24 * 3600.0,
+        "/news": 6 * 3600.0,
+        "/images": 7 * 86400.0,
+        "/places": 7 * 86400.0,
+        "/maps": 7 * 86400.0,
+        "/videos": 24 * 3600.0,
+        "/shopping": 6 * 3600.0,
+        "/scholar": 7 * 86400.0,
+        "/patents": 7 * 86400.0,
+        "/autocomplete": 7 * 86400.0,
+    }
+
     def __init__(
         self,
         api_key: str,
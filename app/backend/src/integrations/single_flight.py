@@ -0,0 +1,158 @@
+"""
+Single-flight coalescing of identical in-flight integration requests.
+
+Company and lead research fan out across many coroutines, and several of
+them often send the exact same Serper or Tavily query at the same moment
+(leads at one company, say). BaseIntegrationClient._request_with_retry
+routes idempotent requests (GETs, and POSTs to an integration's declared
+search endpoints) through SingleFlight: the first caller for a key starts
+the request, and callers arriving while it is in flight await the same task
+instead of sending their own. Once it finishes the key is released, so
+later requests go to the response cache or the network as usual.
+
+The shared task is shielded, so a caller that is cancelled does not cancel
+the request for the others. Followers receive a copy of the response so
+parsers cannot mutate each other's data. Calls made and duplicates saved
+are counted per integration.
+
+Usage:
+    single_flight_stats()["serper"]["coalesced"]
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from src.integrations.response_cache import response_cache_key
+
+logger = logging.getLogger(__name__)
+
+
+def single_flight_key(
+    integration: str,
+    method: str,
+    endpoint: str,
+    headers: dict[str, str],
+    request_kwargs: dict[str, Any],
+) -> str | None:
+    """
+    Key shared by identical requests, or None when they cannot be coalesced.
+
+    Unlike response cache keys, the headers (and so the credentials) are part
+    of the key: only requests made on the same account are coalesced.
+
+    Args:
+        integration: Client name (e.g. "serper").
+        method: HTTP method.
+        endpoint: Endpoint path.
+        headers: Headers the request is sent with.
+        request_kwargs: httpx request arguments.
+
+    Returns:
+        SHA-256 hex key, or None for requests with raw bodies or uploads.
+    """
+    request_key = response_cache_key(integration, method, endpoint, request_kwargs)
+    if request_key is None:
+        return None
+    payload = json.dumps([request_key, headers], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for one integration."""
+
+    calls: int = 0
+    coalesced: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {"calls": self.calls, "coalesced": self.coalesced}
+
+
+class SingleFlight:
+    """Shares one in-flight request among concurrent identical callers."""
+
+    def __init__(self) -> None:
+        # (event loop id, key) -> task running the request
+        self._calls: dict[tuple[int, str], asyncio.Task[dict[str, Any]]] = {}
+        self._stats: dict[str, SingleFlightStats] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently running."""
+        return len(self._calls)
+
+    async def do(
+        self,
+        integration: str,
+        key: str,
+        call: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """
+        Run call() unless an identical request is already in flight.
+
+        Args:
+            integration: Client name, for stats.
+            key: single_flight_key() of the request.
+            call: Sends the request and returns the parsed response.
+
+        Returns:
+            The response (a copy for callers that joined a running request).
+
+        Raises:
+            Whatever the shared request raised.
+        """
+        stats = self._stats_for(integration)
+        flight = (id(asyncio.get_running_loop()), key)
+
+        task = self._calls.get(flight)
+        if task is not None:
+            stats.coalesced += 1
+            logger.debug(f"[{integration}] Joined an identical in-flight request")
+            return copy.deepcopy(await asyncio.shield(task))
+
+        task = asyncio.ensure_future(call())
+        self._calls[flight] = task
+        stats.calls += 1
+        task.add_done_callback(lambda done: self._release(flight, done))
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Counters per integration."""
+        return {name: stats.to_dict() for name, stats in sorted(self._stats.items())}
+
+    def _stats_for(self, integration: str) -> SingleFlightStats:
+        stats = self._stats.get(integration)
+        if stats is None:
+            stats = self._stats[integration] = SingleFlightStats()
+        return stats
+
+    def _release(self, flight: tuple[int, str], task: asyncio.Task[dict[str, Any]]) -> None:
+        if self._calls.get(flight) is task:
+            del self._calls[flight]
+        # Mark the error retrieved when every caller was cancelled before it
+        if not task.cancelled():
+            task.exception()
+
+
+# Module-level singleton (per LEARN-030)
+_single_flight: SingleFlight | None = None
+
+
+def get_single_flight() -> SingleFlight:
+    """The process-wide single-flight registry."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
+
+
+def single_flight_stats() -> dict[str, dict[str, Any]]:
+    """Calls made and duplicate calls saved, per integration."""
+    return get_single_flight().stats()
@@ -40,7 +40,6 @@ Example:
 
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
 from typing import Any
 
@@ -48,6 +47,7 @@ from src.integrations.base import (
     BaseIntegrationClient,
     IntegrationError,
 )
+from src.integrations.response_cache import get_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -237,6 +237,12 @@ class TavilyClient(BaseIntegrationClient):
 
     BASE_URL = "https://api.tavily.com"
 
+    # Cacheable endpoints and TTLs in seconds; cache_ttl overrides /search
+    RESPONSE_CACHE_TTLS = {
+        "/search": 86400.0,
+        "/extract": 7 * 86400.0,
+    }
+
     def __init__(
         self,
         api_key: str,
@@ -252,7 +258,8 @@ class TavilyClient(BaseIntegrationClient):
             api_key: Tavily API key from tavily.com dashboard (starts with "tvly-")
             timeout: Request timeout in seconds (default 30s)
             max_retries: Maximum retry attempts for transient failures
-            enable_caching: Enable result caching to save credits (default True)
+            enable_caching: Cache responses in the shared search response cache
+                to save credits (default True)
             cache_ttl: Cache time-to-live in seconds (default 24 hours)
         """
         super().__init__(
@@ -264,60 +271,11 @@ class TavilyClient(BaseIntegrationClient):
         )
         self.enable_caching = enable_caching
         self.cache_ttl = cache_ttl
-        self._cache: dict[str, tuple[TavilySearchResponse, datetime]] = {}
-
-    def _get_cache_key(self, **params: Any) -> str:
-        """
-        Generate cache key from search parameters.
-
-        Args:
-            **params: Search parameters
-
-        Returns:
-            Cache key string
-        """
-        # Sort params for consistent keys
-        sorted_params = sorted(params.items())
-        return str(sorted_params)
-
-    def _get_cached_result(self, cache_key: str) -> TavilySearchResponse | None:
-        """
-        Retrieve cached result if valid.
-
-        Args:
-            cache_key: Cache key to lookup
-
-        Returns:
-            Cached result if found and not expired, None otherwise
-        """
-        if not self.enable_caching or cache_key not in self._cache:
-            return None
-
-        cached_result, cached_time = self._cache[cache_key]
-        age = datetime.now() - cached_time
-
-        if age.total_seconds() < self.cache_ttl:
-            logger.debug(
-                f"[{self.name}] Cache hit for {cache_key} (age: {age.total_seconds():.0f}s)"
-            )
-            return cached_result
-
-        # Expired - remove from cache
-        del self._cache[cache_key]
-        logger.debug(f"[{self.name}] Cache expired for {cache_key}")
-        return None
-
-    def _cache_result(self, cache_key: str, result: TavilySearchResponse) -> None:
-        """
-        Cache search result.
-
-        Args:
-            cache_key: Cache key
-            result: Search result to cache
-        """
-        if self.enable_caching:
-            self._cache[cache_key] = (result, datetime.now())
-            logger.debug(f"[{self.name}] Cached result for {cache_key}")
+        # Responses go through the shared search response cache
+        if enable_caching:
+            self.response_cache_ttls["/search"] = float(cache_ttl)
+        else:
+            self.response_cache_ttls = {}
 
     async def search(
         self,
@@ -415,20 +373,11 @@ class TavilyClient(BaseIntegrationClient):
         if country:
             payload["country"] = country.lower()
 
-        # Check cache
-        cache_key = self._get_cache_key(**payload)
-        cached_result = self._get_cached_result(cache_key)
-        if cached_result:
-            return cached_result
-
         # Make API request
         try:
             response = await self.post("/search", json=payload)
             result = self._parse_search_response(query, response)
 
-            # Cache result
-            self._cache_result(cache_key, result)
-
             return result
 
         except IntegrationError as e:
@@ -1093,17 +1042,11 @@ class TavilyClient(BaseIntegrationClient):
 
     def clear_cache(self) -> int:
         """
-        Clear the result cache.
+        Drop Tavily responses from the shared search response cache.
 
         Returns:
             Number of cache entries cleared
         """
-        count = len(self._cache)
-        self._cache.clear()
+        count = get_response_cache().clear(self.name)
         logger.info(f"[{self.name}] Cleared {count} cache entries")
         return count
-
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit with cache cleanup."""
-        self.clear_cache()
-        await super().__aexit__(exc_type, exc_val, exc_tb)
@@ -0,0 +1,360 @@
+"""
+Process-wide HTTP transport pool shared by all integration clients.
+
+Every BaseIntegrationClient used to own an httpx.AsyncClient with its own
+connection pool, so an agent holding nine clients held nine pools, repeated
+TLS handshakes per client and had no global cap on sockets. Clients now
+wrap one SharedTransport that routes each request to a per-host
+httpx.AsyncHTTPTransport kept in a process-wide TransportRegistry:
+
+- one connection pool per host, reused by every client that talks to it
+- per-host limits (connections, keepalive, keepalive expiry, HTTP/2)
+- occupancy and connection-reuse metrics per host
+
+Closing a client only closes its AsyncClient wrapper; pooled connections
+stay open for the other clients. Transports belong to the event loop that
+created them and are rebuilt when a new loop (e.g. a new asyncio.run())
+starts using the registry; the old transports are closed on their loop if
+it is still open, otherwise their sockets are shut down directly.
+
+Because clients pass an explicit transport, httpx no longer applies proxy
+environment variables itself. The registry does it instead: each host pool
+is opened through the proxy that HTTP_PROXY / HTTPS_PROXY / ALL_PROXY name
+for the scheme of the host's first request, unless NO_PROXY exempts the host.
+
+Configuration (environment, read on first use):
+    HTTP_POOL_MAX_CONNECTIONS=100      per-host connection cap
+    HTTP_POOL_MAX_KEEPALIVE=20         idle connections kept per host
+    HTTP_POOL_KEEPALIVE_EXPIRY=30      seconds an idle connection is kept
+    HTTP_POOL_HTTP2=false              negotiate HTTP/2 (needs the h2 package)
+    HTTP_POOL_HOST_LIMITS=api.tomba.io=10:5,api.reoon.com=30
+
+Example:
+    >>> configure_transport_pool(
+    ...     TransportPoolConfig(hosts={"api.tomba.io": HostPoolConfig(max_connections=10)})
+    ... )
+    >>> transport_pool_stats()["api.tomba.io"]["reuse_rate"]
+"""
+
+import asyncio
+import contextlib
+import importlib.util
+import logging
+import os
+import socket
+import urllib.request
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+TraceFn = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class HostPoolConfig:
+    """Connection pool settings for one host."""
+
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY
+    http2: bool = False
+
+    def to_limits(self) -> httpx.Limits:
+        """httpx limits for this host."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=min(self.max_keepalive_connections, self.max_connections),
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass
+class TransportPoolConfig:
+    """Default pool settings plus per-host overrides."""
+
+    default: HostPoolConfig = field(default_factory=HostPoolConfig)
+    hosts: dict[str, HostPoolConfig] = field(default_factory=dict)
+
+    def for_host(self, host: str) -> HostPoolConfig:
+        """Settings for a host, falling back to the default."""
+        return self.hosts.get(host.lower(), self.default)
+
+    @classmethod
+    def from_env(cls) -> "TransportPoolConfig":
+        """
+        Build the config from HTTP_POOL_* environment variables.
+
+        HTTP_POOL_HOST_LIMITS is a comma-separated list of
+        ``host=max_connections[:max_keepalive]`` entries; other settings are
+        inherited from the defaults.
+        """
+        default = HostPoolConfig(
+            max_connections=int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)),
+            max_keepalive_connections=int(
+                os.getenv("HTTP_POOL_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE_CONNECTIONS)
+            ),
+            keepalive_expiry=float(
+                os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY)
+            ),
+            http2=os.getenv("HTTP_POOL_HTTP2", "").lower() in ("1", "true", "yes"),
+        )
+
+        hosts: dict[str, HostPoolConfig] = {}
+        for entry in filter(None, os.getenv("HTTP_POOL_HOST_LIMITS", "").split(",")):
+            host, _, limits = entry.strip().partition("=")
+            max_conn, _, max_keepalive = limits.partition(":")
+            try:
+                hosts[host.strip().lower()] = replace(
+                    default,
+                    max_connections=int(max_conn),
+                    max_keepalive_connections=(
+                        int(max_keepalive) if max_keepalive else default.max_keepalive_connections
+                    ),
+                )
+            except ValueError:
+                logger.warning(f"Ignoring invalid HTTP_POOL_HOST_LIMITS entry: {entry!r}")
+        return cls(default=default, hosts=hosts)
+
+
+@dataclass
+class HostPoolMetrics:
+    """Request and connection counters for one host's pool."""
+
+    host: str
+    requests: int = 0
+    errors: int = 0
+    connections_opened: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+    @property
+    def reused(self) -> int:
+        """Requests served on an already-open connection."""
+        return max(self.requests - self.connections_opened, 0)
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of requests that did not open a new connection."""
+        return self.reused / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging."""
+        return {
+            "host": self.host,
+            "requests": self.requests,
+            "errors": self.errors,
+            "connections_opened": self.connections_opened,
+            "reused": self.reused,
+            "reuse_rate": round(self.reuse_rate, 4),
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+        }
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _env_proxy(scheme: str, host: str) -> str | None:
+    """Proxy URL the environment sets for a scheme and host, as httpx would use."""
+    proxies = urllib.request.getproxies()
+    proxy = proxies.get(scheme) or proxies.get("all")
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    return proxy
+
+
+class _HostPool:
+    """Transport and metrics for one host."""
+
+    def __init__(self, host: str, config: HostPoolConfig, proxy: str | None = None) -> None:
+        self.config = config
+        self.proxy = proxy
+        self.metrics = HostPoolMetrics(host=host)
+        self.transport = httpx.AsyncHTTPTransport(
+            http2=config.http2,
+            limits=config.to_limits(),
+            proxy=proxy,
+        )
+        # Network streams opened by this pool, to shut down without their loop
+        self.streams: weakref.WeakSet[Any] = weakref.WeakSet()
+
+    def abort(self) -> None:
+        """Shut down every socket; used when the owning event loop is closed."""
+        for stream in list(self.streams):
+            sock = stream.get_extra_info("socket")
+            if sock is None:
+                continue
+            with contextlib.suppress(OSError):
+                sock.shutdown(socket.SHUT_RDWR)
+
+    def occupancy(self) -> dict[str, int]:
+        """Open, active and idle connections in the pool right now."""
+        # httpx keeps the httpcore pool private; report zeros if that changes
+        pool = getattr(self.transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for conn in connections if conn.is_idle())
+        return {
+            "open_connections": len(connections),
+            "active_connections": len(connections) - idle,
+            "idle_connections": idle,
+            "max_connections": self.config.max_connections,
+        }
+
+
+class TransportRegistry:
+    """
+    Per-host transports shared across every client in the process.
+
+    Attributes:
+        config: Pool settings used for hosts opened from now on.
+        transport: The transport to hand to httpx.AsyncClient.
+    """
+
+    def __init__(self, config: TransportPoolConfig | None = None, trust_env: bool = True) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            config: Pool settings; defaults to TransportPoolConfig.from_env().
+            trust_env: Route hosts through the proxies set in the environment.
+        """
+        self.config = config or TransportPoolConfig.from_env()
+        self.trust_env = trust_env
+        self.transport = SharedTransport(self)
+        self._pools: dict[str, _HostPool] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._warned_http2 = False
+
+    def configure(self, config: TransportPoolConfig) -> None:
+        """Replace the settings; open hosts keep their pool until close_transport_pool()."""
+        self.config = config
+
+    def _pool_for(self, host: str, scheme: str = "https") -> _HostPool:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Connections can't move between event loops; start fresh pools
+            if self._pools:
+                logger.debug("Event loop changed, rebuilding HTTP transport pools")
+                self._retire(list(self._pools.values()), self._loop)
+            self._pools = {}
+            self._loop = loop
+
+        pool = self._pools.get(host)
+        if pool is None:
+            config = self.config.for_host(host)
+            if config.http2 and not _http2_available():
+                if not self._warned_http2:
+                    logger.warning("HTTP/2 requested but h2 is not installed; using HTTP/1.1")
+                    self._warned_http2 = True
+                config = replace(config, http2=False)
+            proxy = _env_proxy(scheme, host) if self.trust_env else None
+            pool = _HostPool(host, config, proxy)
+            self._pools[host] = pool
+        return pool
+
+    @staticmethod
+    def _retire(pools: list[_HostPool], loop: asyncio.AbstractEventLoop | None) -> None:
+        """Close pools that belong to an event loop the registry has moved off."""
+        if loop is not None and not loop.is_closed():
+            for pool in pools:
+                asyncio.run_coroutine_threadsafe(pool.transport.aclose(), loop)
+            return
+        # A closed loop can't run aclose(); release the connections directly
+        for pool in pools:
+            pool.abort()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request through its host's pool, recording metrics."""
+        pool = self._pool_for(request.url.host.lower(), request.url.scheme)
+        metrics = pool.metrics
+
+        outer_trace: TraceFn | None = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                metrics.connections_opened += 1
+                if info.get("return_value") is not None:
+                    pool.streams.add(info["return_value"])
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+
+        metrics.requests += 1
+        metrics.in_flight += 1
+        metrics.peak_in_flight = max(metrics.peak_in_flight, metrics.in_flight)
+        try:
+            return await pool.transport.handle_async_request(request)
+        except Exception:
+            metrics.errors += 1
+            raise
+        finally:
+            metrics.in_flight -= 1
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Metrics and current occupancy per host."""
+        return {
+            host: {**pool.metrics.to_dict(), **pool.occupancy()}
+            for host, pool in self._pools.items()
+        }
+
+    async def aclose(self) -> None:
+        """Close every pooled connection (e.g. on application shutdown)."""
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            await pool.transport.aclose()
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that routes requests into the shared registry.
+
+    Closing it is a no-op, so an AsyncClient that wraps it can be closed
+    without dropping connections other clients are using.
+    """
+
+    def __init__(self, registry: TransportRegistry) -> None:
+        self.registry = registry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.registry.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        return None
+
+
+_registry: TransportRegistry | None = None
+
+
+def get_transport_registry() -> TransportRegistry:
+    """The process-wide registry, created on first use."""
+    global _registry
+    if _registry is None:
+        _registry = TransportRegistry()
+    return _registry
+
+
+def configure_transport_pool(config: TransportPoolConfig) -> None:
+    """Set pool settings for the process-wide registry."""
+    get_transport_registry().configure(config)
+
+
+def transport_pool_stats() -> dict[str, dict[str, Any]]:
+    """Per-host metrics and occupancy for the process-wide registry."""
+    return get_transport_registry().stats()
+
+
+async def close_transport_pool() -> None:
+    """Close all shared connections."""
+    if _registry is not None:
+        await _registry.aclose()